@@ -0,0 +1,102 @@
+"""Token streaming benchmark for group chat teams.
+
+Runs a :class:`~autogen_agentchat.teams.RoundRobinGroupChat` whose agents stream
+:class:`~autogen_agentchat.messages.ModelClientStreamingChunkEvent` messages as fast as
+they can, and reports the time to the first chunk and the chunks per second received from
+:meth:`~autogen_agentchat.teams.BaseGroupChat.run_stream`. It compares the direct delivery
+of chunks to the team's output queue with publishing each chunk through the runtime.
+
+Usage:
+
+.. code-block:: bash
+
+    python benchmarks/team_streaming.py --chunks 20000 --agents 2
+"""
+
+import argparse
+import asyncio
+import time
+from typing import AsyncGenerator, Callable, List, Sequence
+
+from autogen_agentchat.agents import BaseChatAgent
+from autogen_agentchat.base import ChatAgent, Response, TaskResult
+from autogen_agentchat.conditions import MaxMessageTermination
+from autogen_agentchat.messages import (
+    BaseAgentEvent,
+    BaseChatMessage,
+    MessageFactory,
+    ModelClientStreamingChunkEvent,
+    TextMessage,
+)
+from autogen_agentchat.teams import RoundRobinGroupChat
+from autogen_agentchat.teams._group_chat._chat_agent_container import ChatAgentContainer
+from autogen_core import CancellationToken
+
+
+class StreamingAgent(BaseChatAgent):
+    def __init__(self, name: str, num_chunks: int) -> None:
+        super().__init__(name, description="Streams chunks.")
+        self._num_chunks = num_chunks
+
+    @property
+    def produced_message_types(self) -> Sequence[type[BaseChatMessage]]:
+        return (TextMessage,)
+
+    async def on_messages(self, messages: Sequence[BaseChatMessage], cancellation_token: CancellationToken) -> Response:
+        raise NotImplementedError
+
+    async def on_messages_stream(
+        self, messages: Sequence[BaseChatMessage], cancellation_token: CancellationToken
+    ) -> AsyncGenerator[BaseAgentEvent | BaseChatMessage | Response, None]:
+        for _ in range(self._num_chunks):
+            yield ModelClientStreamingChunkEvent(content="token ", source=self.name)
+        yield Response(chat_message=TextMessage(content="token " * self._num_chunks, source=self.name))
+
+    async def on_reset(self, cancellation_token: CancellationToken) -> None:
+        pass
+
+
+class PublishingRoundRobinGroupChat(RoundRobinGroupChat):
+    """A team whose participants publish every chunk through the runtime."""
+
+    def _create_participant_factory(
+        self,
+        parent_topic_type: str,
+        output_topic_type: str,
+        agent: ChatAgent,
+        message_factory: MessageFactory,
+    ) -> Callable[[], ChatAgentContainer]:
+        return lambda: ChatAgentContainer(parent_topic_type, output_topic_type, agent, message_factory)
+
+
+async def run_once(team_class: type[RoundRobinGroupChat], num_chunks: int, num_agents: int) -> tuple[float, float]:
+    agents: List[ChatAgent] = [StreamingAgent(f"agent_{i}", num_chunks) for i in range(num_agents)]
+    team = team_class(agents, termination_condition=MaxMessageTermination(num_agents + 1))
+    num_received = 0
+    first_chunk_time = 0.0
+    start = time.perf_counter()
+    async for message in team.run_stream(task="Stream."):
+        if isinstance(message, ModelClientStreamingChunkEvent):
+            if num_received == 0:
+                first_chunk_time = time.perf_counter() - start
+            num_received += 1
+        elif isinstance(message, TaskResult):
+            break
+    elapsed = time.perf_counter() - start
+    assert num_received == num_chunks * num_agents
+    return first_chunk_time, num_received / elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=10000, help="Chunks streamed by each agent.")
+    parser.add_argument("--agents", type=int, default=2)
+    args = parser.parse_args()
+
+    for label, team_class in [("direct", RoundRobinGroupChat), ("published", PublishingRoundRobinGroupChat)]:
+        first_chunk_time, rate = await run_once(team_class, args.chunks, args.agents)
+        print(f"{label:<10} time to first chunk={first_chunk_time * 1e3:>7.2f} ms {rate:>10.0f} chunks/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
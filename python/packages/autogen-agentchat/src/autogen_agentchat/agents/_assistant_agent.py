@@ -2,6 +2,8 @@
 import json
 import logging
 import warnings
+from concurrent.futures import Executor
+from contextlib import nullcontext
 from typing import (
     Any,
     AsyncGenerator,
@@ -76,6 +78,8 @@ class AssistantAgentConfig(BaseModel):
     tool_call_summary_format: str
     metadata: Dict[str, str] | None = None
     structured_message_factory: ComponentModel | None = None
+    max_concurrent_tool_calls: int | None = None
+    tool_concurrency_limits: Dict[str, int] | None = None
 
 
 class AssistantAgent(BaseChatAgent, Component[AssistantAgentConfig]):
@@ -125,6 +129,7 @@ class AssistantAgent(BaseChatAgent, Component[AssistantAgentConfig]):
         - `reflect_on_tool_use` is set to `True` by default when `output_content_type` is set.
         - `reflect_on_tool_use` is set to `False` by default when `output_content_type` is not set.
     * If the model returns multiple tool calls, they will be executed concurrently. To disable parallel tool calls you need to configure the model client. For example, set `parallel_tool_calls=False` for :class:`~autogen_ext.models.openai.OpenAIChatCompletionClient` and :class:`~autogen_ext.models.openai.AzureOpenAIChatCompletionClient`.
+    * Use `max_concurrent_tool_calls` to limit how many tool calls run at the same time, and `tool_concurrency_limits` to limit individual tools, e.g., `{"browser_action": 2}`. The tool call results keep the order of the tool calls.
 
     .. tip::
         By default, the tool call results are returned as response when tool calls are made.
@@ -195,6 +200,14 @@ class AssistantAgent(BaseChatAgent, Component[AssistantAgentConfig]):
             For example, `"{tool_name}: {result}"` will create a summary like `"tool_name: result"`.
         memory (Sequence[Memory] | None, optional): The memory store to use for the agent. Defaults to `None`.
         metadata (Dict[str, str] | None, optional): Optional metadata for tracking.
+        max_concurrent_tool_calls (int | None, optional): The maximum number of tool calls executed at the same time
+            when the model returns multiple tool calls. Defaults to `None`, meaning no limit.
+        tool_concurrency_limits (Dict[str, int] | None, optional): The maximum number of concurrent calls of individual tools,
+            keyed by tool name. Defaults to `None`, meaning no limit.
+        tool_executor (Executor | None, optional): The executor that runs the synchronous functions passed in `tools`,
+            e.g., a dedicated :class:`~concurrent.futures.ThreadPoolExecutor`. Defaults to `None`, which uses the default executor of the event loop.
+            To use it for a :class:`~autogen_core.tools.FunctionTool`, pass it as the `executor` of the tool.
+            It is not part of the declarative configuration.
 
     Raises:
         ValueError: If tool names are not unique.
@@ -641,6 +654,9 @@ def __init__(
         output_content_type_format: str | None = None,
         memory: Sequence[Memory] | None = None,
         metadata: Dict[str, str] | None = None,
+        max_concurrent_tool_calls: int | None = None,
+        tool_concurrency_limits: Dict[str, int] | None = None,
+        tool_executor: Executor | None = None,
     ):
         super().__init__(name=name, description=description)
         self._metadata = metadata or {}
@@ -678,7 +694,7 @@ def __init__(
                         description = tool.__doc__
                     else:
                         description = ""
-                    self._tools.append(FunctionTool(tool, description=description))
+                    self._tools.append(FunctionTool(tool, description=description, executor=tool_executor))
                 else:
                     raise ValueError(f"Unsupported tool type: {type(tool)}")
         # Check if tool names are unique.
@@ -711,6 +727,22 @@ def __init__(
                 f"Handoff names: {handoff_tool_names}; tool names: {tool_names}"
             )
 
+        # Index the tools by name for looking up the tool of each tool call.
+        self._tool_index: Dict[str, BaseTool[Any, Any]] = {
+            tool.name: tool for tool in self._tools + self._handoff_tools
+        }
+
+        if max_concurrent_tool_calls is not None and max_concurrent_tool_calls < 1:
+            raise ValueError("max_concurrent_tool_calls must be at least 1.")
+        if tool_concurrency_limits is not None:
+            for tool_name, limit in tool_concurrency_limits.items():
+                if tool_name not in self._tool_index:
+                    raise ValueError(f"Concurrency limit for unknown tool: {tool_name}")
+                if limit < 1:
+                    raise ValueError(f"The concurrency limit of tool {tool_name} must be at least 1.")
+        self._max_concurrent_tool_calls = max_concurrent_tool_calls
+        self._tool_concurrency_limits = tool_concurrency_limits or {}
+
         if model_context is not None:
             self._model_context = model_context
         else:
@@ -776,6 +808,9 @@ async def on_messages_stream(
         system_messages = self._system_messages
         tools = self._tools
         handoff_tools = self._handoff_tools
+        tool_index = self._tool_index
+        max_concurrent_tool_calls = self._max_concurrent_tool_calls
+        tool_concurrency_limits = self._tool_concurrency_limits
         handoffs = self._handoffs
         model_client = self._model_client
         model_client_stream = self._model_client_stream
@@ -844,8 +879,9 @@ async def on_messages_stream(
             agent_name=agent_name,
             system_messages=system_messages,
             model_context=model_context,
-            tools=tools,
-            handoff_tools=handoff_tools,
+            tool_index=tool_index,
+            max_concurrent_tool_calls=max_concurrent_tool_calls,
+            tool_concurrency_limits=tool_concurrency_limits,
             handoffs=handoffs,
             model_client=model_client,
             model_client_stream=model_client_stream,
@@ -947,8 +983,9 @@ async def _process_model_result(
         agent_name: str,
         system_messages: List[SystemMessage],
         model_context: ChatCompletionContext,
-        tools: List[BaseTool[Any, Any]],
-        handoff_tools: List[BaseTool[Any, Any]],
+        tool_index: Mapping[str, BaseTool[Any, Any]],
+        max_concurrent_tool_calls: int | None,
+        tool_concurrency_limits: Mapping[str, int],
         handoffs: Dict[str, HandoffBase],
         model_client: ChatCompletionClient,
         model_client_stream: bool,
@@ -1002,17 +1039,13 @@ async def _process_model_result(
         yield tool_call_msg
 
         # STEP 4B: Execute tool calls
-        executed_calls_and_results = await asyncio.gather(
-            *[
-                cls._execute_tool_call(
-                    tool_call=call,
-                    tools=tools,
-                    handoff_tools=handoff_tools,
-                    agent_name=agent_name,
-                    cancellation_token=cancellation_token,
-                )
-                for call in model_result.content
-            ]
+        executed_calls_and_results = await cls._execute_tool_calls(
+            tool_calls=model_result.content,
+            tool_index=tool_index,
+            max_concurrent_tool_calls=max_concurrent_tool_calls,
+            tool_concurrency_limits=tool_concurrency_limits,
+            agent_name=agent_name,
+            cancellation_token=cancellation_token,
         )
         exec_results = [result for _, result in executed_calls_and_results]
 
@@ -1235,20 +1268,59 @@ def _summarize_tool_use(
             inner_messages=inner_messages,
         )
 
+    @classmethod
+    async def _execute_tool_calls(
+        cls,
+        tool_calls: List[FunctionCall],
+        tool_index: Mapping[str, BaseTool[Any, Any]],
+        max_concurrent_tool_calls: int | None,
+        tool_concurrency_limits: Mapping[str, int],
+        agent_name: str,
+        cancellation_token: CancellationToken,
+    ) -> List[Tuple[FunctionCall, FunctionExecutionResult]]:
+        """Execute the tool calls concurrently within the concurrency limits and return the results in order."""
+        if max_concurrent_tool_calls is None and not tool_concurrency_limits:
+            return list(
+                await asyncio.gather(
+                    *[
+                        cls._execute_tool_call(
+                            tool_call=call,
+                            tool_index=tool_index,
+                            agent_name=agent_name,
+                            cancellation_token=cancellation_token,
+                        )
+                        for call in tool_calls
+                    ]
+                )
+            )
+
+        global_semaphore = asyncio.Semaphore(max_concurrent_tool_calls) if max_concurrent_tool_calls else None
+        tool_semaphores = {name: asyncio.Semaphore(limit) for name, limit in tool_concurrency_limits.items()}
+
+        async def _execute_with_limits(call: FunctionCall) -> Tuple[FunctionCall, FunctionExecutionResult]:
+            # Wait for the tool's own limit first, so that a waiting call does not hold a global slot.
+            async with tool_semaphores.get(call.name) or nullcontext(), global_semaphore or nullcontext():
+                return await cls._execute_tool_call(
+                    tool_call=call,
+                    tool_index=tool_index,
+                    agent_name=agent_name,
+                    cancellation_token=cancellation_token,
+                )
+
+        return list(await asyncio.gather(*[_execute_with_limits(call) for call in tool_calls]))
+
     @staticmethod
     async def _execute_tool_call(
         tool_call: FunctionCall,
-        tools: List[BaseTool[Any, Any]],
-        handoff_tools: List[BaseTool[Any, Any]],
+        tool_index: Mapping[str, BaseTool[Any, Any]],
         agent_name: str,
         cancellation_token: CancellationToken,
     ) -> Tuple[FunctionCall, FunctionExecutionResult]:
         """Execute a single tool call and return the result."""
         try:
-            all_tools = tools + handoff_tools
-            if not all_tools:
+            if not tool_index:
                 raise ValueError("No tools are available.")
-            tool = next((t for t in all_tools if t.name == tool_call.name), None)
+            tool = tool_index.get(tool_call.name)
             if tool is None:
                 raise ValueError(f"The tool '{tool_call.name}' is not available.")
             arguments: Dict[str, Any] = json.loads(tool_call.arguments) if tool_call.arguments else {}
@@ -1318,6 +1390,8 @@ def _to_config(self) -> AssistantAgentConfig:
             if self._structured_message_factory
             else None,
             metadata=self._metadata,
+            max_concurrent_tool_calls=self._max_concurrent_tool_calls,
+            tool_concurrency_limits=self._tool_concurrency_limits or None,
         )
 
     @classmethod
@@ -1347,4 +1421,6 @@ def _from_config(cls, config: AssistantAgentConfig) -> Self:
             output_content_type=output_content_type,
             output_content_type_format=format_string,
             metadata=config.metadata,
+            max_concurrent_tool_calls=config.max_concurrent_tool_calls,
+            tool_concurrency_limits=config.tool_concurrency_limits,
         )
@@ -28,6 +28,7 @@ class BaseGroupChatManagerState(BaseState):
     """Base state for all group chat managers."""
 
     message_thread: List[Mapping[str, Any]] = Field(default_factory=list)
+    message_thread_checkpoint: Mapping[str, Any] | None = Field(default=None)
     current_turn: int = Field(default=0)
     type: str = Field(default="BaseGroupChatManagerState")
 
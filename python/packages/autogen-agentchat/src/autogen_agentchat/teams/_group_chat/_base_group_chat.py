@@ -34,6 +34,7 @@
     GroupChatTermination,
     SerializableException,
 )
+from ._message_thread import MessageThread
 from ._sequential_routed_agent import SequentialRoutedAgent
 
 
@@ -56,6 +57,7 @@ def __init__(
         runtime: AgentRuntime | None = None,
         custom_message_types: List[type[BaseAgentEvent | BaseChatMessage]] | None = None,
         emit_team_events: bool = False,
+        message_thread: MessageThread | None = None,
     ):
         if len(participants) == 0:
             raise ValueError("At least one participant is required.")
@@ -127,6 +129,9 @@ def __init__(
         # Flag to track if the team events should be emitted.
         self._emit_team_events = emit_team_events
 
+        # The storage for the message thread of the group chat manager, None for the default.
+        self._message_thread = message_thread
+
     @abstractmethod
     def _create_group_chat_manager_factory(
         self,
@@ -150,7 +155,13 @@ def _create_participant_factory(
         message_factory: MessageFactory,
     ) -> Callable[[], ChatAgentContainer]:
         def _factory() -> ChatAgentContainer:
-            container = ChatAgentContainer(parent_topic_type, output_topic_type, agent, message_factory)
+            container = ChatAgentContainer(
+                parent_topic_type,
+                output_topic_type,
+                agent,
+                message_factory,
+                output_message_queue=self._output_message_queue,
+            )
             return container
 
         return _factory
@@ -1,11 +1,12 @@
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, List, Sequence
+from typing import Any, Dict, List, Sequence
 
-from autogen_core import DefaultTopicId, MessageContext, event, rpc
+from autogen_core import CancellationToken, DefaultTopicId, MessageContext, event, rpc
 
-from ...base import TerminationCondition
+from ...base import Response, TerminationCondition
 from ...messages import BaseAgentEvent, BaseChatMessage, MessageFactory, SelectSpeakerEvent, StopMessage
+from ...state import BaseGroupChatManagerState
 from ._events import (
     GroupChatAgentResponse,
     GroupChatError,
@@ -16,8 +17,10 @@
     GroupChatResume,
     GroupChatStart,
     GroupChatTermination,
+    GroupChatTurn,
     SerializableException,
 )
+from ._message_thread import InMemoryMessageThread, MessageThread
 from ._sequential_routed_agent import SequentialRoutedAgent
 
 
@@ -46,6 +49,7 @@ def __init__(
         max_turns: int | None,
         message_factory: MessageFactory,
         emit_team_events: bool = False,
+        message_thread: MessageThread | None = None,
     ):
         super().__init__(
             description="Group chat manager",
@@ -72,13 +76,17 @@ def __init__(
             name: topic_type for name, topic_type in zip(participant_names, participant_topic_types, strict=True)
         }
         self._participant_descriptions = participant_descriptions
-        self._message_thread: List[BaseAgentEvent | BaseChatMessage] = []
+        self._message_thread: MessageThread = message_thread if message_thread is not None else InMemoryMessageThread()
+        self._message_thread.set_message_factory(message_factory)
         self._output_message_queue = output_message_queue
         self._termination_condition = termination_condition
         self._max_turns = max_turns
         self._current_turn = 0
         self._message_factory = message_factory
         self._emit_team_events = emit_team_events
+        # The speakers of the current turn and the responses received from them so far.
+        self._active_speakers: List[str] = []
+        self._pending_responses: Dict[str, Response] = {}
 
     @rpc
     async def handle_start(self, message: GroupChatStart, ctx: MessageContext) -> None:
@@ -122,56 +130,54 @@ async def handle_start(self, message: GroupChatStart, ctx: MessageContext) -> No
                 # Stop the group chat.
                 return
 
-        # Select a speaker to start/continue the conversation
-        speaker_name_future = asyncio.ensure_future(self.select_speaker(self._message_thread))
-        # Link the select speaker future to the cancellation token.
-        ctx.cancellation_token.link_future(speaker_name_future)
-        speaker_name = await speaker_name_future
-        if speaker_name not in self._participant_name_to_topic_type:
-            raise RuntimeError(f"Speaker {speaker_name} not found in participant names.")
-        await self._log_speaker_selection(speaker_name)
-
-        # Send the message to the next speaker
-        speaker_topic_type = self._participant_name_to_topic_type[speaker_name]
-        await self.publish_message(
-            GroupChatRequestPublish(),
-            topic_id=DefaultTopicId(type=speaker_topic_type),
-            cancellation_token=ctx.cancellation_token,
-        )
+        # Select the speakers to start/continue the conversation
+        await self._transition_to_next_speakers(ctx.cancellation_token)
 
     @event
     async def handle_agent_response(self, message: GroupChatAgentResponse, ctx: MessageContext) -> None:
         try:
-            # Append the message to the message thread and construct the delta.
+            if message.agent_name in self._active_speakers:
+                # Wait for all the active speakers to respond.
+                self._pending_responses[message.agent_name] = message.agent_response
+                if len(self._pending_responses) < len(self._active_speakers):
+                    return
+                # Merge the responses in the order in which the speakers were selected.
+                responses = [self._pending_responses[name] for name in self._active_speakers]
+                speaker_names = self._active_speakers
+                self._active_speakers = []
+                self._pending_responses.clear()
+                if len(speaker_names) > 1:
+                    # Relay the turn to the participants so that all of them receive it in the same order.
+                    await self.publish_message(
+                        GroupChatTurn(
+                            responses=[
+                                GroupChatAgentResponse(agent_response=response, agent_name=name, concurrent=True)
+                                for name, response in zip(speaker_names, responses, strict=True)
+                            ]
+                        ),
+                        topic_id=DefaultTopicId(type=self._group_topic_type),
+                        cancellation_token=ctx.cancellation_token,
+                    )
+            else:
+                responses = [message.agent_response]
+
+            # Append the messages to the message thread and construct the delta.
             delta: List[BaseAgentEvent | BaseChatMessage] = []
-            if message.agent_response.inner_messages is not None:
-                for inner_message in message.agent_response.inner_messages:
-                    self._message_thread.append(inner_message)
-                    delta.append(inner_message)
-            self._message_thread.append(message.agent_response.chat_message)
-            delta.append(message.agent_response.chat_message)
+            for response in responses:
+                if response.inner_messages is not None:
+                    for inner_message in response.inner_messages:
+                        self._message_thread.append(inner_message)
+                        delta.append(inner_message)
+                self._message_thread.append(response.chat_message)
+                delta.append(response.chat_message)
 
             # Check if the conversation should be terminated.
             if await self._apply_termination_condition(delta, increment_turn_count=True):
                 # Stop the group chat.
                 return
 
-            # Select a speaker to continue the conversation.
-            speaker_name_future = asyncio.ensure_future(self.select_speaker(self._message_thread))
-            # Link the select speaker future to the cancellation token.
-            ctx.cancellation_token.link_future(speaker_name_future)
-            speaker_name = await speaker_name_future
-            if speaker_name not in self._participant_name_to_topic_type:
-                raise RuntimeError(f"Speaker {speaker_name} not found in participant names.")
-            await self._log_speaker_selection(speaker_name)
-
-            # Send the message to the next speakers
-            speaker_topic_type = self._participant_name_to_topic_type[speaker_name]
-            await self.publish_message(
-                GroupChatRequestPublish(),
-                topic_id=DefaultTopicId(type=speaker_topic_type),
-                cancellation_token=ctx.cancellation_token,
-            )
+            # Select the speakers to continue the conversation.
+            await self._transition_to_next_speakers(ctx.cancellation_token)
         except Exception as e:
             # Handle the exception and signal termination with an error.
             error = SerializableException.from_exception(e)
@@ -214,9 +220,37 @@ async def _apply_termination_condition(
                 return True
         return False
 
-    async def _log_speaker_selection(self, speaker_name: str) -> None:
-        """Log the selected speaker to the output message queue."""
-        select_msg = SelectSpeakerEvent(content=[speaker_name], source=self._name)
+    async def _transition_to_next_speakers(self, cancellation_token: CancellationToken) -> None:
+        """Select the next speakers and request all of them to speak at once."""
+        speaker_names_future = asyncio.ensure_future(self.select_speaker(self._message_thread))
+        # Link the select speaker future to the cancellation token.
+        cancellation_token.link_future(speaker_names_future)
+        speaker_names = await speaker_names_future
+        if isinstance(speaker_names, str):
+            speaker_names = [speaker_names]
+        # Drop repeated names, keeping the order of selection.
+        speaker_names = list(dict.fromkeys(speaker_names))
+        if not speaker_names:
+            raise RuntimeError("No speaker was selected.")
+        for speaker_name in speaker_names:
+            if speaker_name not in self._participant_name_to_topic_type:
+                raise RuntimeError(f"Speaker {speaker_name} not found in participant names.")
+        self._active_speakers = speaker_names
+        self._pending_responses.clear()
+        await self._log_speaker_selection(speaker_names)
+
+        # Send the request to the next speakers.
+        for speaker_name in speaker_names:
+            speaker_topic_type = self._participant_name_to_topic_type[speaker_name]
+            await self.publish_message(
+                GroupChatRequestPublish(concurrent=len(speaker_names) > 1),
+                topic_id=DefaultTopicId(type=speaker_topic_type),
+                cancellation_token=cancellation_token,
+            )
+
+    async def _log_speaker_selection(self, speaker_names: List[str]) -> None:
+        """Log the selected speakers to the output message queue."""
+        select_msg = SelectSpeakerEvent(content=speaker_names, source=self._name)
         if self._emit_team_events:
             await self.publish_message(
                 GroupChatMessage(message=select_msg),
@@ -249,7 +283,8 @@ async def _signal_termination_with_error(self, error: SerializableException) ->
     @event
     async def handle_group_chat_message(self, message: GroupChatMessage, ctx: MessageContext) -> None:
         """Handle a group chat message by appending the content to its output message queue."""
-        await self._output_message_queue.put(message.message)
+        if not message.delivered:
+            await self._output_message_queue.put(message.message)
 
     @event
     async def handle_group_chat_error(self, message: GroupChatError, ctx: MessageContext) -> None:
@@ -260,6 +295,8 @@ async def handle_group_chat_error(self, message: GroupChatError, ctx: MessageCon
     async def handle_reset(self, message: GroupChatReset, ctx: MessageContext) -> None:
         """Reset the group chat manager. Calling :meth:`reset` to reset the group chat manager
         and clear the message thread."""
+        self._active_speakers = []
+        self._pending_responses.clear()
         await self.reset()
 
     @rpc
@@ -282,10 +319,32 @@ async def validate_group_state(self, messages: List[BaseChatMessage] | None) ->
         """
         ...
 
+    def _save_message_thread(self) -> Dict[str, Any]:
+        """Get the state fields that save the message thread: a checkpoint if the
+        message thread supports it, otherwise all the messages."""
+        checkpoint = self._message_thread.save_checkpoint()
+        if checkpoint is not None:
+            return {"message_thread_checkpoint": checkpoint}
+        return {"message_thread": [message.dump() for message in self._message_thread]}
+
+    def _load_message_thread(self, state: BaseGroupChatManagerState) -> None:
+        """Restore the message thread saved by :meth:`_save_message_thread`."""
+        if state.message_thread_checkpoint is not None:
+            self._message_thread.load_checkpoint(state.message_thread_checkpoint)
+        else:
+            self._message_thread.clear()
+            self._message_thread.extend(self._message_factory.create(message) for message in state.message_thread)
+
     @abstractmethod
-    async def select_speaker(self, thread: List[BaseAgentEvent | BaseChatMessage]) -> str:
+    async def select_speaker(self, thread: Sequence[BaseAgentEvent | BaseChatMessage]) -> List[str] | str:
         """Select a speaker from the participants and return the
-        topic type of the selected speaker."""
+        name of the selected speaker.
+
+        Return a list of names to select several speakers for the next turn.
+        They are requested to speak at the same time, and once all of them have
+        responded, their responses are appended to the message thread in the order
+        of the list and the termination condition is applied to all of them together.
+        Each participant receives the responses of the other speakers before it speaks again."""
         ...
 
     @abstractmethod
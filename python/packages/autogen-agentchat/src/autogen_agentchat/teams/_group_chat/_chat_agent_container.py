@@ -1,8 +1,14 @@
+import asyncio
 from typing import Any, List, Mapping
 
 from autogen_core import DefaultTopicId, MessageContext, event, rpc
 
-from autogen_agentchat.messages import BaseAgentEvent, BaseChatMessage, MessageFactory
+from autogen_agentchat.messages import (
+    BaseAgentEvent,
+    BaseChatMessage,
+    MessageFactory,
+    ModelClientStreamingChunkEvent,
+)
 
 from ...base import ChatAgent, Response
 from ...state import ChatAgentContainerState
@@ -15,6 +21,8 @@
     GroupChatReset,
     GroupChatResume,
     GroupChatStart,
+    GroupChatTermination,
+    GroupChatTurn,
     SerializableException,
 )
 from ._sequential_routed_agent import SequentialRoutedAgent
@@ -31,10 +39,20 @@ class ChatAgentContainer(SequentialRoutedAgent):
         agent (ChatAgent): The agent to delegate message handling to.
         message_factory (MessageFactory): The message factory to use for
             creating messages from JSON data.
+        output_message_queue (asyncio.Queue[BaseAgentEvent | BaseChatMessage | GroupChatTermination] | None, optional):
+            The output message queue of the team. If provided, the messages produced by the agent
+            are put in the queue directly, and :class:`~autogen_agentchat.messages.ModelClientStreamingChunkEvent`
+            messages are not published to the output topic, so token streaming does not go through the runtime.
+            Other messages are still published to the output topic. Defaults to None.
     """
 
     def __init__(
-        self, parent_topic_type: str, output_topic_type: str, agent: ChatAgent, message_factory: MessageFactory
+        self,
+        parent_topic_type: str,
+        output_topic_type: str,
+        agent: ChatAgent,
+        message_factory: MessageFactory,
+        output_message_queue: asyncio.Queue[BaseAgentEvent | BaseChatMessage | GroupChatTermination] | None = None,
     ) -> None:
         super().__init__(
             description=agent.description,
@@ -43,6 +61,7 @@ def __init__(
                 GroupChatRequestPublish,
                 GroupChatReset,
                 GroupChatAgentResponse,
+                GroupChatTurn,
             ],
         )
         self._parent_topic_type = parent_topic_type
@@ -50,6 +69,7 @@ def __init__(
         self._agent = agent
         self._message_buffer: List[BaseChatMessage] = []
         self._message_factory = message_factory
+        self._output_message_queue = output_message_queue
 
     @event
     async def handle_start(self, message: GroupChatStart, ctx: MessageContext) -> None:
@@ -60,9 +80,21 @@ async def handle_start(self, message: GroupChatStart, ctx: MessageContext) -> No
 
     @event
     async def handle_agent_response(self, message: GroupChatAgentResponse, ctx: MessageContext) -> None:
-        """Handle an agent response event by appending the content to the buffer."""
+        """Handle an agent response event by appending the content to the buffer.
+        A response of a turn with several speakers is buffered when the whole turn is received."""
+        if message.concurrent:
+            return
         self._buffer_message(message.agent_response.chat_message)
 
+    @event
+    async def handle_turn(self, message: GroupChatTurn, ctx: MessageContext) -> None:
+        """Handle the responses of a turn with several speakers by appending them to the buffer
+        in the order in which the speakers were selected."""
+        for response in message.responses:
+            # The delegate agent already has its own response.
+            if response.agent_name != self._agent.name:
+                self._buffer_message(response.agent_response.chat_message)
+
     @rpc
     async def handle_reset(self, message: GroupChatReset, ctx: MessageContext) -> None:
         """Handle a reset event by resetting the agent."""
@@ -89,7 +121,9 @@ async def handle_request(self, message: GroupChatRequestPublish, ctx: MessageCon
             # Publish the response to the group chat.
             self._message_buffer.clear()
             await self.publish_message(
-                GroupChatAgentResponse(agent_response=response),
+                GroupChatAgentResponse(
+                    agent_response=response, agent_name=self._agent.name, concurrent=message.concurrent
+                ),
                 topic_id=DefaultTopicId(type=self._parent_topic_type),
                 cancellation_token=ctx.cancellation_token,
             )
@@ -113,9 +147,14 @@ def _buffer_message(self, message: BaseChatMessage) -> None:
     async def _log_message(self, message: BaseAgentEvent | BaseChatMessage) -> None:
         if not self._message_factory.is_registered(message.__class__):
             raise ValueError(f"Message type {message.__class__} is not registered.")
+        if self._output_message_queue is not None:
+            # Deliver all the messages of the agent directly so that they stay in order.
+            await self._output_message_queue.put(message)
+            if isinstance(message, ModelClientStreamingChunkEvent):
+                return
         # Log the message.
         await self.publish_message(
-            GroupChatMessage(message=message),
+            GroupChatMessage(message=message, delivered=self._output_message_queue is not None),
             topic_id=DefaultTopicId(type=self._output_topic_type),
         )
 
@@ -48,11 +48,26 @@ class GroupChatAgentResponse(BaseModel):
     agent_response: Response
     """The response from an agent."""
 
+    agent_name: str
+    """The name of the agent that produced this response."""
+
+    concurrent: bool = False
+    """Whether the response is part of a turn with several speakers.
+    The participants then receive it in a :class:`GroupChatTurn` once the turn is complete."""
+
+
+class GroupChatTurn(BaseModel):
+    """The responses of a turn with several speakers, published once all of them have responded."""
+
+    responses: List[GroupChatAgentResponse]
+    """The responses in the order in which the speakers were selected."""
+
 
 class GroupChatRequestPublish(BaseModel):
     """A request to publish a message to a group chat."""
 
-    ...
+    concurrent: bool = False
+    """Whether other participants are requested to speak in the same turn."""
 
 
 class GroupChatMessage(BaseModel):
@@ -61,6 +76,9 @@ class GroupChatMessage(BaseModel):
     message: BaseAgentEvent | BaseChatMessage
     """The message that was published."""
 
+    delivered: bool = False
+    """Whether the message has already been put in the team's output message queue."""
+
 
 class GroupChatTermination(BaseModel):
     """A message indicating that a group chat has terminated."""
@@ -12,6 +12,7 @@
 from ....messages import BaseAgentEvent, BaseChatMessage, MessageFactory
 from .._base_group_chat import BaseGroupChat
 from .._events import GroupChatTermination
+from .._message_thread import MessageThread
 from ._magentic_one_orchestrator import MagenticOneOrchestrator
 from ._prompts import ORCHESTRATOR_FINAL_ANSWER_PROMPT
 
@@ -48,6 +49,10 @@ class MagenticOneGroupChat(BaseGroupChat, Component[MagenticOneGroupChatConfig])
         max_stalls (int, optional): The maximum number of stalls allowed before re-planning. Defaults to 3.
         final_answer_prompt (str, optional): The LLM prompt used to generate the final answer or response from the team's transcript. A default (sensible for GPT-4o class models) is provided.
         emit_team_events (bool, optional): Whether to emit team events through :meth:`BaseGroupChat.run_stream`. Defaults to False.
+        message_thread (MessageThread | None, optional): The storage for the message thread of the group chat manager.
+            Defaults to None, which uses an :class:`~autogen_agentchat.teams.InMemoryMessageThread`.
+            Use a :class:`~autogen_agentchat.teams.DiskMessageThread` to keep only the most recent messages in memory
+            for long running teams.
 
     Raises:
         ValueError: In orchestration logic if progress ledger does not have required keys or if next speaker is not valid.
@@ -106,6 +111,7 @@ def __init__(
         max_stalls: int = 3,
         final_answer_prompt: str = ORCHESTRATOR_FINAL_ANSWER_PROMPT,
         emit_team_events: bool = False,
+        message_thread: MessageThread | None = None,
     ):
         super().__init__(
             participants,
@@ -115,6 +121,7 @@ def __init__(
             max_turns=max_turns,
             runtime=runtime,
             emit_team_events=emit_team_events,
+            message_thread=message_thread,
         )
 
         # Validate the participants.
@@ -152,6 +159,7 @@ def _create_group_chat_manager_factory(
             output_message_queue,
             termination_condition,
             self._emit_team_events,
+            message_thread=self._message_thread,
         )
 
     def _to_config(self) -> MagenticOneGroupChatConfig:
@@ -2,7 +2,7 @@
 import json
 import logging
 import re
-from typing import Any, Dict, List, Mapping
+from typing import Any, Dict, List, Mapping, Sequence
 
 from autogen_core import AgentId, CancellationToken, DefaultTopicId, MessageContext, event, rpc
 from autogen_core.models import (
@@ -38,6 +38,7 @@
     GroupChatStart,
     GroupChatTermination,
 )
+from .._message_thread import MessageThread
 from ._prompts import (
     ORCHESTRATOR_FINAL_ANSWER_PROMPT,
     ORCHESTRATOR_PROGRESS_LEDGER_PROMPT,
@@ -70,6 +71,7 @@ def __init__(
         output_message_queue: asyncio.Queue[BaseAgentEvent | BaseChatMessage | GroupChatTermination],
         termination_condition: TerminationCondition | None,
         emit_team_events: bool,
+        message_thread: MessageThread | None = None,
     ):
         super().__init__(
             name,
@@ -83,6 +85,7 @@ def __init__(
             max_turns,
             message_factory,
             emit_team_events=emit_team_events,
+            message_thread=message_thread,
         )
         self._model_client = model_client
         self._max_stalls = max_stalls
@@ -209,7 +212,7 @@ async def validate_group_state(self, messages: List[BaseChatMessage] | None) ->
 
     async def save_state(self) -> Mapping[str, Any]:
         state = MagenticOneOrchestratorState(
-            message_thread=[msg.dump() for msg in self._message_thread],
+            **self._save_message_thread(),
             current_turn=self._current_turn,
             task=self._task,
             facts=self._facts,
@@ -221,7 +224,7 @@ async def save_state(self) -> Mapping[str, Any]:
 
     async def load_state(self, state: Mapping[str, Any]) -> None:
         orchestrator_state = MagenticOneOrchestratorState.model_validate(state)
-        self._message_thread = [self._message_factory.create(message) for message in orchestrator_state.message_thread]
+        self._load_message_thread(orchestrator_state)
         self._current_turn = orchestrator_state.current_turn
         self._task = orchestrator_state.task
         self._facts = orchestrator_state.facts
@@ -229,7 +232,7 @@ async def load_state(self, state: Mapping[str, Any]) -> None:
         self._n_rounds = orchestrator_state.n_rounds
         self._n_stalls = orchestrator_state.n_stalls
 
-    async def select_speaker(self, thread: List[BaseAgentEvent | BaseChatMessage]) -> str:
+    async def select_speaker(self, thread: Sequence[BaseAgentEvent | BaseChatMessage]) -> str:
         """Not used in this orchestrator, we select next speaker in _orchestrate_step."""
         return ""
 
@@ -275,7 +278,7 @@ async def _reenter_outer_loop(self, cancellation_token: CancellationToken) -> No
 
         # Broadcast
         await self.publish_message(
-            GroupChatAgentResponse(agent_response=Response(chat_message=ledger_message)),
+            GroupChatAgentResponse(agent_response=Response(chat_message=ledger_message), agent_name=self._name),
             topic_id=DefaultTopicId(type=self._group_topic_type),
         )
 
@@ -389,7 +392,7 @@ async def _orchestrate_step(self, cancellation_token: CancellationToken) -> None
 
         # Broadcast it
         await self.publish_message(  # Broadcast
-            GroupChatAgentResponse(agent_response=Response(chat_message=message)),
+            GroupChatAgentResponse(agent_response=Response(chat_message=message), agent_name=self._name),
             topic_id=DefaultTopicId(type=self._group_topic_type),
             cancellation_token=cancellation_token,
         )
@@ -470,7 +473,7 @@ async def _prepare_final_answer(self, reason: str, cancellation_token: Cancellat
 
         # Broadcast
         await self.publish_message(
-            GroupChatAgentResponse(agent_response=Response(chat_message=message)),
+            GroupChatAgentResponse(agent_response=Response(chat_message=message), agent_name=self._name),
             topic_id=DefaultTopicId(type=self._group_topic_type),
             cancellation_token=cancellation_token,
         )
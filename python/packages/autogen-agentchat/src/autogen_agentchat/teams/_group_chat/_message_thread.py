@@ -0,0 +1,341 @@
+import json
+import mmap
+import os
+from abc import ABC, abstractmethod
+from array import array
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Mapping, Sequence, overload
+
+from ...messages import BaseAgentEvent, BaseChatMessage, MessageFactory
+
+
+class MessageThread(ABC, Sequence[BaseAgentEvent | BaseChatMessage]):
+    """The storage for the message thread of a group chat manager.
+
+    The thread is a sequence of messages that the group chat manager appends to
+    and passes to :meth:`~autogen_agentchat.teams.BaseGroupChatManager.select_speaker`.
+    Implementations decide where the messages are kept and how the thread is saved.
+    """
+
+    def set_message_factory(self, message_factory: MessageFactory) -> None:
+        """Set the factory used to create messages that are read back from storage.
+
+        The group chat manager calls this with the message factory of the team."""
+        pass
+
+    @abstractmethod
+    def append(self, message: BaseAgentEvent | BaseChatMessage) -> None:
+        """Append a message to the thread."""
+        ...
+
+    def extend(self, messages: Iterable[BaseAgentEvent | BaseChatMessage]) -> None:
+        """Append messages to the thread."""
+        for message in messages:
+            self.append(message)
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all messages from the thread."""
+        ...
+
+    def save_checkpoint(self) -> Mapping[str, Any] | None:
+        """Save a checkpoint of the thread that :meth:`load_checkpoint` can restore.
+
+        Returns:
+            The checkpoint, or None if the thread is not persisted by itself and the
+            group chat manager must save all the messages in its state.
+        """
+        return None
+
+    def load_checkpoint(self, checkpoint: Mapping[str, Any]) -> None:
+        """Restore the thread to a checkpoint returned by :meth:`save_checkpoint`."""
+        raise NotImplementedError(f"{type(self).__name__} does not support checkpoints.")
+
+    def __eq__(self, other: object) -> bool:
+        # Compare by messages, also with a list, so that a thread behaves like the list it replaces.
+        if isinstance(other, (MessageThread, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=False))  # type: ignore
+        return NotImplemented
+
+
+class InMemoryMessageThread(MessageThread):
+    """A message thread that keeps all the messages in a list.
+
+    This is the default message thread. The group chat manager saves all the
+    messages in its state."""
+
+    def __init__(self) -> None:
+        self._messages: List[BaseAgentEvent | BaseChatMessage] = []
+
+    def append(self, message: BaseAgentEvent | BaseChatMessage) -> None:
+        self._messages.append(message)
+
+    def extend(self, messages: Iterable[BaseAgentEvent | BaseChatMessage]) -> None:
+        self._messages.extend(messages)
+
+    def clear(self) -> None:
+        self._messages.clear()
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    @overload
+    def __getitem__(self, index: int) -> BaseAgentEvent | BaseChatMessage: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[BaseAgentEvent | BaseChatMessage]: ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> BaseAgentEvent | BaseChatMessage | List[BaseAgentEvent | BaseChatMessage]:
+        return self._messages[index]
+
+    def __iter__(self) -> Iterator[BaseAgentEvent | BaseChatMessage]:
+        return iter(self._messages)
+
+    def __reversed__(self) -> Iterator[BaseAgentEvent | BaseChatMessage]:
+        return reversed(self._messages)
+
+
+class DiskMessageThread(MessageThread):
+    """A message thread that writes every message to an append-only log on disk
+    and keeps only the most recent messages in memory.
+
+    The log is a sequence of segment files in `directory`, each holding one JSON
+    serialized message per line. Older messages are read back from the segments
+    through memory maps when they are accessed, so a long running team, e.g., a
+    :class:`~autogen_agentchat.teams.Swarm` or a
+    :class:`~autogen_agentchat.teams.MagenticOneGroupChat` that runs for days,
+    holds only the last `max_in_memory_messages` messages and an index of
+    offsets in memory.
+
+    Because the log already holds the messages, the group chat manager's saved
+    state only contains the number of messages in the thread. Loading the state
+    truncates the log to that number, so the log must not be deleted or shared
+    with another team while the saved state is in use.
+
+    Example:
+
+        .. code-block:: python
+
+            from autogen_agentchat.teams import DiskMessageThread, Swarm
+
+            team = Swarm(
+                [travel_agent, flights_refunder, user_proxy],
+                termination_condition=termination,
+                message_thread=DiskMessageThread("./swarm_thread", max_in_memory_messages=200),
+            )
+
+    Args:
+        directory: The directory of the segment files. It is created if it does not exist,
+            and an existing log in it is opened.
+        max_in_memory_messages: The number of most recent messages kept in memory. Defaults to 1000.
+        max_segment_bytes: A new segment file is started once the current one reaches this size.
+            Defaults to 64 MiB.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        max_in_memory_messages: int = 1000,
+        max_segment_bytes: int = 64 * 1024 * 1024,
+    ) -> None:
+        if max_in_memory_messages < 0:
+            raise ValueError("max_in_memory_messages must not be negative.")
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_in_memory_messages = max_in_memory_messages
+        self._max_segment_bytes = max_segment_bytes
+        self._message_factory = MessageFactory()
+        # The segment and the offset in the segment of each message, and the end of the last message.
+        self._segments = array("q")
+        self._offsets = array("q")
+        self._segment_end = 0
+        # The most recent messages.
+        self._tail: Deque[BaseAgentEvent | BaseChatMessage] = deque(maxlen=max_in_memory_messages or None)
+        self._writer: Any = None
+        self._writer_segment = -1
+        self._maps: Dict[int, mmap.mmap] = {}
+        self._open_existing()
+
+    @property
+    def directory(self) -> Path:
+        """The directory of the segment files."""
+        return self._directory
+
+    def set_message_factory(self, message_factory: MessageFactory) -> None:
+        self._message_factory = message_factory
+
+    def append(self, message: BaseAgentEvent | BaseChatMessage) -> None:
+        data = json.dumps(message.dump()).encode() + b"\n"
+        segment = self._segments[-1] if self._segments else 0
+        if self._segment_end > 0 and self._segment_end + len(data) > self._max_segment_bytes:
+            segment += 1
+            self._segment_end = 0
+        writer = self._get_writer(segment)
+        writer.write(data)
+        self._segments.append(segment)
+        self._offsets.append(self._segment_end)
+        self._segment_end += len(data)
+        if self._max_in_memory_messages > 0:
+            self._tail.append(message)
+
+    def clear(self) -> None:
+        self._close()
+        for path in self._segment_paths():
+            path.unlink()
+        self._segments = array("q")
+        self._offsets = array("q")
+        self._segment_end = 0
+        self._tail.clear()
+
+    def close(self) -> None:
+        """Flush and close the segment files. The thread reopens them when it is used again."""
+        self._close()
+
+    def save_checkpoint(self) -> Mapping[str, Any] | None:
+        if self._writer is not None:
+            self._writer.flush()
+        return {"directory": str(self._directory), "length": len(self)}
+
+    def load_checkpoint(self, checkpoint: Mapping[str, Any]) -> None:
+        if Path(checkpoint["directory"]).resolve() != self._directory.resolve():
+            raise ValueError(
+                f"The checkpoint is of the message thread in {checkpoint['directory']}, not in {self._directory}."
+            )
+        length = int(checkpoint["length"])
+        if len(self) < length:
+            raise ValueError(
+                f"The message thread in {self._directory} has {len(self)} messages, "
+                f"fewer than the {length} messages in the checkpoint."
+            )
+        self._truncate(length)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    @overload
+    def __getitem__(self, index: int) -> BaseAgentEvent | BaseChatMessage: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[BaseAgentEvent | BaseChatMessage]: ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> BaseAgentEvent | BaseChatMessage | List[BaseAgentEvent | BaseChatMessage]:
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("message thread index out of range")
+        return self._get(index)
+
+    def __iter__(self) -> Iterator[BaseAgentEvent | BaseChatMessage]:
+        for i in range(len(self)):
+            yield self._get(i)
+
+    def __reversed__(self) -> Iterator[BaseAgentEvent | BaseChatMessage]:
+        for i in reversed(range(len(self))):
+            yield self._get(i)
+
+    def _get(self, index: int) -> BaseAgentEvent | BaseChatMessage:
+        tail_start = len(self) - len(self._tail)
+        if index >= tail_start:
+            return self._tail[index - tail_start]
+        return self._message_factory.create(json.loads(self._read(index)))
+
+    def _read(self, index: int) -> bytes:
+        segment = self._segments[index]
+        start = self._offsets[index]
+        if index + 1 < len(self) and self._segments[index + 1] == segment:
+            end = self._offsets[index + 1]
+        elif segment == self._segments[-1]:
+            end = self._segment_end
+        else:
+            end = self._segment_path(segment).stat().st_size
+        segment_map = self._maps.get(segment)
+        if segment_map is None or len(segment_map) < end:
+            if self._writer is not None and self._writer_segment == segment:
+                self._writer.flush()
+            if segment_map is not None:
+                segment_map.close()
+            with open(self._segment_path(segment), "rb") as f:
+                segment_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[segment] = segment_map
+        return segment_map[start:end]
+
+    def _get_writer(self, segment: int) -> Any:
+        if self._writer is None or self._writer_segment != segment:
+            if self._writer is not None:
+                self._writer.close()
+            self._writer = open(self._segment_path(segment), "ab")
+            self._writer_segment = segment
+        return self._writer
+
+    def _segment_path(self, segment: int) -> Path:
+        return self._directory / f"segment-{segment:06d}.jsonl"
+
+    def _segment_paths(self) -> List[Path]:
+        return sorted(self._directory.glob("segment-*.jsonl"))
+
+    def _open_existing(self) -> None:
+        """Index the messages of an existing log."""
+        segment_ends: Dict[int, int] = {}
+        for path in self._segment_paths():
+            segment = int(path.stem.split("-")[1])
+            offset = 0
+            with open(path, "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        # Drop a partially written message.
+                        break
+                    self._segments.append(segment)
+                    self._offsets.append(offset)
+                    offset += len(line)
+            if offset < path.stat().st_size:
+                os.truncate(path, offset)
+            segment_ends[segment] = offset
+        if not self._segments:
+            self.clear()
+            return
+        # Segments after the one of the last message hold no complete message, e.g., when a write
+        # was interrupted at a segment rollover. Remove them so that appends continue the last segment.
+        last_segment = self._segments[-1]
+        for path in self._segment_paths():
+            if int(path.stem.split("-")[1]) > last_segment:
+                path.unlink()
+        self._segment_end = segment_ends[last_segment]
+
+    def _truncate(self, length: int) -> None:
+        if length == len(self):
+            return
+        self._close()
+        if length == 0:
+            self.clear()
+            return
+        # Drop the truncated messages from the tail, which keeps the messages before them.
+        for _ in range(min(len(self._tail), len(self) - length)):
+            self._tail.pop()
+        segment = self._segments[length - 1]
+        end = self._offsets[length] if self._segments[length] == segment else None
+        for path in self._segment_paths():
+            path_segment = int(path.stem.split("-")[1])
+            if path_segment > segment:
+                path.unlink()
+            elif path_segment == segment and end is not None:
+                os.truncate(path, end)
+        del self._segments[length:]
+        del self._offsets[length:]
+        self._segment_end = self._segment_path(segment).stat().st_size
+
+    def _close(self) -> None:
+        for segment_map in self._maps.values():
+            segment_map.close()
+        self._maps.clear()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            self._writer_segment = -1
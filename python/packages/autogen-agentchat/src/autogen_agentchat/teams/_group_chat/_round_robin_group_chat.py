@@ -1,5 +1,5 @@
 import asyncio
-from typing import Any, Callable, List, Mapping
+from typing import Any, Callable, List, Mapping, Sequence
 
 from autogen_core import AgentRuntime, Component, ComponentModel
 from pydantic import BaseModel
@@ -11,6 +11,7 @@
 from ._base_group_chat import BaseGroupChat
 from ._base_group_chat_manager import BaseGroupChatManager
 from ._events import GroupChatTermination
+from ._message_thread import MessageThread
 
 
 class RoundRobinGroupChatManager(BaseGroupChatManager):
@@ -29,6 +30,7 @@ def __init__(
         max_turns: int | None,
         message_factory: MessageFactory,
         emit_team_events: bool,
+        message_thread: MessageThread | None = None,
     ) -> None:
         super().__init__(
             name,
@@ -42,6 +44,7 @@ def __init__(
             max_turns,
             message_factory,
             emit_team_events,
+            message_thread=message_thread,
         )
         self._next_speaker_index = 0
 
@@ -57,7 +60,7 @@ async def reset(self) -> None:
 
     async def save_state(self) -> Mapping[str, Any]:
         state = RoundRobinManagerState(
-            message_thread=[message.dump() for message in self._message_thread],
+            **self._save_message_thread(),
             current_turn=self._current_turn,
             next_speaker_index=self._next_speaker_index,
         )
@@ -65,11 +68,11 @@ async def save_state(self) -> Mapping[str, Any]:
 
     async def load_state(self, state: Mapping[str, Any]) -> None:
         round_robin_state = RoundRobinManagerState.model_validate(state)
-        self._message_thread = [self._message_factory.create(message) for message in round_robin_state.message_thread]
+        self._load_message_thread(round_robin_state)
         self._current_turn = round_robin_state.current_turn
         self._next_speaker_index = round_robin_state.next_speaker_index
 
-    async def select_speaker(self, thread: List[BaseAgentEvent | BaseChatMessage]) -> str:
+    async def select_speaker(self, thread: Sequence[BaseAgentEvent | BaseChatMessage]) -> str:
         """Select a speaker from the participants in a round-robin fashion."""
         current_speaker_index = self._next_speaker_index
         self._next_speaker_index = (current_speaker_index + 1) % len(self._participant_names)
@@ -98,6 +101,10 @@ class RoundRobinGroupChat(BaseGroupChat, Component[RoundRobinGroupChatConfig]):
             Without a termination condition, the group chat will run indefinitely.
         max_turns (int, optional): The maximum number of turns in the group chat before stopping. Defaults to None, meaning no limit.
         emit_team_events (bool, optional): Whether to emit team events through :meth:`BaseGroupChat.run_stream`. Defaults to False.
+        message_thread (MessageThread | None, optional): The storage for the message thread of the group chat manager.
+            Defaults to None, which uses an :class:`~autogen_agentchat.teams.InMemoryMessageThread`.
+            Use a :class:`~autogen_agentchat.teams.DiskMessageThread` to keep only the most recent messages in memory
+            for long running teams.
 
     Raises:
         ValueError: If no participants are provided or if participant names are not unique.
@@ -172,6 +179,7 @@ def __init__(
         runtime: AgentRuntime | None = None,
         custom_message_types: List[type[BaseAgentEvent | BaseChatMessage]] | None = None,
         emit_team_events: bool = False,
+        message_thread: MessageThread | None = None,
     ) -> None:
         super().__init__(
             participants,
@@ -182,6 +190,7 @@ def __init__(
             runtime=runtime,
             custom_message_types=custom_message_types,
             emit_team_events=emit_team_events,
+            message_thread=message_thread,
         )
 
     def _create_group_chat_manager_factory(
@@ -210,6 +219,7 @@ def _factory() -> RoundRobinGroupChatManager:
                 max_turns,
                 message_factory,
                 self._emit_team_events,
+                message_thread=self._message_thread,
             )
 
         return _factory
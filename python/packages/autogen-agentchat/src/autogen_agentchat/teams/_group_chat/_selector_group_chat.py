@@ -5,6 +5,7 @@
 from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence, Union, cast
 
 from autogen_core import AgentRuntime, Component, ComponentModel
+from autogen_core.model_context import ChatCompletionContext, UnboundedChatCompletionContext
 from autogen_core.models import AssistantMessage, ChatCompletionClient, ModelFamily, SystemMessage, UserMessage
 from pydantic import BaseModel
 from typing_extensions import Self
@@ -21,11 +22,12 @@
 from ._base_group_chat import BaseGroupChat
 from ._base_group_chat_manager import BaseGroupChatManager
 from ._events import GroupChatTermination
+from ._message_thread import MessageThread
 
 trace_logger = logging.getLogger(TRACE_LOGGER_NAME)
 
-SyncSelectorFunc = Callable[[Sequence[BaseAgentEvent | BaseChatMessage]], str | None]
-AsyncSelectorFunc = Callable[[Sequence[BaseAgentEvent | BaseChatMessage]], Awaitable[str | None]]
+SyncSelectorFunc = Callable[[Sequence[BaseAgentEvent | BaseChatMessage]], str | List[str] | None]
+AsyncSelectorFunc = Callable[[Sequence[BaseAgentEvent | BaseChatMessage]], Awaitable[str | List[str] | None]]
 SelectorFuncType = Union[SyncSelectorFunc | AsyncSelectorFunc]
 
 SyncCandidateFunc = Callable[[Sequence[BaseAgentEvent | BaseChatMessage]], List[str]]
@@ -56,6 +58,8 @@ def __init__(
         max_selector_attempts: int,
         candidate_func: Optional[CandidateFuncType],
         emit_team_events: bool,
+        model_context: ChatCompletionContext | None = None,
+        message_thread: MessageThread | None = None,
     ) -> None:
         super().__init__(
             name,
@@ -69,6 +73,7 @@ def __init__(
             max_turns,
             message_factory,
             emit_team_events,
+            message_thread=message_thread,
         )
         self._model_client = model_client
         self._selector_prompt = selector_prompt
@@ -79,6 +84,19 @@ def __init__(
         self._max_selector_attempts = max_selector_attempts
         self._candidate_func = candidate_func
         self._is_candidate_func_async = iscoroutinefunction(self._candidate_func)
+        # The chat messages of the thread rendered as model text, added as the thread grows.
+        self._model_context = model_context if model_context is not None else UnboundedChatCompletionContext()
+        # The thread the model context was built from, and how much of it has been added.
+        self._model_context_thread: Sequence[BaseAgentEvent | BaseChatMessage] | None = None
+        self._model_context_thread_length = 0
+        # Agent roles, each on a single line.
+        self._roles = "\n".join(
+            re.sub(r"\s+", " ", f"{topic_type}: {description}").strip()
+            for topic_type, description in zip(self._participant_names, self._participant_descriptions, strict=True)
+        )
+        self._mention_patterns: Dict[str, re.Pattern[str]] = {
+            name: self._mention_pattern(name) for name in self._participant_names
+        }
 
     async def validate_group_state(self, messages: List[BaseChatMessage] | None) -> None:
         pass
@@ -89,10 +107,13 @@ async def reset(self) -> None:
         if self._termination_condition is not None:
             await self._termination_condition.reset()
         self._previous_speaker = None
+        await self._model_context.clear()
+        self._model_context_thread = None
+        self._model_context_thread_length = 0
 
     async def save_state(self) -> Mapping[str, Any]:
         state = SelectorManagerState(
-            message_thread=[msg.dump() for msg in self._message_thread],
+            **self._save_message_thread(),
             current_turn=self._current_turn,
             previous_speaker=self._previous_speaker,
         )
@@ -100,13 +121,15 @@ async def save_state(self) -> Mapping[str, Any]:
 
     async def load_state(self, state: Mapping[str, Any]) -> None:
         selector_state = SelectorManagerState.model_validate(state)
-        self._message_thread = [self._message_factory.create(msg) for msg in selector_state.message_thread]
+        self._load_message_thread(selector_state)
+        # Rebuild the model context from the loaded thread at the next selection.
+        self._model_context_thread = None
         self._current_turn = selector_state.current_turn
         self._previous_speaker = selector_state.previous_speaker
 
-    async def select_speaker(self, thread: List[BaseAgentEvent | BaseChatMessage]) -> str:
+    async def select_speaker(self, thread: Sequence[BaseAgentEvent | BaseChatMessage]) -> List[str] | str:
         """Selects the next speaker in a group chat using a ChatCompletion client,
-        with the selector function as override if it returns a speaker name.
+        with the selector function as override if it returns a speaker name or a list of speaker names.
 
         A key assumption is that the agent type is the same as the topic type, which we use as the agent name.
         """
@@ -120,11 +143,12 @@ async def select_speaker(self, thread: List[BaseAgentEvent | BaseChatMessage]) -
                 sync_selector_func = cast(SyncSelectorFunc, self._selector_func)
                 speaker = sync_selector_func(thread)
             if speaker is not None:
-                if speaker not in self._participant_names:
-                    raise ValueError(
-                        f"Selector function returned an invalid speaker name: {speaker}. "
-                        f"Expected one of: {self._participant_names}."
-                    )
+                for speaker_name in [speaker] if isinstance(speaker, str) else speaker:
+                    if speaker_name not in self._participant_names:
+                        raise ValueError(
+                            f"Selector function returned an invalid speaker name: {speaker_name}. "
+                            f"Expected one of: {self._participant_names}."
+                        )
                 # Skip the model based selection.
                 return speaker
 
@@ -152,34 +176,40 @@ async def select_speaker(self, thread: List[BaseAgentEvent | BaseChatMessage]) -
 
         assert len(participants) > 0
 
-        # Construct the history of the conversation.
-        history_messages: List[str] = []
-        for msg in thread:
-            if not isinstance(msg, BaseChatMessage):
-                # Only process chat messages.
-                continue
-            message = f"{msg.source}: {msg.to_model_text()}"
-            history_messages.append(
-                message.rstrip() + "\n\n"
-            )  # Create some consistency for how messages are separated in the transcript
-        history = "\n".join(history_messages)
-
-        # Construct agent roles.
-        # Each agent sould appear on a single line.
-        roles = ""
-        for topic_type, description in zip(self._participant_names, self._participant_descriptions, strict=True):
-            roles += re.sub(r"\s+", " ", f"{topic_type}: {description}").strip() + "\n"
-        roles = roles.strip()
-
         # Select the next speaker.
         if len(participants) > 1:
-            agent_name = await self._select_speaker(roles, participants, history, self._max_selector_attempts)
+            history = await self._construct_history(thread)
+            agent_name = await self._select_speaker(self._roles, participants, history, self._max_selector_attempts)
         else:
             agent_name = participants[0]
         self._previous_speaker = agent_name
         trace_logger.debug(f"Selected speaker: {agent_name}")
         return agent_name
 
+    async def _construct_history(self, thread: Sequence[BaseAgentEvent | BaseChatMessage]) -> str:
+        """Construct the transcript of the conversation from the messages in the model context,
+        after adding the chat messages of the thread that have not been added yet."""
+        if self._model_context_thread is not thread or len(thread) < self._model_context_thread_length:
+            # The thread was replaced, e.g., by loading a state, so rebuild the model context.
+            await self._model_context.clear()
+            self._model_context_thread = thread
+            self._model_context_thread_length = 0
+        for msg in thread[self._model_context_thread_length :]:
+            # Only process chat messages.
+            if isinstance(msg, BaseChatMessage):
+                await self._model_context.add_message(UserMessage(content=msg.to_model_text(), source=msg.source))
+        self._model_context_thread_length = len(thread)
+
+        history_messages: List[str] = []
+        for llm_message in await self._model_context.get_messages():
+            if not isinstance(llm_message, UserMessage):
+                continue
+            message = f"{llm_message.source}: {llm_message.content}"
+            history_messages.append(
+                message.rstrip() + "\n\n"
+            )  # Create some consistency for how messages are separated in the transcript
+        return "\n".join(history_messages)
+
     async def _select_speaker(self, roles: str, participants: List[str], history: str, max_attempts: int) -> str:
         select_speaker_prompt = self._selector_prompt.format(
             roles=roles, participants=str(participants), history=history
@@ -250,24 +280,29 @@ def _mentioned_agents(self, message_content: str, agent_names: List[str]) -> Dic
             Dict: a counter for mentioned agents.
         """
         mentions: Dict[str, int] = dict()
+        # Pad the message to help with matching
+        padded_content = f" {message_content} "
         for name in agent_names:
-            # Finds agent mentions, taking word boundaries into account,
-            # accommodates escaping underscores and underscores as spaces
-            regex = (
-                r"(?<=\W)("
-                + re.escape(name)
-                + r"|"
-                + re.escape(name.replace("_", " "))
-                + r"|"
-                + re.escape(name.replace("_", r"\_"))
-                + r")(?=\W)"
-            )
-            # Pad the message to help with matching
-            count = len(re.findall(regex, f" {message_content} "))
+            pattern = self._mention_patterns.get(name) or self._mention_pattern(name)
+            count = len(pattern.findall(padded_content))
             if count > 0:
                 mentions[name] = count
         return mentions
 
+    @staticmethod
+    def _mention_pattern(name: str) -> re.Pattern[str]:
+        # Finds agent mentions, taking word boundaries into account,
+        # accommodates escaping underscores and underscores as spaces
+        return re.compile(
+            r"(?<=\W)("
+            + re.escape(name)
+            + r"|"
+            + re.escape(name.replace("_", " "))
+            + r"|"
+            + re.escape(name.replace("_", r"\_"))
+            + r")(?=\W)"
+        )
+
 
 class SelectorGroupChatConfig(BaseModel):
     """The declarative configuration for SelectorGroupChat."""
@@ -281,6 +316,7 @@ class SelectorGroupChatConfig(BaseModel):
     # selector_func: ComponentModel | None
     max_selector_attempts: int = 3
     emit_team_events: bool = False
+    model_context: ComponentModel | None = None
 
 
 class SelectorGroupChat(BaseGroupChat, Component[SelectorGroupChatConfig]):
@@ -302,15 +338,28 @@ class SelectorGroupChat(BaseGroupChat, Component[SelectorGroupChatConfig]):
         max_selector_attempts (int, optional): The maximum number of attempts to select a speaker using the model. Defaults to 3.
             If the model fails to select a speaker after the maximum number of attempts, the previous speaker will be used if available,
             otherwise the first participant will be used.
-        selector_func (Callable[[Sequence[BaseAgentEvent | BaseChatMessage]], str | None], Callable[[Sequence[BaseAgentEvent | BaseChatMessage]], Awaitable[str | None]], optional): A custom selector
+        selector_func (Callable[[Sequence[BaseAgentEvent | BaseChatMessage]], str | List[str] | None], Callable[[Sequence[BaseAgentEvent | BaseChatMessage]], Awaitable[str | List[str] | None]], optional): A custom selector
             function that takes the conversation history and returns the name of the next speaker.
             If provided, this function will be used to override the model to select the next speaker.
             If the function returns None, the model will be used to select the next speaker.
+            If the function returns a list of names, those participants speak concurrently in the next turn,
+            and their responses are added to the conversation in the order of the list.
         candidate_func (Callable[[Sequence[BaseAgentEvent | BaseChatMessage]], List[str]], Callable[[Sequence[BaseAgentEvent | BaseChatMessage]], Awaitable[List[str]]], optional):
             A custom function that takes the conversation history and returns a filtered list of candidates for the next speaker
             selection using model. If the function returns an empty list or `None`, `SelectorGroupChat` will raise a `ValueError`.
             This function is only used if `selector_func` is not set. The `allow_repeated_speaker` will be ignored if set.
         emit_team_events (bool, optional): Whether to emit team events through :meth:`BaseGroupChat.run_stream`. Defaults to False.
+        model_context (ChatCompletionContext | None, optional): The model context that holds the conversation history
+            used in the selector prompt. Each chat message is added to it once, as a :class:`~autogen_core.models.UserMessage`
+            with the message's model text. Defaults to None, which uses an
+            :class:`~autogen_core.model_context.UnboundedChatCompletionContext` with the full history.
+            Use a :class:`~autogen_core.model_context.BufferedChatCompletionContext` to keep only the most recent messages,
+            or a :class:`~autogen_core.model_context.TokenLimitedChatCompletionContext` to keep the history within a token budget.
+            A shorter selector prompt also reduces the latency of speaker selection in long conversations.
+        message_thread (MessageThread | None, optional): The storage for the message thread of the group chat manager.
+            Defaults to None, which uses an :class:`~autogen_agentchat.teams.InMemoryMessageThread`.
+            Use a :class:`~autogen_agentchat.teams.DiskMessageThread` to keep only the most recent messages in memory
+            for long running teams.
 
     Raises:
         ValueError: If the number of participants is less than two or if the selector prompt is invalid.
@@ -453,6 +502,8 @@ def __init__(
         candidate_func: Optional[CandidateFuncType] = None,
         custom_message_types: List[type[BaseAgentEvent | BaseChatMessage]] | None = None,
         emit_team_events: bool = False,
+        model_context: ChatCompletionContext | None = None,
+        message_thread: MessageThread | None = None,
     ):
         super().__init__(
             participants,
@@ -463,6 +514,7 @@ def __init__(
             runtime=runtime,
             custom_message_types=custom_message_types,
             emit_team_events=emit_team_events,
+            message_thread=message_thread,
         )
         # Validate the participants.
         if len(participants) < 2:
@@ -473,6 +525,7 @@ def __init__(
         self._selector_func = selector_func
         self._max_selector_attempts = max_selector_attempts
         self._candidate_func = candidate_func
+        self._model_context = model_context
 
     def _create_group_chat_manager_factory(
         self,
@@ -505,6 +558,8 @@ def _create_group_chat_manager_factory(
             self._max_selector_attempts,
             self._candidate_func,
             self._emit_team_events,
+            self._model_context,
+            message_thread=self._message_thread,
         )
 
     def _to_config(self) -> SelectorGroupChatConfig:
@@ -518,6 +573,7 @@ def _to_config(self) -> SelectorGroupChatConfig:
             max_selector_attempts=self._max_selector_attempts,
             # selector_func=self._selector_func.dump_component() if self._selector_func else None,
             emit_team_events=self._emit_team_events,
+            model_context=self._model_context.dump_component() if self._model_context else None,
         )
 
     @classmethod
@@ -536,4 +592,5 @@ def _from_config(cls, config: SelectorGroupChatConfig) -> Self:
             # if config.selector_func
             # else None,
             emit_team_events=config.emit_team_events,
+            model_context=ChatCompletionContext.load_component(config.model_context) if config.model_context else None,
         )
@@ -1,5 +1,5 @@
 import asyncio
-from typing import Any, Callable, List, Mapping
+from typing import Any, Callable, List, Mapping, Sequence
 
 from autogen_core import AgentRuntime, Component, ComponentModel
 from pydantic import BaseModel
@@ -10,6 +10,7 @@
 from ._base_group_chat import BaseGroupChat
 from ._base_group_chat_manager import BaseGroupChatManager
 from ._events import GroupChatTermination
+from ._message_thread import MessageThread
 
 
 class SwarmGroupChatManager(BaseGroupChatManager):
@@ -28,6 +29,7 @@ def __init__(
         max_turns: int | None,
         message_factory: MessageFactory,
         emit_team_events: bool,
+        message_thread: MessageThread | None = None,
     ) -> None:
         super().__init__(
             name,
@@ -41,6 +43,7 @@ def __init__(
             max_turns,
             message_factory,
             emit_team_events,
+            message_thread=message_thread,
         )
         self._current_speaker = self._participant_names[0]
 
@@ -79,7 +82,7 @@ async def reset(self) -> None:
             await self._termination_condition.reset()
         self._current_speaker = self._participant_names[0]
 
-    async def select_speaker(self, thread: List[BaseAgentEvent | BaseChatMessage]) -> str:
+    async def select_speaker(self, thread: Sequence[BaseAgentEvent | BaseChatMessage]) -> str:
         """Select a speaker from the participants based on handoff message.
         Looks for the last handoff message in the thread to determine the next speaker."""
         if len(thread) == 0:
@@ -94,7 +97,7 @@ async def select_speaker(self, thread: List[BaseAgentEvent | BaseChatMessage]) -
 
     async def save_state(self) -> Mapping[str, Any]:
         state = SwarmManagerState(
-            message_thread=[msg.dump() for msg in self._message_thread],
+            **self._save_message_thread(),
             current_turn=self._current_turn,
             current_speaker=self._current_speaker,
         )
@@ -102,7 +105,7 @@ async def save_state(self) -> Mapping[str, Any]:
 
     async def load_state(self, state: Mapping[str, Any]) -> None:
         swarm_state = SwarmManagerState.model_validate(state)
-        self._message_thread = [self._message_factory.create(message) for message in swarm_state.message_thread]
+        self._load_message_thread(swarm_state)
         self._current_turn = swarm_state.current_turn
         self._current_speaker = swarm_state.current_speaker
 
@@ -130,6 +133,10 @@ class Swarm(BaseGroupChat, Component[SwarmConfig]):
             Without a termination condition, the group chat will run indefinitely.
         max_turns (int, optional): The maximum number of turns in the group chat before stopping. Defaults to None, meaning no limit.
         emit_team_events (bool, optional): Whether to emit team events through :meth:`BaseGroupChat.run_stream`. Defaults to False.
+        message_thread (MessageThread | None, optional): The storage for the message thread of the group chat manager.
+            Defaults to None, which uses an :class:`~autogen_agentchat.teams.InMemoryMessageThread`.
+            Use a :class:`~autogen_agentchat.teams.DiskMessageThread` to keep only the most recent messages in memory
+            for long running teams.
 
     Basic example:
 
@@ -218,6 +225,7 @@ def __init__(
         runtime: AgentRuntime | None = None,
         custom_message_types: List[type[BaseAgentEvent | BaseChatMessage]] | None = None,
         emit_team_events: bool = False,
+        message_thread: MessageThread | None = None,
     ) -> None:
         super().__init__(
             participants,
@@ -228,6 +236,7 @@ def __init__(
             runtime=runtime,
             custom_message_types=custom_message_types,
             emit_team_events=emit_team_events,
+            message_thread=message_thread,
         )
         # The first participant must be able to produce handoff messages.
         first_participant = self._participants[0]
@@ -260,6 +269,7 @@ def _factory() -> SwarmGroupChatManager:
                 max_turns,
                 message_factory,
                 self._emit_team_events,
+                message_thread=self._message_thread,
             )
 
         return _factory
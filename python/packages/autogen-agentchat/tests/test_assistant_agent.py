@@ -1,5 +1,8 @@
+import asyncio
 import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 
 import pytest
@@ -401,6 +404,78 @@ async def test_run_with_parallel_tools_with_empty_call_ids() -> None:
     assert state == state2
 
 
+class _ConcurrencyTracker:
+    def __init__(self) -> None:
+        self.running: Dict[str, int] = {}
+        self.max_running: Dict[str, int] = {}
+        self.max_total = 0
+
+    async def run(self, name: str, input: str) -> str:
+        self.running[name] = self.running.get(name, 0) + 1
+        self.max_running[name] = max(self.max_running.get(name, 0), self.running[name])
+        self.max_total = max(self.max_total, sum(self.running.values()))
+        await asyncio.sleep(0.01)
+        self.running[name] -= 1
+        return input
+
+
+@pytest.mark.asyncio
+async def test_run_with_parallel_tools_concurrency_limits() -> None:
+    tracker = _ConcurrencyTracker()
+
+    async def browser_action(input: str) -> str:
+        return await tracker.run("browser_action", input)
+
+    async def search(input: str) -> str:
+        return await tracker.run("search", input)
+
+    def thread_name(input: str) -> str:
+        return threading.current_thread().name
+
+    tool_calls = [
+        FunctionCall(id=str(i), arguments=json.dumps({"input": f"task{i}"}), name=name)
+        for i, name in enumerate(["browser_action"] * 6 + ["search"] * 14)
+    ]
+    tool_calls.append(FunctionCall(id="thread", arguments=json.dumps({"input": "task"}), name="thread_name"))
+    model_client = ReplayChatCompletionClient(
+        [CreateResult(finish_reason="function_calls", content=tool_calls, usage=RequestUsage(0, 0), cached=False)],
+        model_info={
+            "function_calling": True,
+            "vision": True,
+            "json_output": True,
+            "family": ModelFamily.GPT_4O,
+            "structured_output": True,
+        },
+    )
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="tool_pool") as executor:
+        agent = AssistantAgent(
+            "tool_use_agent",
+            model_client=model_client,
+            tools=[browser_action, search, thread_name],
+            max_concurrent_tool_calls=4,
+            tool_concurrency_limits={"browser_action": 2},
+            tool_executor=executor,
+        )
+        result = await agent.run(task="task")
+
+    assert tracker.max_total == 4
+    assert tracker.max_running["browser_action"] == 2
+    assert isinstance(result.messages[-2], ToolCallExecutionEvent)
+    # The results keep the order of the tool calls.
+    assert [r.call_id for r in result.messages[-2].content] == [call.id for call in tool_calls]
+    assert result.messages[-2].content[-1].content.startswith("tool_pool")
+
+    # The limits are part of the declarative configuration.
+    config = agent.dump_component()
+    assert config.config["max_concurrent_tool_calls"] == 4
+    assert config.config["tool_concurrency_limits"] == {"browser_action": 2}
+
+    with pytest.raises(ValueError):
+        AssistantAgent("agent", model_client=model_client, tools=[search], max_concurrent_tool_calls=0)
+    with pytest.raises(ValueError):
+        AssistantAgent("agent", model_client=model_client, tools=[search], tool_concurrency_limits={"unknown": 1})
+
+
 @pytest.mark.asyncio
 async def test_output_format() -> None:
     class AgentResponse(BaseModel):
@@ -18,6 +18,8 @@
     BaseAgentEvent,
     BaseChatMessage,
     HandoffMessage,
+    MessageFactory,
+    ModelClientStreamingChunkEvent,
     MultiModalMessage,
     SelectSpeakerEvent,
     StopMessage,
@@ -27,12 +29,29 @@
     ToolCallRequestEvent,
     ToolCallSummaryMessage,
 )
-from autogen_agentchat.teams import MagenticOneGroupChat, RoundRobinGroupChat, SelectorGroupChat, Swarm
+from autogen_agentchat.teams import (
+    InMemoryMessageThread,
+    MagenticOneGroupChat,
+    RoundRobinGroupChat,
+    SelectorGroupChat,
+    Swarm,
+)
+from autogen_agentchat.teams._group_chat._events import GroupChatMessage
 from autogen_agentchat.teams._group_chat._round_robin_group_chat import RoundRobinGroupChatManager
 from autogen_agentchat.teams._group_chat._selector_group_chat import SelectorGroupChatManager
 from autogen_agentchat.teams._group_chat._swarm_group_chat import SwarmGroupChatManager
 from autogen_agentchat.ui import Console
-from autogen_core import AgentId, AgentRuntime, CancellationToken, FunctionCall, SingleThreadedAgentRuntime
+from autogen_core import (
+    AgentId,
+    AgentInstantiationContext,
+    AgentRuntime,
+    CancellationToken,
+    DefaultInterventionHandler,
+    FunctionCall,
+    MessageContext,
+    SingleThreadedAgentRuntime,
+)
+from autogen_core.model_context import BufferedChatCompletionContext
 from autogen_core.models import (
     AssistantMessage,
     CreateResult,
@@ -634,6 +653,51 @@ async def test_round_robin_group_chat_cancellation(runtime: AgentRuntime | None)
     assert result.stop_reason is not None and result.stop_reason == "Maximum number of turns 1000 reached."
 
 
+class _PublishedMessageRecorder(DefaultInterventionHandler):
+    def __init__(self) -> None:
+        self.messages: List[GroupChatMessage] = []
+
+    async def on_publish(self, message: Any, *, message_context: MessageContext) -> Any:
+        if isinstance(message, GroupChatMessage):
+            self.messages.append(message)
+        return message
+
+
+@pytest.mark.asyncio
+async def test_round_robin_group_chat_streaming_chunks_skip_runtime() -> None:
+    recorder = _PublishedMessageRecorder()
+    runtime = SingleThreadedAgentRuntime(intervention_handlers=[recorder])
+    runtime.start()
+    agent1 = AssistantAgent(
+        "agent1",
+        model_client=ReplayChatCompletionClient(["Hello from agent 1"]),
+        model_client_stream=True,
+    )
+    agent2 = AssistantAgent(
+        "agent2",
+        model_client=ReplayChatCompletionClient(["Hello from agent 2"]),
+        model_client_stream=True,
+    )
+    team = RoundRobinGroupChat([agent1, agent2], termination_condition=MaxMessageTermination(3), runtime=runtime)
+    messages: List[BaseAgentEvent | BaseChatMessage] = []
+    async for message in team.run_stream(task="task"):
+        if not isinstance(message, TaskResult):
+            messages.append(message)
+    await runtime.stop()
+
+    # The chunks of each agent arrive before its message, in order.
+    for source in ["agent1", "agent2"]:
+        chunks = [m for m in messages if isinstance(m, ModelClientStreamingChunkEvent) and m.source == source]
+        final_index = next(i for i, m in enumerate(messages) if isinstance(m, TextMessage) and m.source == source)
+        assert len(chunks) > 1
+        assert all(messages.index(chunk) < final_index for chunk in chunks)
+        assert "".join(chunk.content for chunk in chunks) == f"Hello from {source[:-1]} {source[-1]}"
+    assert [type(m) for m in messages if not isinstance(m, ModelClientStreamingChunkEvent)] == [TextMessage] * 3
+
+    # Only the agents' messages are published to the output topic, already delivered to the output queue.
+    assert [(m.message.source, m.delivered) for m in recorder.messages] == [("agent1", True), ("agent2", True)]
+
+
 @pytest.mark.asyncio
 async def test_selector_group_chat(runtime: AgentRuntime | None) -> None:
     model_client = ReplayChatCompletionClient(
@@ -1018,6 +1082,67 @@ def _select_agent(messages: Sequence[BaseAgentEvent | BaseChatMessage]) -> str |
     )
 
 
+class _DelayedEchoAgent(_EchoAgent):
+    """An echo agent that takes a while to respond and records how many agents respond at the same time."""
+
+    speaking: List[str] = []
+    max_concurrent_speakers = 0
+
+    def __init__(self, name: str, description: str, delay: float) -> None:
+        super().__init__(name, description)
+        self._delay = delay
+        self.received: List[List[str]] = []
+
+    async def on_messages(self, messages: Sequence[BaseChatMessage], cancellation_token: CancellationToken) -> Response:
+        self.received.append([message.source for message in messages])
+        _DelayedEchoAgent.speaking.append(self.name)
+        _DelayedEchoAgent.max_concurrent_speakers = max(
+            _DelayedEchoAgent.max_concurrent_speakers, len(_DelayedEchoAgent.speaking)
+        )
+        await asyncio.sleep(self._delay)
+        _DelayedEchoAgent.speaking.remove(self.name)
+        return await super().on_messages(messages, cancellation_token)
+
+
+@pytest.mark.asyncio
+async def test_selector_group_chat_concurrent_speakers(runtime: AgentRuntime | None) -> None:
+    _DelayedEchoAgent.speaking = []
+    _DelayedEchoAgent.max_concurrent_speakers = 0
+    message_thread = InMemoryMessageThread()
+    # The slowest agent is selected first.
+    agent1 = _DelayedEchoAgent("agent1", description="echo agent 1", delay=0.2)
+    agent2 = _DelayedEchoAgent("agent2", description="echo agent 2", delay=0.01)
+    agent3 = _DelayedEchoAgent("agent3", description="echo agent 3", delay=0.01)
+
+    def _select_agents(messages: Sequence[BaseAgentEvent | BaseChatMessage]) -> str | List[str] | None:
+        if messages[-1].source == "user":
+            return ["agent1", "agent2", "agent1"]
+        return "agent3"
+
+    team = SelectorGroupChat(
+        participants=[agent1, agent2, agent3],
+        model_client=ReplayChatCompletionClient([]),
+        selector_func=_select_agents,
+        termination_condition=MaxMessageTermination(4),
+        emit_team_events=True,
+        runtime=runtime,
+        message_thread=message_thread,
+    )
+    result = await team.run(task="task")
+    assert _DelayedEchoAgent.max_concurrent_speakers == 2
+    # The responses are merged in the order of selection, and a repeated name is selected once.
+    select_events = [message for message in result.messages if isinstance(message, SelectSpeakerEvent)]
+    assert select_events[0].content == ["agent1", "agent2"]
+    assert [message.source for message in message_thread] == ["user", "agent1", "agent2", "agent3"]
+    # The output stream has the responses in the order in which they arrived.
+    chat_messages = [message for message in result.messages if isinstance(message, TextMessage)]
+    assert [message.source for message in chat_messages] == ["user", "agent2", "agent1", "agent3"]
+    # The termination condition is applied to both responses together.
+    assert result.stop_reason is not None and "current message count: 4" in result.stop_reason
+    # The next speaker received the responses of both concurrent speakers in the order of selection.
+    assert agent3.received == [["user", "agent1", "agent2"]]
+
+
 @pytest.mark.asyncio
 async def test_selector_group_chat_custom_candidate_func(runtime: AgentRuntime | None) -> None:
     model_client = ReplayChatCompletionClient(["agent3"])
@@ -1059,6 +1184,95 @@ def _candidate_func(messages: Sequence[BaseAgentEvent | BaseChatMessage]) -> Lis
     )
 
 
+class _RecordingReplayChatCompletionClient(ReplayChatCompletionClient):
+    """A replay client that records the messages of each request."""
+
+    def __init__(self, chat_completions: Sequence[str]) -> None:
+        super().__init__(chat_completions)
+        self.requests: List[Sequence[LLMMessage]] = []
+
+    async def create(self, messages: Sequence[LLMMessage], *args: Any, **kwargs: Any) -> CreateResult:
+        self.requests.append(list(messages))
+        return await super().create(messages, *args, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_selector_group_chat_model_context(runtime: AgentRuntime | None) -> None:
+    model_client = _RecordingReplayChatCompletionClient(["agent2", "agent3", "agent1"])
+    agent1 = _EchoAgent("agent1", description="echo agent 1")
+    agent2 = _EchoAgent("agent2", description="echo agent 2")
+    agent3 = _EchoAgent("agent3", description="echo agent 3")
+    team = SelectorGroupChat(
+        participants=[agent1, agent2, agent3],
+        model_client=model_client,
+        termination_condition=MaxMessageTermination(4),
+        runtime=runtime,
+        selector_prompt="{roles}\n---\n{history}",
+        model_context=BufferedChatCompletionContext(buffer_size=2),
+    )
+    result = await team.run(task="task")
+    assert [message.source for message in result.messages] == ["user", "agent2", "agent3", "agent1"]
+
+    prompts: List[str] = []
+    for request in model_client.requests:
+        assert isinstance(request[0].content, str)
+        prompts.append(request[0].content)
+    roles = "agent1: echo agent 1\nagent2: echo agent 2\nagent3: echo agent 3"
+    assert prompts == [
+        f"{roles}\n---\nuser: task\n\n",
+        f"{roles}\n---\nuser: task\n\n\nagent2: task\n\n",
+        # Only the two most recent messages are in the history.
+        f"{roles}\n---\nagent2: task\n\n\nagent3: task\n\n",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_selector_group_chat_manager_history_is_incremental() -> None:
+    model_client = ReplayChatCompletionClient(["agent1"])
+    with AgentInstantiationContext.populate_context((SingleThreadedAgentRuntime(), AgentId("manager", "default"))):
+        manager = SelectorGroupChatManager(
+            name="manager",
+            group_topic_type="group",
+            output_topic_type="output",
+            participant_topic_types=["agent1", "agent2"],
+            participant_names=["agent1", "agent2"],
+            participant_descriptions=["echo agent 1", "echo agent 2"],
+            output_message_queue=asyncio.Queue(),
+            termination_condition=None,
+            max_turns=None,
+            message_factory=MessageFactory(),
+            model_client=model_client,
+            selector_prompt="{history}",
+            allow_repeated_speaker=True,
+            selector_func=None,
+            max_selector_attempts=1,
+            candidate_func=None,
+            emit_team_events=False,
+        )
+
+    class _CountingTextMessage(TextMessage):
+        num_renders: int = 0
+
+        def to_model_text(self) -> str:
+            self.num_renders += 1
+            return super().to_model_text()
+
+    thread: List[BaseAgentEvent | BaseChatMessage] = []
+    for i in range(5):
+        thread.append(_CountingTextMessage(content=f"message {i}", source="agent1"))
+        history = await manager._construct_history(thread)  # pyright: ignore[reportPrivateUsage]
+        assert history.count("agent1: message") == i + 1
+    assert all(isinstance(message, _CountingTextMessage) and message.num_renders == 1 for message in thread)
+
+    # A different thread, e.g. after loading a state, replaces the history.
+    history = await manager._construct_history([TextMessage(content="new", source="agent2")])  # pyright: ignore[reportPrivateUsage]
+    assert history == "agent2: new\n\n"
+    assert manager._mentioned_agents("agent1 and agent_3", ["agent1", "agent_3"]) == {  # pyright: ignore[reportPrivateUsage]
+        "agent1": 1,
+        "agent_3": 1,
+    }
+
+
 class _HandOffAgent(BaseChatAgent):
     def __init__(self, name: str, description: str, next_agent: str) -> None:
         super().__init__(name, description)
@@ -1578,10 +1792,12 @@ async def test_declarative_groupchats_with_config(runtime: AgentRuntime | None)
         selector_prompt=selector_prompt,
         allow_repeated_speaker=True,
         runtime=runtime,
+        model_context=BufferedChatCompletionContext(buffer_size=5),
     )
     selector_config = selector.dump_component()
     selector_loaded = SelectorGroupChat.load_component(selector_config)
     assert selector_loaded.dump_component() == selector_config
+    assert isinstance(selector_loaded._model_context, BufferedChatCompletionContext)  # pyright: ignore[reportPrivateUsage]
 
     # Test swarm with handoff termination
     handoff_termination = HandoffTermination(target="Agent2")
@@ -0,0 +1,180 @@
+import json
+from pathlib import Path
+from typing import List, Sequence
+
+import pytest
+from autogen_agentchat.agents import BaseChatAgent
+from autogen_agentchat.base import Response
+from autogen_agentchat.conditions import MaxMessageTermination
+from autogen_agentchat.messages import (
+    BaseAgentEvent,
+    BaseChatMessage,
+    MessageFactory,
+    StructuredMessage,
+    TextMessage,
+)
+from autogen_agentchat.teams import DiskMessageThread, InMemoryMessageThread, RoundRobinGroupChat
+from autogen_core import CancellationToken
+from pydantic import BaseModel
+
+
+class _Answer(BaseModel):
+    value: int
+
+
+def _messages(n: int) -> List[BaseAgentEvent | BaseChatMessage]:
+    return [TextMessage(content=f"message {i}", source=f"agent{i % 3}") for i in range(n)]
+
+
+@pytest.mark.parametrize("max_in_memory_messages", [0, 3, 100])
+def test_disk_message_thread(tmp_path: Path, max_in_memory_messages: int) -> None:
+    messages = _messages(20)
+    thread = DiskMessageThread(tmp_path, max_in_memory_messages=max_in_memory_messages, max_segment_bytes=500)
+    thread.extend(messages)
+
+    assert len(thread) == 20
+    assert thread == messages
+    assert thread[0] == messages[0]
+    assert thread[-1] == messages[-1]
+    assert thread[5:8] == messages[5:8]
+    assert thread[::-7] == messages[::-7]
+    assert list(reversed(thread)) == messages[::-1]
+    with pytest.raises(IndexError):
+        thread[20]
+    # The log is split into segments.
+    assert len(list(tmp_path.glob("segment-*.jsonl"))) > 1
+
+    # Messages appended after reading are also read back.
+    thread.append(TextMessage(content="last", source="agent0"))
+    assert thread[-1].to_text() == "last"
+    assert thread[0] == messages[0]
+
+    thread.clear()
+    assert len(thread) == 0
+    assert list(tmp_path.glob("segment-*.jsonl")) == []
+
+
+def test_disk_message_thread_reopen_and_checkpoint(tmp_path: Path) -> None:
+    messages = _messages(10)
+    thread = DiskMessageThread(tmp_path, max_in_memory_messages=2, max_segment_bytes=300)
+    thread.extend(messages[:6])
+    checkpoint = thread.save_checkpoint()
+    assert checkpoint == {"directory": str(tmp_path), "length": 6}
+    thread.extend(messages[6:])
+    thread.close()
+
+    # A new thread opens the existing log, dropping a partially written message.
+    last_segment = sorted(tmp_path.glob("segment-*.jsonl"))[-1]
+    with open(last_segment, "ab") as f:
+        f.write(b'{"content": "partial')
+    reopened = DiskMessageThread(tmp_path, max_in_memory_messages=2, max_segment_bytes=300)
+    assert reopened == messages
+
+    # Loading the checkpoint drops the messages appended after it.
+    assert checkpoint is not None
+    reopened.load_checkpoint(checkpoint)
+    assert reopened == messages[:6]
+    reopened.append(messages[6])
+    assert reopened == messages[:7]
+    reopened.close()
+    assert DiskMessageThread(tmp_path) == messages[:7]
+
+    with pytest.raises(ValueError):
+        reopened.load_checkpoint({"directory": str(tmp_path), "length": 8})
+
+    # A checkpoint of another thread is not applied.
+    with pytest.raises(ValueError, match="checkpoint is of the message thread"):
+        reopened.load_checkpoint({"directory": str(tmp_path / "other"), "length": 1})
+    assert reopened == messages[:7]
+    # The same directory given by another path is accepted.
+    reopened.load_checkpoint({"directory": str(tmp_path / "other" / ".."), "length": 7})
+    assert reopened == messages[:7]
+
+
+@pytest.mark.parametrize("partial", [b"", b'{"content": "partial'])
+def test_disk_message_thread_reopen_after_segment_rollover(tmp_path: Path, partial: bytes) -> None:
+    messages = _messages(5)
+    thread = DiskMessageThread(tmp_path)
+    thread.extend(messages[:3])
+    thread.close()
+
+    # The first message of a new segment was not completely written.
+    (tmp_path / "segment-000001.jsonl").write_bytes(partial)
+    reopened = DiskMessageThread(tmp_path, max_in_memory_messages=0)
+    assert reopened == messages[:3]
+    assert [path.name for path in sorted(tmp_path.glob("segment-*.jsonl"))] == ["segment-000000.jsonl"]
+    reopened.extend(messages[3:])
+    assert reopened == messages
+    reopened.close()
+    assert DiskMessageThread(tmp_path, max_in_memory_messages=0) == messages
+
+
+def test_disk_message_thread_message_factory(tmp_path: Path) -> None:
+    message_factory = MessageFactory()
+    message_factory.register(StructuredMessage[_Answer])
+    thread = DiskMessageThread(tmp_path, max_in_memory_messages=0)
+    thread.set_message_factory(message_factory)
+    message = StructuredMessage[_Answer](content=_Answer(value=42), source="agent")
+    thread.append(message)
+    assert thread[0] == message
+    assert thread[0] is not message
+    assert json.loads((tmp_path / "segment-000000.jsonl").read_text())["content"] == {"value": 42}
+
+
+def test_in_memory_message_thread() -> None:
+    messages = _messages(5)
+    thread = InMemoryMessageThread()
+    thread.extend(messages)
+    assert thread == messages
+    assert thread[1:3] == messages[1:3]
+    assert thread.save_checkpoint() is None
+    with pytest.raises(NotImplementedError):
+        thread.load_checkpoint({})
+
+
+class _CountingAgent(BaseChatAgent):
+    def __init__(self, name: str) -> None:
+        super().__init__(name, description=f"Counts the messages, {name}.")
+        self._count = 0
+
+    @property
+    def produced_message_types(self) -> Sequence[type[BaseChatMessage]]:
+        return (TextMessage,)
+
+    async def on_messages(self, messages: Sequence[BaseChatMessage], cancellation_token: CancellationToken) -> Response:
+        self._count += 1
+        return Response(chat_message=TextMessage(content=f"{self.name} {self._count}", source=self.name))
+
+    async def on_reset(self, cancellation_token: CancellationToken) -> None:
+        self._count = 0
+
+
+@pytest.mark.asyncio
+async def test_group_chat_with_disk_message_thread(tmp_path: Path) -> None:
+    thread = DiskMessageThread(tmp_path / "thread", max_in_memory_messages=2)
+    team = RoundRobinGroupChat(
+        [_CountingAgent("agent1"), _CountingAgent("agent2")],
+        termination_condition=MaxMessageTermination(5),
+        message_thread=thread,
+    )
+    result = await team.run(task="count")
+    assert len(thread) == 5
+    assert thread == result.messages
+
+    # The saved state holds a checkpoint instead of the messages.
+    state = await team.save_state()
+    manager_state = next(
+        agent_state
+        for name, agent_state in state["agent_states"].items()
+        if name.startswith("RoundRobinGroupChatManager")
+    )
+    assert manager_state["message_thread"] == []
+    assert manager_state["message_thread_checkpoint"]["length"] == 5
+
+    await team.run(task="count again")
+    assert len(thread) == 10
+    await team.load_state(state)
+    assert thread == result.messages
+
+    await team.reset()
+    assert len(thread) == 0
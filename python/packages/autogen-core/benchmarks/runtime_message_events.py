@@ -0,0 +1,96 @@
+"""Microbenchmark for per-message event emission in :class:`~autogen_core.SingleThreadedAgentRuntime`.
+
+Measures send/publish throughput (messages per second) with message events
+enabled and disabled, with and without a handler attached to the event logger.
+
+Usage:
+
+.. code-block:: bash
+
+    python benchmarks/runtime_message_events.py --messages 20000
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import List
+
+from autogen_core import (
+    EVENT_LOGGER_NAME,
+    AgentId,
+    DefaultTopicId,
+    MessageContext,
+    RoutedAgent,
+    SingleThreadedAgentRuntime,
+    default_subscription,
+    message_handler,
+    try_get_known_serializers_for_type,
+)
+
+
+@dataclass
+class Payload:
+    content: str
+    values: List[int] = field(default_factory=lambda: list(range(32)))
+
+
+@default_subscription
+class EchoAgent(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("Echo agent.")
+
+    @message_handler
+    async def on_payload(self, message: Payload, ctx: MessageContext) -> Payload:
+        return message
+
+
+async def run_once(num_messages: int, emit_message_events: bool, mode: str) -> float:
+    runtime = SingleThreadedAgentRuntime(emit_message_events=emit_message_events)
+    runtime.add_message_serializer(try_get_known_serializers_for_type(Payload))
+    await EchoAgent.register(runtime, "echo", EchoAgent)
+    runtime.start()
+    message = Payload(content="x" * 256)
+    start = time.perf_counter()
+    if mode == "send":
+        recipient = AgentId("echo", "default")
+        for _ in range(num_messages):
+            await runtime.send_message(message, recipient)
+    else:
+        for _ in range(num_messages):
+            await runtime.publish_message(message, DefaultTopicId())
+    await runtime.stop_when_idle()
+    elapsed = time.perf_counter() - start
+    await runtime.close()
+    return num_messages / elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=10000)
+    args = parser.parse_args()
+
+    event_logger = logging.getLogger(EVENT_LOGGER_NAME)
+    for listening in (False, True):
+        handler: logging.Handler | None = None
+        if listening:
+            # A handler that formats (and so serializes) every record but discards the output.
+            handler = logging.StreamHandler(open(os.devnull, "w"))
+            event_logger.addHandler(handler)
+            event_logger.setLevel(logging.INFO)
+        for mode in ("send", "publish"):
+            for emit in (True, False):
+                rate = await run_once(args.messages, emit, mode)
+                print(
+                    f"listener={'on ' if listening else 'off'} mode={mode:<7} "
+                    f"emit_message_events={emit!s:<5} {rate:>10.0f} msg/s"
+                )
+        if handler is not None:
+            event_logger.removeHandler(handler)
+            event_logger.setLevel(logging.NOTSET)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,77 @@
+"""Benchmark for :class:`~autogen_core._runtime_impl_helpers.SubscriptionManager`.
+
+Registers per-session :class:`~autogen_core.TypeSubscription` and
+:class:`~autogen_core.TypePrefixSubscription` instances, resolves recipients for
+many topics, and then adds and removes subscriptions while those topics are cached.
+
+Usage:
+
+.. code-block:: bash
+
+    python benchmarks/subscription_manager.py --subscriptions 10000 --topics 100000
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import List
+
+from autogen_core import Subscription, TopicId, TypePrefixSubscription, TypeSubscription
+from autogen_core._runtime_impl_helpers import SubscriptionManager
+
+
+def make_subscriptions(num_subscriptions: int) -> List[Subscription]:
+    subscriptions: List[Subscription] = []
+    for i in range(num_subscriptions):
+        if i % 10 == 0:
+            subscriptions.append(TypePrefixSubscription(f"session_{i}.", f"observer_{i}"))
+        else:
+            subscriptions.append(TypeSubscription(f"session_{i}.chat", f"agent_{i}"))
+    return subscriptions
+
+
+def make_topics(num_topics: int, num_subscriptions: int) -> List[TopicId]:
+    rng = random.Random(0)
+    return [TopicId(f"session_{rng.randrange(num_subscriptions)}.chat", f"source_{i}") for i in range(num_topics)]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--subscriptions", type=int, default=10000)
+    parser.add_argument("--topics", type=int, default=100000)
+    parser.add_argument("--churn", type=int, default=1000, help="Subscriptions added and removed after warm-up.")
+    args = parser.parse_args()
+
+    manager = SubscriptionManager()
+    subscriptions = make_subscriptions(args.subscriptions)
+    topics = make_topics(args.topics, args.subscriptions)
+
+    start = time.perf_counter()
+    for subscription in subscriptions:
+        await manager.add_subscription(subscription)
+    print(f"add {args.subscriptions} subscriptions: {time.perf_counter() - start:.3f}s")
+
+    start = time.perf_counter()
+    for topic in topics:
+        await manager.get_subscribed_recipients(topic)
+    print(f"resolve {args.topics} new topics: {time.perf_counter() - start:.3f}s")
+
+    start = time.perf_counter()
+    for topic in topics:
+        await manager.get_subscribed_recipients(topic)
+    print(f"resolve {args.topics} cached topics: {time.perf_counter() - start:.3f}s")
+
+    churn = [TypeSubscription(f"session_{i}.chat", "late_joiner") for i in range(args.churn)]
+    start = time.perf_counter()
+    for subscription in churn:
+        await manager.add_subscription(subscription)
+    for subscription in churn:
+        await manager.remove_subscription(subscription.id)
+    print(
+        f"add+remove {len(churn)} subscriptions with {args.topics} cached topics: {time.perf_counter() - start:.3f}s"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
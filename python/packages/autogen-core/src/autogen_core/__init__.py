@@ -10,7 +10,14 @@
 from ._agent_runtime import AgentRuntime
 from ._agent_type import AgentType
 from ._base_agent import BaseAgent
-from ._cache_store import CacheStore, InMemoryStore
+from ._cache_store import (
+    AsyncCacheStore,
+    CacheStore,
+    InMemoryStore,
+    InMemoryStoreConfig,
+    InMemoryStoreStats,
+    ThreadedCacheStore,
+)
 from ._cancellation_token import CancellationToken
 from ._closure_agent import ClosureAgent, ClosureContext
 from ._component_config import (
@@ -88,6 +95,10 @@
     "BaseAgent",
     "CacheStore",
     "InMemoryStore",
+    "InMemoryStoreConfig",
+    "InMemoryStoreStats",
+    "AsyncCacheStore",
+    "ThreadedCacheStore",
     "CancellationToken",
     "AgentInstantiationContext",
     "TopicId",
@@ -1,10 +1,18 @@
+import asyncio
+import json
+import sys
+import threading
+import time
+import zlib
 from abc import ABC, abstractmethod
-from typing import Dict, Generic, Optional, TypeVar
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Generic, List, Literal, Mapping, Optional, Sequence, Type, TypeVar, cast
 
 from pydantic import BaseModel
 from typing_extensions import Self
 
-from ._component_config import Component, ComponentBase
+from ._component_config import Component, ComponentBase, ComponentModel
 
 T = TypeVar("T")
 
@@ -44,27 +52,372 @@ def set(self, key: str, value: T) -> None:
         """
         ...
 
+    def get_many(self, keys: Sequence[str], default: Optional[T] = None) -> List[Optional[T]]:
+        """
+        Retrieve several items from the store.
+
+        The default implementation calls :meth:`get` for each key. Stores backed by
+        a server or a database override it to fetch all the items at once.
+
+        Args:
+            keys: The keys identifying the items in the store.
+            default (optional): The default value to return for a key that is not found.
+                                Defaults to None.
+
+        Returns:
+            The values associated with the keys, in the same order, with the default value for keys that are not found.
+        """
+        return [self.get(key, default) for key in keys]
+
+    def set_many(self, items: Mapping[str, T]) -> None:
+        """
+        Set several items in the store.
+
+        The default implementation calls :meth:`set` for each item. Stores backed by
+        a server or a database override it to store all the items at once.
+
+        Args:
+            items: The values to be stored, by key.
+        """
+        for key, value in items.items():
+            self.set(key, value)
+
 
 class InMemoryStoreConfig(BaseModel):
-    pass
+    max_entries: Optional[int] = None
+    """The maximum number of entries. Defaults to None, which means no limit."""
+    max_bytes: Optional[int] = None
+    """The approximate maximum total size of the values in bytes. Defaults to None, which means no limit."""
+    eviction_policy: Literal["lru", "lfu"] = "lru"
+    """Which entry to evict when a limit is reached: the least recently used or the least frequently used."""
+    ttl: Optional[float] = None
+    """If set, entries expire this many seconds after they are set."""
+    compact: bool = False
+    """If True, pydantic model values, such as :class:`~autogen_core.models.CreateResult`, and lists of them
+    are stored as compressed JSON and decoded on every get."""
+
+
+@dataclass
+class InMemoryStoreStats:
+    """Counters of an :class:`InMemoryStore`."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    oversized: int = 0
+    """The number of values not stored because they were larger than `max_bytes`."""
+
+
+class _CompactValue:
+    """A pydantic model, or a list of strings and pydantic models, stored as compressed JSON."""
+
+    __slots__ = ("model_types", "data")
+
+    def __init__(self, model_types: Optional[List[Optional[Type[BaseModel]]]], data: bytes) -> None:
+        # None for a single model, otherwise the model type of each list item, or None for a string item.
+        self.model_types = model_types
+        self.data = data
+
+    @classmethod
+    def encode(cls, value: Any) -> Any:
+        if isinstance(value, BaseModel):
+            return cls([type(value)], zlib.compress(value.model_dump_json().encode()))
+        if isinstance(value, list) and all(isinstance(item, (str, BaseModel)) for item in value):  # type: ignore
+            items = cast(List[str | BaseModel], value)
+            model_types: List[Optional[Type[BaseModel]]] = [
+                type(item) if isinstance(item, BaseModel) else None for item in items
+            ]
+            serialized = [item.model_dump(mode="json") if isinstance(item, BaseModel) else item for item in items]
+            return cls([None, *model_types], zlib.compress(json.dumps(serialized).encode()))
+        return value
+
+    def decode(self) -> Any:
+        assert self.model_types is not None
+        data = zlib.decompress(self.data)
+        if self.model_types[0] is not None:
+            return self.model_types[0].model_validate_json(data)
+        return [
+            model_type.model_validate(item) if model_type is not None else item
+            for model_type, item in zip(self.model_types[1:], json.loads(data), strict=True)
+        ]
+
+
+def _approximate_size(value: Any) -> int:
+    if isinstance(value, _CompactValue):
+        return len(value.data)
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, BaseModel):
+        return len(value.model_dump_json())
+    if isinstance(value, list):
+        sizes: List[int] = [_approximate_size(item) for item in value]  # type: ignore
+        return sum(sizes)
+    return sys.getsizeof(value)
 
 
 class InMemoryStore(CacheStore[T], Component[InMemoryStoreConfig]):
+    """
+    A :class:`CacheStore` that keeps the values in memory, optionally bounded in size and age.
+
+    The store is safe to use from multiple threads.
+
+    Args:
+        max_entries: The maximum number of entries. Defaults to None, which means no limit.
+        max_bytes: The approximate maximum total size of the values in bytes. Sizes are measured
+            from the JSON serialization of pydantic models, the length of strings and bytes, and
+            :func:`sys.getsizeof` for other values. A value larger than `max_bytes` is not stored.
+            Defaults to None, which means no limit.
+        eviction_policy: Which entry to evict when a limit is reached, "lru" for the least
+            recently used or "lfu" for the least frequently used. Defaults to "lru".
+        ttl: If set, entries expire this many seconds after they are set.
+        compact: If True, pydantic model values, such as :class:`~autogen_core.models.CreateResult`,
+            and lists of strings and pydantic models, are stored as compressed JSON instead of as
+            objects, and a new object is decoded on every get. Defaults to False.
+    """
+
     component_provider_override = "autogen_core.InMemoryStore"
     component_config_schema = InMemoryStoreConfig
 
-    def __init__(self) -> None:
-        self.store: Dict[str, T] = {}
+    def __init__(
+        self,
+        *,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        eviction_policy: Literal["lru", "lfu"] = "lru",
+        ttl: Optional[float] = None,
+        compact: bool = False,
+    ) -> None:
+        if eviction_policy not in ("lru", "lfu"):
+            raise ValueError(f"Unknown eviction policy: {eviction_policy}")
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive.")
+        self._config = InMemoryStoreConfig(
+            max_entries=max_entries, max_bytes=max_bytes, eviction_policy=eviction_policy, ttl=ttl, compact=compact
+        )
+        # The stored values, encoded if compact is True, from the least to the most recently used.
+        self.store: OrderedDict[str, T] = OrderedDict()
+        self.stats = InMemoryStoreStats()
+        self._lock = threading.Lock()
+        # Expiry times, in the order the entries were set.
+        self._expiry: OrderedDict[str, float] = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._total_bytes = 0
+        # For the LFU policy: the number of uses of each key, and the keys by number of uses in the order they were last used.
+        self._frequencies: Dict[str, int] = {}
+        self._frequency_buckets: Dict[int, OrderedDict[str, None]] = {}
+
+    @property
+    def total_bytes(self) -> int:
+        """The approximate total size of the values, if `max_bytes` is set, else 0."""
+        return self._total_bytes
 
     def get(self, key: str, default: Optional[T] = None) -> Optional[T]:
-        return self.store.get(key, default)
+        with self._lock:
+            if key not in self.store:
+                self.stats.misses += 1
+                return default
+            if self._config.ttl is not None and self._expiry[key] <= time.monotonic():
+                self._remove(key)
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return default
+            self.stats.hits += 1
+            self._touch(key)
+            value = self.store[key]
+        if isinstance(value, _CompactValue):
+            return cast(T, value.decode())
+        return value
 
     def set(self, key: str, value: T) -> None:
-        self.store[key] = value
+        stored = cast(T, _CompactValue.encode(value)) if self._config.compact else value
+        size = _approximate_size(stored) if self._config.max_bytes is not None else 0
+        with self._lock:
+            if key in self.store:
+                self._remove(key)
+            if self._config.max_bytes is not None and size > self._config.max_bytes:
+                # Storing the value would mean evicting everything and still exceeding the limit.
+                self.stats.oversized += 1
+                return
+            self._remove_expired()
+            self._evict(size)
+            self.store[key] = stored
+            if self._config.ttl is not None:
+                self._expiry[key] = time.monotonic() + self._config.ttl
+            if self._config.max_bytes is not None:
+                self._sizes[key] = size
+                self._total_bytes += size
+            if self._config.eviction_policy == "lfu":
+                self._frequencies[key] = 1
+                self._frequency_buckets.setdefault(1, OrderedDict())[key] = None
+
+    def _touch(self, key: str) -> None:
+        if self._config.eviction_policy == "lru":
+            self.store.move_to_end(key)
+            return
+        frequency = self._frequencies[key]
+        bucket = self._frequency_buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self._frequency_buckets[frequency]
+        self._frequencies[key] = frequency + 1
+        self._frequency_buckets.setdefault(frequency + 1, OrderedDict())[key] = None
+
+    def _remove(self, key: str) -> None:
+        del self.store[key]
+        self._expiry.pop(key, None)
+        self._total_bytes -= self._sizes.pop(key, 0)
+        frequency = self._frequencies.pop(key, None)
+        if frequency is not None:
+            bucket = self._frequency_buckets[frequency]
+            del bucket[key]
+            if not bucket:
+                del self._frequency_buckets[frequency]
+
+    def _remove_expired(self) -> None:
+        if self._config.ttl is None:
+            return
+        now = time.monotonic()
+        while self._expiry:
+            key, expiry = next(iter(self._expiry.items()))
+            if expiry > now:
+                break
+            self._remove(key)
+            self.stats.expirations += 1
+
+    def _evict(self, size: int) -> None:
+        """Make room for a new entry of the given size. The new entry itself is never evicted."""
+        max_entries = self._config.max_entries
+        max_bytes = self._config.max_bytes
+        while self.store and (
+            (max_entries is not None and len(self.store) >= max_entries)
+            or (max_bytes is not None and self._total_bytes + size > max_bytes)
+        ):
+            if self._config.eviction_policy == "lru":
+                key = next(iter(self.store))
+            else:
+                key = next(iter(self._frequency_buckets[min(self._frequency_buckets)]))
+            self._remove(key)
+            self.stats.evictions += 1
 
     def _to_config(self) -> InMemoryStoreConfig:
-        return InMemoryStoreConfig()
+        return self._config.model_copy()
 
     @classmethod
     def _from_config(cls, config: InMemoryStoreConfig) -> Self:
-        return cls()
+        return cls(
+            max_entries=config.max_entries,
+            max_bytes=config.max_bytes,
+            eviction_policy=config.eviction_policy,
+            ttl=config.ttl,
+            compact=config.compact,
+        )
+
+
+class AsyncCacheStore(ABC, Generic[T], ComponentBase[BaseModel]):
+    """
+    This protocol defines the interface for store/cache operations that do not block the event loop.
+
+    Use :class:`ThreadedCacheStore` to adapt a :class:`CacheStore` that performs blocking I/O.
+    """
+
+    component_type = "cache_store"
+
+    @abstractmethod
+    async def get(self, key: str, default: Optional[T] = None) -> Optional[T]:
+        """
+        Retrieve an item from the store.
+
+        Args:
+            key: The key identifying the item in the store.
+            default (optional): The default value to return if the key is not found.
+                                Defaults to None.
+
+        Returns:
+            The value associated with the key if found, else the default value.
+        """
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: T) -> None:
+        """
+        Set an item in the store.
+
+        Args:
+            key: The key under which the item is to be stored.
+            value: The value to be stored in the store.
+        """
+        ...
+
+    async def get_many(self, keys: Sequence[str], default: Optional[T] = None) -> List[Optional[T]]:
+        """
+        Retrieve several items from the store.
+
+        The default implementation calls :meth:`get` for each key. Stores backed by
+        a server or a database override it to fetch all the items at once.
+
+        Args:
+            keys: The keys identifying the items in the store.
+            default (optional): The default value to return for a key that is not found.
+                                Defaults to None.
+
+        Returns:
+            The values associated with the keys, in the same order, with the default value for keys that are not found.
+        """
+        return [await self.get(key, default) for key in keys]
+
+    async def set_many(self, items: Mapping[str, T]) -> None:
+        """
+        Set several items in the store.
+
+        The default implementation calls :meth:`set` for each item. Stores backed by
+        a server or a database override it to store all the items at once.
+
+        Args:
+            items: The values to be stored, by key.
+        """
+        for key, value in items.items():
+            await self.set(key, value)
+
+
+class ThreadedCacheStoreConfig(BaseModel):
+    store: ComponentModel
+
+
+class ThreadedCacheStore(AsyncCacheStore[T], Component[ThreadedCacheStoreConfig]):
+    """
+    An :class:`AsyncCacheStore` that runs the operations of a synchronous :class:`CacheStore`,
+    such as a disk or network backed store, in a worker thread.
+
+    Args:
+        store: The synchronous store to wrap.
+    """
+
+    component_provider_override = "autogen_core.ThreadedCacheStore"
+    component_config_schema = ThreadedCacheStoreConfig
+
+    def __init__(self, store: CacheStore[T]) -> None:
+        self.store = store
+
+    async def get(self, key: str, default: Optional[T] = None) -> Optional[T]:
+        return await asyncio.to_thread(self.store.get, key, default)
+
+    async def set(self, key: str, value: T) -> None:
+        await asyncio.to_thread(self.store.set, key, value)
+
+    async def get_many(self, keys: Sequence[str], default: Optional[T] = None) -> List[Optional[T]]:
+        return await asyncio.to_thread(self.store.get_many, keys, default)
+
+    async def set_many(self, items: Mapping[str, T]) -> None:
+        await asyncio.to_thread(self.store.set_many, items)
+
+    def _to_config(self) -> ThreadedCacheStoreConfig:
+        return ThreadedCacheStoreConfig(store=self.store.dump_component())
+
+    @classmethod
+    def _from_config(cls, config: ThreadedCacheStoreConfig) -> Self:
+        return cls(CacheStore.load_component(config.store))
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
 import base64
+import math
 import re
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict, cast
+from typing import Any, Dict, Tuple, cast
 
 from PIL import Image as PILImage
 from pydantic import GetCoreSchemaHandler, ValidationInfo
 from pydantic_core import core_schema
 from typing_extensions import Literal
 
+# Encoded formats that are kept as-is instead of being decoded and encoded again as PNG.
+_PASSTHROUGH_FORMATS = {"PNG", "JPEG", "GIF", "WEBP"}
+
 
 class Image:
     """Represents an image.
@@ -37,37 +41,116 @@ async def from_url(url: str) -> Image:
 
             image = asyncio.run(from_url("https://example.com/image"))
 
+    Images created from encoded data (:meth:`from_bytes`, :meth:`from_base64`, :meth:`from_uri`
+    and :meth:`from_file`) keep the original PNG, JPEG, GIF or WebP bytes and reuse them when the
+    image is serialized; the pixels are only decoded when :attr:`image` is accessed. Encoded forms
+    are cached, so an image should not be modified in place after it is created.
+
     """
 
     def __init__(self, image: PILImage.Image):
-        self.image: PILImage.Image = image.convert("RGB")
+        self._set(image.convert("RGB"), None, None)
+
+    def _set(self, image: PILImage.Image | None, source_image: PILImage.Image | None, data: bytes | None) -> None:
+        self._image = image
+        # The opened, not yet decoded, image and its encoded bytes, if the image was created from encoded data.
+        self._source_image = source_image
+        self._data = data
+        self._base64: str | None = None
+        self._data_uri: str | None = None
+        self._encodings: Dict[Tuple[str, int, int | None], bytes] = {}
+
+    @property
+    def image(self) -> PILImage.Image:
+        """The image as an RGB PIL image."""
+        if self._image is None:
+            assert self._source_image is not None
+            self._image = self._source_image.convert("RGB")
+            self._source_image = None
+        return self._image
+
+    @image.setter
+    def image(self, image: PILImage.Image) -> None:
+        self._set(image.convert("RGB"), None, None)
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """The width and height of the image, read without decoding the pixels."""
+        if self._image is None:
+            assert self._source_image is not None
+            return self._source_image.size
+        return self._image.size
 
     @classmethod
     def from_pil(cls, pil_image: PILImage.Image) -> Image:
         return cls(pil_image)
 
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Image:
+        """Create an image from encoded image data, e.g. the contents of a PNG or JPEG file."""
+        source_image = PILImage.open(BytesIO(data))
+        if source_image.format not in _PASSTHROUGH_FORMATS:
+            return cls(source_image)
+        image = cls.__new__(cls)
+        image._set(None, source_image, data)
+        return image
+
     @classmethod
     def from_uri(cls, uri: str) -> Image:
-        if not re.match(r"data:image/(?:png|jpeg);base64,", uri):
+        if not re.match(r"data:image/(?:png|jpeg|gif|webp);base64,", uri):
             raise ValueError("Invalid URI format. It should be a base64 encoded image URI.")
 
         # A URI. Remove the prefix and decode the base64 string.
-        base64_data = re.sub(r"data:image/(?:png|jpeg);base64,", "", uri)
+        base64_data = re.sub(r"data:image/(?:png|jpeg|gif|webp);base64,", "", uri)
         return cls.from_base64(base64_data)
 
     @classmethod
     def from_base64(cls, base64_str: str) -> Image:
-        return cls(PILImage.open(BytesIO(base64.b64decode(base64_str))))
-
-    def to_base64(self) -> str:
-        buffered = BytesIO()
-        self.image.save(buffered, format="PNG")
-        content = buffered.getvalue()
-        return base64.b64encode(content).decode("utf-8")
+        return cls.from_bytes(base64.b64decode(base64_str))
+
+    def to_bytes(
+        self,
+        format: Literal["PNG", "JPEG", "WEBP"] | None = None,
+        *,
+        quality: int = 85,
+        max_bytes: int | None = None,
+    ) -> bytes:
+        """Get the encoded image.
+
+        Args:
+            format (Literal["PNG", "JPEG", "WEBP"] | None): The format to encode the image in. If None,
+                the original encoded data is returned when the image was created from PNG, JPEG, GIF or
+                WebP data, otherwise the image is encoded as PNG.
+            quality (int): The quality used for JPEG and WebP encoding.
+            max_bytes (int | None): If set, the image is scaled down until its encoded size is at most
+                this many bytes.
+        """
+        if format is None:
+            if self._data is not None and (max_bytes is None or len(self._data) <= max_bytes):
+                return self._data
+            format = "PNG"
+        key = (format, quality, max_bytes)
+        if key not in self._encodings:
+            self._encodings[key] = _encode(self.image, format, quality, max_bytes)
+        return self._encodings[key]
+
+    def to_base64(
+        self,
+        format: Literal["PNG", "JPEG", "WEBP"] | None = None,
+        *,
+        quality: int = 85,
+        max_bytes: int | None = None,
+    ) -> str:
+        """Get the encoded image as a base64 string. See :meth:`to_bytes` for the arguments."""
+        if format is None and max_bytes is None:
+            if self._base64 is None:
+                self._base64 = base64.b64encode(self.to_bytes()).decode("utf-8")
+            return self._base64
+        return base64.b64encode(self.to_bytes(format, quality=quality, max_bytes=max_bytes)).decode("utf-8")
 
     @classmethod
     def from_file(cls, file_path: Path) -> Image:
-        return cls(PILImage.open(file_path))
+        return cls.from_bytes(Path(file_path).read_bytes())
 
     def _repr_html_(self) -> str:
         # Show the image in Jupyter notebook
@@ -75,7 +158,21 @@ def _repr_html_(self) -> str:
 
     @property
     def data_uri(self) -> str:
-        return _convert_base64_to_data_uri(self.to_base64())
+        if self._data_uri is None:
+            self._data_uri = _convert_base64_to_data_uri(self.to_base64())
+        return self._data_uri
+
+    def __getstate__(self) -> Dict[str, Any]:
+        if self._data is not None:
+            # Only the encoded data is needed to recreate the image.
+            return {"data": self._data}
+        return {"image": self._image}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        if "data" in state:
+            self._set(None, PILImage.open(BytesIO(state["data"])), state["data"])
+        else:
+            self._set(state["image"], None, None)
 
     # Returns openai.types.chat.ChatCompletionContentPartImageParam, which is a TypedDict
     # We don't use the explicit type annotation so that we can avoid a dependency on the OpenAI Python SDK in this package.
@@ -107,10 +204,25 @@ def serialize(value: Image) -> dict[str, Any]:
         )
 
 
+def _encode(image: PILImage.Image, format: str, quality: int, max_bytes: int | None) -> bytes:
+    while True:
+        buffered = BytesIO()
+        if format == "PNG":
+            image.save(buffered, format=format)
+        else:
+            image.save(buffered, format=format, quality=quality)
+        content = buffered.getvalue()
+        if max_bytes is None or len(content) <= max_bytes or image.width * image.height <= 1:
+            return content
+        # The encoded size is roughly proportional to the number of pixels.
+        scale = min(math.sqrt(max_bytes / len(content)) * 0.9, 0.9)
+        image = image.resize((max(1, int(image.width * scale)), max(1, int(image.height * scale))))
+
+
 def _convert_base64_to_data_uri(base64_image: str) -> str:
     def _get_mime_type_from_data_uri(base64_image: str) -> str:
-        # Decode the base64 string
-        image_data = base64.b64decode(base64_image)
+        # Decode the first bytes of the base64 string, which is enough for the signatures below.
+        image_data = base64.b64decode(base64_image[:16])
         # Check the first few bytes for known signatures
         if image_data.startswith(b"\xff\xd8\xff"):
             return "image/jpeg"
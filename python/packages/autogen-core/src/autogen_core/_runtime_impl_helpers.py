@@ -1,11 +1,26 @@
 from collections import defaultdict
-from typing import Awaitable, Callable, DefaultDict, List, Sequence, Set
+from typing import (
+    Awaitable,
+    Callable,
+    DefaultDict,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 from ._agent import Agent
 from ._agent_id import AgentId
 from ._agent_type import AgentType
 from ._subscription import Subscription
 from ._topic import TopicId
+from ._type_prefix_subscription import TypePrefixSubscription
+from ._type_subscription import TypeSubscription
 
 
 async def get_impl(
@@ -29,50 +44,227 @@ async def get_impl(
     return id
 
 
+V = TypeVar("V")
+
+
+class _TrieNode(Generic[V]):
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _TrieNode[V]] = {}
+        self.values: Dict[str, V] = {}
+
+
+class _PrefixTrie(Generic[V]):
+    """A character trie mapping string keys to a set of values identified by an id."""
+
+    def __init__(self) -> None:
+        self._root: _TrieNode[V] = _TrieNode()
+
+    def add(self, key: str, value_id: str, value: V) -> None:
+        node = self._root
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                child = _TrieNode()
+                node.children[char] = child
+            node = child
+        node.values[value_id] = value
+
+    def remove(self, key: str, value_id: str) -> None:
+        path: List[Tuple[_TrieNode[V], str]] = []
+        node = self._root
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                return
+            path.append((node, char))
+            node = child
+        node.values.pop(value_id, None)
+        # Prune nodes that no longer lead to any value.
+        for parent, char in reversed(path):
+            child = parent.children[char]
+            if child.values or child.children:
+                break
+            del parent.children[char]
+
+    def iter_prefixes_of(self, key: str) -> Iterator[V]:
+        """Yield the values stored under every key that is a prefix of `key`, including `key` itself."""
+        node = self._root
+        yield from node.values.values()
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                return
+            node = child
+            yield from node.values.values()
+
+    def iter_with_prefix(self, prefix: str) -> Iterator[V]:
+        """Yield the values stored under every key that starts with `prefix`."""
+        node = self._root
+        for char in prefix:
+            child = node.children.get(char)
+            if child is None:
+                return
+            node = child
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            yield from node.values.values()
+            stack.extend(node.children.values())
+
+
+def _is_exact_type_subscription(subscription: Subscription) -> bool:
+    cls = type(subscription)
+    return (
+        isinstance(subscription, TypeSubscription)
+        and cls.is_match is TypeSubscription.is_match
+        and cls.map_to_agent is TypeSubscription.map_to_agent
+    )
+
+
+def _is_type_prefix_subscription(subscription: Subscription) -> bool:
+    cls = type(subscription)
+    return (
+        isinstance(subscription, TypePrefixSubscription)
+        and cls.is_match is TypePrefixSubscription.is_match
+        and cls.map_to_agent is TypePrefixSubscription.map_to_agent
+    )
+
+
 class SubscriptionManager:
+    """Tracks subscriptions and resolves the recipients of a topic.
+
+    :class:`~autogen_core.TypeSubscription` instances are indexed by topic type and
+    :class:`~autogen_core.TypePrefixSubscription` instances are stored in a prefix trie,
+    so matching a topic does not scan every subscription. Other subscription types are
+    matched by calling :meth:`~autogen_core.Subscription.is_match`. Recipients of topics
+    that have been seen are cached, and the cache is updated only for the topics affected
+    when a subscription is added or removed.
+    """
+
     def __init__(self) -> None:
-        self._subscriptions: List[Subscription] = []
-        self._seen_topics: Set[TopicId] = set()
-        self._subscribed_recipients: DefaultDict[TopicId, List[AgentId]] = defaultdict(list)
+        self._subscriptions: Dict[str, Subscription] = {}
+        # Insertion order of the subscriptions, used to keep recipients in subscription order.
+        self._sequence: Dict[str, int] = {}
+        self._next_sequence = 0
+        self._type_index: DefaultDict[str, Dict[str, Subscription]] = defaultdict(dict)
+        self._type_keys: Set[Tuple[str, str]] = set()
+        self._prefix_index: _PrefixTrie[Subscription] = _PrefixTrie()
+        self._prefix_keys: Set[Tuple[str, str]] = set()
+        self._other_subscriptions: Dict[str, Subscription] = {}
+        # Seen topics grouped by topic type, plus a trie of the seen topic types.
+        self._seen_topics: DefaultDict[str, Set[TopicId]] = defaultdict(set)
+        self._seen_topic_types: _PrefixTrie[str] = _PrefixTrie()
+        self._subscribed_recipients: Dict[TopicId, List[AgentId]] = {}
 
     @property
     def subscriptions(self) -> Sequence[Subscription]:
-        return self._subscriptions
+        return list(self._subscriptions.values())
 
     async def add_subscription(self, subscription: Subscription) -> None:
         # Check if the subscription already exists
-        if any(sub == subscription for sub in self._subscriptions):
+        if self._is_duplicate(subscription):
             raise ValueError("Subscription already exists")
 
-        self._subscriptions.append(subscription)
-        self._rebuild_subscriptions(self._seen_topics)
+        self._subscriptions[subscription.id] = subscription
+        self._sequence[subscription.id] = self._next_sequence
+        self._next_sequence += 1
+        if _is_exact_type_subscription(subscription):
+            assert isinstance(subscription, TypeSubscription)
+            self._type_index[subscription.topic_type][subscription.id] = subscription
+            self._type_keys.add((subscription.topic_type, subscription.agent_type))
+        elif _is_type_prefix_subscription(subscription):
+            assert isinstance(subscription, TypePrefixSubscription)
+            self._prefix_index.add(subscription.topic_type_prefix, subscription.id, subscription)
+            self._prefix_keys.add((subscription.topic_type_prefix, subscription.agent_type))
+        else:
+            self._other_subscriptions[subscription.id] = subscription
+
+        # The new subscription is the most recent one, so its recipient goes last. The list is
+        # replaced rather than appended to, since callers may still be iterating the old one.
+        for topic in self._affected_topics(subscription):
+            recipient = subscription.map_to_agent(topic)
+            self._subscribed_recipients[topic] = [*self._subscribed_recipients[topic], recipient]
 
     async def remove_subscription(self, id: str) -> None:
         # Check if the subscription exists
-        if not any(sub.id == id for sub in self._subscriptions):
+        subscription = self._subscriptions.pop(id, None)
+        if subscription is None:
             raise ValueError("Subscription does not exist")
 
-        def is_not_sub(x: Subscription) -> bool:
-            return x.id != id
-
-        self._subscriptions = list(filter(is_not_sub, self._subscriptions))
+        affected_topics = list(self._affected_topics(subscription))
+        del self._sequence[id]
+        if _is_exact_type_subscription(subscription):
+            assert isinstance(subscription, TypeSubscription)
+            subscriptions_for_type = self._type_index[subscription.topic_type]
+            del subscriptions_for_type[id]
+            if not subscriptions_for_type:
+                del self._type_index[subscription.topic_type]
+            self._type_keys.discard((subscription.topic_type, subscription.agent_type))
+        elif _is_type_prefix_subscription(subscription):
+            assert isinstance(subscription, TypePrefixSubscription)
+            self._prefix_index.remove(subscription.topic_type_prefix, id)
+            self._prefix_keys.discard((subscription.topic_type_prefix, subscription.agent_type))
+        else:
+            del self._other_subscriptions[id]
 
-        # Rebuild the subscriptions
-        self._rebuild_subscriptions(self._seen_topics)
+        for topic in affected_topics:
+            self._subscribed_recipients[topic] = self._match_recipients(topic)
 
     async def get_subscribed_recipients(self, topic: TopicId) -> List[AgentId]:
-        if topic not in self._seen_topics:
-            self._build_for_new_topic(topic)
-        return self._subscribed_recipients[topic]
-
-    # TODO: optimize this...
-    def _rebuild_subscriptions(self, topics: Set[TopicId]) -> None:
-        self._subscribed_recipients.clear()
-        for topic in topics:
-            self._build_for_new_topic(topic)
-
-    def _build_for_new_topic(self, topic: TopicId) -> None:
-        self._seen_topics.add(topic)
-        for subscription in self._subscriptions:
-            if subscription.is_match(topic):
-                self._subscribed_recipients[topic].append(subscription.map_to_agent(topic))
+        recipients = self._subscribed_recipients.get(topic)
+        if recipients is None:
+            recipients = self._build_for_new_topic(topic)
+        # Return a copy so that callers cannot change the cached recipients.
+        return list(recipients)
+
+    def _is_duplicate(self, subscription: Subscription) -> bool:
+        if subscription.id in self._subscriptions:
+            return True
+        if _is_exact_type_subscription(subscription):
+            assert isinstance(subscription, TypeSubscription)
+            if (subscription.topic_type, subscription.agent_type) in self._type_keys:
+                return True
+            candidates: Iterable[Subscription] = self._other_subscriptions.values()
+        elif _is_type_prefix_subscription(subscription):
+            assert isinstance(subscription, TypePrefixSubscription)
+            if (subscription.topic_type_prefix, subscription.agent_type) in self._prefix_keys:
+                return True
+            candidates = self._other_subscriptions.values()
+        else:
+            candidates = self._subscriptions.values()
+        return any(sub == subscription for sub in candidates)
+
+    def _affected_topics(self, subscription: Subscription) -> Iterator[TopicId]:
+        """Yield the seen topics that `subscription` matches."""
+        if _is_exact_type_subscription(subscription):
+            assert isinstance(subscription, TypeSubscription)
+            yield from self._seen_topics.get(subscription.topic_type, ())
+        elif _is_type_prefix_subscription(subscription):
+            assert isinstance(subscription, TypePrefixSubscription)
+            for topic_type in self._seen_topic_types.iter_with_prefix(subscription.topic_type_prefix):
+                yield from self._seen_topics[topic_type]
+        else:
+            for topics in self._seen_topics.values():
+                yield from (topic for topic in topics if subscription.is_match(topic))
+
+    def _match_recipients(self, topic: TopicId) -> List[AgentId]:
+        matches: List[Subscription] = []
+        exact = self._type_index.get(topic.type)
+        if exact is not None:
+            matches.extend(exact.values())
+        matches.extend(self._prefix_index.iter_prefixes_of(topic.type))
+        matches.extend(sub for sub in self._other_subscriptions.values() if sub.is_match(topic))
+        if len(matches) > 1:
+            matches.sort(key=lambda sub: self._sequence[sub.id])
+        return [sub.map_to_agent(topic) for sub in matches]
+
+    def _build_for_new_topic(self, topic: TopicId) -> List[AgentId]:
+        topics_for_type = self._seen_topics[topic.type]
+        if not topics_for_type:
+            self._seen_topic_types.add(topic.type, topic.type, topic.type)
+        topics_for_type.add(topic)
+        recipients = self._match_recipients(topic)
+        self._subscribed_recipients[topic] = recipients
+        return recipients
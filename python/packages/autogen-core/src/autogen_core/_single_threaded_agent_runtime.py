@@ -8,14 +8,30 @@
 import warnings
 from asyncio import CancelledError, Future, Queue, Task
 from collections.abc import Sequence
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Any, Awaitable, Callable, Dict, List, Mapping, ParamSpec, Set, Type, TypeVar, cast
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    ParamSpec,
+    Set,
+    Type,
+    TypeVar,
+    cast,
+)
 
 from opentelemetry.trace import TracerProvider
 
 from .logging import (
     AgentConstructionExceptionEvent,
     DeliveryStage,
+    LazyPayload,
     MessageDroppedEvent,
     MessageEvent,
     MessageHandlerExceptionEvent,
@@ -43,7 +59,7 @@
 from ._subscription import Subscription
 from ._telemetry import EnvelopeMetadata, MessageRuntimeTracingConfig, TraceHelper, get_telemetry_envelope_metadata
 from ._topic import TopicId
-from .exceptions import MessageDroppedException
+from .exceptions import MessageDroppedException, MessageQueueFullException
 
 logger = logging.getLogger("autogen_core")
 event_logger = logging.getLogger("autogen_core.events")
@@ -53,6 +69,28 @@
 type_func_alias = type
 
 
+class _QueueSlot:
+    """A slot in a bounded message queue. The slot is held from the time a message is
+    queued until it has been admitted to every recipient's handler, and is shared by the
+    recipients of a published message."""
+
+    __slots__ = ("_semaphore", "_holders")
+
+    def __init__(self, semaphore: asyncio.Semaphore) -> None:
+        self._semaphore = semaphore
+        self._holders = 1
+
+    def share(self, count: int) -> None:
+        self._holders += count
+
+    def release(self) -> None:
+        if self._holders == 0:
+            return
+        self._holders -= 1
+        if self._holders == 0:
+            self._semaphore.release()
+
+
 @dataclass(kw_only=True)
 class PublishMessageEnvelope:
     """A message envelope for publishing messages to all agents that can handle
@@ -64,6 +102,7 @@ class PublishMessageEnvelope:
     topic_id: TopicId
     metadata: EnvelopeMetadata | None = None
     message_id: str
+    queue_slot: _QueueSlot | None = None
 
 
 @dataclass(kw_only=True)
@@ -78,6 +117,7 @@ class SendMessageEnvelope:
     cancellation_token: CancellationToken
     metadata: EnvelopeMetadata | None = None
     message_id: str
+    queue_slot: _QueueSlot | None = None
 
 
 @dataclass(kw_only=True)
@@ -160,6 +200,24 @@ class SingleThreadedAgentRuntime(AgentRuntime):
             handlers that can intercept messages before they are sent or published. Defaults to None.
         tracer_provider (TracerProvider, optional): The tracer provider to use for tracing. Defaults to None.
         ignore_unhandled_exceptions (bool, optional): Whether to ignore unhandled exceptions in that occur in agent event handlers. Any background exceptions will be raised on the next call to `process_next` or from an awaited `stop`, `stop_when_idle` or `stop_when`. Note, this does not apply to RPC handlers. Defaults to True.
+        emit_message_events (bool, optional): Whether to emit a :class:`~autogen_core.logging.MessageEvent` to the
+            :data:`~autogen_core.EVENT_LOGGER_NAME` logger for every message sent, published, delivered and responded to.
+            Message payloads are only serialized when a handler formats the event, but turning this off removes the
+            per-message overhead entirely for high-throughput workloads. Exception and dropped-message events are
+            still emitted. Defaults to True.
+        max_queue_size (int, optional): The maximum number of sent and published messages that may be waiting
+            for delivery, including messages that are waiting for an in-flight slot of their recipient's agent type.
+            Responses to direct messages are never bounded. Defaults to None, which means the queue is unbounded.
+        queue_full_policy (Literal["block", "drop", "error"], optional): What to do when a message is sent or
+            published while the queue is full. ``"block"`` waits for a free slot, ``"drop"`` discards the message
+            (sending raises :class:`~autogen_core.exceptions.MessageDroppedException`, publishing returns silently)
+            and ``"error"`` raises :class:`~autogen_core.exceptions.MessageQueueFullException`. Dropped messages
+            are reported with a :class:`~autogen_core.logging.MessageDroppedEvent`. Defaults to ``"block"``.
+        max_inflight_per_agent_type (Mapping[str, int], optional): The maximum number of messages that agents of
+            a given type may handle concurrently, keyed by agent type. Further messages for that type wait in the
+            queue, so together with `max_queue_size` producers are slowed down while the agents drain.
+            An agent that sends a message to an agent of its own type and awaits the response can deadlock if the
+            limit for its type is reached. Defaults to None, which means no limit.
 
     Examples:
 
@@ -250,7 +308,19 @@ def __init__(
         intervention_handlers: List[InterventionHandler] | None = None,
         tracer_provider: TracerProvider | None = None,
         ignore_unhandled_exceptions: bool = True,
+        emit_message_events: bool = True,
+        max_queue_size: int | None = None,
+        queue_full_policy: Literal["block", "drop", "error"] = "block",
+        max_inflight_per_agent_type: Mapping[str, int] | None = None,
     ) -> None:
+        if max_queue_size is not None and max_queue_size <= 0:
+            raise ValueError("max_queue_size must be a positive integer.")
+        if queue_full_policy not in ("block", "drop", "error"):
+            raise ValueError(f"Unsupported queue_full_policy: {queue_full_policy}")
+        if max_inflight_per_agent_type is not None and any(
+            limit <= 0 for limit in max_inflight_per_agent_type.values()
+        ):
+            raise ValueError("max_inflight_per_agent_type limits must be positive integers.")
         self._tracer_helper = TraceHelper(tracer_provider, MessageRuntimeTracingConfig("SingleThreadedAgentRuntime"))
         self._message_queue: Queue[PublishMessageEnvelope | SendMessageEnvelope | ResponseMessageEnvelope] = Queue()
         # (namespace, type) -> List[AgentId]
@@ -265,6 +335,15 @@ def __init__(
         self._serialization_registry = SerializationRegistry()
         self._ignore_unhandled_handler_exceptions = ignore_unhandled_exceptions
         self._background_exception: BaseException | None = None
+        self._emit_message_events = emit_message_events
+        self._max_queue_size = max_queue_size
+        self._queue_full_policy = queue_full_policy
+        self._queue_slots: asyncio.Semaphore | None = (
+            asyncio.Semaphore(max_queue_size) if max_queue_size is not None else None
+        )
+        self._inflight_limits: Dict[str, asyncio.Semaphore] = {
+            agent_type: asyncio.Semaphore(limit) for agent_type, limit in (max_inflight_per_agent_type or {}).items()
+        }
 
     @property
     def unprocessed_messages_count(
@@ -292,15 +371,16 @@ async def send_message(
         if message_id is None:
             message_id = str(uuid.uuid4())
 
-        event_logger.info(
-            MessageEvent(
-                payload=self._try_serialize(message),
-                sender=sender,
-                receiver=recipient,
-                kind=MessageKind.DIRECT,
-                delivery_stage=DeliveryStage.SEND,
+        if self._message_events_enabled():
+            event_logger.info(
+                MessageEvent(
+                    payload=self._lazy_payload(message),
+                    sender=sender,
+                    receiver=recipient,
+                    kind=MessageKind.DIRECT,
+                    delivery_stage=DeliveryStage.SEND,
+                )
             )
-        )
 
         with self._tracer_helper.trace_block(
             "create",
@@ -308,12 +388,18 @@ async def send_message(
             parent=None,
             extraAttributes={"message_type": type(message).__name__},
         ):
+            queue_slot = await self._acquire_queue_slot()
+            if queue_slot is None and self._queue_slots is not None:
+                self._log_queue_full_drop(message, sender, recipient, MessageKind.DIRECT)
+                raise MessageDroppedException()
+
             future = asyncio.get_event_loop().create_future()
             if recipient.type not in self._known_agent_names:
                 future.set_exception(Exception("Recipient not found"))
 
-            content = message.__dict__ if hasattr(message, "__dict__") else message
-            logger.info(f"Sending message of type {type(message).__name__} to {recipient.type}: {content}")
+            if logger.isEnabledFor(logging.INFO):
+                content = message.__dict__ if hasattr(message, "__dict__") else message
+                logger.info("Sending message of type %s to %s: %s", type(message).__name__, recipient.type, content)
 
             await self._message_queue.put(
                 SendMessageEnvelope(
@@ -324,6 +410,7 @@ async def send_message(
                     sender=sender,
                     metadata=get_telemetry_envelope_metadata(),
                     message_id=message_id,
+                    queue_slot=queue_slot,
                 )
             )
 
@@ -348,21 +435,28 @@ async def publish_message(
         ):
             if cancellation_token is None:
                 cancellation_token = CancellationToken()
-            content = message.__dict__ if hasattr(message, "__dict__") else message
-            logger.info(f"Publishing message of type {type(message).__name__} to all subscribers: {content}")
+            if logger.isEnabledFor(logging.INFO):
+                content = message.__dict__ if hasattr(message, "__dict__") else message
+                logger.info("Publishing message of type %s to all subscribers: %s", type(message).__name__, content)
 
             if message_id is None:
                 message_id = str(uuid.uuid4())
 
-            event_logger.info(
-                MessageEvent(
-                    payload=self._try_serialize(message),
-                    sender=sender,
-                    receiver=topic_id,
-                    kind=MessageKind.PUBLISH,
-                    delivery_stage=DeliveryStage.SEND,
+            if self._message_events_enabled():
+                event_logger.info(
+                    MessageEvent(
+                        payload=self._lazy_payload(message),
+                        sender=sender,
+                        receiver=topic_id,
+                        kind=MessageKind.PUBLISH,
+                        delivery_stage=DeliveryStage.SEND,
+                    )
                 )
-            )
+
+            queue_slot = await self._acquire_queue_slot()
+            if queue_slot is None and self._queue_slots is not None:
+                self._log_queue_full_drop(message, sender, topic_id, MessageKind.PUBLISH)
+                return
 
             await self._message_queue.put(
                 PublishMessageEnvelope(
@@ -372,9 +466,57 @@ async def publish_message(
                     topic_id=topic_id,
                     metadata=get_telemetry_envelope_metadata(),
                     message_id=message_id,
+                    queue_slot=queue_slot,
                 )
             )
 
+    async def _acquire_queue_slot(self) -> _QueueSlot | None:
+        """Reserve a slot in the bounded message queue according to the queue full policy.
+
+        Returns None if the queue is unbounded, or if it is full and the message should be dropped."""
+        semaphore = self._queue_slots
+        if semaphore is None:
+            return None
+        if semaphore.locked():
+            if self._queue_full_policy == "drop":
+                return None
+            if self._queue_full_policy == "error":
+                raise MessageQueueFullException(f"Message queue is full (max_queue_size={self._max_queue_size}).")
+        await semaphore.acquire()
+        return _QueueSlot(semaphore)
+
+    def _log_queue_full_drop(
+        self, message: Any, sender: AgentId | None, receiver: AgentId | TopicId, kind: MessageKind
+    ) -> None:
+        logger.warning("Message queue is full, dropping message of type %s to %s", type(message).__name__, receiver)
+        if event_logger.isEnabledFor(logging.INFO):
+            event_logger.info(
+                MessageDroppedEvent(
+                    payload=self._lazy_payload(message),
+                    sender=sender,
+                    receiver=receiver,
+                    kind=kind,
+                )
+            )
+
+    @asynccontextmanager
+    async def _admit(self, agent_type: str, queue_slot: _QueueSlot | None) -> AsyncIterator[None]:
+        """Hold an in-flight slot for the agent type, if it is limited, while a handler runs.
+
+        The message's queue slot is released once it has been admitted."""
+        semaphore = self._inflight_limits.get(agent_type)
+        try:
+            if semaphore is not None:
+                await semaphore.acquire()
+        finally:
+            if queue_slot is not None:
+                queue_slot.release()
+        try:
+            yield
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
     async def save_state(self) -> Mapping[str, Any]:
         """Save the state of all instantiated agents.
 
@@ -415,70 +557,83 @@ async def _process_send(self, message_envelope: SendMessageEnvelope) -> None:
             recipient = message_envelope.recipient
 
             if recipient.type not in self._known_agent_names:
+                if message_envelope.queue_slot is not None:
+                    message_envelope.queue_slot.release()
                 raise LookupError(f"Agent type '{recipient.type}' does not exist.")
 
             try:
-                sender_id = str(message_envelope.sender) if message_envelope.sender is not None else "Unknown"
-                logger.info(
-                    f"Calling message handler for {recipient} with message type {type(message_envelope.message).__name__} sent by {sender_id}"
-                )
-                event_logger.info(
-                    MessageEvent(
-                        payload=self._try_serialize(message_envelope.message),
+                async with self._admit(recipient.type, message_envelope.queue_slot):
+                    if logger.isEnabledFor(logging.INFO):
+                        sender_id = str(message_envelope.sender) if message_envelope.sender is not None else "Unknown"
+                        logger.info(
+                            "Calling message handler for %s with message type %s sent by %s",
+                            recipient,
+                            type(message_envelope.message).__name__,
+                            sender_id,
+                        )
+                    if self._message_events_enabled():
+                        event_logger.info(
+                            MessageEvent(
+                                payload=self._lazy_payload(message_envelope.message),
+                                sender=message_envelope.sender,
+                                receiver=recipient,
+                                kind=MessageKind.DIRECT,
+                                delivery_stage=DeliveryStage.DELIVER,
+                            )
+                        )
+                    recipient_agent = await self._get_agent(recipient)
+
+                    message_context = MessageContext(
                         sender=message_envelope.sender,
-                        receiver=recipient,
-                        kind=MessageKind.DIRECT,
-                        delivery_stage=DeliveryStage.DELIVER,
+                        topic_id=None,
+                        is_rpc=True,
+                        cancellation_token=message_envelope.cancellation_token,
+                        message_id=message_envelope.message_id,
                     )
-                )
-                recipient_agent = await self._get_agent(recipient)
-
-                message_context = MessageContext(
-                    sender=message_envelope.sender,
-                    topic_id=None,
-                    is_rpc=True,
-                    cancellation_token=message_envelope.cancellation_token,
-                    message_id=message_envelope.message_id,
-                )
-                with self._tracer_helper.trace_block("process", recipient_agent.id, parent=message_envelope.metadata):
-                    with MessageHandlerContext.populate_context(recipient_agent.id):
-                        response = await recipient_agent.on_message(
-                            message_envelope.message,
-                            ctx=message_context,
-                        )
+                    with self._tracer_helper.trace_block(
+                        "process", recipient_agent.id, parent=message_envelope.metadata
+                    ):
+                        with MessageHandlerContext.populate_context(recipient_agent.id):
+                            response = await recipient_agent.on_message(
+                                message_envelope.message,
+                                ctx=message_context,
+                            )
             except CancelledError as e:
                 if not message_envelope.future.cancelled():
                     message_envelope.future.set_exception(e)
                 self._message_queue.task_done()
-                event_logger.info(
-                    MessageHandlerExceptionEvent(
-                        payload=self._try_serialize(message_envelope.message),
-                        handling_agent=recipient,
-                        exception=e,
+                if event_logger.isEnabledFor(logging.INFO):
+                    event_logger.info(
+                        MessageHandlerExceptionEvent(
+                            payload=self._lazy_payload(message_envelope.message),
+                            handling_agent=recipient,
+                            exception=e,
+                        )
                     )
-                )
                 return
             except BaseException as e:
                 message_envelope.future.set_exception(e)
                 self._message_queue.task_done()
-                event_logger.info(
-                    MessageHandlerExceptionEvent(
-                        payload=self._try_serialize(message_envelope.message),
-                        handling_agent=recipient,
-                        exception=e,
+                if event_logger.isEnabledFor(logging.INFO):
+                    event_logger.info(
+                        MessageHandlerExceptionEvent(
+                            payload=self._lazy_payload(message_envelope.message),
+                            handling_agent=recipient,
+                            exception=e,
+                        )
                     )
-                )
                 return
 
-            event_logger.info(
-                MessageEvent(
-                    payload=self._try_serialize(response),
-                    sender=message_envelope.recipient,
-                    receiver=message_envelope.sender,
-                    kind=MessageKind.RESPOND,
-                    delivery_stage=DeliveryStage.SEND,
+            if self._message_events_enabled():
+                event_logger.info(
+                    MessageEvent(
+                        payload=self._lazy_payload(response),
+                        sender=message_envelope.recipient,
+                        receiver=message_envelope.sender,
+                        kind=MessageKind.RESPOND,
+                        delivery_stage=DeliveryStage.SEND,
+                    )
                 )
-            )
 
             await self._message_queue.put(
                 ResponseMessageEnvelope(
@@ -493,6 +648,7 @@ async def _process_send(self, message_envelope: SendMessageEnvelope) -> None:
 
     async def _process_publish(self, message_envelope: PublishMessageEnvelope) -> None:
         with self._tracer_helper.trace_block("publish", message_envelope.topic_id, parent=message_envelope.metadata):
+            queue_slot = message_envelope.queue_slot
             try:
                 responses: List[Awaitable[Any]] = []
                 recipients = await self._subscription_manager.get_subscribed_recipients(message_envelope.topic_id)
@@ -504,19 +660,24 @@ async def _process_publish(self, message_envelope: PublishMessageEnvelope) -> No
                     sender_agent = (
                         await self._get_agent(message_envelope.sender) if message_envelope.sender is not None else None
                     )
-                    sender_name = str(sender_agent.id) if sender_agent is not None else "Unknown"
-                    logger.info(
-                        f"Calling message handler for {agent_id.type} with message type {type(message_envelope.message).__name__} published by {sender_name}"
-                    )
-                    event_logger.info(
-                        MessageEvent(
-                            payload=self._try_serialize(message_envelope.message),
-                            sender=message_envelope.sender,
-                            receiver=None,
-                            kind=MessageKind.PUBLISH,
-                            delivery_stage=DeliveryStage.DELIVER,
+                    if logger.isEnabledFor(logging.INFO):
+                        sender_name = str(sender_agent.id) if sender_agent is not None else "Unknown"
+                        logger.info(
+                            "Calling message handler for %s with message type %s published by %s",
+                            agent_id.type,
+                            type(message_envelope.message).__name__,
+                            sender_name,
+                        )
+                    if self._message_events_enabled():
+                        event_logger.info(
+                            MessageEvent(
+                                payload=self._lazy_payload(message_envelope.message),
+                                sender=message_envelope.sender,
+                                receiver=None,
+                                kind=MessageKind.PUBLISH,
+                                delivery_stage=DeliveryStage.DELIVER,
+                            )
                         )
-                    )
                     message_context = MessageContext(
                         sender=message_envelope.sender,
                         topic_id=message_envelope.topic_id,
@@ -527,54 +688,69 @@ async def _process_publish(self, message_envelope: PublishMessageEnvelope) -> No
                     agent = await self._get_agent(agent_id)
 
                     async def _on_message(agent: Agent, message_context: MessageContext) -> Any:
-                        with self._tracer_helper.trace_block("process", agent.id, parent=message_envelope.metadata):
-                            with MessageHandlerContext.populate_context(agent.id):
-                                try:
-                                    return await agent.on_message(
-                                        message_envelope.message,
-                                        ctx=message_context,
-                                    )
-                                except BaseException as e:
-                                    logger.error(f"Error processing publish message for {agent.id}", exc_info=True)
-                                    event_logger.info(
-                                        MessageHandlerExceptionEvent(
-                                            payload=self._try_serialize(message_envelope.message),
-                                            handling_agent=agent.id,
-                                            exception=e,
+                        async with self._admit(agent.id.type, message_envelope.queue_slot):
+                            with self._tracer_helper.trace_block("process", agent.id, parent=message_envelope.metadata):
+                                with MessageHandlerContext.populate_context(agent.id):
+                                    try:
+                                        return await agent.on_message(
+                                            message_envelope.message,
+                                            ctx=message_context,
                                         )
-                                    )
-                                    raise e
+                                    except BaseException as e:
+                                        logger.error(f"Error processing publish message for {agent.id}", exc_info=True)
+                                        if event_logger.isEnabledFor(logging.INFO):
+                                            event_logger.info(
+                                                MessageHandlerExceptionEvent(
+                                                    payload=self._lazy_payload(message_envelope.message),
+                                                    handling_agent=agent.id,
+                                                    exception=e,
+                                                )
+                                            )
+                                        raise e
 
                     future = _on_message(agent, message_context)
                     responses.append(future)
 
+                if queue_slot is not None:
+                    # Hand the slot over to the recipients; it is released once all of them are admitted.
+                    queue_slot.share(len(responses))
+                    queue_slot.release()
+                    queue_slot = None
                 await asyncio.gather(*responses)
             except BaseException as e:
                 if not self._ignore_unhandled_handler_exceptions:
                     self._background_exception = e
             finally:
+                if queue_slot is not None:
+                    queue_slot.release()
                 self._message_queue.task_done()
             # TODO if responses are given for a publish
 
     async def _process_response(self, message_envelope: ResponseMessageEnvelope) -> None:
         with self._tracer_helper.trace_block("ack", message_envelope.recipient, parent=message_envelope.metadata):
-            content = (
-                message_envelope.message.__dict__
-                if hasattr(message_envelope.message, "__dict__")
-                else message_envelope.message
-            )
-            logger.info(
-                f"Resolving response with message type {type(message_envelope.message).__name__} for recipient {message_envelope.recipient} from {message_envelope.sender.type}: {content}"
-            )
-            event_logger.info(
-                MessageEvent(
-                    payload=self._try_serialize(message_envelope.message),
-                    sender=message_envelope.sender,
-                    receiver=message_envelope.recipient,
-                    kind=MessageKind.RESPOND,
-                    delivery_stage=DeliveryStage.DELIVER,
+            if logger.isEnabledFor(logging.INFO):
+                content = (
+                    message_envelope.message.__dict__
+                    if hasattr(message_envelope.message, "__dict__")
+                    else message_envelope.message
+                )
+                logger.info(
+                    "Resolving response with message type %s for recipient %s from %s: %s",
+                    type(message_envelope.message).__name__,
+                    message_envelope.recipient,
+                    message_envelope.sender.type,
+                    content,
+                )
+            if self._message_events_enabled():
+                event_logger.info(
+                    MessageEvent(
+                        payload=self._lazy_payload(message_envelope.message),
+                        sender=message_envelope.sender,
+                        receiver=message_envelope.recipient,
+                        kind=MessageKind.RESPOND,
+                        delivery_stage=DeliveryStage.DELIVER,
+                    )
                 )
-            )
             if not message_envelope.future.cancelled():
                 message_envelope.future.set_result(message_envelope.message)
             self._message_queue.task_done()
@@ -625,17 +801,22 @@ async def _process_next(self) -> None:
                                 _warn_if_none(temp_message, "on_send")
                             except BaseException as e:
                                 future.set_exception(e)
+                                if message_envelope.queue_slot is not None:
+                                    message_envelope.queue_slot.release()
                                 return
                             if temp_message is DropMessage or isinstance(temp_message, DropMessage):
-                                event_logger.info(
-                                    MessageDroppedEvent(
-                                        payload=self._try_serialize(message),
-                                        sender=sender,
-                                        receiver=recipient,
-                                        kind=MessageKind.DIRECT,
+                                if event_logger.isEnabledFor(logging.INFO):
+                                    event_logger.info(
+                                        MessageDroppedEvent(
+                                            payload=self._lazy_payload(message),
+                                            sender=sender,
+                                            receiver=recipient,
+                                            kind=MessageKind.DIRECT,
+                                        )
                                     )
-                                )
                                 future.set_exception(MessageDroppedException())
+                                if message_envelope.queue_slot is not None:
+                                    message_envelope.queue_slot.release()
                                 return
 
                         message_envelope.message = temp_message
@@ -665,16 +846,21 @@ async def _process_next(self) -> None:
                             except BaseException as e:
                                 # TODO: we should raise the intervention exception to the publisher.
                                 logger.error(f"Exception raised in in intervention handler: {e}", exc_info=True)
+                                if message_envelope.queue_slot is not None:
+                                    message_envelope.queue_slot.release()
                                 return
                             if temp_message is DropMessage or isinstance(temp_message, DropMessage):
-                                event_logger.info(
-                                    MessageDroppedEvent(
-                                        payload=self._try_serialize(message),
-                                        sender=sender,
-                                        receiver=topic_id,
-                                        kind=MessageKind.PUBLISH,
+                                if event_logger.isEnabledFor(logging.INFO):
+                                    event_logger.info(
+                                        MessageDroppedEvent(
+                                            payload=self._lazy_payload(message),
+                                            sender=sender,
+                                            receiver=topic_id,
+                                            kind=MessageKind.PUBLISH,
+                                        )
                                     )
-                                )
+                                if message_envelope.queue_slot is not None:
+                                    message_envelope.queue_slot.release()
                                 return
 
                         message_envelope.message = temp_message
@@ -693,14 +879,15 @@ async def _process_next(self) -> None:
                             future.set_exception(e)
                             return
                         if temp_message is DropMessage or isinstance(temp_message, DropMessage):
-                            event_logger.info(
-                                MessageDroppedEvent(
-                                    payload=self._try_serialize(message),
-                                    sender=sender,
-                                    receiver=recipient,
-                                    kind=MessageKind.RESPOND,
+                            if event_logger.isEnabledFor(logging.INFO):
+                                event_logger.info(
+                                    MessageDroppedEvent(
+                                        payload=self._lazy_payload(message),
+                                        sender=sender,
+                                        receiver=recipient,
+                                        kind=MessageKind.RESPOND,
+                                    )
                                 )
-                            )
                             future.set_exception(MessageDroppedException())
                             return
                         message_envelope.message = temp_message
@@ -757,7 +944,7 @@ async def stop(self) -> None:
             await self._run_context.stop()
         finally:
             self._run_context = None
-            self._message_queue = Queue()
+            self._reset_message_queue()
 
     async def stop_when_idle(self) -> None:
         """Stop the runtime message processing loop when there is
@@ -769,7 +956,7 @@ async def stop_when_idle(self) -> None:
             await self._run_context.stop_when_idle()
         finally:
             self._run_context = None
-            self._message_queue = Queue()
+            self._reset_message_queue()
 
     async def stop_when(self, condition: Callable[[], bool]) -> None:
         """Stop the runtime message processing loop when the condition is met.
@@ -790,7 +977,13 @@ async def stop_when(self, condition: Callable[[], bool]) -> None:
         await self._run_context.stop_when(condition)
 
         self._run_context = None
+        self._reset_message_queue()
+
+    def _reset_message_queue(self) -> None:
         self._message_queue = Queue()
+        # Messages discarded with the old queue still hold slots of the old semaphore.
+        if self._max_queue_size is not None:
+            self._queue_slots = asyncio.Semaphore(self._max_queue_size)
 
     async def agent_metadata(self, agent: AgentId) -> AgentMetadata:
         return (await self._get_agent(agent)).metadata
@@ -911,6 +1104,12 @@ async def get(
     def add_message_serializer(self, serializer: MessageSerializer[Any] | Sequence[MessageSerializer[Any]]) -> None:
         self._serialization_registry.add_serializer(serializer)
 
+    def _message_events_enabled(self) -> bool:
+        return self._emit_message_events and event_logger.isEnabledFor(logging.INFO)
+
+    def _lazy_payload(self, message: Any) -> LazyPayload:
+        return LazyPayload(lambda: self._try_serialize(message))
+
     def _try_serialize(self, message: Any) -> str:
         try:
             type_name = self._serialization_registry.type_name(message)
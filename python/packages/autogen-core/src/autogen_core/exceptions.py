@@ -1,4 +1,10 @@
-__all__ = ["CantHandleException", "UndeliverableException", "MessageDroppedException", "NotAccessibleError"]
+__all__ = [
+    "CantHandleException",
+    "UndeliverableException",
+    "MessageDroppedException",
+    "MessageQueueFullException",
+    "NotAccessibleError",
+]
 
 
 class CantHandleException(Exception):
@@ -13,5 +19,9 @@ class MessageDroppedException(Exception):
     """Raised when a message is dropped."""
 
 
+class MessageQueueFullException(Exception):
+    """Raised when a message can't be queued because the runtime's message queue is full."""
+
+
 class NotAccessibleError(Exception):
     """Tried to access a value that is not accessible. For example if it is remote cannot be accessed locally."""
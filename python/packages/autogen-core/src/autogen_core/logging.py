@@ -1,6 +1,6 @@
 import json
 from enum import Enum
-from typing import Any, Dict, List, cast
+from typing import Any, Callable, Dict, List, cast
 
 from ._agent_id import AgentId
 from ._message_handler_context import MessageHandlerContext
@@ -199,6 +199,45 @@ def __str__(self) -> str:
         return json.dumps(self.kwargs)
 
 
+class LazyPayload:
+    """A message payload whose serialization is deferred until the event it belongs to
+    is actually formatted by a log handler.
+
+    Runtimes use this to avoid serializing every message on the hot path when nothing
+    is listening on :data:`~autogen_core.EVENT_LOGGER_NAME`. The serialized value is
+    computed at most once.
+
+    Args:
+        serializer (Callable[[], str]): A callable that returns the serialized payload.
+    """
+
+    __slots__ = ("_serializer", "_value")
+
+    def __init__(self, serializer: Callable[[], str]) -> None:
+        self._serializer: Callable[[], str] | None = serializer
+        self._value: str | None = None
+
+    @property
+    def value(self) -> str:
+        if self._serializer is not None:
+            self._value = self._serializer()
+            self._serializer = None
+        return cast(str, self._value)
+
+    def __str__(self) -> str:
+        return self.value
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, LazyPayload):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _payload_value(payload: str | LazyPayload) -> str:
+    return payload.value if isinstance(payload, LazyPayload) else payload
+
+
 class MessageKind(Enum):
     DIRECT = 1
     PUBLISH = 2
@@ -214,7 +253,7 @@ class MessageEvent:
     def __init__(
         self,
         *,
-        payload: str,
+        payload: str | LazyPayload,
         sender: AgentId | None,
         receiver: AgentId | TopicId | None,
         kind: MessageKind,
@@ -229,16 +268,20 @@ def __init__(
         self.kwargs["delivery_stage"] = str(delivery_stage)
         self.kwargs["type"] = "Message"
 
+    @property
+    def payload(self) -> str:
+        return _payload_value(self.kwargs["payload"])
+
     # This must output the event in a json serializable format
     def __str__(self) -> str:
-        return json.dumps(self.kwargs)
+        return json.dumps(self.kwargs, default=_json_default)
 
 
 class MessageDroppedEvent:
     def __init__(
         self,
         *,
-        payload: str,
+        payload: str | LazyPayload,
         sender: AgentId | None,
         receiver: AgentId | TopicId | None,
         kind: MessageKind,
@@ -251,16 +294,20 @@ def __init__(
         self.kwargs["kind"] = str(kind)
         self.kwargs["type"] = "MessageDropped"
 
+    @property
+    def payload(self) -> str:
+        return _payload_value(self.kwargs["payload"])
+
     # This must output the event in a json serializable format
     def __str__(self) -> str:
-        return json.dumps(self.kwargs)
+        return json.dumps(self.kwargs, default=_json_default)
 
 
 class MessageHandlerExceptionEvent:
     def __init__(
         self,
         *,
-        payload: str,
+        payload: str | LazyPayload,
         handling_agent: AgentId,
         exception: BaseException,
         **kwargs: Any,
@@ -271,9 +318,13 @@ def __init__(
         self.kwargs["exception"] = str(exception)
         self.kwargs["type"] = "MessageHandlerException"
 
+    @property
+    def payload(self) -> str:
+        return _payload_value(self.kwargs["payload"])
+
     # This must output the event in a json serializable format
     def __str__(self) -> str:
-        return json.dumps(self.kwargs)
+        return json.dumps(self.kwargs, default=_json_default)
 
 
 class AgentConstructionExceptionEvent:
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Tuple
 
 from pydantic import BaseModel
 from typing_extensions import Self
@@ -34,6 +34,10 @@ class TokenLimitedChatCompletionContext(ChatCompletionContext, Component[TokenLi
         tools (List[ToolSchema] | None): A list of tool schema to use in the context.
         initial_messages (List[LLMMessage] | None): A list of initial messages to include in the context.
 
+    If the model client implements :meth:`~autogen_core.models.ChatCompletionClient.count_message_tokens`,
+    each message is counted once and the count is cached, so trimming the context does not tokenize the
+    whole conversation again on every call.
+
     """
 
     component_config_schema = TokenLimitedChatCompletionContextConfig
@@ -53,12 +57,18 @@ def __init__(
         self._token_limit = token_limit
         self._model_client = model_client
         self._tool_schema = tool_schema or []
+        # Cached token count of each message, in the order of the messages that were last counted.
+        self._message_token_counts: List[Tuple[LLMMessage, int]] = []
+        self._supports_message_token_counts = True
 
     async def get_messages(self) -> List[LLMMessage]:
         """Get at most `token_limit` tokens in recent messages. If the token limit is not
         provided, then return as many messages as the remaining token allowed by the model client."""
         messages = list(self._messages)
-        if self._token_limit is None:
+        token_counts = self._get_message_token_counts(messages)
+        if token_counts is not None:
+            messages = self._trim_messages(messages, token_counts)
+        elif self._token_limit is None:
             remaining_tokens = self._model_client.remaining_tokens(messages, tools=self._tool_schema)
             while remaining_tokens < 0 and len(messages) > 0:
                 middle_index = len(messages) // 2
@@ -76,6 +86,53 @@ async def get_messages(self) -> List[LLMMessage]:
             messages = messages[1:]
         return messages
 
+    def _get_message_token_counts(self, messages: List[LLMMessage]) -> List[int] | None:
+        """Get the token count of each message, counting only the messages that were not counted before.
+        Returns None if the model client does not support counting tokens per message."""
+        if not self._supports_message_token_counts:
+            return None
+        cached = self._message_token_counts
+        # Messages are usually only appended, so reuse the counts of the longest unchanged prefix.
+        prefix_length = 0
+        for (cached_message, _), message in zip(cached, messages, strict=False):
+            if cached_message is not message:
+                break
+            prefix_length += 1
+        del cached[prefix_length:]
+        try:
+            for message in messages[prefix_length:]:
+                cached.append((message, self._model_client.count_message_tokens(message)))
+        except NotImplementedError:
+            self._supports_message_token_counts = False
+            cached.clear()
+            return None
+        return [count for _, count in cached]
+
+    def _trim_messages(self, messages: List[LLMMessage], token_counts: List[int]) -> List[LLMMessage]:
+        """Remove messages from the middle until the rest fit, the same way as removing the middle message
+        one at a time and counting again, but using prefix sums of the cached per-message counts."""
+        if self._token_limit is None:
+            budget = self._model_client.remaining_tokens([], tools=self._tool_schema)
+        else:
+            budget = self._token_limit - self._model_client.count_tokens([], tools=self._tool_schema)
+        prefix_sums = [0]
+        for count in token_counts:
+            prefix_sums.append(prefix_sums[-1] + count)
+        num_messages = len(messages)
+        if prefix_sums[num_messages] <= budget:
+            return messages
+        # Removing the middle message repeatedly always leaves a head and a tail of the original list.
+        head = num_messages // 2
+        tail = num_messages - head
+        while head + tail > 0:
+            if (head + tail) // 2 < head:
+                head -= 1
+            else:
+                tail -= 1
+            if prefix_sums[head] + prefix_sums[num_messages] - prefix_sums[num_messages - tail] <= budget:
+                break
+        return messages[:head] + messages[num_messages - tail :]
+
     def _to_config(self) -> TokenLimitedChatCompletionContextConfig:
         return TokenLimitedChatCompletionContextConfig(
             model_client=self._model_client.dump_component(),
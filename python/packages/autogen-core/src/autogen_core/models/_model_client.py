@@ -228,6 +228,19 @@ def count_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool |
     @abstractmethod
     def remaining_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int: ...
 
+    def count_message_tokens(self, message: LLMMessage) -> int:
+        """Count the tokens of a single message.
+
+        Clients whose token count is additive over messages can implement this so that callers,
+        such as :class:`~autogen_core.model_context.TokenLimitedChatCompletionContext`, can count each
+        message once and cache the result. An implementation must satisfy
+        ``count_tokens(messages, tools=tools) == count_tokens([], tools=tools) + sum(count_message_tokens(m) for m in messages)``.
+
+        Raises:
+            NotImplementedError: If the client does not support counting tokens per message.
+        """
+        raise NotImplementedError("This model client does not support counting tokens per message.")
+
     # Deprecated
     @property
     @abstractmethod
@@ -1,6 +1,7 @@
 import asyncio
 import functools
 import warnings
+from concurrent.futures import Executor
 from textwrap import dedent
 from typing import Any, Callable, Sequence
 
@@ -50,6 +51,10 @@ class FunctionTool(BaseTool[BaseModel, BaseModel], Component[FunctionToolConfig]
         strict (bool, optional): If set to True, the tool schema will only contain arguments that are explicitly
             defined in the function signature, and no default values will be allowed. Defaults to False.
             This is required to be set to True when used with models in structured output mode.
+        executor (Executor | None, optional): The executor that runs a synchronous function, e.g., a dedicated
+            :class:`~concurrent.futures.ThreadPoolExecutor` so that slow tools do not use up the threads of the
+            event loop's default executor. Defaults to None, which uses the default executor.
+            It is not part of the declarative configuration.
 
     Example:
 
@@ -92,8 +97,10 @@ def __init__(
         name: str | None = None,
         global_imports: Sequence[Import] = [],
         strict: bool = False,
+        executor: Executor | None = None,
     ) -> None:
         self._func = func
+        self._executor = executor
         self._global_imports = global_imports
         self._signature = get_typed_signature(func)
         func_name = name or func.func.__name__ if isinstance(func, functools.partial) else name or func.__name__
@@ -117,7 +124,7 @@ async def run(self, args: BaseModel, cancellation_token: CancellationToken) -> A
         else:
             if self._has_cancellation_support:
                 result = await asyncio.get_event_loop().run_in_executor(
-                    None,
+                    self._executor,
                     functools.partial(
                         self._func,
                         **kwargs,
@@ -125,7 +132,9 @@ async def run(self, args: BaseModel, cancellation_token: CancellationToken) -> A
                     ),
                 )
             else:
-                future = asyncio.get_event_loop().run_in_executor(None, functools.partial(self._func, **kwargs))
+                future = asyncio.get_event_loop().run_in_executor(
+                    self._executor, functools.partial(self._func, **kwargs)
+                )
                 cancellation_token.link_future(future)
                 result = await future
 
@@ -1,6 +1,10 @@
+import threading
+from typing import List, Optional, Union
 from unittest.mock import Mock
 
-from autogen_core import CacheStore, InMemoryStore
+import pytest
+from autogen_core import CacheStore, FunctionCall, InMemoryStore, InMemoryStoreStats, ThreadedCacheStore
+from autogen_core.models import CreateResult, RequestUsage
 
 
 def test_set_and_get_object_key_value() -> None:
@@ -46,3 +50,147 @@ def test_inmemory_store() -> None:
     key = "non_existent_key"
     default_value = 99
     assert store.get(key, default_value) == default_value
+
+
+def test_inmemory_store_lru_eviction() -> None:
+    store = InMemoryStore[int](max_entries=2)
+    store.set("a", 1)
+    store.set("b", 2)
+    assert store.get("a") == 1
+    store.set("c", 3)
+    # "b" is the least recently used.
+    assert list(store.store) == ["a", "c"]
+    assert store.get("b") is None
+    assert store.stats == InMemoryStoreStats(hits=1, misses=1, evictions=1)
+
+
+def test_inmemory_store_lfu_eviction() -> None:
+    store = InMemoryStore[int](max_entries=2, eviction_policy="lfu")
+    store.set("a", 1)
+    store.set("b", 2)
+    for _ in range(3):
+        store.get("a")
+    store.get("b")
+    store.set("c", 3)
+    # "b" is the least frequently used, although "a" was used less recently.
+    assert set(store.store) == {"a", "c"}
+    store.set("d", 4)
+    # "c" has been used once, and "d" has just been set.
+    assert set(store.store) == {"a", "d"}
+    # Setting a key again resets its count.
+    store.set("a", 5)
+    store.get("d")
+    store.set("e", 6)
+    assert set(store.store) == {"d", "e"}
+    assert store.stats.evictions == 3
+
+
+def test_inmemory_store_max_bytes() -> None:
+    store = InMemoryStore[str](max_bytes=10)
+    store.set("a", "x" * 4)
+    store.set("b", "x" * 4)
+    assert store.total_bytes == 8
+    store.set("c", "x" * 4)
+    assert list(store.store) == ["b", "c"]
+    assert store.total_bytes == 8
+    # An entry larger than the limit is not stored and does not evict the others.
+    store.set("d", "x" * 20)
+    assert list(store.store) == ["b", "c"]
+    assert store.total_bytes == 8
+    assert store.stats.oversized == 1
+    assert store.stats.evictions == 1
+    # Setting an existing key to an oversized value removes the old value.
+    store.set("b", "x" * 20)
+    assert list(store.store) == ["c"]
+    assert store.total_bytes == 4
+    assert store.stats.oversized == 2
+
+
+def test_inmemory_store_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 1000.0
+    monkeypatch.setattr("autogen_core._cache_store.time.monotonic", lambda: now)
+    store = InMemoryStore[int](ttl=10)
+    store.set("a", 1)
+    now += 5
+    store.set("b", 2)
+    assert store.get("a") == 1
+    now += 6
+    assert store.get("a") is None
+    assert store.get("b") == 2
+    now += 5
+    # Expired entries are also removed on set.
+    store.set("c", 3)
+    assert list(store.store) == ["c"]
+    assert store.stats == InMemoryStoreStats(hits=2, misses=1, expirations=2)
+
+
+def test_inmemory_store_compact() -> None:
+    result = CreateResult(
+        finish_reason="function_calls",
+        content=[FunctionCall(id="1", name="get_weather", arguments='{"city": "Paris"}')],
+        usage=RequestUsage(prompt_tokens=10, completion_tokens=5),
+        cached=False,
+    )
+    chunks: List[Union[str, CreateResult]] = ["Hello", " world", result]
+    store = InMemoryStore[Union[CreateResult, List[Union[str, CreateResult]], int]](compact=True)
+    store.set("result", result)
+    store.set("stream", chunks)
+    store.set("other", 42)
+
+    assert store.get("result") == result
+    assert store.get("result") is not result
+    assert store.get("stream") == chunks
+    assert store.get("other") == 42
+    assert not isinstance(store.store["result"], CreateResult)
+
+
+def test_inmemory_store_config() -> None:
+    store = InMemoryStore[int](max_entries=100, max_bytes=1 << 20, eviction_policy="lfu", ttl=60, compact=True)
+    loaded = InMemoryStore[int].load_component(store.dump_component())
+    assert loaded.dump_component() == store.dump_component()
+    with pytest.raises(ValueError):
+        InMemoryStore[int](eviction_policy="fifo")  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        InMemoryStore[int](max_entries=0)
+    with pytest.raises(ValueError):
+        InMemoryStore[int](max_bytes=0)
+    with pytest.raises(ValueError):
+        InMemoryStore[int](ttl=0)
+
+
+def test_inmemory_store_get_many_and_set_many() -> None:
+    store = InMemoryStore[int]()
+    store.set_many({"a": 1, "b": 2})
+    assert store.get_many(["a", "missing", "b"]) == [1, None, 2]
+    assert store.get_many(["missing"], 0) == [0]
+
+
+class ThreadRecordingStore(InMemoryStore[int]):
+    def __init__(self) -> None:
+        super().__init__()
+        self.threads: set[str] = set()
+
+    def get(self, key: str, default: Optional[int] = None) -> Optional[int]:
+        self.threads.add(threading.current_thread().name)
+        return super().get(key, default)
+
+    def set(self, key: str, value: int) -> None:
+        self.threads.add(threading.current_thread().name)
+        super().set(key, value)
+
+
+@pytest.mark.asyncio
+async def test_threaded_store() -> None:
+    sync_store = ThreadRecordingStore()
+    store = ThreadedCacheStore[int](sync_store)
+    await store.set("test_key", 42)
+    assert await store.get("test_key") == 42
+    assert await store.get("non_existent_key", 99) == 99
+    assert sync_store.store == {"test_key": 42}
+    await store.set_many({"a": 1, "b": 2})
+    assert await store.get_many(["a", "b", "c"], 0) == [1, 2, 0]
+    assert threading.current_thread().name not in sync_store.threads
+
+    config = ThreadedCacheStore[int](InMemoryStore[int]()).dump_component()
+    loaded = ThreadedCacheStore[int].load_component(config)
+    assert isinstance(loaded.store, InMemoryStore)
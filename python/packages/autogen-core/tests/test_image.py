@@ -0,0 +1,102 @@
+import base64
+import pickle
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from autogen_core import Image
+from PIL import Image as PILImage
+from pydantic import BaseModel
+
+
+def _encode(pil_image: PILImage.Image, format: str) -> bytes:
+    buffered = BytesIO()
+    pil_image.save(buffered, format=format)
+    return buffered.getvalue()
+
+
+def _noisy_image(width: int, height: int) -> PILImage.Image:
+    return PILImage.frombytes("RGB", (width, height), bytes((i * 7919) % 251 for i in range(width * height * 3)))
+
+
+@pytest.mark.parametrize("format, mime_type", [("PNG", "image/png"), ("JPEG", "image/jpeg"), ("WEBP", "image/webp")])
+def test_image_keeps_encoded_data(format: str, mime_type: str) -> None:
+    data = _encode(PILImage.new("RGB", (40, 30), (255, 0, 0)), format)
+    base64_data = base64.b64encode(data).decode("utf-8")
+
+    image = Image.from_base64(base64_data)
+    assert image.size == (40, 30)
+    assert image.to_bytes() == data
+    assert image.to_base64() == base64_data
+    assert image.data_uri == f"data:{mime_type};base64,{base64_data}"
+    # Serializing did not decode the pixels.
+    assert image._image is None  # pyright: ignore[reportPrivateUsage]
+
+    assert Image.from_uri(image.data_uri).to_bytes() == data
+    assert image.image.mode == "RGB"
+    assert image.image.size == (40, 30)
+    assert image.to_bytes() == data
+
+
+def test_image_from_file(tmp_path: Path) -> None:
+    data = _encode(PILImage.new("RGB", (8, 8)), "JPEG")
+    file_path = tmp_path / "image.jpg"
+    file_path.write_bytes(data)
+    assert Image.from_file(file_path).to_bytes() == data
+
+    # Formats that are not kept as-is are encoded as PNG.
+    bmp_path = tmp_path / "image.bmp"
+    PILImage.new("RGB", (8, 8)).save(bmp_path)
+    assert Image.from_file(bmp_path).to_bytes().startswith(b"\x89PNG\r\n\x1a\n")
+
+
+def test_image_from_pil_encodes_png_once() -> None:
+    image = Image.from_pil(PILImage.new("L", (10, 10)))
+    assert image.image.mode == "RGB"
+    base64_data = image.to_base64()
+    assert base64.b64decode(base64_data).startswith(b"\x89PNG\r\n\x1a\n")
+    assert image.to_base64() is base64_data
+
+    image.image = PILImage.new("RGB", (5, 5))
+    assert image.size == (5, 5)
+    assert image.to_base64() != base64_data
+
+
+@pytest.mark.parametrize("format", ["PNG", "JPEG", "WEBP"])
+def test_image_to_bytes_with_size_cap(format: str) -> None:
+    image = Image.from_pil(_noisy_image(256, 128))
+    uncapped = image.to_bytes(format)  # type: ignore[arg-type]
+    max_bytes = len(uncapped) // 4
+
+    capped = image.to_bytes(format, max_bytes=max_bytes)  # type: ignore[arg-type]
+    assert len(capped) <= max_bytes
+    with PILImage.open(BytesIO(capped)) as decoded:
+        assert decoded.format == format
+        width, height = decoded.size
+    assert width < 256 and height < 128
+    # The aspect ratio is kept, up to rounding.
+    assert abs(width / height - 2) <= 0.25
+    assert image.to_bytes(format, max_bytes=max_bytes) is capped  # type: ignore[arg-type]
+
+    # The original data is re-encoded only if it is over the cap.
+    png_image = Image.from_bytes(image.to_bytes("PNG"))
+    assert png_image.to_bytes(max_bytes=len(uncapped) * 4) == image.to_bytes("PNG")
+    assert len(png_image.to_bytes(max_bytes=1000)) <= 1000
+
+
+def test_image_pickle_and_pydantic_round_trip() -> None:
+    data = _encode(PILImage.new("RGB", (20, 10), (0, 128, 255)), "JPEG")
+    image = Image.from_bytes(data)
+
+    unpickled = pickle.loads(pickle.dumps(image))
+    assert unpickled.to_bytes() == data
+    assert unpickled.size == (20, 10)
+
+    class ImageMessage(BaseModel):
+        image: Image
+
+    json = ImageMessage(image=image).model_dump_json()
+    assert ImageMessage.model_validate_json(json).image.to_bytes() == data
+
+    decoded = Image.from_pil(PILImage.new("RGB", (3, 3)))
+    assert pickle.loads(pickle.dumps(decoded)).to_bytes() == decoded.to_bytes()
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Sequence
 
 import pytest
 from autogen_core.model_context import (
@@ -14,8 +14,38 @@
     LLMMessage,
     UserMessage,
 )
+from autogen_core.tools import Tool, ToolSchema
 from autogen_ext.models.ollama import OllamaChatCompletionClient
 from autogen_ext.models.openai import OpenAIChatCompletionClient
+from autogen_ext.models.replay import ReplayChatCompletionClient
+
+
+class WordCountChatCompletionClient(ReplayChatCompletionClient):
+    """Counts one token per word, plus a fixed overhead per message and per request."""
+
+    def __init__(self) -> None:
+        super().__init__([])
+        self.num_message_counts = 0
+
+    def _count_words(self, message: LLMMessage) -> int:
+        return 2 + len(str(message.content).split())
+
+    def count_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
+        return 5 + sum(self._count_words(message) for message in messages)
+
+    def remaining_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
+        return 40 - self.count_tokens(messages, tools=tools)
+
+    def count_message_tokens(self, message: LLMMessage) -> int:
+        self.num_message_counts += 1
+        return self._count_words(message)
+
+
+class WholeConversationChatCompletionClient(WordCountChatCompletionClient):
+    """Same counts as :class:`WordCountChatCompletionClient`, without per-message counting."""
+
+    def count_message_tokens(self, message: LLMMessage) -> int:
+        raise NotImplementedError()
 
 
 @pytest.mark.asyncio
@@ -205,3 +235,36 @@ async def test_token_limited_model_context_openai_with_function_result(
     assert type(retrieved[0]) == UserMessage  # Function result should be removed
     assert type(retrieved[1]) == AssistantMessage
     assert type(retrieved[2]) == UserMessage
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("token_limit", [None, 1, 5, 9, 12, 20, 33, 50, 80, 1000])
+async def test_token_limited_model_context_per_message_counts(token_limit: int | None) -> None:
+    messages: List[LLMMessage] = []
+    for i in range(13):
+        messages.append(UserMessage(content=" ".join(["word"] * (i % 4 + 1)), source="user"))
+        if i % 3 == 0:
+            messages.append(FunctionExecutionResultMessage(content=[]))
+        messages.append(AssistantMessage(content=" ".join(["reply"] * (i % 5)), source="assistant"))
+
+    model_client = WordCountChatCompletionClient()
+    model_context = TokenLimitedChatCompletionContext(model_client=model_client, token_limit=token_limit)
+    reference_context = TokenLimitedChatCompletionContext(
+        model_client=WholeConversationChatCompletionClient(), token_limit=token_limit
+    )
+    for msg in messages:
+        await model_context.add_message(msg)
+        await reference_context.add_message(msg)
+        # Trimming with cached per-message counts gives the same result as counting the whole conversation.
+        assert await model_context.get_messages() == await reference_context.get_messages()
+
+    # Each message is counted only once.
+    assert model_client.num_message_counts == len(messages)
+
+    # Counts are recomputed after the messages are replaced.
+    state = await model_context.save_state()
+    await model_context.clear()
+    assert await model_context.get_messages() == []
+    await model_context.load_state(state)
+    assert await model_context.get_messages() == await reference_context.get_messages()
+    assert model_client.num_message_counts == 2 * len(messages)
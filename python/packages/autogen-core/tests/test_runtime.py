@@ -1,7 +1,11 @@
+import asyncio
+import json
 import logging
+from dataclasses import dataclass
 
 import pytest
 from autogen_core import (
+    EVENT_LOGGER_NAME,
     AgentId,
     AgentInstantiationContext,
     AgentType,
@@ -16,6 +20,8 @@
     type_subscription,
 )
 from autogen_core._default_subscription import default_subscription
+from autogen_core.exceptions import MessageDroppedException, MessageQueueFullException
+from autogen_core.logging import MessageEvent
 from autogen_test_utils import (
     CascadingAgent,
     CascadingMessageType,
@@ -310,3 +316,156 @@ async def test_event_handler_exception_multi_message() -> None:
         await runtime.stop_when_idle()
 
     await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_message_events_payload_is_lazy(caplog: pytest.LogCaptureFixture) -> None:
+    runtime = SingleThreadedAgentRuntime()
+    runtime.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+    await LoopbackAgent.register(runtime, "name", LoopbackAgent)
+    serialize_calls = 0
+    try_serialize = runtime._try_serialize  # type: ignore[reportPrivateUsage]
+
+    def counting_serialize(message: object) -> str:
+        nonlocal serialize_calls
+        serialize_calls += 1
+        return try_serialize(message)
+
+    runtime._try_serialize = counting_serialize  # type: ignore[method-assign]
+
+    # Info events are not enabled on the event logger, so no payload is serialized.
+    with caplog.at_level(logging.WARNING, logger=EVENT_LOGGER_NAME):
+        runtime.start()
+        await runtime.send_message(MessageType(), AgentId("name", "default"))
+        await runtime.stop_when_idle()
+    assert serialize_calls == 0
+
+    with caplog.at_level(logging.INFO, logger=EVENT_LOGGER_NAME):
+        runtime.start()
+        await runtime.send_message(MessageType(), AgentId("name", "default"))
+        await runtime.stop_when_idle()
+    message_events = [record.msg for record in caplog.records if isinstance(record.msg, MessageEvent)]
+    assert len(message_events) == 4
+    assert all(event.payload == "{}" for event in message_events)
+    assert json.loads(str(message_events[0]))["payload"] == "{}"
+
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_emit_message_events_disabled(caplog: pytest.LogCaptureFixture) -> None:
+    runtime = SingleThreadedAgentRuntime(emit_message_events=False)
+    await LoopbackAgent.register(runtime, "name", LoopbackAgent)
+
+    with caplog.at_level(logging.INFO, logger=EVENT_LOGGER_NAME):
+        runtime.start()
+        await runtime.send_message(MessageType(), AgentId("name", "default"))
+        await runtime.stop_when_idle()
+    assert not any(isinstance(record.msg, MessageEvent) for record in caplog.records)
+
+    agent = await runtime.try_get_underlying_agent_instance(AgentId("name", "default"), type=LoopbackAgent)
+    assert agent.num_calls == 1
+
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_bounded_queue_error_and_drop_policies() -> None:
+    runtime = SingleThreadedAgentRuntime(max_queue_size=1, queue_full_policy="error")
+    await LoopbackAgentWithDefaultSubscription.register(runtime, "name", LoopbackAgentWithDefaultSubscription)
+
+    # The runtime is not started, so the first message stays in the queue.
+    await runtime.publish_message(MessageType(), topic_id=DefaultTopicId())
+    with pytest.raises(MessageQueueFullException):
+        await runtime.publish_message(MessageType(), topic_id=DefaultTopicId())
+    assert runtime.unprocessed_messages_count == 1
+
+    runtime._queue_full_policy = "drop"  # type: ignore[reportPrivateUsage]
+    await runtime.publish_message(MessageType(), topic_id=DefaultTopicId())
+    with pytest.raises(MessageDroppedException):
+        await runtime.send_message(MessageType(), AgentId("name", "default"))
+    assert runtime.unprocessed_messages_count == 1
+
+    runtime.start()
+    await runtime.stop_when_idle()
+    agent = await runtime.try_get_underlying_agent_instance(
+        AgentId("name", "default"), type=LoopbackAgentWithDefaultSubscription
+    )
+    assert agent.num_calls == 1
+
+    # Slots are freed once messages are delivered.
+    runtime.start()
+    await runtime.send_message(MessageType(), AgentId("name", "default"))
+    await runtime.publish_message(MessageType(), topic_id=DefaultTopicId())
+    await runtime.stop_when_idle()
+    assert agent.num_calls == 3
+
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_bounded_queue_block_policy() -> None:
+    runtime = SingleThreadedAgentRuntime(max_queue_size=2)
+    await LoopbackAgentWithDefaultSubscription.register(runtime, "name", LoopbackAgentWithDefaultSubscription)
+
+    await runtime.publish_message(MessageType(), topic_id=DefaultTopicId())
+    await runtime.publish_message(MessageType(), topic_id=DefaultTopicId())
+    blocked = asyncio.create_task(runtime.publish_message(MessageType(), topic_id=DefaultTopicId()))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+    assert runtime.unprocessed_messages_count == 2
+
+    runtime.start()
+    await blocked
+    await runtime.stop_when_idle()
+    agent = await runtime.try_get_underlying_agent_instance(
+        AgentId("name", "default"), type=LoopbackAgentWithDefaultSubscription
+    )
+    assert agent.num_calls == 3
+
+    await runtime.close()
+
+
+@dataclass
+class Concurrency:
+    active: int = 0
+    max_active: int = 0
+    num_calls: int = 0
+
+
+@default_subscription
+class ConcurrencyTrackingAgent(RoutedAgent):
+    def __init__(self, concurrency: Concurrency) -> None:
+        super().__init__("Tracks how many messages agents of its type handle at once.")
+        self._concurrency = concurrency
+
+    @event
+    async def on_new_message_event(self, message: MessageType, ctx: MessageContext) -> None:
+        self._concurrency.active += 1
+        self._concurrency.max_active = max(self._concurrency.max_active, self._concurrency.active)
+        await asyncio.sleep(0.01)
+        self._concurrency.active -= 1
+        self._concurrency.num_calls += 1
+
+
+@pytest.mark.asyncio
+async def test_max_inflight_per_agent_type() -> None:
+    runtime = SingleThreadedAgentRuntime(max_queue_size=4, max_inflight_per_agent_type={"limited": 2})
+    limited = Concurrency()
+    unlimited = Concurrency()
+    await ConcurrencyTrackingAgent.register(runtime, "limited", lambda: ConcurrencyTrackingAgent(limited))
+    await ConcurrencyTrackingAgent.register(runtime, "unlimited", lambda: ConcurrencyTrackingAgent(unlimited))
+    runtime.start()
+
+    # Each message goes to a different agent of each type, so only the type limit serializes them.
+    for i in range(10):
+        await runtime.publish_message(MessageType(), topic_id=TopicId("default", str(i)))
+    await runtime.stop_when_idle()
+
+    assert limited.num_calls == 10
+    assert limited.max_active == 2
+    assert unlimited.num_calls == 10
+    # The limited type holds back the queue, which in turn holds back producers.
+    assert unlimited.max_active <= 6
+
+    await runtime.close()
@@ -5,8 +5,10 @@
     DefaultTopicId,
     SingleThreadedAgentRuntime,
     TopicId,
+    TypePrefixSubscription,
     TypeSubscription,
 )
+from autogen_core._runtime_impl_helpers import SubscriptionManager
 from autogen_core.exceptions import CantHandleException
 from autogen_test_utils import LoopbackAgent, MessageType
 
@@ -120,3 +122,121 @@ async def test_subscription_deduplication() -> None:
     default_subscription = DefaultSubscription(agent_type=agent_type)
     with pytest.raises(ValueError, match="Subscription already exists"):
         await runtime.add_subscription(default_subscription)
+
+
+class SourceSubscription:
+    """A custom subscription that is not indexed by the subscription manager."""
+
+    def __init__(self, source: str, agent_type: str) -> None:
+        self._source = source
+        self._agent_type = agent_type
+
+    @property
+    def id(self) -> str:
+        return f"source-{self._source}-{self._agent_type}"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, SourceSubscription) and self.id == other.id
+
+    def is_match(self, topic_id: TopicId) -> bool:
+        return topic_id.source == self._source
+
+    def map_to_agent(self, topic_id: TopicId) -> AgentId:
+        return AgentId(self._agent_type, topic_id.type)
+
+
+@pytest.mark.asyncio
+async def test_subscription_manager_matching_order() -> None:
+    manager = SubscriptionManager()
+    await manager.add_subscription(TypePrefixSubscription("cha", "prefix_short"))
+    await manager.add_subscription(TypeSubscription("chat", "exact"))
+    await manager.add_subscription(SourceSubscription("s1", "custom"))
+    await manager.add_subscription(TypePrefixSubscription("chat", "prefix_full"))
+    await manager.add_subscription(TypeSubscription("other", "unrelated"))
+    await manager.add_subscription(TypePrefixSubscription("chats", "prefix_long"))
+
+    # Recipients are returned in subscription order regardless of how they were matched.
+    assert await manager.get_subscribed_recipients(TopicId("chat", "s1")) == [
+        AgentId("prefix_short", "s1"),
+        AgentId("exact", "s1"),
+        AgentId("custom", "chat"),
+        AgentId("prefix_full", "s1"),
+    ]
+    assert await manager.get_subscribed_recipients(TopicId("chat", "s2")) == [
+        AgentId("prefix_short", "s2"),
+        AgentId("exact", "s2"),
+        AgentId("prefix_full", "s2"),
+    ]
+    assert await manager.get_subscribed_recipients(TopicId("chats", "s2")) == [
+        AgentId("prefix_short", "s2"),
+        AgentId("prefix_full", "s2"),
+        AgentId("prefix_long", "s2"),
+    ]
+    assert await manager.get_subscribed_recipients(TopicId("ch", "s2")) == []
+
+
+@pytest.mark.asyncio
+async def test_subscription_manager_updates_seen_topics() -> None:
+    manager = SubscriptionManager()
+    exact = TypeSubscription("chat", "exact")
+    await manager.add_subscription(exact)
+    assert await manager.get_subscribed_recipients(TopicId("chat", "s1")) == [AgentId("exact", "s1")]
+    assert await manager.get_subscribed_recipients(TopicId("chat_room", "s1")) == []
+
+    prefix = TypePrefixSubscription("chat", "prefix")
+    await manager.add_subscription(prefix)
+    custom = SourceSubscription("s1", "custom")
+    await manager.add_subscription(custom)
+    assert await manager.get_subscribed_recipients(TopicId("chat", "s1")) == [
+        AgentId("exact", "s1"),
+        AgentId("prefix", "s1"),
+        AgentId("custom", "chat"),
+    ]
+    assert await manager.get_subscribed_recipients(TopicId("chat_room", "s1")) == [
+        AgentId("prefix", "s1"),
+        AgentId("custom", "chat_room"),
+    ]
+
+    await manager.remove_subscription(prefix.id)
+    await manager.remove_subscription(exact.id)
+    assert await manager.get_subscribed_recipients(TopicId("chat", "s1")) == [AgentId("custom", "chat")]
+    assert await manager.get_subscribed_recipients(TopicId("chat_room", "s1")) == [AgentId("custom", "chat_room")]
+
+    await manager.remove_subscription(custom.id)
+    assert await manager.get_subscribed_recipients(TopicId("chat", "s1")) == []
+    assert manager.subscriptions == []
+
+    with pytest.raises(ValueError, match="Subscription does not exist"):
+        await manager.remove_subscription(custom.id)
+
+
+@pytest.mark.asyncio
+async def test_subscription_manager_recipients_are_snapshots() -> None:
+    manager = SubscriptionManager()
+    await manager.add_subscription(TypeSubscription("chat", "first"))
+    topic = TopicId("chat", "s1")
+    recipients = await manager.get_subscribed_recipients(topic)
+    assert recipients == [AgentId("first", "s1")]
+
+    # A subscription added while the recipients are in use does not change them.
+    await manager.add_subscription(TypeSubscription("chat", "second"))
+    assert recipients == [AgentId("first", "s1")]
+
+    # Changing the returned list does not change the recipients of the topic.
+    recipients.clear()
+    assert await manager.get_subscribed_recipients(topic) == [AgentId("first", "s1"), AgentId("second", "s1")]
+
+
+@pytest.mark.asyncio
+async def test_subscription_manager_deduplication() -> None:
+    manager = SubscriptionManager()
+    prefix = TypePrefixSubscription("chat", "prefix")
+    await manager.add_subscription(prefix)
+    with pytest.raises(ValueError, match="Subscription already exists"):
+        await manager.add_subscription(TypePrefixSubscription("chat", "prefix"))
+    with pytest.raises(ValueError, match="Subscription already exists"):
+        await manager.add_subscription(TypeSubscription("other", "exact", id=prefix.id))
+    await manager.add_subscription(SourceSubscription("s1", "custom"))
+    with pytest.raises(ValueError, match="Subscription already exists"):
+        await manager.add_subscription(SourceSubscription("s1", "custom"))
+    assert len(manager.subscriptions) == 2
@@ -1,4 +1,6 @@
 import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from functools import partial
 from typing import Annotated, List
@@ -322,6 +324,17 @@ def my_function() -> str:
     assert tool.state_type() is None
 
 
+@pytest.mark.asyncio
+async def test_func_tool_executor() -> None:
+    def my_function() -> str:
+        return threading.current_thread().name
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="tool_pool") as executor:
+        tool = FunctionTool(my_function, description="Function tool.", executor=executor)
+        result = await tool.run_json({}, CancellationToken())
+    assert result.startswith("tool_pool")
+
+
 def test_func_tool_annotated_arg() -> None:
     def my_function(my_arg: Annotated[str, "test description"]) -> str:
         return "result"
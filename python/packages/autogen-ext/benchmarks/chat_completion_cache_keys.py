@@ -0,0 +1,84 @@
+"""Cache key benchmark for :class:`~autogen_ext.models.cache.ChatCompletionCache`.
+
+Simulates a conversation that grows by one message per turn and measures the time to compute the
+cache key of each turn, comparing the incremental digest-based key with serializing the whole
+conversation on every call. Every fourth message contains an image. The time reported is the time
+to compute the key of the last turn, which includes digesting the one new message.
+
+Usage:
+
+.. code-block:: bash
+
+    python benchmarks/chat_completion_cache_keys.py --lengths 10 100 500
+"""
+
+import argparse
+import hashlib
+import json
+import time
+from typing import Any, List, Mapping, Sequence
+
+from autogen_core import Image
+from autogen_core.models import AssistantMessage, LLMMessage, UserMessage
+from autogen_core.tools import FunctionTool, Tool, ToolSchema
+from autogen_ext.models.cache import ChatCompletionCache
+from autogen_ext.models.replay import ReplayChatCompletionClient
+from PIL import Image as PILImage
+
+
+def full_serialization_key(
+    messages: Sequence[LLMMessage], tools: Sequence[Tool | ToolSchema], extra_create_args: Mapping[str, Any]
+) -> str:
+    data = {
+        "messages": [message.model_dump() for message in messages],
+        "tools": [(tool.schema if isinstance(tool, Tool) else tool) for tool in tools],
+        "json_output": None,
+        "extra_create_args": extra_create_args,
+    }
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+def make_message(i: int) -> LLMMessage:
+    text = f"Message {i}: " + "lorem ipsum dolor sit amet " * 20
+    if i % 4 == 0:
+        image = Image.from_pil(PILImage.effect_noise((256, 256), 64).convert("RGB"))
+        # Encode the image up front so that its encoding time is not part of either measurement.
+        image.to_base64()
+        return UserMessage(content=[text, image], source="user")
+    if i % 2 == 0:
+        return UserMessage(content=text, source="user")
+    return AssistantMessage(content=text, source="assistant")
+
+
+def get_weather(city: str) -> str:
+    return f"The weather in {city} is sunny."
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lengths", type=int, nargs="+", default=[10, 50, 100, 200])
+    args = parser.parse_args()
+
+    tools = [FunctionTool(get_weather, description="Get the weather for a city.")]
+    extra_create_args = {"temperature": 0.0}
+    for length in args.lengths:
+        cache = ChatCompletionCache(ReplayChatCompletionClient([]))
+        messages: List[LLMMessage] = []
+        incremental = 0.0
+        full = 0.0
+        for i in range(length):
+            messages = messages + [make_message(i)]
+            start = time.perf_counter()
+            cache._cache_key(messages, tools, None, extra_create_args)  # pyright: ignore[reportPrivateUsage]
+            incremental = time.perf_counter() - start
+            start = time.perf_counter()
+            full_serialization_key(messages, tools, extra_create_args)
+            full = time.perf_counter() - start
+        print(
+            f"messages={length:<5} key of the last turn: incremental={incremental * 1e3:>8.3f} ms "
+            f"full={full * 1e3:>8.3f} ms ({full / incremental:.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
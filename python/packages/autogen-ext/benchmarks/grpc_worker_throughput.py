@@ -0,0 +1,104 @@
+"""Throughput benchmark for :class:`~autogen_ext.runtimes.grpc.GrpcWorkerAgentRuntime`.
+
+Starts an in-process :class:`~autogen_ext.runtimes.grpc.GrpcWorkerAgentRuntimeHost` and two workers,
+then publishes messages from one worker to several agents on the other, with and without message
+batching, and reports messages delivered per second.
+
+Usage:
+
+.. code-block:: bash
+
+    python benchmarks/grpc_worker_throughput.py --messages 5000 --agents 4
+"""
+
+import argparse
+import asyncio
+import time
+from dataclasses import dataclass
+
+from autogen_core import (
+    AgentType,
+    MessageContext,
+    RoutedAgent,
+    TopicId,
+    TypeSubscription,
+    message_handler,
+    try_get_known_serializers_for_type,
+)
+from autogen_ext.runtimes.grpc import GrpcWorkerAgentRuntime, GrpcWorkerAgentRuntimeHost
+
+
+@dataclass
+class Payload:
+    content: str
+
+
+class Counter:
+    def __init__(self, target: int) -> None:
+        self._count = 0
+        self._target = target
+        self.done = asyncio.Event()
+
+    def increment(self) -> None:
+        self._count += 1
+        if self._count >= self._target:
+            self.done.set()
+
+
+class CountingAgent(RoutedAgent):
+    def __init__(self, counter: Counter) -> None:
+        super().__init__("Counts the messages it receives.")
+        self._counter = counter
+
+    @message_handler
+    async def on_payload(self, message: Payload, ctx: MessageContext) -> None:
+        self._counter.increment()
+
+
+async def run_once(port: int, num_messages: int, num_agents: int, max_batch_size: int, batch_window: float) -> float:
+    host_address = f"localhost:{port}"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address)
+    host.start()
+
+    publisher = GrpcWorkerAgentRuntime(
+        host_address=host_address, max_batch_size=max_batch_size, batch_window=batch_window
+    )
+    subscriber = GrpcWorkerAgentRuntime(
+        host_address=host_address, max_batch_size=max_batch_size, batch_window=batch_window
+    )
+    counter = Counter(num_messages * num_agents)
+    for runtime in (publisher, subscriber):
+        await runtime.start()
+        runtime.add_message_serializer(try_get_known_serializers_for_type(Payload))
+    for i in range(num_agents):
+        await subscriber.register_factory(AgentType(f"counter_{i}"), lambda: CountingAgent(counter))
+        await subscriber.add_subscription(TypeSubscription("bench", f"counter_{i}"))
+
+    message = Payload(content="x" * 256)
+    start = time.perf_counter()
+    for _ in range(num_messages):
+        await publisher.publish_message(message, TopicId("bench", "default"))
+    await counter.done.wait()
+    elapsed = time.perf_counter() - start
+
+    await publisher.stop()
+    await subscriber.stop()
+    await host.stop(grace=0)
+    return num_messages * num_agents / elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--agents", type=int, default=4, help="Subscribed agent types on the receiving worker.")
+    parser.add_argument("--port", type=int, default=50151)
+    args = parser.parse_args()
+
+    settings = [(1, 0.0), (32, 0.0), (128, 0.0), (128, 0.001)]
+    for offset, (max_batch_size, batch_window) in enumerate(settings):
+        rate = await run_once(args.port + offset, args.messages, args.agents, max_batch_size, batch_window)
+        print(f"max_batch_size={max_batch_size:<4} batch_window={batch_window:<6} {rate:>10.0f} deliveries/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
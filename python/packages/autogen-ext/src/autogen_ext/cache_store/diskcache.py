@@ -1,4 +1,4 @@
-from typing import Any, Optional, TypeVar, cast
+from typing import Any, List, Mapping, Optional, Sequence, TypeVar, cast
 
 import diskcache
 from autogen_core import CacheStore, Component
@@ -37,6 +37,17 @@ def get(self, key: str, default: Optional[T] = None) -> Optional[T]:
     def set(self, key: str, value: T) -> None:
         self.cache.set(key, cast(Any, value))  # type: ignore[reportUnknownMemberType]
 
+    def get_many(self, keys: Sequence[str], default: Optional[T] = None) -> List[Optional[T]]:
+        """Retrieve several items in one transaction."""
+        with self.cache.transact():  # type: ignore[reportUnknownMemberType]
+            return [cast(Optional[T], self.cache.get(key, default)) for key in keys]  # type: ignore[reportUnknownMemberType]
+
+    def set_many(self, items: Mapping[str, T]) -> None:
+        """Set several items in one transaction, which commits them with a single write to disk."""
+        with self.cache.transact():  # type: ignore[reportUnknownMemberType]
+            for key, value in items.items():
+                self.cache.set(key, cast(Any, value))  # type: ignore[reportUnknownMemberType]
+
     def _to_config(self) -> DiskCacheStoreConfig:
         # Get directory from cache instance
         return DiskCacheStoreConfig(directory=self.cache.directory)
@@ -1,7 +1,8 @@
-from typing import Any, Dict, Optional, TypeVar, cast
+from typing import Any, Dict, List, Mapping, Optional, Sequence, TypeVar, cast
 
 import redis
-from autogen_core import CacheStore, Component
+import redis.asyncio
+from autogen_core import AsyncCacheStore, CacheStore, Component
 from pydantic import BaseModel
 from typing_extensions import Self
 
@@ -19,6 +20,45 @@ class RedisStoreConfig(BaseModel):
     password: Optional[str] = None
     ssl: bool = False
     socket_timeout: Optional[float] = None
+    max_connections: Optional[int] = None
+    """The maximum number of connections in the connection pool. Defaults to None, which means no limit."""
+
+
+def _config_from_connection_pool(connection_pool: Any) -> RedisStoreConfig:
+    # Extract connection info from the connection pool of a redis instance
+    connection_kwargs: Dict[str, Any] = connection_pool.connection_kwargs
+
+    username = connection_kwargs.get("username")
+    password = connection_kwargs.get("password")
+    socket_timeout = connection_kwargs.get("socket_timeout")
+    max_connections = getattr(connection_pool, "max_connections", None)
+
+    return RedisStoreConfig(
+        host=str(connection_kwargs.get("host", "localhost")),
+        port=int(connection_kwargs.get("port", 6379)),
+        db=int(connection_kwargs.get("db", 0)),
+        username=str(username) if username is not None else None,
+        password=str(password) if password is not None else None,
+        ssl=bool(connection_kwargs.get("ssl", False)),
+        socket_timeout=float(socket_timeout) if socket_timeout is not None else None,
+        # redis-py uses 2**31 for an unbounded pool.
+        max_connections=int(max_connections) if isinstance(max_connections, int) and max_connections < 2**31 else None,
+    )
+
+
+def _connection_kwargs(config: RedisStoreConfig) -> Dict[str, Any]:
+    kwargs: Dict[str, Any] = dict(
+        host=config.host,
+        port=config.port,
+        db=config.db,
+        username=config.username,
+        password=config.password,
+        ssl=config.ssl,
+        socket_timeout=config.socket_timeout,
+    )
+    if config.max_connections is not None:
+        kwargs["max_connections"] = config.max_connections
+    return kwargs
 
 
 class RedisStore(CacheStore[T], Component[RedisStoreConfig]):
@@ -46,35 +86,93 @@ def get(self, key: str, default: Optional[T] = None) -> Optional[T]:
     def set(self, key: str, value: T) -> None:
         self.cache.set(key, cast(Any, value))
 
+    def get_many(self, keys: Sequence[str], default: Optional[T] = None) -> List[Optional[T]]:
+        """Retrieve several items in one round trip with ``MGET``."""
+        if not keys:
+            return []
+        values = cast(List[Optional[T]], self.cache.mget(keys))
+        return [default if value is None else value for value in values]
+
+    def set_many(self, items: Mapping[str, T]) -> None:
+        """Set several items in one round trip with a pipeline."""
+        if not items:
+            return
+        with self.cache.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.set(key, cast(Any, value))
+            pipe.execute()
+
     def _to_config(self) -> RedisStoreConfig:
-        # Extract connection info from redis instance
-        connection_pool = self.cache.connection_pool
-        connection_kwargs: Dict[str, Any] = connection_pool.connection_kwargs  # type: ignore[reportUnknownMemberType]
-
-        username = connection_kwargs.get("username")
-        password = connection_kwargs.get("password")
-        socket_timeout = connection_kwargs.get("socket_timeout")
-
-        return RedisStoreConfig(
-            host=str(connection_kwargs.get("host", "localhost")),
-            port=int(connection_kwargs.get("port", 6379)),
-            db=int(connection_kwargs.get("db", 0)),
-            username=str(username) if username is not None else None,
-            password=str(password) if password is not None else None,
-            ssl=bool(connection_kwargs.get("ssl", False)),
-            socket_timeout=float(socket_timeout) if socket_timeout is not None else None,
-        )
+        return _config_from_connection_pool(self.cache.connection_pool)
 
     @classmethod
     def _from_config(cls, config: RedisStoreConfig) -> Self:
         # Create new redis instance from config
-        redis_instance = redis.Redis(
-            host=config.host,
-            port=config.port,
-            db=config.db,
-            username=config.username,
-            password=config.password,
-            ssl=config.ssl,
-            socket_timeout=config.socket_timeout,
-        )
+        redis_instance = redis.Redis(**_connection_kwargs(config))
         return cls(redis_instance=redis_instance)
+
+
+class AsyncRedisStore(AsyncCacheStore[T], Component[RedisStoreConfig]):
+    """
+    A typed AsyncCacheStore implementation that uses an async redis client as the underlying storage.
+
+    The client's connection pool is shared by concurrent requests, so the store
+    does not block the event loop or need a worker thread like :class:`RedisStore`.
+
+    Example:
+
+        .. code-block:: python
+
+            import redis.asyncio
+            from autogen_ext.cache_store.redis import AsyncRedisStore
+            from autogen_ext.models.cache import CHAT_CACHE_VALUE_TYPE, ChatCompletionCache
+            from autogen_ext.models.openai import OpenAIChatCompletionClient
+
+            redis_instance = redis.asyncio.Redis(host="localhost", port=6379, max_connections=20)
+            cache_client = ChatCompletionCache(
+                OpenAIChatCompletionClient(model="gpt-4o"),
+                AsyncRedisStore[CHAT_CACHE_VALUE_TYPE](redis_instance),
+            )
+
+    Args:
+        redis_instance: An instance of `redis.asyncio.Redis`.
+                        The user is responsible for managing the Redis instance's lifetime.
+    """
+
+    component_config_schema = RedisStoreConfig
+    component_provider_override = "autogen_ext.cache_store.redis.AsyncRedisStore"
+
+    def __init__(self, redis_instance: redis.asyncio.Redis):
+        self.cache = redis_instance
+
+    async def get(self, key: str, default: Optional[T] = None) -> Optional[T]:
+        value = cast(Optional[T], await self.cache.get(key))
+        if value is None:
+            return default
+        return value
+
+    async def set(self, key: str, value: T) -> None:
+        await self.cache.set(key, cast(Any, value))
+
+    async def get_many(self, keys: Sequence[str], default: Optional[T] = None) -> List[Optional[T]]:
+        """Retrieve several items in one round trip with ``MGET``."""
+        if not keys:
+            return []
+        values = cast(List[Optional[T]], await self.cache.mget(keys))
+        return [default if value is None else value for value in values]
+
+    async def set_many(self, items: Mapping[str, T]) -> None:
+        """Set several items in one round trip with a pipeline."""
+        if not items:
+            return
+        async with self.cache.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.set(key, cast(Any, value))
+            await pipe.execute()
+
+    def _to_config(self) -> RedisStoreConfig:
+        return _config_from_connection_pool(self.cache.connection_pool)
+
+    @classmethod
+    def _from_config(cls, config: RedisStoreConfig) -> Self:
+        return cls(redis_instance=redis.asyncio.Redis(**_connection_kwargs(config)))
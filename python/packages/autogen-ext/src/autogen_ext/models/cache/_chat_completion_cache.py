@@ -1,9 +1,34 @@
+import asyncio
 import hashlib
 import json
 import warnings
-from typing import Any, AsyncGenerator, List, Mapping, Optional, Sequence, Union, cast
+import weakref
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
-from autogen_core import CacheStore, CancellationToken, Component, ComponentModel, InMemoryStore
+from autogen_core import (
+    AsyncCacheStore,
+    CacheStore,
+    CancellationToken,
+    Component,
+    ComponentLoader,
+    ComponentModel,
+    InMemoryStore,
+    ThreadedCacheStore,
+)
 from autogen_core.models import (
     ChatCompletionClient,
     CreateResult,
@@ -11,13 +36,106 @@
     ModelCapabilities,  # type: ignore
     ModelInfo,
     RequestUsage,
+    UserMessage,
 )
 from autogen_core.tools import Tool, ToolSchema
 from pydantic import BaseModel
 from typing_extensions import Self
 
+if TYPE_CHECKING:
+    from .semantic import SemanticCache
+
 CHAT_CACHE_VALUE_TYPE = Union[CreateResult, List[Union[str, CreateResult]]]
 
+ObjectT = TypeVar("ObjectT")
+
+
+class _ObjectDigestCache:
+    """Caches digests by object identity for as long as the object is alive.
+    Objects are assumed not to change after their digest is computed."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[int, Tuple["weakref.ref[Any]", bytes]] = {}
+
+    def get(self, obj: ObjectT, compute: Callable[[ObjectT], bytes]) -> bytes:
+        key = id(obj)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0]() is obj:
+            return entry[1]
+        digest = compute(obj)
+        try:
+            ref = weakref.ref(obj, self._remove_callback(key))
+        except TypeError:
+            # The object cannot be weakly referenced, so its digest is not cached.
+            return digest
+        self._entries[key] = (ref, digest)
+        return digest
+
+    def _remove_callback(self, key: int) -> Callable[["weakref.ref[Any]"], None]:
+        def remove(ref: "weakref.ref[Any]") -> None:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is ref:
+                del self._entries[key]
+
+        return remove
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _message_digest(message: LLMMessage) -> bytes:
+    return hashlib.sha256(message.model_dump_json().encode()).digest()
+
+
+def _tool_digest(tool: Tool) -> bytes:
+    return hashlib.sha256(json.dumps(tool.schema, sort_keys=True).encode()).digest()
+
+
+def _json_output_digest(json_output: type[BaseModel]) -> bytes:
+    return hashlib.sha256(json.dumps(json_output.model_json_schema(), sort_keys=True).encode()).digest()
+
+
+class _SharedStream:
+    """A stream from the original client that identical concurrent `create_stream` calls read from.
+
+    The original stream is read by a background task into `chunks`, so that every reader receives
+    each chunk as soon as it arrives and a reader that stops does not hold back the others.
+    """
+
+    def __init__(self) -> None:
+        self.chunks: List[Union[str, CreateResult]] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.readers = 0
+        self.cancellation_token = CancellationToken()
+        self.task: Optional[asyncio.Task[None]] = None
+        self._changed: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+
+    def append(self, chunk: Union[str, CreateResult]) -> None:
+        self.chunks.append(chunk)
+        self._notify()
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        self.done = True
+        self.error = error
+        self._notify()
+
+    async def wait(self, cancelled: "asyncio.Future[None]") -> None:
+        """Wait for the next chunk or the end of the stream, or until `cancelled` is cancelled."""
+        changed = self._changed
+        await asyncio.wait([changed, cancelled], return_when=asyncio.FIRST_COMPLETED)
+        if cancelled.cancelled():
+            raise asyncio.CancelledError()
+
+    def cancel(self) -> None:
+        self.cancellation_token.cancel()
+        if self.task is not None:
+            self.task.cancel()
+
+    def _notify(self) -> None:
+        self._changed.set_result(None)
+        self._changed = asyncio.get_running_loop().create_future()
+
 
 class ChatCompletionCacheConfig(BaseModel):
     """ """
@@ -79,11 +197,27 @@ async def main():
 
     You can now use the `cached_client` as you would the original client, but with caching enabled.
 
+    The cache key is computed from a digest of each message, tool and structured output type, which is
+    computed once per object, so messages and tools should not be modified after they are passed to
+    the client. Concurrent identical requests are only sent to the original client once: the other callers wait
+    for the first request to finish and receive its result, marked as cached. Concurrent identical streams
+    receive each chunk of the first stream as soon as it arrives. The original stream is read in a background
+    task, so it continues while any of the callers is still reading it, and it is cancelled once none is.
+    If it fails, a caller that has not received any chunk yet sends its own request, and the other callers
+    receive the error. A streamed result is only stored once the stream has completed.
+
     Args:
         client (ChatCompletionClient): The original ChatCompletionClient to wrap.
-        store (CacheStore): A store object that implements get and set methods.
+        store (CacheStore | AsyncCacheStore): A store object that implements get and set methods.
+            A synchronous :class:`~autogen_core.CacheStore` other than :class:`~autogen_core.InMemoryStore`
+            is accessed from a worker thread through :class:`~autogen_core.ThreadedCacheStore`,
+            so that disk or network I/O does not block the event loop.
             The user is responsible for managing the store's lifecycle & clearing it (if needed).
             Defaults to using in-memory cache.
+        semantic_cache (SemanticCache | None): If set, a request that misses the cache reuses the cached result
+            of an earlier request whose final user message is similar and whose other messages and arguments
+            are identical. See :class:`~autogen_ext.models.cache.semantic.SemanticCache`.
+            The semantic cache is not included in the component configuration.
     """
 
     component_type = "chat_completion_cache"
@@ -93,12 +227,54 @@ async def main():
     def __init__(
         self,
         client: ChatCompletionClient,
-        store: Optional[CacheStore[CHAT_CACHE_VALUE_TYPE]] = None,
+        store: Optional[Union[CacheStore[CHAT_CACHE_VALUE_TYPE], AsyncCacheStore[CHAT_CACHE_VALUE_TYPE]]] = None,
+        semantic_cache: Optional["SemanticCache"] = None,
     ):
         self.client = client
+        self.semantic_cache = semantic_cache
         self.store = store or InMemoryStore[CHAT_CACHE_VALUE_TYPE]()
-
-    def _check_cache(
+        self._async_store: Optional[AsyncCacheStore[CHAT_CACHE_VALUE_TYPE]] = None
+        if isinstance(self.store, AsyncCacheStore):
+            self._async_store = self.store
+        elif not isinstance(self.store, InMemoryStore):
+            self._async_store = ThreadedCacheStore(self.store)
+        # Requests that are being sent to the original client, by kind ("create" or "stream") and cache key.
+        # The future's result is None if the request failed.
+        self._inflight: Dict[Tuple[str, str], asyncio.Future[Optional[CHAT_CACHE_VALUE_TYPE]]] = {}
+        # Streams that are being read from the original client, by cache key.
+        self._inflight_streams: Dict[str, _SharedStream] = {}
+        self._digests = _ObjectDigestCache()
+
+    async def _store_get(self, cache_key: str) -> Optional[CHAT_CACHE_VALUE_TYPE]:
+        if self._async_store is not None:
+            return await self._async_store.get(cache_key)
+        assert isinstance(self.store, CacheStore)
+        return self.store.get(cache_key)
+
+    async def _store_set(self, cache_key: str, value: CHAT_CACHE_VALUE_TYPE) -> None:
+        if self._async_store is not None:
+            await self._async_store.set(cache_key, value)
+        else:
+            assert isinstance(self.store, CacheStore)
+            self.store.set(cache_key, value)
+
+    async def _wait_for_inflight(
+        self, kind: str, cache_key: str, cancellation_token: Optional[CancellationToken]
+    ) -> Tuple[bool, Optional[CHAT_CACHE_VALUE_TYPE]]:
+        """
+        Wait for an identical request that is already being sent to the original client.
+        Returns (False, None) if there is no such request, or (True, result), where result is None if the request failed.
+        """
+        inflight = self._inflight.get((kind, cache_key))
+        if inflight is None:
+            return False, None
+        # Cancelling this caller must not cancel the request that other callers are waiting for.
+        waiter = asyncio.shield(inflight)
+        if cancellation_token is not None:
+            cancellation_token.link_future(waiter)
+        return True, await waiter
+
+    async def _check_cache(
         self,
         messages: Sequence[LLMMessage],
         tools: Sequence[Tool | ToolSchema],
@@ -110,28 +286,73 @@ def _check_cache(
         Returns a tuple of (cached_result, cache_key).
         """
 
-        json_output_data: str | bool | None = None
-
-        if isinstance(json_output, type) and issubclass(json_output, BaseModel):
-            json_output_data = json.dumps(json_output.model_json_schema())
-        elif isinstance(json_output, bool):
-            json_output_data = json_output
-
-        data = {
-            "messages": [message.model_dump() for message in messages],
-            "tools": [(tool.schema if isinstance(tool, Tool) else tool) for tool in tools],
-            "json_output": json_output_data,
-            "extra_create_args": extra_create_args,
-        }
-        serialized_data = json.dumps(data, sort_keys=True)
-        cache_key = hashlib.sha256(serialized_data.encode()).hexdigest()
-
-        cached_result = cast(Optional[CreateResult], self.store.get(cache_key))
+        cache_key = self._cache_key(messages, tools, json_output, extra_create_args)
+        cached_result = cast(Optional[CreateResult], await self._store_get(cache_key))
         if cached_result is not None:
             return cached_result, cache_key
 
         return None, cache_key
 
+    async def _check_semantic_cache(
+        self,
+        messages: Sequence[LLMMessage],
+        tools: Sequence[Tool | ToolSchema],
+        json_output: Optional[bool | type[BaseModel]],
+        extra_create_args: Mapping[str, Any],
+    ) -> tuple[Optional[CHAT_CACHE_VALUE_TYPE], Optional[Tuple[str, Any]]]:
+        """
+        Helper function to check the semantic cache for the result of a similar request.
+        Returns a tuple of (cached_result, (partition, embedding)), where the second item is
+        None if the request cannot be looked up in the semantic cache.
+        """
+        if self.semantic_cache is None or not messages or not isinstance(messages[-1], UserMessage):
+            return None, None
+        content = messages[-1].content
+        if not isinstance(content, str):
+            if not all(isinstance(part, str) for part in content):
+                # Only text can be embedded.
+                return None, None
+            content = "\n".join(cast(List[str], content))
+        partition = self._cache_key(messages[:-1], tools, json_output, extra_create_args)
+        embedding = await self.semantic_cache.embed(content)
+        similar_key = self.semantic_cache.search(partition, embedding)
+        cached_result: Optional[CHAT_CACHE_VALUE_TYPE] = None
+        if similar_key is not None:
+            cached_result = await self._store_get(similar_key)
+            if cached_result is None:
+                # The result is no longer in the store.
+                self.semantic_cache.remove(similar_key)
+        return cached_result, (partition, embedding)
+
+    def _cache_key(
+        self,
+        messages: Sequence[LLMMessage],
+        tools: Sequence[Tool | ToolSchema],
+        json_output: Optional[bool | type[BaseModel]],
+        extra_create_args: Mapping[str, Any],
+    ) -> str:
+        """
+        Compute the cache key from the digests of the messages, tools and output type, in order.
+        Only objects that were not seen before are serialized.
+        """
+        hasher = hashlib.sha256()
+        for message in messages:
+            hasher.update(self._digests.get(message, _message_digest))
+        hasher.update(b"tools")
+        for tool in tools:
+            if isinstance(tool, Tool):
+                hasher.update(self._digests.get(tool, _tool_digest))
+            else:
+                hasher.update(hashlib.sha256(json.dumps(tool, sort_keys=True).encode()).digest())
+        hasher.update(b"json_output")
+        if isinstance(json_output, type) and issubclass(json_output, BaseModel):
+            hasher.update(self._digests.get(json_output, _json_output_digest))
+        else:
+            hasher.update(json.dumps(json_output).encode())
+        hasher.update(b"extra_create_args")
+        hasher.update(json.dumps(extra_create_args, sort_keys=True).encode())
+        return hasher.hexdigest()
+
     async def create(
         self,
         messages: Sequence[LLMMessage],
@@ -148,21 +369,47 @@ async def create(
 
         NOTE: cancellation_token is ignored for cached results.
         """
-        cached_result, cache_key = self._check_cache(messages, tools, json_output, extra_create_args)
-        if cached_result:
-            assert isinstance(cached_result, CreateResult)
-            cached_result.cached = True
-            return cached_result
-
-        result = await self.client.create(
-            messages,
-            tools=tools,
-            json_output=json_output,
-            extra_create_args=extra_create_args,
-            cancellation_token=cancellation_token,
-        )
-        self.store.set(cache_key, result)
-        return result
+        semantic_query: Optional[Tuple[str, Any]] = None
+        while True:
+            cached_result, cache_key = await self._check_cache(messages, tools, json_output, extra_create_args)
+            if cached_result:
+                assert isinstance(cached_result, CreateResult)
+                cached_result.cached = True
+                return cached_result
+
+            if semantic_query is None:
+                similar_result, semantic_query = await self._check_semantic_cache(
+                    messages, tools, json_output, extra_create_args
+                )
+                if isinstance(similar_result, CreateResult):
+                    return similar_result.model_copy(update={"cached": True})
+
+            found, inflight_result = await self._wait_for_inflight("create", cache_key, cancellation_token)
+            if not found:
+                break
+            if inflight_result is not None:
+                assert isinstance(inflight_result, CreateResult)
+                return inflight_result.model_copy(update={"cached": True})
+            # The identical request failed, so send this one.
+
+        inflight = asyncio.get_running_loop().create_future()
+        self._inflight[("create", cache_key)] = inflight
+        result: Optional[CreateResult] = None
+        try:
+            result = await self.client.create(
+                messages,
+                tools=tools,
+                json_output=json_output,
+                extra_create_args=extra_create_args,
+                cancellation_token=cancellation_token,
+            )
+            await self._store_set(cache_key, result)
+            if self.semantic_cache is not None and semantic_query is not None:
+                self.semantic_cache.add(*semantic_query, cache_key)
+            return result
+        finally:
+            del self._inflight[("create", cache_key)]
+            inflight.set_result(result)
 
     def create_stream(
         self,
@@ -182,36 +429,107 @@ def create_stream(
         """
 
         async def _generator() -> AsyncGenerator[Union[str, CreateResult], None]:
-            cached_result, cache_key = self._check_cache(
-                messages,
-                tools,
-                json_output,
-                extra_create_args,
-            )
-            if cached_result:
-                assert isinstance(cached_result, list)
-                for result in cached_result:
-                    if isinstance(result, CreateResult):
-                        result.cached = True
-                    yield result
-                return
-
-            result_stream = self.client.create_stream(
+            semantic_query: Optional[Tuple[str, Any]] = None
+            while True:
+                cached_result, cache_key = await self._check_cache(
+                    messages,
+                    tools,
+                    json_output,
+                    extra_create_args,
+                )
+                if not cached_result and semantic_query is None:
+                    similar_result, semantic_query = await self._check_semantic_cache(
+                        messages, tools, json_output, extra_create_args
+                    )
+                    if isinstance(similar_result, list):
+                        cached_result = similar_result
+                if cached_result:
+                    assert isinstance(cached_result, list)
+                    for result in cached_result:
+                        if isinstance(result, CreateResult):
+                            result = result.model_copy(update={"cached": True})
+                        yield result
+                    return
+
+                shared = self._inflight_streams.get(cache_key)
+                is_first = shared is None
+                if shared is None:
+                    shared = _SharedStream()
+                    self._inflight_streams[cache_key] = shared
+                    shared.task = asyncio.create_task(
+                        self._read_stream(
+                            shared, cache_key, semantic_query, messages, tools, json_output, extra_create_args
+                        )
+                    )
+
+                # Linked once per reader, since a token keeps every future linked to it.
+                cancelled: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+                if cancellation_token is not None:
+                    cancellation_token.link_future(cancelled)
+                position = 0
+                shared.readers += 1
+                try:
+                    while True:
+                        while position < len(shared.chunks):
+                            result = shared.chunks[position]
+                            position += 1
+                            if not is_first and isinstance(result, CreateResult):
+                                result = result.model_copy(update={"cached": True})
+                            yield result
+                        if shared.done:
+                            break
+                        await shared.wait(cancelled)
+                finally:
+                    shared.readers -= 1
+                    if shared.readers == 0 and not shared.done:
+                        # The task may be cancelled before it has started, so it is removed here too.
+                        self._remove_stream(cache_key, shared)
+                        shared.cancel()
+                    if not cancelled.done():
+                        cancelled.set_result(None)
+
+                if shared.error is None:
+                    return
+                if is_first or position > 0:
+                    raise shared.error
+                # The identical stream failed before it returned anything, so send this request.
+
+        return _generator()
+
+    async def _read_stream(
+        self,
+        shared: _SharedStream,
+        cache_key: str,
+        semantic_query: Optional[Tuple[str, Any]],
+        messages: Sequence[LLMMessage],
+        tools: Sequence[Tool | ToolSchema],
+        json_output: Optional[bool | type[BaseModel]],
+        extra_create_args: Mapping[str, Any],
+    ) -> None:
+        """Read a stream from the original client into `shared`, and store the results once it has completed."""
+        try:
+            async for result in self.client.create_stream(
                 messages,
                 tools=tools,
                 json_output=json_output,
                 extra_create_args=extra_create_args,
-                cancellation_token=cancellation_token,
-            )
-
-            output_results: List[Union[str, CreateResult]] = []
-            self.store.set(cache_key, output_results)
-
-            async for result in result_stream:
-                output_results.append(result)
-                yield result
-
-        return _generator()
+                cancellation_token=shared.cancellation_token,
+            ):
+                shared.append(result)
+            await self._store_set(cache_key, list(shared.chunks))
+            if self.semantic_cache is not None and semantic_query is not None:
+                self.semantic_cache.add(*semantic_query, cache_key)
+        except BaseException as e:
+            # The readers receive the error, so it is not raised from the task.
+            self._remove_stream(cache_key, shared)
+            shared.finish(e)
+            return
+        self._remove_stream(cache_key, shared)
+        shared.finish()
+
+    def _remove_stream(self, cache_key: str, shared: _SharedStream) -> None:
+        if self._inflight_streams.get(cache_key) is shared:
+            del self._inflight_streams[cache_key]
 
     async def close(self) -> None:
         await self.client.close()
@@ -234,19 +552,31 @@ def model_info(self) -> ModelInfo:
     def remaining_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
         return self.client.remaining_tokens(messages, tools=tools)
 
+    def count_message_tokens(self, message: LLMMessage) -> int:
+        return self.client.count_message_tokens(message)
+
     def total_usage(self) -> RequestUsage:
         return self.client.total_usage()
 
+    def _has_default_store(self) -> bool:
+        if not isinstance(self.store, InMemoryStore):
+            return False
+        default_config = InMemoryStore[CHAT_CACHE_VALUE_TYPE]().dump_component().config
+        return self.store.dump_component().config == default_config
+
     def _to_config(self) -> ChatCompletionCacheConfig:
         return ChatCompletionCacheConfig(
             client=self.client.dump_component(),
-            store=self.store.dump_component() if not isinstance(self.store, InMemoryStore) else None,
+            store=None if self._has_default_store() else self.store.dump_component(),
         )
 
     @classmethod
     def _from_config(cls, config: ChatCompletionCacheConfig) -> Self:
         client = ChatCompletionClient.load_component(config.client)
-        store: Optional[CacheStore[CHAT_CACHE_VALUE_TYPE]] = (
-            CacheStore.load_component(config.store) if config.store else InMemoryStore()
-        )
+        store: Optional[Union[CacheStore[CHAT_CACHE_VALUE_TYPE], AsyncCacheStore[CHAT_CACHE_VALUE_TYPE]]] = None
+        if config.store:
+            loaded_store = ComponentLoader.load_component(config.store)
+            if not isinstance(loaded_store, (CacheStore, AsyncCacheStore)):
+                raise TypeError(f"Expected a CacheStore or AsyncCacheStore, got {type(loaded_store)}")
+            store = cast(Union[CacheStore[CHAT_CACHE_VALUE_TYPE], AsyncCacheStore[CHAT_CACHE_VALUE_TYPE]], loaded_store)
         return cls(client=client, store=store)
@@ -0,0 +1,232 @@
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence
+
+try:
+    import numpy as np
+    from numpy.typing import NDArray
+except ImportError as e:
+    raise ImportError(
+        "Dependencies for SemanticCache not found. "
+        'Please install the semantic-cache extra: `pip install -U "autogen-ext[semantic-cache]"`'
+    ) from e
+
+
+@dataclass
+class SemanticCacheStats:
+    """Statistics of a :class:`SemanticCache`."""
+
+    hits: int = 0
+    """Number of lookups that found a similar request."""
+    misses: int = 0
+    """Number of lookups that did not find a similar request."""
+    evictions: int = 0
+    """Number of entries removed because the cache was full."""
+    expirations: int = 0
+    """Number of entries removed because they were older than the time-to-live."""
+
+
+class SemanticCache:
+    """
+    An index of request embeddings used by :class:`~autogen_ext.models.cache.ChatCompletionCache`
+    to reuse the result of a similar, not only identical, request.
+
+    The cache embeds the text of the final user message of a request. A lookup returns the cache key
+    of the most similar earlier request whose other messages and arguments are identical, if its
+    cosine similarity is at least `similarity_threshold`. The results themselves stay in the
+    :class:`~autogen_core.CacheStore` of the :class:`~autogen_ext.models.cache.ChatCompletionCache`.
+
+    The index is a brute-force search over a NumPy matrix, which is suitable for up to tens of
+    thousands of entries. The matrix grows by doubling its capacity, so adding an entry does not
+    copy the index.
+
+    Example:
+
+        .. code-block:: python
+
+            from openai import AsyncOpenAI
+            from autogen_ext.models.cache import ChatCompletionCache
+            from autogen_ext.models.cache.semantic import SemanticCache
+            from autogen_ext.models.openai import OpenAIChatCompletionClient
+
+            openai_client = AsyncOpenAI()
+
+
+            async def embed(text: str) -> list[float]:
+                response = await openai_client.embeddings.create(model="text-embedding-3-small", input=text)
+                return response.data[0].embedding
+
+
+            cache_client = ChatCompletionCache(
+                OpenAIChatCompletionClient(model="gpt-4o"),
+                semantic_cache=SemanticCache(embed, similarity_threshold=0.95, ttl=24 * 3600),
+            )
+
+    Args:
+        embed: An async function that returns the embedding of a text.
+        similarity_threshold: The minimum cosine similarity for a cached request to be reused.
+        max_entries: The maximum number of entries. The least recently used entry is evicted when the cache is full.
+        ttl: If set, entries older than this many seconds are not used and are removed.
+        path: If set, the index is loaded from this file if it exists, and :meth:`save` writes to it.
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[str], Awaitable[Sequence[float]]],
+        *,
+        similarity_threshold: float = 0.95,
+        max_entries: int = 10000,
+        ttl: Optional[float] = None,
+        path: Optional[str | Path] = None,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self._embed = embed
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.path = Path(path) if path is not None else None
+        self.stats = SemanticCacheStats()
+        # The entries are the first `_size` rows of arrays whose capacity grows geometrically.
+        self._size = 0
+        self._vectors: NDArray[np.float32] = np.zeros((0, 0), dtype=np.float32)
+        self._partitions: NDArray[np.object_] = np.empty(0, dtype=object)
+        self._cache_keys: NDArray[np.object_] = np.empty(0, dtype=object)
+        self._created: NDArray[np.float64] = np.zeros(0, dtype=np.float64)
+        self._last_used: NDArray[np.float64] = np.zeros(0, dtype=np.float64)
+        self._rows: Dict[str, int] = {}
+        if self.path is not None and self.path.exists():
+            self._load(self.path)
+
+    def __len__(self) -> int:
+        return self._size
+
+    async def embed(self, text: str) -> NDArray[np.float32]:
+        """Get the normalized embedding of a text."""
+        vector = np.asarray(await self._embed(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def search(self, partition: str, vector: NDArray[np.float32]) -> Optional[str]:
+        """
+        Find the cache key of the most similar entry in the partition.
+
+        Args:
+            partition: The key of everything in the request except the embedded text. Only entries with the same partition match.
+            vector: The normalized embedding returned by :meth:`embed`.
+
+        Returns:
+            The cache key of the entry if its similarity is at least the threshold, else None.
+        """
+        self._expire()
+        if len(self) > 0:
+            if vector.shape[0] != self._vectors.shape[1]:
+                raise ValueError(
+                    f"Embedding dimension {vector.shape[0]} does not match the index dimension {self._vectors.shape[1]}."
+                )
+            similarities = self._vectors[: self._size] @ vector
+            similarities[self._partitions[: self._size] != partition] = -np.inf
+            index = int(np.argmax(similarities))
+            if similarities[index] >= self.similarity_threshold:
+                self.stats.hits += 1
+                self._last_used[index] = time.time()
+                return str(self._cache_keys[index])
+        self.stats.misses += 1
+        return None
+
+    def add(self, partition: str, vector: NDArray[np.float32], cache_key: str) -> None:
+        """Add an entry, replacing an entry with the same cache key."""
+        self.remove(cache_key)
+        self._expire()
+        if self._size >= self.max_entries:
+            self._remove_row(int(np.argmin(self._last_used[: self._size])))
+            self.stats.evictions += 1
+        if self._size == 0 and self._vectors.shape[1] != vector.shape[0]:
+            self._vectors = np.zeros((self._vectors.shape[0], vector.shape[0]), dtype=np.float32)
+        if self._size == self._vectors.shape[0]:
+            self._grow(min(max(2 * self._size, 16), self.max_entries))
+        now = time.time()
+        row = self._size
+        self._vectors[row] = vector
+        self._partitions[row] = partition
+        self._cache_keys[row] = cache_key
+        self._created[row] = now
+        self._last_used[row] = now
+        self._rows[cache_key] = row
+        self._size += 1
+
+    def remove(self, cache_key: str) -> None:
+        """Remove the entry with the cache key, if any."""
+        row = self._rows.get(cache_key)
+        if row is not None:
+            self._remove_row(row)
+
+    def save(self, path: Optional[str | Path] = None) -> None:
+        """Write the index to a file, by default the `path` the cache was created with."""
+        path = Path(path) if path is not None else self.path
+        if path is None:
+            raise ValueError("No path to save the semantic cache to.")
+        temp_path = path.with_name(path.name + ".tmp")
+        with open(temp_path, "wb") as f:
+            np.savez(
+                f,
+                vectors=self._vectors[: self._size],
+                partitions=self._partitions[: self._size].astype(np.str_),
+                cache_keys=self._cache_keys[: self._size].astype(np.str_),
+                created=self._created[: self._size],
+                last_used=self._last_used[: self._size],
+            )
+        os.replace(temp_path, path)
+
+    def _load(self, path: Path) -> None:
+        with np.load(path, allow_pickle=False) as data:
+            self._vectors = data["vectors"].astype(np.float32)
+            self._partitions = data["partitions"].astype(object)
+            self._cache_keys = data["cache_keys"].astype(object)
+            self._created = data["created"]
+            self._last_used = data["last_used"]
+        self._size = len(self._cache_keys)
+        self._rows = {str(cache_key): row for row, cache_key in enumerate(self._cache_keys)}
+
+    def _grow(self, capacity: int) -> None:
+        self._vectors = self._resized(self._vectors, capacity)
+        self._partitions = self._resized(self._partitions, capacity)
+        self._cache_keys = self._resized(self._cache_keys, capacity)
+        self._created = self._resized(self._created, capacity)
+        self._last_used = self._resized(self._last_used, capacity)
+
+    def _resized(self, array: NDArray[Any], capacity: int) -> NDArray[Any]:
+        resized = np.empty((capacity, *array.shape[1:]), dtype=array.dtype)
+        resized[: self._size] = array[: self._size]
+        return resized
+
+    def _remove_row(self, row: int) -> None:
+        # Move the last entry into the row, so that the entries stay contiguous without copying the index.
+        last = self._size - 1
+        del self._rows[str(self._cache_keys[row])]
+        if row != last:
+            self._vectors[row] = self._vectors[last]
+            self._partitions[row] = self._partitions[last]
+            self._cache_keys[row] = self._cache_keys[last]
+            self._created[row] = self._created[last]
+            self._last_used[row] = self._last_used[last]
+            self._rows[str(self._cache_keys[row])] = row
+        self._partitions[last] = None
+        self._cache_keys[last] = None
+        self._size = last
+
+    def _expire(self) -> None:
+        if self.ttl is None or self._size == 0:
+            return
+        keep = self._created[: self._size] > time.time() - self.ttl
+        num_kept = int(np.count_nonzero(keep))
+        if num_kept < self._size:
+            for array in (self._vectors, self._partitions, self._cache_keys, self._created, self._last_used):
+                array[:num_kept] = array[: self._size][keep]
+            self._partitions[num_kept : self._size] = None
+            self._cache_keys[num_kept : self._size] = None
+            self.stats.expirations += self._size - num_kept
+            self._size = num_kept
+            self._rows = {str(self._cache_keys[row]): row for row in range(num_kept)}
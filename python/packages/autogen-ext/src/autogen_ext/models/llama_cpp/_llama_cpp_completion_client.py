@@ -1,7 +1,23 @@
 import asyncio
 import logging  # added import
 import re
-from typing import Any, AsyncGenerator, Dict, List, Literal, Mapping, Optional, Sequence, TypedDict, Union, cast
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncGenerator,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypedDict,
+    Union,
+    cast,
+)
 
 from autogen_core import EVENT_LOGGER_NAME, CancellationToken, FunctionCall, MessageHandlerContext
 from autogen_core.logging import LLMCallEvent
@@ -29,14 +45,24 @@
     ChatCompletionRequestUserMessage,
     ChatCompletionTool,
     ChatCompletionToolFunction,
+    CreateChatCompletionStreamResponse,
     Llama,
     llama_chat_format,
 )
+from llama_cpp.llama_cache import BaseLlamaCache
 from pydantic import BaseModel
 from typing_extensions import Unpack
 
 logger = logging.getLogger(EVENT_LOGGER_NAME)  # initialize logger
 
+ConvertedMessage = Union[
+    ChatCompletionRequestSystemMessage,
+    ChatCompletionRequestUserMessage,
+    ChatCompletionRequestAssistantMessage,
+    ChatCompletionRequestToolMessage,
+    ChatCompletionRequestFunctionMessage,
+]
+
 
 def normalize_stop_reason(stop_reason: str | None) -> FinishReasons:
     if stop_reason is None:
@@ -183,8 +209,17 @@ class LlamaCppChatCompletionClient(ChatCompletionClient):
         n_ctx (optional, int): The context size.
         n_batch (optional, int): The batch size.
         verbose (optional, bool): Whether to print verbose output.
+        prompt_cache (optional, BaseLlamaCache): A llama.cpp state cache, e.g., :class:`llama_cpp.LlamaRAMCache`
+            or :class:`llama_cpp.LlamaDiskCache`. After each request, the model's KV state is saved in the cache,
+            keyed by the prompt tokens. A later prompt that starts with the same tokens, e.g., the system prompt
+            and the history of another agent that shares the model, restores that state and only evaluates the
+            new tokens. Defaults to None, which disables the cache.
         **kwargs: Additional parameters to pass to the Llama class.
 
+    The model is not safe to use concurrently, so the client runs all requests one
+    at a time, in the order they were made, on a dedicated thread. :meth:`create_stream`
+    yields the tokens as the model generates them on that thread.
+
     Examples:
 
         The following code snippet shows how to use the client with a local model file:
@@ -223,6 +258,32 @@ async def main():
                 print(result)
 
 
+            asyncio.run(main())
+
+        The following code snippet shows how to stream the response and reuse the evaluated
+        prompt prefix across requests with a prompt cache:
+
+        .. code-block:: python
+
+            import asyncio
+
+            from autogen_core.models import SystemMessage, UserMessage
+            from autogen_ext.models.llama_cpp import LlamaCppChatCompletionClient
+            from llama_cpp import LlamaRAMCache
+
+
+            async def main():
+                llama_client = LlamaCppChatCompletionClient(
+                    model_path="/path/to/your/model.gguf",
+                    prompt_cache=LlamaRAMCache(capacity_bytes=2 << 30),
+                )
+                system_message = SystemMessage(content="You are a helpful assistant.")
+                async for chunk in llama_client.create_stream(
+                    [system_message, UserMessage(content="What is the capital of France?", source="user")]
+                ):
+                    print(chunk)
+
+
             asyncio.run(main())
     """
 
@@ -233,6 +294,7 @@ async def main():
     def __init__(
         self,
         model_info: Optional[ModelInfo] = None,
+        prompt_cache: Optional[BaseLlamaCache] = None,
         **kwargs: Unpack[LlamaCppParams],
     ) -> None:
         """
@@ -257,7 +319,11 @@ def __init__(
             self.llm = Llama(**kwargs)  # pyright: ignore[reportUnknownMemberType]
         else:
             raise ValueError("Please provide model_path if ... or provide repo_id and filename if ....")
+        if prompt_cache is not None:
+            self.llm.set_cache(prompt_cache)
         self._total_usage = {"prompt_tokens": 0, "completion_tokens": 0}
+        # A single worker thread serializes the requests to the model.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="llama_cpp")
 
     async def create(
         self,
@@ -270,50 +336,14 @@ async def create(
         extra_create_args: Mapping[str, Any] = {},
         cancellation_token: Optional[CancellationToken] = None,
     ) -> CreateResult:
-        create_args = dict(extra_create_args)
-        # Convert LLMMessage objects to dictionaries with 'role' and 'content'
-        # converted_messages: List[Dict[str, str | Image | list[str | Image] | list[FunctionCall]]] = []
-        converted_messages: list[
-            ChatCompletionRequestSystemMessage
-            | ChatCompletionRequestUserMessage
-            | ChatCompletionRequestAssistantMessage
-            | ChatCompletionRequestUserMessage
-            | ChatCompletionRequestToolMessage
-            | ChatCompletionRequestFunctionMessage
-        ] = []
-        for msg in messages:
-            if isinstance(msg, SystemMessage):
-                converted_messages.append({"role": "system", "content": msg.content})
-            elif isinstance(msg, UserMessage) and isinstance(msg.content, str):
-                converted_messages.append({"role": "user", "content": msg.content})
-            elif isinstance(msg, AssistantMessage) and isinstance(msg.content, str):
-                converted_messages.append({"role": "assistant", "content": msg.content})
-            elif (
-                isinstance(msg, SystemMessage) or isinstance(msg, UserMessage) or isinstance(msg, AssistantMessage)
-            ) and isinstance(msg.content, list):
-                raise ValueError("Multi-part messages such as those containing images are currently not supported.")
-            else:
-                raise ValueError(f"Unsupported message type: {type(msg)}")
-
-        if isinstance(json_output, type) and issubclass(json_output, BaseModel):
-            create_args["response_format"] = {"type": "json_object", "schema": json_output.model_json_schema()}
-        elif json_output is True:
-            create_args["response_format"] = {"type": "json_object"}
-        elif json_output is not False and json_output is not None:
-            raise ValueError("json_output must be a boolean, a BaseModel subclass or None.")
+        converted_messages = self._convert_messages(messages)
+        create_args = self._create_args(tools, json_output, extra_create_args)
 
-        if self.model_info["function_calling"]:
-            # Run this in on the event loop to avoid blocking.
-            response_future = asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.llm.create_chat_completion(
-                    messages=converted_messages, tools=convert_tools(tools), stream=False, **create_args
-                ),
-            )
-        else:
-            response_future = asyncio.get_event_loop().run_in_executor(
-                None, lambda: self.llm.create_chat_completion(messages=converted_messages, stream=False, **create_args)
-            )
+        # Run the request on the worker thread to avoid blocking the event loop.
+        response_future = asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            lambda: self.llm.create_chat_completion(messages=converted_messages, stream=False, **create_args),
+        )
         if cancellation_token:
             cancellation_token.link_future(response_future)
         response = await response_future
@@ -375,21 +405,7 @@ async def create(
             cached=False,
         )
 
-        # If we are running in the context of a handler we can get the agent_id
-        try:
-            agent_id = MessageHandlerContext.agent_id()
-        except RuntimeError:
-            agent_id = None
-
-        logger.info(
-            LLMCallEvent(
-                messages=cast(List[Dict[str, Any]], converted_messages),
-                response=create_result.model_dump(),
-                prompt_tokens=response["usage"]["prompt_tokens"],
-                completion_tokens=response["usage"]["completion_tokens"],
-                agent_id=agent_id,
-            )
-        )
+        self._log_llm_call(converted_messages, create_result)
         return create_result
 
     async def create_stream(
@@ -403,8 +419,152 @@ async def create_stream(
         extra_create_args: Mapping[str, Any] = {},
         cancellation_token: Optional[CancellationToken] = None,
     ) -> AsyncGenerator[Union[str, CreateResult], None]:
-        raise NotImplementedError("Stream not yet implemented for LlamaCppChatCompletionClient")
-        yield ""
+        converted_messages = self._convert_messages(messages)
+        create_args = self._create_args(tools, json_output, extra_create_args)
+
+        loop = asyncio.get_running_loop()
+        chunk_queue: asyncio.Queue[CreateChatCompletionStreamResponse | None] = asyncio.Queue()
+        stop_event = threading.Event()
+
+        def _generate() -> int:
+            """Run the request on the worker thread and pass the chunks to the event loop.
+            Returns the number of tokens in the model's context after the request."""
+            try:
+                if stop_event.is_set():
+                    return 0
+                chunks = cast(
+                    Iterator[CreateChatCompletionStreamResponse],
+                    self.llm.create_chat_completion(messages=converted_messages, stream=True, **create_args),
+                )
+                for chunk in chunks:
+                    if stop_event.is_set():
+                        break
+                    loop.call_soon_threadsafe(chunk_queue.put_nowait, chunk)
+                return self.llm.n_tokens
+            finally:
+                loop.call_soon_threadsafe(chunk_queue.put_nowait, None)
+
+        generate_future = loop.run_in_executor(self._executor, _generate)
+        content_deltas: List[str] = []
+        # The tool call deltas by index: the id, the name and the parts of the arguments.
+        tool_call_deltas: Dict[int, Tuple[str, str, List[str]]] = {}
+        finish_reason: str | None = None
+        completion_tokens = 0
+        try:
+            while True:
+                get_future = asyncio.ensure_future(chunk_queue.get())
+                if cancellation_token:
+                    cancellation_token.link_future(get_future)
+                chunk = await get_future
+                if chunk is None:
+                    break
+                if not chunk["choices"]:
+                    continue
+                choice = chunk["choices"][0]
+                if choice["finish_reason"] is not None:
+                    finish_reason = choice["finish_reason"]
+                delta = choice["delta"]
+                if delta.get("content"):
+                    completion_tokens += 1
+                    content_deltas.append(cast(str, delta["content"]))
+                    yield cast(str, delta["content"])
+                for tool_call in delta.get("tool_calls") or []:
+                    tool_id, tool_name, arguments = tool_call_deltas.setdefault(tool_call["index"], ("", "", []))
+                    function = tool_call.get("function") or {}
+                    tool_call_deltas[tool_call["index"]] = (
+                        tool_call.get("id") or tool_id,
+                        function.get("name") or tool_name,
+                        arguments,
+                    )
+                    if function.get("arguments"):
+                        completion_tokens += 1
+                        arguments.append(cast(str, function["arguments"]))
+            context_tokens = await generate_future
+        finally:
+            # Stop the generation if the caller stopped consuming the stream.
+            stop_event.set()
+
+        response_text = "".join(content_deltas)
+        content: List[FunctionCall] | str
+        thought: str | None = None
+        if tool_call_deltas:
+            content = [
+                FunctionCall(id=tool_id, arguments="".join(arguments), name=normalize_name(tool_name))
+                for tool_id, tool_name, arguments in (tool_call_deltas[index] for index in sorted(tool_call_deltas))
+            ]
+            if response_text:
+                thought = response_text
+        else:
+            content = response_text
+
+        # Streamed chunks do not report the usage, so it is derived from the tokens in the model's context.
+        usage = RequestUsage(
+            prompt_tokens=max(context_tokens - completion_tokens, 0),
+            completion_tokens=completion_tokens,
+        )
+        self._total_usage["prompt_tokens"] += usage.prompt_tokens
+        self._total_usage["completion_tokens"] += usage.completion_tokens
+        create_result = CreateResult(
+            content=content,
+            thought=thought,
+            usage=usage,
+            finish_reason=normalize_stop_reason(finish_reason),
+            cached=False,
+        )
+        self._log_llm_call(converted_messages, create_result)
+        yield create_result
+
+    def _convert_messages(self, messages: Sequence[LLMMessage]) -> List[ConvertedMessage]:
+        """Convert LLMMessage objects to dictionaries with 'role' and 'content'."""
+        converted_messages: List[ConvertedMessage] = []
+        for msg in messages:
+            if isinstance(msg, SystemMessage):
+                converted_messages.append({"role": "system", "content": msg.content})
+            elif isinstance(msg, UserMessage) and isinstance(msg.content, str):
+                converted_messages.append({"role": "user", "content": msg.content})
+            elif isinstance(msg, AssistantMessage) and isinstance(msg.content, str):
+                converted_messages.append({"role": "assistant", "content": msg.content})
+            elif (
+                isinstance(msg, SystemMessage) or isinstance(msg, UserMessage) or isinstance(msg, AssistantMessage)
+            ) and isinstance(msg.content, list):
+                raise ValueError("Multi-part messages such as those containing images are currently not supported.")
+            else:
+                raise ValueError(f"Unsupported message type: {type(msg)}")
+        return converted_messages
+
+    def _create_args(
+        self,
+        tools: Sequence[Tool | ToolSchema],
+        json_output: Optional[bool | type[BaseModel]],
+        extra_create_args: Mapping[str, Any],
+    ) -> Dict[str, Any]:
+        create_args = dict(extra_create_args)
+        if isinstance(json_output, type) and issubclass(json_output, BaseModel):
+            create_args["response_format"] = {"type": "json_object", "schema": json_output.model_json_schema()}
+        elif json_output is True:
+            create_args["response_format"] = {"type": "json_object"}
+        elif json_output is not False and json_output is not None:
+            raise ValueError("json_output must be a boolean, a BaseModel subclass or None.")
+        if self.model_info["function_calling"]:
+            create_args["tools"] = convert_tools(tools)
+        return create_args
+
+    def _log_llm_call(self, converted_messages: List[ConvertedMessage], create_result: CreateResult) -> None:
+        # If we are running in the context of a handler we can get the agent_id
+        try:
+            agent_id = MessageHandlerContext.agent_id()
+        except RuntimeError:
+            agent_id = None
+
+        logger.info(
+            LLMCallEvent(
+                messages=cast(List[Dict[str, Any]], converted_messages),
+                response=create_result.model_dump(),
+                prompt_tokens=create_result.usage.prompt_tokens,
+                completion_tokens=create_result.usage.completion_tokens,
+                agent_id=agent_id,
+            )
+        )
 
     # Implement abstract methods
     def actual_usage(self) -> RequestUsage:
@@ -450,5 +610,9 @@ def total_usage(self) -> RequestUsage:
     async def close(self) -> None:
         """
         Close the LlamaCpp client.
+
+        Requests that are still queued are cancelled. The model is closed once the running request finishes.
         """
+        # Wait for the running request in another thread, so that the event loop is not blocked.
+        await asyncio.to_thread(self._executor.shutdown, wait=True, cancel_futures=True)
         self.llm.close()
@@ -253,7 +253,7 @@ def calculate_vision_tokens(image: Image, detail: str = "auto") -> int:
     if detail == "low":
         return BASE_TOKEN_COUNT
 
-    width, height = image.image.size
+    width, height = image.size
 
     # Scale down to fit within a MAX_LONG_EDGE x MAX_LONG_EDGE square if necessary
 
@@ -378,25 +378,34 @@ def normalize_stop_reason(stop_reason: str | None) -> FinishReasons:
     return KNOWN_STOP_MAPPINGS.get(stop_reason, "unknown")
 
 
-# TODO: probably needs work
-def count_tokens_ollama(messages: Sequence[LLMMessage], model: str, *, tools: Sequence[Tool | ToolSchema] = []) -> int:
+def _get_encoding(model: str) -> tiktoken.Encoding:
     try:
-        encoding = tiktoken.encoding_for_model(model)
+        return tiktoken.encoding_for_model(model)
     except KeyError:
         trace_logger.warning(f"Model {model} not found. Using cl100k_base encoding.")
-        encoding = tiktoken.get_encoding("cl100k_base")
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def _count_message_tokens(message: LLMMessage, encoding: tiktoken.Encoding) -> int:
     tokens_per_message = 3
+    num_tokens = tokens_per_message
+    ollama_message = to_ollama_type(message)
+    for ollama_message_part in ollama_message:
+        if isinstance(message.content, Image):
+            num_tokens += calculate_vision_tokens(message.content)
+        elif ollama_message_part.content is not None:
+            num_tokens += len(encoding.encode(ollama_message_part.content))
+    return num_tokens
+
+
+# TODO: probably needs work
+def count_tokens_ollama(messages: Sequence[LLMMessage], model: str, *, tools: Sequence[Tool | ToolSchema] = []) -> int:
+    encoding = _get_encoding(model)
     num_tokens = 0
 
     # Message tokens.
     for message in messages:
-        num_tokens += tokens_per_message
-        ollama_message = to_ollama_type(message)
-        for ollama_message_part in ollama_message:
-            if isinstance(message.content, Image):
-                num_tokens += calculate_vision_tokens(message.content)
-            elif ollama_message_part.content is not None:
-                num_tokens += len(encoding.encode(ollama_message_part.content))
+        num_tokens += _count_message_tokens(message, encoding)
     # TODO: every model family has its own message sequence.
     num_tokens += 3  # every reply is primed with <|start|>assistant<|message|>
 
@@ -851,6 +860,9 @@ def remaining_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[To
         token_limit = _model_info.get_token_limit(self._create_args["model"])
         return token_limit - self.count_tokens(messages, tools=tools)
 
+    def count_message_tokens(self, message: LLMMessage) -> int:
+        return _count_message_tokens(message, _get_encoding(self._create_args["model"]))
+
     @property
     def capabilities(self) -> ModelCapabilities:  # type: ignore
         warnings.warn("capabilities is deprecated, use model_info instead", DeprecationWarning, stacklevel=2)
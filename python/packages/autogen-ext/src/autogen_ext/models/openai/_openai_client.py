@@ -1,12 +1,17 @@
 import asyncio
+import functools
+import hashlib
 import inspect
 import json
 import logging
 import math
 import os
 import re
+import threading
 import warnings
+import weakref
 from asyncio import Task
+from collections import OrderedDict
 from dataclasses import dataclass
 from importlib.metadata import PackageNotFoundError, version
 from typing import (
@@ -19,6 +24,7 @@
     Optional,
     Sequence,
     Set,
+    Tuple,
     Type,
     Union,
     cast,
@@ -189,7 +195,7 @@ def calculate_vision_tokens(image: Image, detail: str = "auto") -> int:
     if detail == "low":
         return BASE_TOKEN_COUNT
 
-    width, height = image.image.size
+    width, height = image.size
 
     # Scale down to fit within a MAX_LONG_EDGE x MAX_LONG_EDGE square if necessary
 
@@ -274,6 +280,170 @@ def normalize_name(name: str) -> str:
     return re.sub(r"[^a-zA-Z0-9_-]", "_", name)[:64]
 
 
+@functools.lru_cache(maxsize=None)
+def _get_encoding(model: str) -> tiktoken.Encoding:
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        trace_logger.warning(f"Model {model} not found. Using cl100k_base encoding.")
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def _count_message_tokens(
+    message: LLMMessage,
+    encoding: tiktoken.Encoding,
+    model: str,
+    *,
+    add_name_prefixes: bool,
+    model_family: str,
+) -> int:
+    tokens_per_message = 3
+    tokens_per_name = 1
+    num_tokens = tokens_per_message
+    oai_message = to_oai_type(message, prepend_name=add_name_prefixes, model=model, model_family=model_family)
+    for oai_message_part in oai_message:
+        for key, value in oai_message_part.items():
+            if value is None:
+                continue
+
+            if isinstance(message, UserMessage) and isinstance(value, list):
+                typed_message_value = cast(List[ChatCompletionContentPartParam], value)
+
+                assert len(typed_message_value) == len(
+                    message.content
+                ), "Mismatch in message content and typed message value"
+
+                # We need image properties that are only in the original message
+                for part, content_part in zip(typed_message_value, message.content, strict=False):
+                    if isinstance(content_part, Image):
+                        # TODO: add detail parameter
+                        num_tokens += calculate_vision_tokens(content_part)
+                    elif isinstance(part, str):
+                        num_tokens += len(encoding.encode(part))
+                    else:
+                        try:
+                            serialized_part = json.dumps(part)
+                            num_tokens += len(encoding.encode(serialized_part))
+                        except TypeError:
+                            trace_logger.warning(f"Could not convert {part} to string, skipping.")
+            else:
+                if not isinstance(value, str):
+                    try:
+                        value = json.dumps(value)
+                    except TypeError:
+                        trace_logger.warning(f"Could not convert {value} to string, skipping.")
+                        continue
+                num_tokens += len(encoding.encode(value))
+                if key == "name":
+                    num_tokens += tokens_per_name
+    return num_tokens
+
+
+def _count_function_tokens(function: FunctionDefinition, encoding: tiktoken.Encoding) -> int:
+    tool_tokens = len(encoding.encode(function["name"]))
+    if "description" in function:
+        tool_tokens += len(encoding.encode(function["description"]))
+    tool_tokens -= 2
+    if "parameters" in function:
+        parameters = function["parameters"]
+        if "properties" in parameters:
+            assert isinstance(parameters["properties"], dict)
+            for propertiesKey in parameters["properties"]:  # pyright: ignore
+                assert isinstance(propertiesKey, str)
+                tool_tokens += len(encoding.encode(propertiesKey))
+                v = parameters["properties"][propertiesKey]  # pyright: ignore
+                for field in v:  # pyright: ignore
+                    if field == "type":
+                        tool_tokens += 2
+                        tool_tokens += len(encoding.encode(v["type"]))  # pyright: ignore
+                    elif field == "description":
+                        tool_tokens += 2
+                        tool_tokens += len(encoding.encode(v["description"]))  # pyright: ignore
+                    elif field == "enum":
+                        tool_tokens -= 3
+                        for o in v["enum"]:  # pyright: ignore
+                            tool_tokens += 3
+                            tool_tokens += len(encoding.encode(o))  # pyright: ignore
+                    else:
+                        trace_logger.warning(f"Not supported field {field}")
+            tool_tokens += 11
+            if len(parameters["properties"]) == 0:  # pyright: ignore
+                tool_tokens -= 2
+    return tool_tokens
+
+
+@functools.lru_cache(maxsize=1024)
+def _count_tool_schema_tokens(serialized_tool_schema: str, encoding_name: str) -> int:
+    tool_schema = cast(ToolSchema, json.loads(serialized_tool_schema))
+    return _count_function_tokens(convert_tools([tool_schema])[0]["function"], tiktoken.get_encoding(encoding_name))
+
+
+# Token counts of tool objects, per encoding name. A tool's schema is derived from its
+# name, description and argument type, which do not change after it is created.
+_tool_token_counts: "weakref.WeakKeyDictionary[Tool, Dict[str, int]]" = weakref.WeakKeyDictionary()
+_tool_token_counts_lock = threading.Lock()
+
+
+def _count_tool_tokens(tool: Tool | ToolSchema, encoding: tiktoken.Encoding) -> int:
+    if isinstance(tool, Tool):
+        try:
+            with _tool_token_counts_lock:
+                counts = _tool_token_counts.setdefault(tool, {})
+        except TypeError:
+            # The tool object cannot be weakly referenced, count its schema instead.
+            return _count_tool_tokens(tool.schema, encoding)
+        if encoding.name not in counts:
+            counts[encoding.name] = _count_tool_tokens(tool.schema, encoding)
+        return counts[encoding.name]
+    # Tool schemas are plain dictionaries that can be modified, so they are memoized by content.
+    return _count_tool_schema_tokens(json.dumps(tool, sort_keys=True), encoding.name)
+
+
+class _MessageTokenCountCache:
+    """A least-recently-used cache of message token counts, keyed by a hash of the message content
+    and the settings that affect how the message is counted."""
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._counts: OrderedDict[Tuple[str, str, bool, str, bytes], int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        # A lock cannot be pickled, so the client that holds the cache can be pickled.
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def get_or_count(
+        self,
+        message: LLMMessage,
+        encoding: tiktoken.Encoding,
+        model: str,
+        *,
+        add_name_prefixes: bool,
+        model_family: str,
+    ) -> int:
+        digest = hashlib.sha256(message.model_dump_json().encode("utf-8")).digest()
+        key = (encoding.name, model, add_name_prefixes, model_family, digest)
+        with self._lock:
+            count = self._counts.get(key)
+            if count is not None:
+                self._counts.move_to_end(key)
+                return count
+        count = _count_message_tokens(
+            message, encoding, model, add_name_prefixes=add_name_prefixes, model_family=model_family
+        )
+        with self._lock:
+            self._counts[key] = count
+            while len(self._counts) > self._maxsize:
+                self._counts.popitem(last=False)
+        return count
+
+
 def count_tokens_openai(
     messages: Sequence[LLMMessage],
     model: str,
@@ -281,91 +451,26 @@ def count_tokens_openai(
     add_name_prefixes: bool = False,
     tools: Sequence[Tool | ToolSchema] = [],
     model_family: str = ModelFamily.UNKNOWN,
+    message_token_cache: _MessageTokenCountCache | None = None,
 ) -> int:
-    try:
-        encoding = tiktoken.encoding_for_model(model)
-    except KeyError:
-        trace_logger.warning(f"Model {model} not found. Using cl100k_base encoding.")
-        encoding = tiktoken.get_encoding("cl100k_base")
-    tokens_per_message = 3
-    tokens_per_name = 1
+    encoding = _get_encoding(model)
     num_tokens = 0
 
     # Message tokens.
     for message in messages:
-        num_tokens += tokens_per_message
-        oai_message = to_oai_type(message, prepend_name=add_name_prefixes, model=model, model_family=model_family)
-        for oai_message_part in oai_message:
-            for key, value in oai_message_part.items():
-                if value is None:
-                    continue
-
-                if isinstance(message, UserMessage) and isinstance(value, list):
-                    typed_message_value = cast(List[ChatCompletionContentPartParam], value)
-
-                    assert len(typed_message_value) == len(
-                        message.content
-                    ), "Mismatch in message content and typed message value"
-
-                    # We need image properties that are only in the original message
-                    for part, content_part in zip(typed_message_value, message.content, strict=False):
-                        if isinstance(content_part, Image):
-                            # TODO: add detail parameter
-                            num_tokens += calculate_vision_tokens(content_part)
-                        elif isinstance(part, str):
-                            num_tokens += len(encoding.encode(part))
-                        else:
-                            try:
-                                serialized_part = json.dumps(part)
-                                num_tokens += len(encoding.encode(serialized_part))
-                            except TypeError:
-                                trace_logger.warning(f"Could not convert {part} to string, skipping.")
-                else:
-                    if not isinstance(value, str):
-                        try:
-                            value = json.dumps(value)
-                        except TypeError:
-                            trace_logger.warning(f"Could not convert {value} to string, skipping.")
-                            continue
-                    num_tokens += len(encoding.encode(value))
-                    if key == "name":
-                        num_tokens += tokens_per_name
+        if message_token_cache is not None:
+            num_tokens += message_token_cache.get_or_count(
+                message, encoding, model, add_name_prefixes=add_name_prefixes, model_family=model_family
+            )
+        else:
+            num_tokens += _count_message_tokens(
+                message, encoding, model, add_name_prefixes=add_name_prefixes, model_family=model_family
+            )
     num_tokens += 3  # every reply is primed with <|start|>assistant<|message|>
 
     # Tool tokens.
-    oai_tools = convert_tools(tools)
-    for tool in oai_tools:
-        function = tool["function"]
-        tool_tokens = len(encoding.encode(function["name"]))
-        if "description" in function:
-            tool_tokens += len(encoding.encode(function["description"]))
-        tool_tokens -= 2
-        if "parameters" in function:
-            parameters = function["parameters"]
-            if "properties" in parameters:
-                assert isinstance(parameters["properties"], dict)
-                for propertiesKey in parameters["properties"]:  # pyright: ignore
-                    assert isinstance(propertiesKey, str)
-                    tool_tokens += len(encoding.encode(propertiesKey))
-                    v = parameters["properties"][propertiesKey]  # pyright: ignore
-                    for field in v:  # pyright: ignore
-                        if field == "type":
-                            tool_tokens += 2
-                            tool_tokens += len(encoding.encode(v["type"]))  # pyright: ignore
-                        elif field == "description":
-                            tool_tokens += 2
-                            tool_tokens += len(encoding.encode(v["description"]))  # pyright: ignore
-                        elif field == "enum":
-                            tool_tokens -= 3
-                            for o in v["enum"]:  # pyright: ignore
-                                tool_tokens += 3
-                                tool_tokens += len(encoding.encode(o))  # pyright: ignore
-                        else:
-                            trace_logger.warning(f"Not supported field {field}")
-                tool_tokens += 11
-                if len(parameters["properties"]) == 0:  # pyright: ignore
-                    tool_tokens -= 2
-        num_tokens += tool_tokens
+    for tool in tools:
+        num_tokens += _count_tool_tokens(tool, encoding)
     num_tokens += 12
     return num_tokens
 
@@ -387,9 +492,13 @@ def __init__(
         model_capabilities: Optional[ModelCapabilities] = None,  # type: ignore
         model_info: Optional[ModelInfo] = None,
         add_name_prefixes: bool = False,
+        token_count_cache_size: int = 0,
     ):
         self._client = client
         self._add_name_prefixes = add_name_prefixes
+        self._message_token_cache = (
+            _MessageTokenCountCache(token_count_cache_size) if token_count_cache_size > 0 else None
+        )
         if model_capabilities is None and model_info is None:
             try:
                 self._model_info = _model_info.get_info(create_args["model"])
@@ -1056,12 +1165,28 @@ def count_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool |
             add_name_prefixes=self._add_name_prefixes,
             tools=tools,
             model_family=self._model_info["family"],
+            message_token_cache=self._message_token_cache,
         )
 
     def remaining_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
         token_limit = _model_info.get_token_limit(self._create_args["model"])
         return token_limit - self.count_tokens(messages, tools=tools)
 
+    def count_message_tokens(self, message: LLMMessage) -> int:
+        model = self._create_args["model"]
+        encoding = _get_encoding(model)
+        if self._message_token_cache is not None:
+            return self._message_token_cache.get_or_count(
+                message,
+                encoding,
+                model,
+                add_name_prefixes=self._add_name_prefixes,
+                model_family=self._model_info["family"],
+            )
+        return _count_message_tokens(
+            message, encoding, model, add_name_prefixes=self._add_name_prefixes, model_family=self._model_info["family"]
+        )
+
     @property
     def capabilities(self) -> ModelCapabilities:  # type: ignore
         warnings.warn(
@@ -1156,6 +1281,10 @@ class OpenAIChatCompletionClient(BaseOpenAIChatCompletionClient, Component[OpenA
             "this is content" becomes "Reviewer said: this is content."
             This can be useful for models that do not support the `name` field in
             message. Defaults to False.
+        token_count_cache_size (optional, int): The number of per-message token counts to keep in a
+            least-recently-used cache keyed by a hash of the message content, so that
+            :meth:`count_tokens` does not tokenize the same messages again on every turn.
+            Defaults to 0, which disables the cache.
         stream_options (optional, dict): Additional options for streaming. Currently only `include_usage` is supported.
 
     Examples:
@@ -1355,6 +1484,10 @@ def __init__(self, **kwargs: Unpack[OpenAIClientConfiguration]):
         if "add_name_prefixes" in kwargs:
             add_name_prefixes = kwargs["add_name_prefixes"]
 
+        token_count_cache_size: int = 0
+        if "token_count_cache_size" in kwargs:
+            token_count_cache_size = kwargs["token_count_cache_size"]
+
         # Special handling for Gemini model.
         assert "model" in copied_args and isinstance(copied_args["model"], str)
         if copied_args["model"].startswith("gemini-"):
@@ -1377,6 +1510,7 @@ def __init__(self, **kwargs: Unpack[OpenAIClientConfiguration]):
             model_capabilities=model_capabilities,
             model_info=model_info,
             add_name_prefixes=add_name_prefixes,
+            token_count_cache_size=token_count_cache_size,
         )
 
     def __getstate__(self) -> Dict[str, Any]:
@@ -1569,6 +1703,10 @@ def __init__(self, **kwargs: Unpack[AzureOpenAIClientConfiguration]):
         if "add_name_prefixes" in kwargs:
             add_name_prefixes = kwargs["add_name_prefixes"]
 
+        token_count_cache_size: int = 0
+        if "token_count_cache_size" in kwargs:
+            token_count_cache_size = kwargs["token_count_cache_size"]
+
         client = _azure_openai_client_from_config(copied_args)
         create_args = _create_args_from_config(copied_args)
         self._raw_config: Dict[str, Any] = copied_args
@@ -1578,6 +1716,7 @@ def __init__(self, **kwargs: Unpack[AzureOpenAIClientConfiguration]):
             model_capabilities=model_capabilities,
             model_info=model_info,
             add_name_prefixes=add_name_prefixes,
+            token_count_cache_size=token_count_cache_size,
         )
 
     def __getstate__(self) -> Dict[str, Any]:
@@ -64,6 +64,7 @@ class BaseOpenAIClientConfiguration(CreateArguments, total=False):
     add_name_prefixes: bool
     """What functionality the model supports, determined by default from model name but is overriden if value passed."""
     default_headers: Dict[str, str] | None
+    token_count_cache_size: int
 
 
 # See OpenAI docs for explanation of these parameters
@@ -106,6 +107,7 @@ class BaseOpenAIClientConfigurationConfigModel(CreateArgumentsConfigModel):
     model_info: ModelInfo | None = None
     add_name_prefixes: bool | None = None
     default_headers: Dict[str, str] | None = None
+    token_count_cache_size: int | None = None
 
 
 # See OpenAI docs for explanation of these parameters
@@ -7,6 +7,7 @@
 AGENT_SENDER_TYPE_ATTR = "agagentsendertype"
 AGENT_SENDER_KEY_ATTR = "agagentsenderkey"
 MESSAGE_KIND_ATTR = "agmsgkind"
+TARGET_AGENT_IDS_ATTR = "agtargetagentids"
 MESSAGE_KIND_VALUE_PUBLISH = "publish"
 MESSAGE_KIND_VALUE_RPC_REQUEST = "rpc_request"
 MESSAGE_KIND_VALUE_RPC_RESPONSE = "rpc_response"
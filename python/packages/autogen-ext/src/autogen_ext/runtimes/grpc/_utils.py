@@ -1,3 +1,6 @@
+import asyncio
+from typing import List
+
 from autogen_core._subscription import Subscription
 from autogen_core._type_prefix_subscription import TypePrefixSubscription
 from autogen_core._type_subscription import TypeSubscription
@@ -43,3 +46,30 @@ def subscription_from_proto(subscription: agent_worker_pb2.Subscription) -> Subs
             )
         case None:
             raise ValueError("Invalid subscription message.")
+
+
+MAX_BATCH_SIZE_METADATA_KEY = "max-batch-size"
+
+
+async def get_message_or_batch(
+    queue: asyncio.Queue[agent_worker_pb2.Message], max_batch_size: int, batch_window: float = 0.0
+) -> agent_worker_pb2.Message:
+    """Wait for the next message in the queue and coalesce it with the messages queued behind it.
+
+    Messages that are already queued are taken immediately. If `batch_window` is positive and the batch
+    is not full, waits that many seconds once for more messages. A single message is returned as is,
+    several are wrapped in a :class:`MessageBatch`.
+    """
+    messages: List[agent_worker_pb2.Message] = [await queue.get()]
+    waited = batch_window <= 0
+    while len(messages) < max_batch_size:
+        try:
+            messages.append(queue.get_nowait())
+        except asyncio.QueueEmpty:
+            if waited:
+                break
+            waited = True
+            await asyncio.sleep(batch_window)
+    if len(messages) == 1:
+        return messages[0]
+    return agent_worker_pb2.Message(batch=agent_worker_pb2.MessageBatch(messages=messages))
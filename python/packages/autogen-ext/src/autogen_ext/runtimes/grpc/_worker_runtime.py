@@ -9,6 +9,7 @@
 import warnings
 from asyncio import Future, Task
 from collections import defaultdict
+from contextlib import AbstractAsyncContextManager, nullcontext
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -17,6 +18,7 @@
     Awaitable,
     Callable,
     ClassVar,
+    Coroutine,
     DefaultDict,
     Dict,
     List,
@@ -52,11 +54,12 @@
     SerializationRegistry,
 )
 from autogen_core._telemetry import MessageRuntimeTracingConfig, TraceHelper, get_telemetry_grpc_metadata
+from autogen_core.exceptions import MessageDroppedException, MessageQueueFullException
 from google.protobuf import any_pb2
 from opentelemetry.trace import TracerProvider
 from typing_extensions import Self
 
-from autogen_ext.runtimes.grpc._utils import subscription_to_proto
+from autogen_ext.runtimes.grpc._utils import MAX_BATCH_SIZE_METADATA_KEY, get_message_or_batch, subscription_to_proto
 
 from . import _constants
 from ._constants import GRPC_IMPORT_ERROR_STR
@@ -92,6 +95,23 @@ def __aiter__(self) -> AsyncIterator[Any]:
         return self
 
 
+class BatchingQueueAsyncIterable(AsyncIterator[agent_worker_pb2.Message], AsyncIterable[agent_worker_pb2.Message]):
+    """Coalesces the messages in the queue into :class:`MessageBatch` frames of up to `max_batch_size` messages."""
+
+    def __init__(
+        self, queue: asyncio.Queue[agent_worker_pb2.Message], max_batch_size: int, batch_window: float
+    ) -> None:
+        self._queue = queue
+        self._max_batch_size = max_batch_size
+        self._batch_window = batch_window
+
+    async def __anext__(self) -> agent_worker_pb2.Message:
+        return await get_message_or_batch(self._queue, self._max_batch_size, self._batch_window)
+
+    def __aiter__(self) -> AsyncIterator[agent_worker_pb2.Message]:
+        return self
+
+
 class HostConnection:
     DEFAULT_GRPC_CONFIG: ClassVar[ChannelArgumentType] = [
         (
@@ -115,13 +135,25 @@ class HostConnection:
         )
     ]
 
-    def __init__(self, channel: grpc.aio.Channel, stub: Any) -> None:  # type: ignore
+    def __init__(  # type: ignore
+        self,
+        channel: grpc.aio.Channel,  # type: ignore
+        stub: Any,
+        max_send_queue_size: int = 0,
+        max_recv_queue_size: int = 0,
+        max_batch_size: int = 1,
+        batch_window: float = 0.0,
+    ) -> None:
         self._channel = channel
-        self._send_queue = asyncio.Queue[agent_worker_pb2.Message]()
-        self._recv_queue = asyncio.Queue[agent_worker_pb2.Message]()
+        # A max size of 0 means the queue is unbounded. When the receive queue is full the read loop stops
+        # reading from the stream, which lets gRPC flow control push back on the host.
+        self._send_queue = asyncio.Queue[agent_worker_pb2.Message](max_send_queue_size)
+        self._recv_queue = asyncio.Queue[agent_worker_pb2.Message](max_recv_queue_size)
         self._connection_task: Task[None] | None = None
         self._stub: AgentRpcAsyncStub = stub
         self._client_id = str(uuid.uuid4())
+        self._max_batch_size = max_batch_size
+        self._batch_window = batch_window
 
     @property
     def stub(self) -> Any:
@@ -131,9 +163,30 @@ def stub(self) -> Any:
     def metadata(self) -> Sequence[Tuple[str, str]]:
         return [("client-id", self._client_id)]
 
+    @property
+    def _channel_metadata(self) -> Sequence[Tuple[str, str]]:
+        if self._max_batch_size > 1:
+            # Tell the host that it may send batches to this client.
+            return [*self.metadata, (MAX_BATCH_SIZE_METADATA_KEY, str(self._max_batch_size))]
+        return self.metadata
+
+    @property
+    def send_queue_full(self) -> bool:
+        return self._send_queue.full()
+
+    @property
+    def recv_queue_full(self) -> bool:
+        return self._recv_queue.full()
+
     @classmethod
     async def from_host_address(
-        cls, host_address: str, extra_grpc_config: ChannelArgumentType = DEFAULT_GRPC_CONFIG
+        cls,
+        host_address: str,
+        extra_grpc_config: ChannelArgumentType = DEFAULT_GRPC_CONFIG,
+        max_send_queue_size: int = 0,
+        max_recv_queue_size: int = 0,
+        max_batch_size: int = 1,
+        batch_window: float = 0.0,
     ) -> Self:
         logger.info("Connecting to %s", host_address)
         #  Always use DEFAULT_GRPC_CONFIG and override it with provided grpc_config
@@ -146,10 +199,23 @@ async def from_host_address(
             options=merged_options,
         )
         stub: AgentRpcAsyncStub = agent_worker_pb2_grpc.AgentRpcStub(channel)  # type: ignore
-        instance = cls(channel, stub)
+        instance = cls(
+            channel,
+            stub,
+            max_send_queue_size=max_send_queue_size,
+            max_recv_queue_size=max_recv_queue_size,
+            max_batch_size=max_batch_size,
+            batch_window=batch_window,
+        )
 
+        if max_batch_size > 1:
+            request_iterator: AsyncIterator[agent_worker_pb2.Message] = BatchingQueueAsyncIterable(
+                instance._send_queue, max_batch_size, batch_window
+            )
+        else:
+            request_iterator = QueueAsyncIterable(instance._send_queue)
         instance._connection_task = await instance._connect(
-            stub, instance._send_queue, instance._recv_queue, instance._client_id
+            stub, request_iterator, instance._recv_queue, instance._channel_metadata
         )
 
         return instance
@@ -163,39 +229,42 @@ async def close(self) -> None:
     @staticmethod
     async def _connect(
         stub: Any,  # AgentRpcAsyncStub
-        send_queue: asyncio.Queue[agent_worker_pb2.Message],
+        request_iterator: AsyncIterator[agent_worker_pb2.Message],
         receive_queue: asyncio.Queue[agent_worker_pb2.Message],
-        client_id: str,
+        metadata: Sequence[Tuple[str, str]],
     ) -> Task[None]:
         from grpc.aio import StreamStreamCall
 
         # TODO: where do exceptions from reading the iterable go? How do we recover from those?
         stream: StreamStreamCall[agent_worker_pb2.Message, agent_worker_pb2.Message] = stub.OpenChannel(  # type: ignore
-            QueueAsyncIterable(send_queue), metadata=[("client-id", client_id)]
+            request_iterator, metadata=metadata
         )
 
         await stream.wait_for_connection()
 
         async def read_loop() -> None:
             while True:
-                logger.info("Waiting for message from host")
+                logger.debug("Waiting for message from host")
                 message = cast(agent_worker_pb2.Message, await stream.read())  # type: ignore
                 if message == grpc.aio.EOF:  # type: ignore
                     logger.info("EOF")
                     break
-                logger.info(f"Received a message from host: {message}")
-                await receive_queue.put(message)
-                logger.info("Put message in receive queue")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Received a message from host: %s", message)
+                if message.WhichOneof("message") == "batch":
+                    for batched_message in message.batch.messages:
+                        await receive_queue.put(batched_message)
+                else:
+                    await receive_queue.put(message)
 
         return asyncio.create_task(read_loop())
 
     async def send(self, message: agent_worker_pb2.Message) -> None:
-        logger.info(f"Send message to host: {message}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Send message to host: %s", message)
         await self._send_queue.put(message)
-        logger.info("Put message in send queue")
 
     async def recv(self) -> agent_worker_pb2.Message:
-        logger.info("Getting message from queue")
         return await self._recv_queue.get()
 
 
@@ -223,6 +292,39 @@ class GrpcWorkerAgentRuntime(AgentRuntime):
 
     .. _cloudevent.proto: https://github.com/microsoft/autogen/blob/main/protos/cloudevent.proto
 
+    Args:
+        host_address (str): The address of the host to connect to.
+        tracer_provider (TracerProvider, optional): The tracer provider to use for tracing. Defaults to None.
+        extra_grpc_config (ChannelArgumentType, optional): Extra gRPC channel options. Defaults to None.
+        payload_serialization_format (str, optional): The serialization format for published messages.
+            Defaults to JSON.
+        max_send_queue_size (int, optional): The maximum number of messages waiting to be sent to the host.
+            Defaults to None, which means the queue is unbounded.
+        max_recv_queue_size (int, optional): The maximum number of messages received from the host that are
+            waiting to be processed. When as many requests and events are waiting for a handler, the runtime stops
+            taking messages from the queue, and when the queue is full it stops reading from the host. While a
+            response to a request sent from this runtime is awaited, the runtime keeps reading, so that the
+            response is not held back behind the waiting messages. Defaults to None, which means the queue is
+            unbounded.
+        max_concurrent_handlers (int, optional): The maximum number of requests and events handled at once,
+            counting those waiting for an in-flight slot. Further requests and events wait for a handler without
+            holding back the responses read from the host. It must be larger than the depth of nested requests
+            between agents in this runtime. Defaults to None, which means no limit.
+        queue_full_policy (Literal["block", "drop", "error"], optional): What to do when a message is sent or
+            published while the send queue is full. ``"block"`` waits for room in the queue, ``"drop"`` discards
+            the message (sending raises :class:`~autogen_core.exceptions.MessageDroppedException`, publishing
+            returns silently) and ``"error"`` raises :class:`~autogen_core.exceptions.MessageQueueFullException`.
+            Responses to requests from the host always wait for room. Defaults to ``"block"``.
+        max_inflight_per_agent_type (Mapping[str, int], optional): The maximum number of messages that local
+            agents of a given type may handle concurrently, keyed by agent type. Defaults to None, which means
+            no limit.
+        max_batch_size (int, optional): The maximum number of messages coalesced into one frame on the stream
+            to and from the host. Values greater than 1 require a host that supports message batches, such as
+            :class:`GrpcWorkerAgentRuntimeHost`. Defaults to 1, which disables batching.
+        batch_window (float, optional): How long, in seconds, the send loop waits for more messages when a
+            batch is not full. Messages that are already queued are always coalesced without waiting.
+            Defaults to 0.
+
     """
 
     # TODO: Needs to handle agent close() call
@@ -232,7 +334,29 @@ def __init__(
         tracer_provider: TracerProvider | None = None,
         extra_grpc_config: ChannelArgumentType | None = None,
         payload_serialization_format: str = JSON_DATA_CONTENT_TYPE,
+        max_send_queue_size: int | None = None,
+        max_recv_queue_size: int | None = None,
+        max_concurrent_handlers: int | None = None,
+        queue_full_policy: Literal["block", "drop", "error"] = "block",
+        max_inflight_per_agent_type: Mapping[str, int] | None = None,
+        max_batch_size: int = 1,
+        batch_window: float = 0.0,
     ) -> None:
+        if max_batch_size <= 0:
+            raise ValueError("max_batch_size must be a positive integer.")
+        if batch_window < 0:
+            raise ValueError("batch_window must not be negative.")
+        if queue_full_policy not in ("block", "drop", "error"):
+            raise ValueError(f"Unsupported queue_full_policy: {queue_full_policy}")
+        for size in (max_send_queue_size, max_recv_queue_size):
+            if size is not None and size <= 0:
+                raise ValueError("Queue sizes must be positive integers.")
+        if max_concurrent_handlers is not None and max_concurrent_handlers <= 0:
+            raise ValueError("max_concurrent_handlers must be a positive integer.")
+        if max_inflight_per_agent_type is not None and any(
+            limit <= 0 for limit in max_inflight_per_agent_type.values()
+        ):
+            raise ValueError("max_inflight_per_agent_type limits must be positive integers.")
         self._host_address = host_address
         self._trace_helper = TraceHelper(tracer_provider, MessageRuntimeTracingConfig("Worker Runtime"))
         self._per_type_subscribers: DefaultDict[tuple[str, str], Set[AgentId]] = defaultdict(set)
@@ -256,6 +380,21 @@ def __init__(
             raise ValueError(f"Unsupported payload serialization format: {payload_serialization_format}")
 
         self._payload_serialization_format = payload_serialization_format
+        self._max_send_queue_size = max_send_queue_size
+        self._max_recv_queue_size = max_recv_queue_size
+        self._queue_full_policy = queue_full_policy
+        self._max_batch_size = max_batch_size
+        self._batch_window = batch_window
+        self._inflight_limits: Dict[str, asyncio.Semaphore] = {
+            agent_type: asyncio.Semaphore(limit) for agent_type, limit in (max_inflight_per_agent_type or {}).items()
+        }
+        self._handler_slots: asyncio.Semaphore | None = (
+            asyncio.Semaphore(max_concurrent_handlers) if max_concurrent_handlers is not None else None
+        )
+        # The requests and events taken from the receive queue that are waiting for a handler slot.
+        self._num_waiting_handlers = 0
+        # Set when a waiting request or event gets a handler, or a request is sent, so the read loop checks again.
+        self._recv_room_changed = asyncio.Event()
 
     async def start(self) -> None:
         """Start the runtime in a background task."""
@@ -263,7 +402,12 @@ async def start(self) -> None:
             raise ValueError("Runtime is already running.")
         logger.info(f"Connecting to host: {self._host_address}")
         self._host_connection = await HostConnection.from_host_address(
-            self._host_address, extra_grpc_config=self._extra_grpc_config
+            self._host_address,
+            extra_grpc_config=self._extra_grpc_config,
+            max_send_queue_size=self._max_send_queue_size or 0,
+            max_recv_queue_size=self._max_recv_queue_size or 0,
+            max_batch_size=self._max_batch_size,
+            batch_window=self._batch_window,
         )
         logger.info("Connection established")
         if self._read_task is None:
@@ -281,29 +425,63 @@ async def _run_read_loop(self) -> None:
         # TODO: catch exceptions and reconnect
         while self._running:
             try:
+                await self._wait_for_recv_room()
                 message = await self._host_connection.recv()
                 oneofcase = agent_worker_pb2.Message.WhichOneof(message, "message")
                 match oneofcase:
                     case "request":
-                        task = asyncio.create_task(self._process_request(message.request))
-                        self._background_tasks.add(task)
-                        task.add_done_callback(self._raise_on_exception)
-                        task.add_done_callback(self._background_tasks.discard)
+                        self._dispatch_handler(self._process_request(message.request))
                     case "response":
-                        task = asyncio.create_task(self._process_response(message.response))
-                        self._background_tasks.add(task)
-                        task.add_done_callback(self._raise_on_exception)
-                        task.add_done_callback(self._background_tasks.discard)
+                        self._dispatch(self._process_response(message.response))
                     case "cloudEvent":
-                        task = asyncio.create_task(self._process_event(message.cloudEvent))
-                        self._background_tasks.add(task)
-                        task.add_done_callback(self._raise_on_exception)
-                        task.add_done_callback(self._background_tasks.discard)
+                        self._dispatch_handler(self._process_event(message.cloudEvent))
                     case None:
                         logger.warning("No message")
             except Exception as e:
                 logger.error("Error in read loop", exc_info=e)
 
+    async def _wait_for_recv_room(self) -> None:
+        """Wait while the requests and events waiting for a handler fill the receive queue size.
+
+        The read loop never waits while a response is awaited, since it may be queued behind other messages
+        and the handlers holding every slot may be waiting for it."""
+        while (
+            self._max_recv_queue_size is not None
+            and self._num_waiting_handlers >= self._max_recv_queue_size
+            and not self._pending_requests
+        ):
+            self._recv_room_changed.clear()
+            await self._recv_room_changed.wait()
+
+    def _dispatch(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Process a message from the host in a background task."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._raise_on_exception)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def _dispatch_handler(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Process a request or event from the host in a background task, once a handler slot is free."""
+        # Counted before the task starts, since the read loop may take more messages first.
+        self._num_waiting_handlers += 1
+        self._dispatch(self._handle(coro))
+
+    async def _handle(self, coro: Coroutine[Any, Any, None]) -> None:
+        try:
+            if self._handler_slots is not None:
+                await self._handler_slots.acquire()
+        except BaseException:
+            coro.close()
+            raise
+        finally:
+            self._num_waiting_handlers -= 1
+            self._recv_room_changed.set()
+        try:
+            await coro
+        finally:
+            if self._handler_slots is not None:
+                self._handler_slots.release()
+
     async def stop(self) -> None:
         """Stop the runtime immediately."""
         if not self._running:
@@ -362,6 +540,40 @@ async def _send_message(
         with self._trace_helper.trace_block(send_type, recipient, parent=telemetry_metadata):
             await self._host_connection.send(runtime_message)
 
+    async def _enqueue_message(
+        self,
+        runtime_message: agent_worker_pb2.Message,
+        send_type: Literal["send", "publish"],
+        recipient: AgentId | TopicId,
+        telemetry_metadata: Mapping[str, str],
+    ) -> bool:
+        """Queue a message for the host according to the queue full policy.
+
+        The message is put on the send queue directly; the connection's send loop writes it to the stream,
+        coalescing it with other queued messages if batching is enabled. With a bounded send queue the caller
+        waits for room in the queue, or the message is rejected if the queue is full. Returns False if the
+        message was dropped.
+        """
+        if self._host_connection is None:
+            raise RuntimeError("Host connection is not set.")
+        if self._max_send_queue_size is not None and self._host_connection.send_queue_full:
+            if self._queue_full_policy == "drop":
+                logger.warning("Send queue is full, dropping %s message to %s", send_type, recipient)
+                return False
+            if self._queue_full_policy == "error":
+                raise MessageQueueFullException(
+                    f"Send queue is full (max_send_queue_size={self._max_send_queue_size})."
+                )
+        await self._send_message(runtime_message, send_type, recipient, telemetry_metadata)
+        return True
+
+    def _inflight_slot(self, agent_type: str) -> AbstractAsyncContextManager[Any]:
+        """Hold an in-flight slot for the agent type, if it is limited, while a handler runs."""
+        semaphore = self._inflight_limits.get(agent_type)
+        if semaphore is None:
+            return nullcontext()
+        return semaphore
+
     async def send_message(
         self,
         message: Any,
@@ -384,6 +596,7 @@ async def send_message(
             future = asyncio.get_event_loop().create_future()
             request_id = await self._get_new_request_id()
             self._pending_requests[request_id] = future
+            self._recv_room_changed.set()
             serialized_message = self._serialization_registry.serialize(
                 message, type_name=data_type, data_content_type=JSON_DATA_CONTENT_TYPE
             )
@@ -402,11 +615,14 @@ async def send_message(
                 )
             )
 
-            # TODO: Find a way to handle timeouts/errors
-            task = asyncio.create_task(self._send_message(runtime_message, "send", recipient, telemetry_metadata))
-            self._background_tasks.add(task)
-            task.add_done_callback(self._raise_on_exception)
-            task.add_done_callback(self._background_tasks.discard)
+            try:
+                queued = await self._enqueue_message(runtime_message, "send", recipient, telemetry_metadata)
+            except MessageQueueFullException:
+                self._pending_requests.pop(request_id, None)
+                raise
+            if not queued:
+                self._pending_requests.pop(request_id, None)
+                raise MessageDroppedException()
             return await future
 
     async def publish_message(
@@ -483,10 +699,7 @@ async def publish_message(
                 )
 
             telemetry_metadata = get_telemetry_grpc_metadata()
-            task = asyncio.create_task(self._send_message(runtime_message, "publish", topic_id, telemetry_metadata))
-            self._background_tasks.add(task)
-            task.add_done_callback(self._raise_on_exception)
-            task.add_done_callback(self._background_tasks.discard)
+            await self._enqueue_message(runtime_message, "publish", topic_id, telemetry_metadata)
 
     async def save_state(self) -> Mapping[str, Any]:
         raise NotImplementedError("Saving state is not yet implemented.")
@@ -537,15 +750,16 @@ async def _process_request(self, request: agent_worker_pb2.RpcRequest) -> None:
 
         # Call the receiving agent.
         try:
-            with MessageHandlerContext.populate_context(rec_agent.id):
-                with self._trace_helper.trace_block(
-                    "process",
-                    rec_agent.id,
-                    parent=request.metadata,
-                    attributes={"request_id": request.request_id},
-                    extraAttributes={"message_type": request.payload.data_type},
-                ):
-                    result = await rec_agent.on_message(message, ctx=message_context)
+            async with self._inflight_slot(recipient.type):
+                with MessageHandlerContext.populate_context(rec_agent.id):
+                    with self._trace_helper.trace_block(
+                        "process",
+                        rec_agent.id,
+                        parent=request.metadata,
+                        attributes={"request_id": request.request_id},
+                        extraAttributes={"message_type": request.payload.data_type},
+                    ):
+                        result = await rec_agent.on_message(message, ctx=message_context)
         except BaseException as e:
             response_message = agent_worker_pb2.Message(
                 response=agent_worker_pb2.RpcResponse(
@@ -642,11 +856,18 @@ async def _process_event(self, event: cloudevent_pb2.CloudEvent) -> None:
         if is_rpc and not is_marked_rpc_type:
             warnings.warn("Received RPC request with topic type suffix but not marked as RPC request.", stacklevel=2)
 
+        # A host that load balances agent types tells each worker which of the recipients it serves.
+        target_agent_ids: Set[str] | None = None
+        if _constants.TARGET_AGENT_IDS_ATTR in event_attributes:
+            target_agent_ids = set(json.loads(event_attributes[_constants.TARGET_AGENT_IDS_ATTR].ce_string))
+
         # Send the message to each recipient.
         responses: List[Awaitable[Any]] = []
         for agent_id in recipients:
             if agent_id == sender:
                 continue
+            if target_agent_ids is not None and str(agent_id) not in target_agent_ids:
+                continue
             message_context = MessageContext(
                 sender=sender,
                 topic_id=topic_id,
@@ -685,13 +906,14 @@ def stringify_attributes(
                     return result
 
                 async def send_message(agent: Agent, message_context: MessageContext) -> Any:
-                    with self._trace_helper.trace_block(
-                        "process",
-                        agent.id,
-                        parent=stringify_attributes(event.attributes),
-                        extraAttributes={"message_type": message_type},
-                    ):
-                        await agent.on_message(message, ctx=message_context)
+                    async with self._inflight_slot(agent.id.type):
+                        with self._trace_helper.trace_block(
+                            "process",
+                            agent.id,
+                            parent=stringify_attributes(event.attributes),
+                            extraAttributes={"message_type": message_type},
+                        ):
+                            await agent.on_message(message, ctx=message_context)
 
                 future = send_message(agent, message_context)
             responses.append(future)
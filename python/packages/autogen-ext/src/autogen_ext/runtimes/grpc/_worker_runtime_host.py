@@ -17,9 +17,24 @@
 
 
 class GrpcWorkerAgentRuntimeHost:
-    def __init__(self, address: str, extra_grpc_config: Optional[ChannelArgumentType] = None) -> None:
+    """A host that routes messages between :class:`GrpcWorkerAgentRuntime` workers.
+
+    Args:
+        address (str): The address to listen on.
+        extra_grpc_config (ChannelArgumentType, optional): Extra gRPC server options. Defaults to None.
+        load_balance_agent_types (bool, optional): Whether several workers may register the same agent type.
+            Messages are then routed by consistent hashing on the agent key, see
+            :class:`GrpcWorkerAgentRuntimeHostServicer`. Defaults to False.
+    """
+
+    def __init__(
+        self,
+        address: str,
+        extra_grpc_config: Optional[ChannelArgumentType] = None,
+        load_balance_agent_types: bool = False,
+    ) -> None:
         self._server = grpc.aio.server(options=extra_grpc_config)
-        self._servicer = GrpcWorkerAgentRuntimeHostServicer()
+        self._servicer = GrpcWorkerAgentRuntimeHostServicer(load_balance_agent_types=load_balance_agent_types)
         agent_worker_pb2_grpc.add_AgentRpcServicer_to_server(self._servicer, self._server)
         self._server.add_insecure_port(address)
         self._address = address
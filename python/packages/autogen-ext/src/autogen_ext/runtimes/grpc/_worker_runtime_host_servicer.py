@@ -1,17 +1,26 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
+import hashlib
+import json
 import logging
 from abc import ABC, abstractmethod
 from asyncio import Future, Task
-from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Generic, Sequence, Set, Tuple, TypeVar
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Generic, List, Sequence, Set, Tuple, TypeVar
 
-from autogen_core import TopicId
+from autogen_core import Subscription, TopicId
 from autogen_core._agent_id import AgentId
 from autogen_core._runtime_impl_helpers import SubscriptionManager
 
+from . import _constants
 from ._constants import GRPC_IMPORT_ERROR_STR
-from ._utils import subscription_from_proto, subscription_to_proto
+from ._utils import (
+    MAX_BATCH_SIZE_METADATA_KEY,
+    get_message_or_batch,
+    subscription_from_proto,
+    subscription_to_proto,
+)
 
 try:
     import grpc
@@ -41,6 +50,66 @@ async def get_client_id_or_abort(context: grpc.aio.ServicerContext[Any, Any]) ->
     return client_id  # type: ignore
 
 
+class ConsistentHashRing:
+    """Assigns agent keys to the clients serving an agent type using consistent hashing.
+
+    Each client is placed on the ring at several points, and a key is owned by the first
+    client point at or after the key's hash. A key therefore stays with the same client
+    until that client leaves, and adding or removing a client only moves the keys that
+    client takes over or gives up.
+
+    Args:
+        replicas (int): The number of points each client occupies on the ring. Defaults to 64.
+    """
+
+    def __init__(self, replicas: int = 64) -> None:
+        self._replicas = replicas
+        self._hashes: List[int] = []
+        self._owners: List[ClientConnectionId] = []
+        self._clients: Set[ClientConnectionId] = set()
+
+    @staticmethod
+    def _hash(value: str) -> int:
+        return int.from_bytes(hashlib.sha1(value.encode("utf-8")).digest()[:8], "big")
+
+    @property
+    def clients(self) -> Set[ClientConnectionId]:
+        return set(self._clients)
+
+    def __contains__(self, client_id: object) -> bool:
+        return client_id in self._clients
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def add(self, client_id: ClientConnectionId) -> None:
+        if client_id in self._clients:
+            return
+        self._clients.add(client_id)
+        for replica in range(self._replicas):
+            point = self._hash(f"{client_id}#{replica}")
+            index = bisect.bisect_left(self._hashes, point)
+            self._hashes.insert(index, point)
+            self._owners.insert(index, client_id)
+
+    def remove(self, client_id: ClientConnectionId) -> None:
+        if client_id not in self._clients:
+            return
+        self._clients.remove(client_id)
+        points = [(point, owner) for point, owner in zip(self._hashes, self._owners, strict=True) if owner != client_id]
+        self._hashes = [point for point, _ in points]
+        self._owners = [owner for _, owner in points]
+
+    def get(self, key: str) -> ClientConnectionId | None:
+        """Get the client that owns `key`, or None if the ring is empty."""
+        if not self._owners:
+            return None
+        if len(self._clients) == 1:
+            return self._owners[0]
+        index = bisect.bisect_left(self._hashes, self._hash(key))
+        return self._owners[index % len(self._owners)]
+
+
 SendT = TypeVar("SendT")
 ReceiveT = TypeVar("ReceiveT")
 
@@ -55,7 +124,8 @@ def __init__(self, request_iterator: AsyncIterator[ReceiveT], client_id: str) ->
     async def _receive_messages(self, client_id: ClientConnectionId, request_iterator: AsyncIterator[ReceiveT]) -> None:
         # Receive messages from the client and process them.
         async for message in request_iterator:
-            logger.info(f"Received message from client {client_id}: {message}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Received message from client %s: %s", client_id, message)
             await self._handle_message(message)
 
     def __aiter__(self) -> AsyncIterator[SendT]:
@@ -63,7 +133,7 @@ def __aiter__(self) -> AsyncIterator[SendT]:
 
     async def __anext__(self) -> SendT:
         try:
-            return await self._send_queue.get()
+            return await self._next_message()
         except StopAsyncIteration:
             await self._receiving_task
             raise
@@ -72,6 +142,9 @@ async def __anext__(self) -> SendT:
             await self._receiving_task
             raise
 
+    async def _next_message(self) -> SendT:
+        return await self._send_queue.get()
+
     @abstractmethod
     async def _handle_message(self, message: ReceiveT) -> None:
         pass
@@ -79,6 +152,11 @@ async def _handle_message(self, message: ReceiveT) -> None:
     async def send(self, message: SendT) -> None:
         await self._send_queue.put(message)
 
+    def send_nowait(self, message: SendT) -> None:
+        """Queue a message for the client without waiting. The client's stream drains its own queue,
+        so a slow client does not hold up the sender."""
+        self._send_queue.put_nowait(message)
+
 
 class CallbackChannelConnection(ChannelConnection[SendT, ReceiveT]):
     def __init__(
@@ -94,10 +172,35 @@ async def _handle_message(self, message: ReceiveT) -> None:
         await self._handle_callback(message)
 
 
+class BatchingCallbackChannelConnection(CallbackChannelConnection[agent_worker_pb2.Message, agent_worker_pb2.Message]):
+    """A data channel connection that coalesces the messages queued for the client into batches."""
+
+    def __init__(
+        self,
+        request_iterator: AsyncIterator[agent_worker_pb2.Message],
+        client_id: str,
+        handle_callback: Callable[[agent_worker_pb2.Message], Awaitable[None]],
+        max_batch_size: int,
+    ) -> None:
+        self._max_batch_size = max_batch_size
+        super().__init__(request_iterator, client_id, handle_callback)
+
+    async def _next_message(self) -> agent_worker_pb2.Message:
+        return await get_message_or_batch(self._send_queue, self._max_batch_size)
+
+
 class GrpcWorkerAgentRuntimeHostServicer(agent_worker_pb2_grpc.AgentRpcServicer):
-    """A gRPC servicer that hosts message delivery service for agents."""
+    """A gRPC servicer that hosts message delivery service for agents.
+
+    Args:
+        load_balance_agent_types (bool, optional): Whether several workers may register the same agent type.
+            Messages for an agent of a shared type are routed by consistent hashing on the agent key, so an agent
+            instance stays on one worker, and the keys of a worker that disconnects are re-routed to the remaining
+            workers. Workers that join later take over part of the keys, and agent state is not migrated.
+            Defaults to False, in which case an agent type can only be registered by one worker.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, load_balance_agent_types: bool = False) -> None:
         self._data_connections: Dict[
             ClientConnectionId, ChannelConnection[agent_worker_pb2.Message, agent_worker_pb2.Message]
         ] = {}
@@ -105,11 +208,20 @@ def __init__(self) -> None:
             ClientConnectionId, ChannelConnection[agent_worker_pb2.ControlMessage, agent_worker_pb2.ControlMessage]
         ] = {}
         self._agent_type_to_client_id_lock = asyncio.Lock()
-        self._agent_type_to_client_id: Dict[str, ClientConnectionId] = {}
+        self._agent_type_to_client_ids: Dict[str, ConsistentHashRing] = {}
+        self._load_balance_agent_types = load_balance_agent_types
         self._pending_responses: Dict[ClientConnectionId, Dict[str, Future[Any]]] = {}
         self._background_tasks: Set[Task[Any]] = set()
         self._subscription_manager = SubscriptionManager()
         self._client_id_to_subscription_id_mapping: Dict[ClientConnectionId, set[str]] = {}
+        # Workers sharing an agent type add equal subscriptions under different ids. Only the first is added
+        # to the subscription manager, and it is removed when the last worker holding it removes it.
+        self._subscription_aliases: Dict[str, str] = {}
+        self._subscription_ref_counts: Dict[str, int] = {}
+        # Recipients of each published topic grouped by client. Cleared whenever agent registrations,
+        # client connections or subscriptions change.
+        self._topic_client_recipients: Dict[TopicId, Dict[ClientConnectionId, List[AgentId]]] = {}
+        self._routing_generation = 0
 
     async def OpenChannel(  # type: ignore
         self,
@@ -121,9 +233,18 @@ async def OpenChannel(  # type: ignore
         async def handle_callback(message: agent_worker_pb2.Message) -> None:
             await self._receive_message(client_id, message)
 
-        connection = CallbackChannelConnection[agent_worker_pb2.Message, agent_worker_pb2.Message](
-            request_iterator, client_id, handle_callback=handle_callback
-        )
+        # The type hint on context.invocation_metadata() is incorrect.
+        metadata = metadata_to_dict(context.invocation_metadata())  # type: ignore
+        max_batch_size = int(metadata.get(MAX_BATCH_SIZE_METADATA_KEY, "1"))
+        connection: ChannelConnection[agent_worker_pb2.Message, agent_worker_pb2.Message]
+        if max_batch_size > 1:
+            connection = BatchingCallbackChannelConnection(
+                request_iterator, client_id, handle_callback=handle_callback, max_batch_size=max_batch_size
+            )
+        else:
+            connection = CallbackChannelConnection[agent_worker_pb2.Message, agent_worker_pb2.Message](
+                request_iterator, client_id, handle_callback=handle_callback
+            )
         self._data_connections[client_id] = connection
         logger.info(f"Client {client_id} connected.")
 
@@ -164,26 +285,57 @@ async def handle_callback(message: agent_worker_pb2.ControlMessage) -> None:
 
     async def _on_client_disconnect(self, client_id: ClientConnectionId) -> None:
         async with self._agent_type_to_client_id_lock:
-            agent_types = [agent_type for agent_type, id_ in self._agent_type_to_client_id.items() if id_ == client_id]
+            self._invalidate_routes()
+            agent_types = [
+                agent_type for agent_type, ring in self._agent_type_to_client_ids.items() if client_id in ring
+            ]
             for agent_type in agent_types:
-                logger.info(f"Removing agent type {agent_type} from agent type to client id mapping")
-                del self._agent_type_to_client_id[agent_type]
-            for sub_id in self._client_id_to_subscription_id_mapping.get(client_id, set()):
-                logger.info(f"Client id {client_id} disconnected. Removing corresponding subscription with id {id}")
+                logger.info(f"Removing client {client_id} from the clients of agent type {agent_type}")
+                ring = self._agent_type_to_client_ids[agent_type]
+                ring.remove(client_id)
+                if len(ring) == 0:
+                    del self._agent_type_to_client_ids[agent_type]
+            for sub_id in self._client_id_to_subscription_id_mapping.pop(client_id, set()):
+                logger.info(f"Client id {client_id} disconnected. Removing corresponding subscription with id {sub_id}")
                 try:
-                    await self._subscription_manager.remove_subscription(sub_id)
+                    await self._release_subscription(sub_id)
                 # Catch and ignore if the subscription does not exist.
                 except ValueError:
                     continue
         logger.info(f"Client {client_id} disconnected successfully")
 
+    def _invalidate_routes(self) -> None:
+        self._topic_client_recipients.clear()
+        self._routing_generation += 1
+
+    def _get_client_id(self, agent_id: AgentId) -> ClientConnectionId | None:
+        ring = self._agent_type_to_client_ids.get(agent_id.type)
+        if ring is None:
+            return None
+        return ring.get(agent_id.key)
+
+    async def _release_subscription(self, subscription_id: str) -> None:
+        self._invalidate_routes()
+        canonical_id = self._subscription_aliases.pop(subscription_id, subscription_id)
+        ref_count = self._subscription_ref_counts.get(canonical_id, 1) - 1
+        if ref_count > 0:
+            self._subscription_ref_counts[canonical_id] = ref_count
+            return
+        self._subscription_ref_counts.pop(canonical_id, None)
+        await self._subscription_manager.remove_subscription(canonical_id)
+
+    def _find_equal_subscription(self, subscription: Subscription) -> Subscription | None:
+        for existing in self._subscription_manager.subscriptions:
+            if existing.id != subscription.id and existing == subscription:
+                return existing
+        return None
+
     def _raise_on_exception(self, task: Task[Any]) -> None:
         exception = task.exception()
         if exception is not None:
             raise exception
 
     async def _receive_message(self, client_id: ClientConnectionId, message: agent_worker_pb2.Message) -> None:
-        logger.info(f"Received message from client {client_id}: {message}")
         oneofcase = message.WhichOneof("message")
         match oneofcase:
             case "request":
@@ -203,6 +355,9 @@ async def _receive_message(self, client_id: ClientConnectionId, message: agent_w
                 self._background_tasks.add(task)
                 task.add_done_callback(self._raise_on_exception)
                 task.add_done_callback(self._background_tasks.discard)
+            case "batch":
+                for batched_message in message.batch.messages:
+                    await self._receive_message(client_id, batched_message)
             case None:
                 logger.warning("Received empty message")
 
@@ -213,7 +368,7 @@ async def _receive_control_message(
         destination = message.destination
         if destination.startswith("agentid="):
             agent_id = AgentId.from_str(destination[len("agentid=") :])
-            target_client_id = self._agent_type_to_client_id.get(agent_id.type)
+            target_client_id = self._get_client_id(agent_id)
             if target_client_id is None:
                 logger.error(f"Agent client id not found for agent type {agent_id.type}.")
                 return
@@ -232,7 +387,7 @@ async def _receive_control_message(
     async def _process_request(self, request: agent_worker_pb2.RpcRequest, client_id: ClientConnectionId) -> None:
         # Deliver the message to a client given the target agent type.
         async with self._agent_type_to_client_id_lock:
-            target_client_id = self._agent_type_to_client_id.get(request.target.type)
+            target_client_id = self._get_client_id(AgentId(request.target.type, request.target.key))
         if target_client_id is None:
             logger.error(f"Agent {request.target.type} not found, failed to deliver message.")
             return
@@ -270,19 +425,47 @@ async def _process_response(self, response: agent_worker_pb2.RpcResponse, client
 
     async def _process_event(self, event: cloudevent_pb2.CloudEvent) -> None:
         topic_id = TopicId(type=event.type, source=event.source)
+        client_recipients = await self._get_client_recipients(topic_id)
+        # Deliver the event to clients. Each connection has its own outbound queue, so this never waits on a client.
+        message: agent_worker_pb2.Message | None = None
+        for client_id, client_agent_ids in client_recipients.items():
+            connection = self._data_connections.get(client_id)
+            if connection is None:
+                logger.error(f"Client {client_id} not found, failed to deliver event for topic {topic_id}.")
+                continue
+            if self._load_balance_agent_types:
+                # Several clients may serve the same agent type, so tell each one which agents it should deliver to.
+                # The ids are a JSON array because an agent key may contain any character.
+                client_event = cloudevent_pb2.CloudEvent()
+                client_event.CopyFrom(event)
+                client_event.attributes[_constants.TARGET_AGENT_IDS_ATTR].ce_string = json.dumps(
+                    [str(agent_id) for agent_id in client_agent_ids]
+                )
+                connection.send_nowait(agent_worker_pb2.Message(cloudEvent=client_event))
+            else:
+                # The same message can be queued for every client.
+                if message is None:
+                    message = agent_worker_pb2.Message(cloudEvent=event)
+                connection.send_nowait(message)
+
+    async def _get_client_recipients(self, topic_id: TopicId) -> Dict[ClientConnectionId, List[AgentId]]:
+        """Get the recipients of a topic grouped by the client that serves them."""
+        client_recipients = self._topic_client_recipients.get(topic_id)
+        if client_recipients is not None:
+            return client_recipients
+        generation = self._routing_generation
         recipients = await self._subscription_manager.get_subscribed_recipients(topic_id)
-        # Get the client ids of the recipients.
-        async with self._agent_type_to_client_id_lock:
-            client_ids: Set[ClientConnectionId] = set()
-            for recipient in recipients:
-                client_id = self._agent_type_to_client_id.get(recipient.type)
-                if client_id is not None:
-                    client_ids.add(client_id)
-                else:
-                    logger.error(f"Agent {recipient.type} and its client not found for topic {topic_id}.")
-        # Deliver the event to clients.
-        for client_id in client_ids:
-            await self._data_connections[client_id].send(agent_worker_pb2.Message(cloudEvent=event))
+        client_recipients = {}
+        for recipient in recipients:
+            client_id = self._get_client_id(recipient)
+            if client_id is not None:
+                client_recipients.setdefault(client_id, []).append(recipient)
+            else:
+                logger.error(f"Agent {recipient.type} and its client not found for topic {topic_id}.")
+        # Only cache the result if the routes did not change while resolving them.
+        if generation == self._routing_generation:
+            self._topic_client_recipients[topic_id] = client_recipients
+        return client_recipients
 
     async def RegisterAgent(  # type: ignore
         self,
@@ -294,14 +477,16 @@ async def RegisterAgent(  # type: ignore
         client_id = await get_client_id_or_abort(context)
 
         async with self._agent_type_to_client_id_lock:
-            if request.type in self._agent_type_to_client_id:
-                existing_client_id = self._agent_type_to_client_id[request.type]
+            ring = self._agent_type_to_client_ids.get(request.type)
+            if ring is not None and (client_id in ring or not self._load_balance_agent_types):
+                existing_client_ids = ", ".join(sorted(ring.clients))
                 await context.abort(
                     grpc.StatusCode.INVALID_ARGUMENT,
-                    f"Agent type {request.type} already registered with client {existing_client_id}.",
+                    f"Agent type {request.type} already registered with client {existing_client_ids}.",
                 )
             else:
-                self._agent_type_to_client_id[request.type] = client_id
+                self._agent_type_to_client_ids.setdefault(request.type, ConsistentHashRing()).add(client_id)
+                self._invalidate_routes()
 
         return agent_worker_pb2.RegisterAgentTypeResponse()
 
@@ -317,10 +502,18 @@ async def AddSubscription(  # type: ignore
         subscription = subscription_from_proto(request.subscription)
         try:
             await self._subscription_manager.add_subscription(subscription)
-            subscription_ids = self._client_id_to_subscription_id_mapping.setdefault(client_id, set())
-            subscription_ids.add(subscription.id)
+            self._subscription_ref_counts[subscription.id] = 1
+            self._invalidate_routes()
         except ValueError as e:
-            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+            existing = self._find_equal_subscription(subscription) if self._load_balance_agent_types else None
+            if existing is None:
+                await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+            else:
+                # Another worker serving the same agent type added this subscription already.
+                self._subscription_aliases[subscription.id] = existing.id
+                self._subscription_ref_counts[existing.id] = self._subscription_ref_counts.get(existing.id, 1) + 1
+        subscription_ids = self._client_id_to_subscription_id_mapping.setdefault(client_id, set())
+        subscription_ids.add(subscription.id)
         return agent_worker_pb2.AddSubscriptionResponse()
 
     async def RemoveSubscription(  # type: ignore
@@ -330,8 +523,9 @@ async def RemoveSubscription(  # type: ignore
             agent_worker_pb2.RemoveSubscriptionRequest, agent_worker_pb2.RemoveSubscriptionResponse
         ],
     ) -> agent_worker_pb2.RemoveSubscriptionResponse:
-        _client_id = await get_client_id_or_abort(context)
-        await self._subscription_manager.remove_subscription(request.id)
+        client_id = await get_client_id_or_abort(context)
+        self._client_id_to_subscription_id_mapping.get(client_id, set()).discard(request.id)
+        await self._release_subscription(request.id)
         return agent_worker_pb2.RemoveSubscriptionResponse()
 
     async def GetSubscriptions(  # type: ignore
@@ -312,6 +312,26 @@ class GetSubscriptionsResponse(google.protobuf.message.Message):
 
 global___GetSubscriptionsResponse = GetSubscriptionsResponse
 
+@typing.final
+class MessageBatch(google.protobuf.message.Message):
+    """Several messages coalesced into one frame on the OpenChannel stream.
+    Only sent to peers that advertise a max-batch-size greater than 1 in the call metadata.
+    """
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    MESSAGES_FIELD_NUMBER: builtins.int
+    @property
+    def messages(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___Message]: ...
+    def __init__(
+        self,
+        *,
+        messages: collections.abc.Iterable[global___Message] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing.Literal["messages", b"messages"]) -> None: ...
+
+global___MessageBatch = MessageBatch
+
 @typing.final
 class Message(google.protobuf.message.Message):
     DESCRIPTOR: google.protobuf.descriptor.Descriptor
@@ -319,22 +339,26 @@ class Message(google.protobuf.message.Message):
     REQUEST_FIELD_NUMBER: builtins.int
     RESPONSE_FIELD_NUMBER: builtins.int
     CLOUDEVENT_FIELD_NUMBER: builtins.int
+    BATCH_FIELD_NUMBER: builtins.int
     @property
     def request(self) -> global___RpcRequest: ...
     @property
     def response(self) -> global___RpcResponse: ...
     @property
     def cloudEvent(self) -> cloudevent_pb2.CloudEvent: ...
+    @property
+    def batch(self) -> global___MessageBatch: ...
     def __init__(
         self,
         *,
         request: global___RpcRequest | None = ...,
         response: global___RpcResponse | None = ...,
         cloudEvent: cloudevent_pb2.CloudEvent | None = ...,
+        batch: global___MessageBatch | None = ...,
     ) -> None: ...
-    def HasField(self, field_name: typing.Literal["cloudEvent", b"cloudEvent", "message", b"message", "request", b"request", "response", b"response"]) -> builtins.bool: ...
-    def ClearField(self, field_name: typing.Literal["cloudEvent", b"cloudEvent", "message", b"message", "request", b"request", "response", b"response"]) -> None: ...
-    def WhichOneof(self, oneof_group: typing.Literal["message", b"message"]) -> typing.Literal["request", "response", "cloudEvent"] | None: ...
+    def HasField(self, field_name: typing.Literal["batch", b"batch", "cloudEvent", b"cloudEvent", "message", b"message", "request", b"request", "response", b"response"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["batch", b"batch", "cloudEvent", b"cloudEvent", "message", b"message", "request", b"request", "response", b"response"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing.Literal["message", b"message"]) -> typing.Literal["request", "response", "cloudEvent", "batch"] | None: ...
 
 global___Message = Message
 
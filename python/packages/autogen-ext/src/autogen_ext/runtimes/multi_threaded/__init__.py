@@ -0,0 +1,5 @@
+from ._multi_threaded_agent_runtime import MultiThreadedAgentRuntime
+
+__all__ = [
+    "MultiThreadedAgentRuntime",
+]
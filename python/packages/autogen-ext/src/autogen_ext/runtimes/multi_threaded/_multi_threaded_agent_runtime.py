@@ -0,0 +1,916 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import threading
+import uuid
+import warnings
+import zlib
+from collections.abc import Sequence
+from concurrent.futures import Future as ConcurrentFuture
+from concurrent.futures import InvalidStateError
+from typing import Any, Awaitable, Callable, Coroutine, Dict, List, Mapping, Set, Tuple, Type, TypeVar, cast
+
+from autogen_core import (
+    Agent,
+    AgentId,
+    AgentInstantiationContext,
+    AgentMetadata,
+    AgentRuntime,
+    AgentType,
+    CancellationToken,
+    ClosureAgent,
+    DropMessage,
+    InterventionHandler,
+    MessageContext,
+    MessageHandlerContext,
+    MessageSerializer,
+    Subscription,
+    TopicId,
+)
+from autogen_core._runtime_impl_helpers import SubscriptionManager, get_impl
+from autogen_core._serialization import JSON_DATA_CONTENT_TYPE, SerializationRegistry
+from autogen_core._telemetry import (
+    EnvelopeMetadata,
+    MessageRuntimeTracingConfig,
+    TraceHelper,
+    get_telemetry_envelope_metadata,
+)
+from autogen_core.exceptions import MessageDroppedException
+from autogen_core.logging import (
+    AgentConstructionExceptionEvent,
+    DeliveryStage,
+    LazyPayload,
+    MessageDroppedEvent,
+    MessageEvent,
+    MessageHandlerExceptionEvent,
+    MessageKind,
+)
+from opentelemetry.trace import TracerProvider
+
+logger = logging.getLogger("autogen_core")
+event_logger = logging.getLogger("autogen_core.events")
+
+# We use a type parameter in some functions which shadows the built-in `type` function.
+# This is a workaround to avoid shadowing the built-in `type` function.
+type_func_alias = type
+
+T = TypeVar("T", bound=Agent)
+R = TypeVar("R")
+
+
+class _Shard:
+    """A worker thread running its own event loop, owning the agents mapped to it.
+
+    A shard created with an existing `loop` does not own a thread and delivers on that loop instead."""
+
+    def __init__(self, index: int, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        self.index = index
+        self.instantiated_agents: Dict[AgentId, Agent] = {}
+        self.background_tasks: Set[asyncio.Task[Any]] = set()
+        self.loop: asyncio.AbstractEventLoop | None = loop
+        self.thread: threading.Thread | None = None
+        self.owns_loop = loop is None
+
+    def start(self, thread_name: str) -> None:
+        if not self.owns_loop:
+            return
+        ready = threading.Event()
+
+        def run() -> None:
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            self.loop = loop
+            ready.set()
+            try:
+                loop.run_forever()
+            finally:
+                # Cancel whatever is still in flight, mirroring an immediate stop.
+                pending = asyncio.all_tasks(loop)
+                for task in pending:
+                    task.cancel()
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+                loop.run_until_complete(loop.shutdown_asyncgens())
+                loop.close()
+
+        self.thread = threading.Thread(target=run, name=thread_name, daemon=True)
+        self.thread.start()
+        ready.wait()
+
+    async def stop(self) -> None:
+        if not self.owns_loop:
+            self._cancel_background_tasks()
+            return
+        loop, thread = self.loop, self.thread
+        if loop is None or thread is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        await asyncio.to_thread(thread.join)
+        self.loop = None
+        self.thread = None
+
+    def _cancel_background_tasks(self) -> None:
+        loop = self.loop
+        if loop is None or loop.is_closed():
+            return
+
+        def _cancel() -> None:
+            for task in list(self.background_tasks):
+                task.cancel()
+
+        loop.call_soon_threadsafe(_cancel)
+
+
+def _resolve(future: ConcurrentFuture[Any], task: asyncio.Task[Any]) -> None:
+    try:
+        if task.cancelled():
+            future.cancel()
+        elif task.exception() is not None:
+            future.set_exception(cast(BaseException, task.exception()))
+        else:
+            future.set_result(task.result())
+    except InvalidStateError:
+        # The caller already cancelled the future.
+        pass
+
+
+class MultiThreadedAgentRuntime(AgentRuntime):
+    """An in-process agent runtime that shards agents across several worker threads.
+
+    Each worker thread runs its own asyncio event loop. Every agent is owned by exactly one
+    worker, chosen by hashing its :class:`~autogen_core.AgentId`, and all messages for an
+    agent are delivered on that worker's loop in the order they were sent. This keeps the
+    per-agent ordering guarantees of :class:`~autogen_core.SingleThreadedAgentRuntime` while
+    letting independent agents run on different threads, so handlers that release the GIL
+    (tokenizers, serializers, native model bindings, blocking I/O) do not stall each other.
+
+    :meth:`send_message` returns the recipient's response and :meth:`publish_message` returns
+    once the message is accepted, exactly as in :class:`~autogen_core.SingleThreadedAgentRuntime`.
+    Messages sent or published before :meth:`start` is called are held until the runtime starts.
+    A published message is routed to the agents subscribed to its topic when it is published.
+
+    .. note::
+
+        Agents, intervention handlers and message serializers are shared across worker threads.
+        An agent is only ever invoked on its own worker, but intervention handlers may be called
+        concurrently from several workers and must be thread-safe. Handlers must not await or
+        mutate asyncio objects that belong to another event loop.
+
+        :class:`~autogen_core.ClosureAgent` types are the exception: they are not sharded and
+        always run on the event loop that registered them, so closures can safely put results
+        into queues owned by the application.
+
+        AgentChat teams are not supported, because their group chat managers write into a queue
+        bound to the caller's event loop. Use :class:`~autogen_core.SingleThreadedAgentRuntime` for them.
+
+    Args:
+        num_workers (int, optional): The number of worker threads to shard agents across. Defaults to 4.
+        intervention_handlers (List[InterventionHandler], optional): A list of intervention
+            handlers that can intercept messages before they are sent or published. Defaults to None.
+        tracer_provider (TracerProvider, optional): The tracer provider to use for tracing. Defaults to None.
+        ignore_unhandled_exceptions (bool, optional): Whether to ignore unhandled exceptions that occur in agent event handlers. Any background exception will be raised from an awaited `stop`, `stop_when_idle` or `stop_when`. Note, this does not apply to RPC handlers. Defaults to True.
+        emit_message_events (bool, optional): Whether to emit a :class:`~autogen_core.logging.MessageEvent` to the
+            :data:`~autogen_core.EVENT_LOGGER_NAME` logger for every message sent, published, delivered and responded to,
+            as :class:`~autogen_core.SingleThreadedAgentRuntime` does. Exception and dropped-message events are
+            still emitted. Defaults to True.
+
+    Example:
+
+        .. code-block:: python
+
+            import asyncio
+            from dataclasses import dataclass
+
+            from autogen_core import AgentId, MessageContext, RoutedAgent, message_handler
+            from autogen_ext.runtimes.multi_threaded import MultiThreadedAgentRuntime
+
+
+            @dataclass
+            class MyMessage:
+                content: str
+
+
+            class MyAgent(RoutedAgent):
+                @message_handler
+                async def handle_my_message(self, message: MyMessage, ctx: MessageContext) -> MyMessage:
+                    return MyMessage(content=message.content.upper())
+
+
+            async def main() -> None:
+                runtime = MultiThreadedAgentRuntime(num_workers=4)
+                await MyAgent.register(runtime, "my_agent", lambda: MyAgent("My agent"))
+
+                runtime.start()
+                # Agents with different keys may be handled on different worker threads.
+                responses = await asyncio.gather(
+                    *[runtime.send_message(MyMessage("hello"), AgentId("my_agent", str(i))) for i in range(8)]
+                )
+                print(responses)
+                await runtime.stop_when_idle()
+
+
+            asyncio.run(main())
+
+    """
+
+    def __init__(
+        self,
+        *,
+        num_workers: int = 4,
+        intervention_handlers: List[InterventionHandler] | None = None,
+        tracer_provider: TracerProvider | None = None,
+        ignore_unhandled_exceptions: bool = True,
+        emit_message_events: bool = True,
+    ) -> None:
+        if num_workers < 1:
+            raise ValueError("num_workers must be at least 1.")
+        self._tracer_helper = TraceHelper(tracer_provider, MessageRuntimeTracingConfig("MultiThreadedAgentRuntime"))
+        self._shards = [_Shard(index) for index in range(num_workers)]
+        # Agent types pinned to the event loop that registered them, see `register_factory`.
+        self._pinned_shards: Dict[str, _Shard] = {}
+        self._external_shards: Dict[asyncio.AbstractEventLoop, _Shard] = {}
+        self._agent_factories: Dict[
+            str, Callable[[], Agent | Awaitable[Agent]] | Callable[[AgentRuntime, AgentId], Agent | Awaitable[Agent]]
+        ] = {}
+        self._intervention_handlers = intervention_handlers
+        self._subscription_manager = SubscriptionManager()
+        # The subscription manager never suspends, so this lock is never held across an actual await.
+        self._subscription_lock = threading.Lock()
+        self._serialization_registry = SerializationRegistry()
+        self._ignore_unhandled_handler_exceptions = ignore_unhandled_exceptions
+        self._emit_message_events = emit_message_events
+        self._background_exception: BaseException | None = None
+        # Guards the run state, the deferred submissions and the outstanding work counter.
+        self._state_lock = threading.Lock()
+        self._running = False
+        self._deferred: List[Tuple[_Shard, Coroutine[Any, Any, Any], ConcurrentFuture[Any] | None]] = []
+        self._outstanding = 0
+        self._idle_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = []
+
+    @property
+    def num_workers(self) -> int:
+        return len(self._shards)
+
+    @property
+    def outstanding_messages_count(self) -> int:
+        """The number of messages that have been sent or published but not yet fully processed."""
+        with self._state_lock:
+            return self._outstanding
+
+    @property
+    def _known_agent_names(self) -> Set[str]:
+        return set(self._agent_factories.keys())
+
+    @property
+    def _all_shards(self) -> List[_Shard]:
+        return self._shards + list(self._external_shards.values())
+
+    def _shard_for(self, agent_id: AgentId) -> _Shard:
+        pinned = self._pinned_shards.get(agent_id.type)
+        if pinned is not None:
+            return pinned
+        return self._shards[zlib.crc32(f"{agent_id.type}/{agent_id.key}".encode()) % len(self._shards)]
+
+    # Returns the response of the message
+    async def send_message(
+        self,
+        message: Any,
+        recipient: AgentId,
+        *,
+        sender: AgentId | None = None,
+        cancellation_token: CancellationToken | None = None,
+        message_id: str | None = None,
+    ) -> Any:
+        if cancellation_token is None:
+            cancellation_token = CancellationToken()
+
+        if message_id is None:
+            message_id = str(uuid.uuid4())
+
+        if self._message_events_enabled():
+            event_logger.info(
+                MessageEvent(
+                    payload=self._lazy_payload(message),
+                    sender=sender,
+                    receiver=recipient,
+                    kind=MessageKind.DIRECT,
+                    delivery_stage=DeliveryStage.SEND,
+                )
+            )
+
+        with self._tracer_helper.trace_block(
+            "create",
+            recipient,
+            parent=None,
+            extraAttributes={"message_type": type(message).__name__},
+        ):
+            if recipient.type not in self._known_agent_names:
+                raise LookupError(f"Agent type '{recipient.type}' does not exist.")
+
+            if logger.isEnabledFor(logging.INFO):
+                content = message.__dict__ if hasattr(message, "__dict__") else message
+                logger.info("Sending message of type %s to %s: %s", type(message).__name__, recipient.type, content)
+
+            result: ConcurrentFuture[Any] = ConcurrentFuture()
+            self._submit(
+                self._shard_for(recipient),
+                self._process_send(
+                    message,
+                    recipient=recipient,
+                    sender=sender,
+                    cancellation_token=cancellation_token,
+                    message_id=message_id,
+                    metadata=get_telemetry_envelope_metadata(),
+                ),
+                result,
+            )
+            future = asyncio.wrap_future(result)
+            cancellation_token.link_future(future)
+
+            return await future
+
+    async def publish_message(
+        self,
+        message: Any,
+        topic_id: TopicId,
+        *,
+        sender: AgentId | None = None,
+        cancellation_token: CancellationToken | None = None,
+        message_id: str | None = None,
+    ) -> None:
+        with self._tracer_helper.trace_block(
+            "create",
+            topic_id,
+            parent=None,
+            extraAttributes={"message_type": type(message).__name__},
+        ):
+            if cancellation_token is None:
+                cancellation_token = CancellationToken()
+            if logger.isEnabledFor(logging.INFO):
+                content = message.__dict__ if hasattr(message, "__dict__") else message
+                logger.info("Publishing message of type %s to all subscribers: %s", type(message).__name__, content)
+
+            if message_id is None:
+                message_id = str(uuid.uuid4())
+
+            if self._message_events_enabled():
+                event_logger.info(
+                    MessageEvent(
+                        payload=self._lazy_payload(message),
+                        sender=sender,
+                        receiver=topic_id,
+                        kind=MessageKind.PUBLISH,
+                        delivery_stage=DeliveryStage.SEND,
+                    )
+                )
+
+            metadata = get_telemetry_envelope_metadata()
+            with self._tracer_helper.trace_block("publish", topic_id, parent=metadata):
+                if self._intervention_handlers is not None:
+                    for handler in self._intervention_handlers:
+                        with self._tracer_helper.trace_block("intercept", handler.__class__.__name__, parent=metadata):
+                            try:
+                                message_context = MessageContext(
+                                    sender=sender,
+                                    topic_id=topic_id,
+                                    is_rpc=False,
+                                    cancellation_token=cancellation_token,
+                                    message_id=message_id,
+                                )
+                                message = await handler.on_publish(message, message_context=message_context)
+                            except asyncio.CancelledError:
+                                raise
+                            except BaseException as e:
+                                logger.error(f"Exception raised in in intervention handler: {e}", exc_info=True)
+                                return
+                        if message is DropMessage or isinstance(message, DropMessage):
+                            self._log_dropped(message, sender, topic_id, MessageKind.PUBLISH)
+                            return
+
+                # The subscribers are resolved by the caller and each delivery is queued on its recipient's
+                # worker right away, so an agent receives messages in the order they were sent, whatever
+                # their topic and whether they were sent or published.
+                with self._subscription_lock:
+                    recipients = list(await self._subscription_manager.get_subscribed_recipients(topic_id))
+                for agent_id in recipients:
+                    # Avoid sending the message back to the sender
+                    if sender is not None and agent_id == sender:
+                        continue
+                    self._submit(
+                        self._shard_for(agent_id),
+                        self._deliver_publish(
+                            message,
+                            agent_id=agent_id,
+                            topic_id=topic_id,
+                            sender=sender,
+                            cancellation_token=cancellation_token,
+                            message_id=message_id,
+                            metadata=metadata,
+                        ),
+                    )
+
+    def _submit(
+        self,
+        shard: _Shard,
+        coro: Coroutine[Any, Any, Any],
+        result: ConcurrentFuture[Any] | None = None,
+    ) -> None:
+        """Schedule `coro` on the worker owning `shard`, in FIFO order with everything else
+        submitted to that worker. The outcome is copied into `result` when given."""
+        with self._state_lock:
+            self._outstanding += 1
+            if not self._running:
+                self._deferred.append((shard, coro, result))
+                return
+            self._post(shard, coro, result)
+
+    def _post(self, shard: _Shard, coro: Coroutine[Any, Any, Any], result: ConcurrentFuture[Any] | None) -> None:
+        assert shard.loop is not None
+        shard.loop.call_soon_threadsafe(self._spawn, shard, coro, result)
+
+    def _spawn(self, shard: _Shard, coro: Coroutine[Any, Any, Any], result: ConcurrentFuture[Any] | None) -> None:
+        if result is not None and result.cancelled():
+            coro.close()
+            self._finish_work()
+            return
+        task = asyncio.get_running_loop().create_task(coro)
+        shard.background_tasks.add(task)
+        task.add_done_callback(shard.background_tasks.discard)
+        task.add_done_callback(lambda _: self._finish_work())
+        if result is not None:
+            loop = asyncio.get_running_loop()
+            task.add_done_callback(lambda t: _resolve(result, t))
+
+            def _cancel_task(future: ConcurrentFuture[Any]) -> None:
+                if future.cancelled() and not loop.is_closed():
+                    loop.call_soon_threadsafe(task.cancel)
+
+            result.add_done_callback(_cancel_task)
+
+    def _finish_work(self) -> None:
+        with self._state_lock:
+            self._outstanding -= 1
+            if self._outstanding > 0:
+                return
+            waiters, self._idle_waiters = self._idle_waiters, []
+        for loop, waiter in waiters:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(_set_if_pending, waiter)
+
+    async def _wait_until_idle(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._state_lock:
+            if self._outstanding == 0:
+                return
+            waiter: asyncio.Future[None] = loop.create_future()
+            self._idle_waiters.append((loop, waiter))
+        await waiter
+
+    def _local_cancellation_token(self, cancellation_token: CancellationToken) -> CancellationToken:
+        """Create a token owned by the current worker that is cancelled when `cancellation_token` is."""
+        local_token = CancellationToken()
+        loop = asyncio.get_running_loop()
+
+        def _cancel() -> None:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(local_token.cancel)
+
+        cancellation_token.add_callback(_cancel)
+        return local_token
+
+    async def _process_send(
+        self,
+        message: Any,
+        *,
+        recipient: AgentId,
+        sender: AgentId | None,
+        cancellation_token: CancellationToken,
+        message_id: str,
+        metadata: EnvelopeMetadata | None,
+    ) -> Any:
+        with self._tracer_helper.trace_block("send", recipient, parent=metadata):
+            message_context = MessageContext(
+                sender=sender,
+                topic_id=None,
+                is_rpc=True,
+                cancellation_token=self._local_cancellation_token(cancellation_token),
+                message_id=message_id,
+            )
+            if self._intervention_handlers is not None:
+                for handler in self._intervention_handlers:
+                    with self._tracer_helper.trace_block("intercept", handler.__class__.__name__, parent=metadata):
+                        message = await handler.on_send(message, message_context=message_context, recipient=recipient)
+                    if message is DropMessage or isinstance(message, DropMessage):
+                        self._log_dropped(message, sender, recipient, MessageKind.DIRECT)
+                        raise MessageDroppedException()
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Calling message handler for %s with message type %s sent by %s",
+                    recipient,
+                    type(message).__name__,
+                    str(sender) if sender is not None else "Unknown",
+                )
+            if self._message_events_enabled():
+                event_logger.info(
+                    MessageEvent(
+                        payload=self._lazy_payload(message),
+                        sender=sender,
+                        receiver=recipient,
+                        kind=MessageKind.DIRECT,
+                        delivery_stage=DeliveryStage.DELIVER,
+                    )
+                )
+            try:
+                recipient_agent = await self._get_agent(recipient)
+                with self._tracer_helper.trace_block("process", recipient_agent.id, parent=metadata):
+                    with MessageHandlerContext.populate_context(recipient_agent.id):
+                        response = await recipient_agent.on_message(message, ctx=message_context)
+            except asyncio.CancelledError:
+                raise
+            except BaseException as e:
+                if event_logger.isEnabledFor(logging.INFO):
+                    event_logger.info(
+                        MessageHandlerExceptionEvent(
+                            payload=self._lazy_payload(message),
+                            handling_agent=recipient,
+                            exception=e,
+                        )
+                    )
+                raise
+
+            if self._message_events_enabled():
+                event_logger.info(
+                    MessageEvent(
+                        payload=self._lazy_payload(response),
+                        sender=recipient,
+                        receiver=sender,
+                        kind=MessageKind.RESPOND,
+                        delivery_stage=DeliveryStage.SEND,
+                    )
+                )
+
+        with self._tracer_helper.trace_block("ack", sender, parent=get_telemetry_envelope_metadata()):
+            if self._intervention_handlers is not None:
+                for handler in self._intervention_handlers:
+                    response = await handler.on_response(response, sender=recipient, recipient=sender)
+                    if response is DropMessage or isinstance(response, DropMessage):
+                        self._log_dropped(response, recipient, sender, MessageKind.RESPOND)
+                        raise MessageDroppedException()
+            if self._message_events_enabled():
+                event_logger.info(
+                    MessageEvent(
+                        payload=self._lazy_payload(response),
+                        sender=recipient,
+                        receiver=sender,
+                        kind=MessageKind.RESPOND,
+                        delivery_stage=DeliveryStage.DELIVER,
+                    )
+                )
+            return response
+
+    async def _deliver_publish(
+        self,
+        message: Any,
+        *,
+        agent_id: AgentId,
+        topic_id: TopicId,
+        sender: AgentId | None,
+        cancellation_token: CancellationToken,
+        message_id: str,
+        metadata: EnvelopeMetadata | None,
+    ) -> None:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Calling message handler for %s with message type %s published by %s",
+                agent_id.type,
+                type(message).__name__,
+                str(sender) if sender is not None else "Unknown",
+            )
+        if self._message_events_enabled():
+            event_logger.info(
+                MessageEvent(
+                    payload=self._lazy_payload(message),
+                    sender=sender,
+                    receiver=None,
+                    kind=MessageKind.PUBLISH,
+                    delivery_stage=DeliveryStage.DELIVER,
+                )
+            )
+        message_context = MessageContext(
+            sender=sender,
+            topic_id=topic_id,
+            is_rpc=False,
+            cancellation_token=self._local_cancellation_token(cancellation_token),
+            message_id=message_id,
+        )
+        try:
+            agent = await self._get_agent(agent_id)
+            with self._tracer_helper.trace_block("process", agent.id, parent=metadata):
+                with MessageHandlerContext.populate_context(agent.id):
+                    await agent.on_message(message, ctx=message_context)
+        except asyncio.CancelledError:
+            # Cancelled by `stop`, not an error of the handler
+            raise
+        except BaseException as e:
+            logger.error(f"Error processing publish message for {agent_id}", exc_info=True)
+            if event_logger.isEnabledFor(logging.INFO):
+                event_logger.info(
+                    MessageHandlerExceptionEvent(
+                        payload=self._lazy_payload(message),
+                        handling_agent=agent_id,
+                        exception=e,
+                    )
+                )
+            if not self._ignore_unhandled_handler_exceptions:
+                with self._state_lock:
+                    if self._background_exception is None:
+                        self._background_exception = e
+
+    def _log_dropped(
+        self, message: Any, sender: AgentId | None, receiver: AgentId | TopicId | None, kind: MessageKind
+    ) -> None:
+        if event_logger.isEnabledFor(logging.INFO):
+            event_logger.info(
+                MessageDroppedEvent(
+                    payload=self._lazy_payload(message),
+                    sender=sender,
+                    receiver=receiver,
+                    kind=kind,
+                )
+            )
+
+    async def save_state(self) -> Mapping[str, Any]:
+        """Save the state of all instantiated agents.
+
+        This method calls the :meth:`~autogen_core.BaseAgent.save_state` method on each agent, on the worker that
+        owns it, and returns a dictionary mapping agent IDs to their state.
+
+        .. note::
+            This method does not currently save the subscription state.
+
+        Returns:
+            A dictionary mapping agent IDs to their state.
+
+        """
+        state: Dict[str, Dict[str, Any]] = {}
+        for shard in self._all_shards:
+            for agent_id in list(shard.instantiated_agents):
+                state[str(agent_id)] = dict(await self.agent_save_state(agent_id))
+        return state
+
+    async def load_state(self, state: Mapping[str, Any]) -> None:
+        """Load the state of all instantiated agents.
+
+        This method calls the :meth:`~autogen_core.BaseAgent.load_state` method on each agent with the state
+        provided in the dictionary, on the worker that owns the agent.
+
+        .. note::
+
+            This method does not currently load the subscription state.
+
+        """
+        for agent_id_str in state:
+            agent_id = AgentId.from_str(agent_id_str)
+            if agent_id.type in self._known_agent_names:
+                await self.agent_load_state(agent_id, state[str(agent_id)])
+
+    async def _on_owner(self, agent_id: AgentId, func: Callable[[Agent], Awaitable[R]]) -> R:
+        """Run `func` with the agent on the worker that owns it, or inline if the runtime is not running."""
+
+        async def _call() -> R:
+            return await func(await self._get_agent(agent_id))
+
+        shard = self._shard_for(agent_id)
+        loop = shard.loop
+        if loop is None or loop.is_closed() or loop is asyncio.get_running_loop():
+            return await _call()
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(_call(), loop))
+
+    def start(self) -> None:
+        """Start the worker threads. Messages sent or published before the runtime was started are delivered now."""
+        with self._state_lock:
+            if self._running:
+                raise RuntimeError("Runtime is already started")
+            for shard in self._shards:
+                shard.start(f"MultiThreadedAgentRuntime-{shard.index}")
+            self._running = True
+            deferred, self._deferred = self._deferred, []
+            for shard, coro, result in deferred:
+                self._post(shard, coro, result)
+
+    async def close(self) -> None:
+        """Calls :meth:`stop` if applicable and the :meth:`Agent.close` method on all instantiated agents"""
+        if self._running:
+            await self.stop()
+        for shard in self._all_shards:
+            for agent in list(shard.instantiated_agents.values()):
+                await agent.close()
+
+    async def stop(self) -> None:
+        """Immediately stop the worker threads. Messages that are still being processed are cancelled."""
+        if threading.current_thread() in {shard.thread for shard in self._shards}:
+            raise RuntimeError("The runtime cannot be stopped from one of its own worker threads.")
+        with self._state_lock:
+            if not self._running:
+                raise RuntimeError("Runtime is not started")
+            self._running = False
+        await asyncio.gather(*(shard.stop() for shard in self._all_shards))
+        with self._state_lock:
+            for _, coro, _ in self._deferred:
+                coro.close()
+            self._deferred = []
+            self._outstanding = 0
+            waiters, self._idle_waiters = self._idle_waiters, []
+            background_exception, self._background_exception = self._background_exception, None
+        for loop, waiter in waiters:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(_set_if_pending, waiter)
+        if background_exception is not None:
+            raise background_exception
+
+    async def stop_when_idle(self) -> None:
+        """Stop the runtime when there is no outstanding message being processed or queued on any worker."""
+        if not self._running:
+            raise RuntimeError("Runtime is not started")
+        await self._wait_until_idle()
+        await self.stop()
+
+    async def stop_when(self, condition: Callable[[], bool], check_period: float = 1.0) -> None:
+        """Stop the runtime when the condition is met, checking every `check_period` seconds."""
+        if not self._running:
+            raise RuntimeError("Runtime is not started")
+        while not condition():
+            await asyncio.sleep(check_period)
+        await self.stop()
+
+    async def agent_metadata(self, agent: AgentId) -> AgentMetadata:
+        async def _metadata(instance: Agent) -> AgentMetadata:
+            return instance.metadata
+
+        return await self._on_owner(agent, _metadata)
+
+    async def agent_save_state(self, agent: AgentId) -> Mapping[str, Any]:
+        async def _save(instance: Agent) -> Mapping[str, Any]:
+            return await instance.save_state()
+
+        return await self._on_owner(agent, _save)
+
+    async def agent_load_state(self, agent: AgentId, state: Mapping[str, Any]) -> None:
+        async def _load(instance: Agent) -> None:
+            await instance.load_state(state)
+
+        await self._on_owner(agent, _load)
+
+    async def register_factory(
+        self,
+        type: str | AgentType,
+        agent_factory: Callable[[], T | Awaitable[T]],
+        *,
+        expected_class: type[T] | None = None,
+    ) -> AgentType:
+        if isinstance(type, str):
+            type = AgentType(type)
+
+        if type.type in self._agent_factories:
+            raise ValueError(f"Agent with type {type} already exists.")
+
+        if expected_class is not None and issubclass(expected_class, ClosureAgent):
+            # Closures usually hand results to the application through objects bound to its event loop.
+            loop = asyncio.get_running_loop()
+            shard = self._external_shards.get(loop)
+            if shard is None:
+                shard = _Shard(-1, loop=loop)
+                self._external_shards[loop] = shard
+            self._pinned_shards[type.type] = shard
+
+        async def factory_wrapper() -> T:
+            maybe_agent_instance = agent_factory()
+            if inspect.isawaitable(maybe_agent_instance):
+                agent_instance = await maybe_agent_instance
+            else:
+                agent_instance = maybe_agent_instance
+
+            if expected_class is not None and type_func_alias(agent_instance) != expected_class:
+                raise ValueError("Factory registered using the wrong type.")
+
+            return agent_instance
+
+        self._agent_factories[type.type] = factory_wrapper
+
+        return type
+
+    async def _invoke_agent_factory(
+        self,
+        agent_factory: Callable[[], T | Awaitable[T]] | Callable[[AgentRuntime, AgentId], T | Awaitable[T]],
+        agent_id: AgentId,
+    ) -> T:
+        with AgentInstantiationContext.populate_context((self, agent_id)):
+            try:
+                if len(inspect.signature(agent_factory).parameters) == 0:
+                    factory_one = cast(Callable[[], T], agent_factory)
+                    agent = factory_one()
+                elif len(inspect.signature(agent_factory).parameters) == 2:
+                    warnings.warn(
+                        "Agent factories that take two arguments are deprecated. Use AgentInstantiationContext instead. Two arg factories will be removed in a future version.",
+                        stacklevel=2,
+                    )
+                    factory_two = cast(Callable[[AgentRuntime, AgentId], T], agent_factory)
+                    agent = factory_two(self, agent_id)
+                else:
+                    raise ValueError("Agent factory must take 0 or 2 arguments.")
+
+                if inspect.isawaitable(agent):
+                    return cast(T, await agent)
+
+                return agent
+
+            except asyncio.CancelledError:
+                raise
+            except BaseException as e:
+                event_logger.info(
+                    AgentConstructionExceptionEvent(
+                        agent_id=agent_id,
+                        exception=e,
+                    )
+                )
+                logger.error(f"Error constructing agent {agent_id}", exc_info=True)
+                raise
+
+    async def _get_agent(self, agent_id: AgentId) -> Agent:
+        instantiated_agents = self._shard_for(agent_id).instantiated_agents
+        if agent_id in instantiated_agents:
+            return instantiated_agents[agent_id]
+
+        if agent_id.type not in self._agent_factories:
+            raise LookupError(f"Agent with name {agent_id.type} not found.")
+
+        agent_factory = self._agent_factories[agent_id.type]
+        agent = await self._invoke_agent_factory(agent_factory, agent_id)
+        instantiated_agents[agent_id] = agent
+        return agent
+
+    # TODO: uncomment out the following type ignore when this is fixed in mypy: https://github.com/python/mypy/issues/3737
+    async def try_get_underlying_agent_instance(self, id: AgentId, type: Type[T] = Agent) -> T:  # type: ignore[assignment]
+        if id.type not in self._agent_factories:
+            raise LookupError(f"Agent with name {id.type} not found.")
+
+        async def _identity(instance: Agent) -> Agent:
+            return instance
+
+        agent_instance = await self._on_owner(id, _identity)
+
+        if not isinstance(agent_instance, type):
+            raise TypeError(
+                f"Agent with name {id.type} is not of type {type.__name__}. It is of type {type_func_alias(agent_instance).__name__}"
+            )
+
+        return agent_instance
+
+    async def add_subscription(self, subscription: Subscription) -> None:
+        with self._subscription_lock:
+            await self._subscription_manager.add_subscription(subscription)
+
+    async def remove_subscription(self, id: str) -> None:
+        with self._subscription_lock:
+            await self._subscription_manager.remove_subscription(id)
+
+    async def get(
+        self, id_or_type: AgentId | AgentType | str, /, key: str = "default", *, lazy: bool = True
+    ) -> AgentId:
+        async def _instantiate(agent_id: AgentId) -> Agent:
+            async def _identity(instance: Agent) -> Agent:
+                return instance
+
+            return await self._on_owner(agent_id, _identity)
+
+        return await get_impl(
+            id_or_type=id_or_type,
+            key=key,
+            lazy=lazy,
+            instance_getter=_instantiate,
+        )
+
+    def add_message_serializer(self, serializer: MessageSerializer[Any] | Sequence[MessageSerializer[Any]]) -> None:
+        self._serialization_registry.add_serializer(serializer)
+
+    def _message_events_enabled(self) -> bool:
+        return self._emit_message_events and event_logger.isEnabledFor(logging.INFO)
+
+    def _lazy_payload(self, message: Any) -> LazyPayload:
+        return LazyPayload(lambda: self._try_serialize(message))
+
+    def _try_serialize(self, message: Any) -> str:
+        try:
+            type_name = self._serialization_registry.type_name(message)
+            return self._serialization_registry.serialize(
+                message, type_name=type_name, data_content_type=JSON_DATA_CONTENT_TYPE
+            ).decode("utf-8")
+        except ValueError:
+            return "Message could not be serialized"
+
+
+def _set_if_pending(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
@@ -53,3 +53,15 @@ def test_diskcache_with_different_instances() -> None:
         loaded_store_1: DiskCacheStore[int] = DiskCacheStore.load_component(store_1_config)
         assert loaded_store_1.get(test_key) == test_value_1
         loaded_store_1.cache.close()
+
+
+def test_diskcache_store_get_many_and_set_many() -> None:
+    from autogen_ext.cache_store.diskcache import DiskCacheStore
+    from diskcache import Cache
+
+    with tempfile.TemporaryDirectory() as temp_dir, Cache(temp_dir) as cache:
+        store = DiskCacheStore[int](cache)
+        store.set_many({f"key_{i}": i for i in range(100)})
+        assert store.get("key_42") == 42
+        assert store.get_many(["key_0", "missing", "key_99"], -1) == [0, -1, 99]
+        assert store.get_many([]) == []
@@ -1,8 +1,9 @@
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 redis = pytest.importorskip("redis")
+pytest.importorskip("redis.asyncio")
 
 
 def test_redis_store_basic() -> None:
@@ -56,3 +57,64 @@ def test_redis_with_different_instances() -> None:
     store_1_config = store_1.dump_component()
     assert store_1_config.component_type == "cache_store"
     assert store_1_config.component_version == 1
+
+
+def test_redis_store_get_many_and_set_many() -> None:
+    from autogen_ext.cache_store.redis import RedisStore
+
+    redis_instance = MagicMock()
+    store = RedisStore[int](redis_instance)
+
+    redis_instance.mget.return_value = [1, None, 3]
+    assert store.get_many(["a", "b", "c"], 0) == [1, 0, 3]
+    redis_instance.mget.assert_called_once_with(["a", "b", "c"])
+    assert store.get_many([]) == []
+
+    store.set_many({"a": 1, "b": 2})
+    redis_instance.pipeline.assert_called_once_with(transaction=False)
+    pipe = redis_instance.pipeline.return_value.__enter__.return_value
+    assert [c.args for c in pipe.set.call_args_list] == [("a", 1), ("b", 2)]
+    pipe.execute.assert_called_once()
+    redis_instance.set.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_redis_store() -> None:
+    from autogen_ext.cache_store.redis import AsyncRedisStore
+
+    redis_instance = MagicMock()
+    redis_instance.get = AsyncMock(return_value=None)
+    redis_instance.set = AsyncMock()
+    redis_instance.mget = AsyncMock(return_value=[None, 2])
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    redis_instance.pipeline.return_value.__aenter__.return_value = pipe
+    store = AsyncRedisStore[int](redis_instance)
+
+    await store.set("a", 1)
+    redis_instance.set.assert_awaited_once_with("a", 1)
+    assert await store.get("a", 99) == 99
+    assert await store.get_many(["a", "b"]) == [None, 2]
+
+    await store.set_many({"a": 1, "b": 2})
+    redis_instance.pipeline.assert_called_once_with(transaction=False)
+    assert [c.args for c in pipe.set.call_args_list] == [("a", 1), ("b", 2)]
+    pipe.execute.assert_awaited_once()
+
+
+def test_redis_store_config_round_trip() -> None:
+    from autogen_ext.cache_store.redis import AsyncRedisStore, RedisStore
+
+    store = RedisStore[int](redis.Redis(host="redis.example.com", port=6380, db=2, max_connections=10))
+    config = store.dump_component()
+    assert config.config["max_connections"] == 10
+    loaded = RedisStore[int].load_component(config)
+    assert loaded.cache.connection_pool.max_connections == 10
+
+    async_store = AsyncRedisStore[int](redis.asyncio.Redis(host="redis.example.com", max_connections=4))
+    async_config = async_store.dump_component()
+    assert async_config.provider == "autogen_ext.cache_store.redis.AsyncRedisStore"
+    loaded_async = AsyncRedisStore[int].load_component(async_config)
+    assert isinstance(loaded_async.cache, redis.asyncio.Redis)
+    assert loaded_async.cache.connection_pool.connection_kwargs["host"] == "redis.example.com"
+    assert loaded_async.cache.connection_pool.max_connections == 4
@@ -1,7 +1,14 @@
+import asyncio
 import copy
-from typing import List, Tuple, Union
+import itertools
+import re
+import threading
+from pathlib import Path
+from typing import Any, AsyncGenerator, List, Mapping, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import pytest
+from autogen_core import CacheStore, CancellationToken, InMemoryStore
 from autogen_core.models import (
     ChatCompletionClient,
     CreateResult,
@@ -9,7 +16,10 @@
     SystemMessage,
     UserMessage,
 )
-from autogen_ext.models.cache import ChatCompletionCache
+from autogen_core.tools import FunctionTool, Tool, ToolSchema
+from autogen_ext.models.cache import CHAT_CACHE_VALUE_TYPE, ChatCompletionCache
+from autogen_ext.models.cache import _chat_completion_cache as chat_completion_cache_module
+from autogen_ext.models.cache.semantic import SemanticCache
 from autogen_ext.models.replay import ReplayChatCompletionClient
 from pydantic import BaseModel
 
@@ -184,3 +194,398 @@ async def test_cache_create_stream() -> None:
     # cached_client_config = cached_client.dump_component()
     # loaded_client = ChatCompletionCache.load_component(cached_client_config)
     # assert loaded_client.client == cached_client.client
+
+
+class GatedReplayChatCompletionClient(ReplayChatCompletionClient):
+    """Waits for the gate to open before each response, and optionally fails the first request.
+    If `stepped`, each streamed chunk also waits for a release of `steps`."""
+
+    def __init__(self, chat_completions: Sequence[str], fail_first: bool = False, stepped: bool = False) -> None:
+        super().__init__(chat_completions)
+        self.set_cached_bool_value(False)
+        self.gate = asyncio.Event()
+        self.steps = asyncio.Semaphore(0)
+        self.num_requests = 0
+        self._fail_first = fail_first
+        self._stepped = stepped
+
+    async def _wait(self) -> None:
+        self.num_requests += 1
+        await self.gate.wait()
+        if self._fail_first and self.num_requests == 1:
+            raise RuntimeError("Request failed")
+
+    async def create(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+        json_output: Optional[bool | type[BaseModel]] = None,
+        extra_create_args: Mapping[str, Any] = {},
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> CreateResult:
+        await self._wait()
+        return await super().create(messages, tools=tools, json_output=json_output, extra_create_args=extra_create_args)
+
+    async def create_stream(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+        json_output: Optional[bool | type[BaseModel]] = None,
+        extra_create_args: Mapping[str, Any] = {},
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> AsyncGenerator[Union[str, CreateResult], None]:
+        await self._wait()
+        async for result in super().create_stream(
+            messages, tools=tools, json_output=json_output, extra_create_args=extra_create_args
+        ):
+            if self._stepped:
+                await self.steps.acquire()
+            yield result
+
+
+class ThreadRecordingStore(CacheStore[CHAT_CACHE_VALUE_TYPE]):
+    def __init__(self) -> None:
+        self.store = InMemoryStore[CHAT_CACHE_VALUE_TYPE]()
+        self.threads: set[str] = set()
+
+    def get(self, key: str, default: Optional[CHAT_CACHE_VALUE_TYPE] = None) -> Optional[CHAT_CACHE_VALUE_TYPE]:
+        self.threads.add(threading.current_thread().name)
+        return self.store.get(key, default)
+
+    def set(self, key: str, value: CHAT_CACHE_VALUE_TYPE) -> None:
+        self.threads.add(threading.current_thread().name)
+        self.store.set(key, value)
+
+
+@pytest.mark.asyncio
+async def test_cache_single_flight_create() -> None:
+    replay_client = GatedReplayChatCompletionClient(["response 0", "response 1"])
+    store = ThreadRecordingStore()
+    cached_client = ChatCompletionCache(replay_client, store)
+    messages: List[LLMMessage] = [UserMessage(content="prompt", source="user")]
+
+    tasks = [asyncio.create_task(cached_client.create(messages)) for _ in range(3)]
+    await asyncio.sleep(0.1)
+    replay_client.gate.set()
+    results = await asyncio.gather(*tasks)
+
+    assert replay_client.num_requests == 1
+    assert [result.content for result in results] == ["response 0"] * 3
+    assert [result.cached for result in results].count(False) == 1
+    # The synchronous store is only accessed from worker threads.
+    assert store.threads and threading.current_thread().name not in store.threads
+
+    cached = await cached_client.create(messages)
+    assert cached.cached and cached.content == "response 0"
+    assert replay_client.num_requests == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_single_flight_failed_request() -> None:
+    replay_client = GatedReplayChatCompletionClient(["response 0", "response 1"], fail_first=True)
+    cached_client = ChatCompletionCache(replay_client)
+    messages: List[LLMMessage] = [UserMessage(content="prompt", source="user")]
+
+    leader = asyncio.create_task(cached_client.create(messages))
+    await asyncio.sleep(0.1)
+    follower = asyncio.create_task(cached_client.create(messages))
+    await asyncio.sleep(0.1)
+    replay_client.gate.set()
+
+    with pytest.raises(RuntimeError, match="Request failed"):
+        await leader
+    # The waiting request is sent once the identical request has failed.
+    result = await follower
+    assert not result.cached
+    assert result.content == "response 0"
+    assert replay_client.num_requests == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_create_stream_single_flight_and_commit() -> None:
+    replay_client = GatedReplayChatCompletionClient(["response 0", "response 1"], stepped=True)
+    store = InMemoryStore[CHAT_CACHE_VALUE_TYPE]()
+    cached_client = ChatCompletionCache(replay_client, store)
+    messages: List[LLMMessage] = [UserMessage(content="prompt", source="user")]
+
+    # A stream that every caller stops reading before it completes is cancelled and not stored.
+    replay_client.gate.set()
+    replay_client.steps.release()
+    stream = cached_client.create_stream(messages)
+    assert await stream.__anext__() == "response "
+    await stream.aclose()
+    await asyncio.sleep(0.1)
+    assert store.store == {}
+
+    received: List[List[Union[str, CreateResult]]] = [[], [], []]
+
+    async def consume(index: int) -> None:
+        async for result in cached_client.create_stream(messages):
+            received[index].append(result)
+
+    tasks = [asyncio.create_task(consume(i)) for i in range(3)]
+    # Every caller receives a chunk as soon as it arrives.
+    replay_client.steps.release()
+    await asyncio.sleep(0.1)
+    assert received == [["response "]] * 3
+    assert store.store == {}
+    for _ in range(10):
+        replay_client.steps.release()
+    await asyncio.gather(*tasks)
+
+    assert replay_client.num_requests == 2
+    assert len(store.store) == 1
+    final_results = [streamed[-1] for streamed in received]
+    assert all(isinstance(final, CreateResult) for final in final_results)
+    assert [final.content for final in final_results if isinstance(final, CreateResult)] == ["response 0"] * 3
+    assert [final.cached for final in final_results if isinstance(final, CreateResult)].count(False) == 1
+    assert all(streamed[:-1] == received[0][:-1] for streamed in received)
+
+
+@pytest.mark.asyncio
+async def test_cache_create_stream_abandoned_and_failed_first_stream() -> None:
+    replay_client = GatedReplayChatCompletionClient(["response 0", "response 1"], stepped=True)
+    cached_client = ChatCompletionCache(replay_client)
+    messages: List[LLMMessage] = [UserMessage(content="prompt", source="user")]
+
+    # The first caller stops reading without closing its stream; the other caller still gets the whole stream.
+    replay_client.gate.set()
+    replay_client.steps.release()
+    abandoned = cached_client.create_stream(messages)
+    assert await abandoned.__anext__() == "response "
+    follower = asyncio.create_task(_collect(cached_client.create_stream(messages)))
+    for _ in range(10):
+        replay_client.steps.release()
+    results = await asyncio.wait_for(follower, timeout=5)
+    assert results[0] == "response "
+    assert isinstance(results[-1], CreateResult) and results[-1].content == "response 0"
+    assert replay_client.num_requests == 1
+    await abandoned.aclose()
+
+    # A caller that has not received anything when the first stream fails sends its own request.
+    replay_client = GatedReplayChatCompletionClient(["response 0", "response 1"], fail_first=True)
+    cached_client = ChatCompletionCache(replay_client)
+    first = asyncio.create_task(_collect(cached_client.create_stream(messages)))
+    await asyncio.sleep(0.1)
+    second = asyncio.create_task(_collect(cached_client.create_stream(messages)))
+    await asyncio.sleep(0.1)
+    replay_client.gate.set()
+    with pytest.raises(RuntimeError, match="Request failed"):
+        await first
+    results = await second
+    assert isinstance(results[-1], CreateResult) and not results[-1].cached
+    assert results[-1].content == "response 0"
+    assert replay_client.num_requests == 2
+
+
+async def _collect(stream: AsyncGenerator[Union[str, CreateResult], None]) -> List[Union[str, CreateResult]]:
+    return [result async for result in stream]
+
+
+def test_cache_key_digests_each_object_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    _, prompts, system_prompt, _, cached_client = get_test_data()
+    computed: List[LLMMessage] = []
+    original_message_digest = chat_completion_cache_module._message_digest  # pyright: ignore[reportPrivateUsage]
+
+    def message_digest(message: LLMMessage) -> bytes:
+        computed.append(message)
+        return original_message_digest(message)
+
+    monkeypatch.setattr(chat_completion_cache_module, "_message_digest", message_digest)
+
+    def tool1(test: str) -> str:
+        return test
+
+    tools = [FunctionTool(tool1, description="example tool 1")]
+
+    class Answer(BaseModel):
+        answer: str
+
+    messages: List[LLMMessage] = [system_prompt]
+    keys: List[str] = []
+    for prompt in prompts:
+        messages = messages + [UserMessage(content=prompt, source="user")]
+        keys.append(
+            cached_client._cache_key(messages, tools, Answer, {"temperature": 0})  # pyright: ignore[reportPrivateUsage]
+        )
+    # Each message is serialized once, even though it is part of several keys.
+    assert computed == messages
+    assert len(set(keys)) == len(keys)
+
+    # Keys depend on the content and order of the messages and on the other arguments, not on object identity.
+    copied = [message.model_copy() for message in messages]
+    key = cached_client._cache_key(copied, tools, Answer, {"temperature": 0})  # pyright: ignore[reportPrivateUsage]
+    assert key == keys[-1]
+    for other_key in [
+        cached_client._cache_key(messages[::-1], tools, Answer, {"temperature": 0}),  # pyright: ignore[reportPrivateUsage]
+        cached_client._cache_key(messages, [], Answer, {"temperature": 0}),  # pyright: ignore[reportPrivateUsage]
+        cached_client._cache_key(messages, [tools[0].schema], True, {"temperature": 0}),  # pyright: ignore[reportPrivateUsage]
+        cached_client._cache_key(messages, tools, None, {"temperature": 0}),  # pyright: ignore[reportPrivateUsage]
+        cached_client._cache_key(messages, tools, Answer, {"temperature": 1}),  # pyright: ignore[reportPrivateUsage]
+    ]:
+        assert other_key != key
+    assert cached_client._cache_key(messages, [tools[0].schema], Answer, {"temperature": 0}) == key  # pyright: ignore[reportPrivateUsage]
+
+
+VOCABULARY = ["weather", "seattle", "paris", "today", "tomorrow", "please", "what", "is", "the", "in"]
+
+
+async def bag_of_words_embedding(text: str) -> List[float]:
+    words = re.findall(r"\w+", text.lower())
+    return [float(words.count(word)) for word in VOCABULARY]
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_create() -> None:
+    replay_client = ReplayChatCompletionClient(["response 0", "response 1", "response 2", "response 3"])
+    replay_client.set_cached_bool_value(False)
+    semantic_cache = SemanticCache(bag_of_words_embedding, similarity_threshold=0.9)
+    cached_client = ChatCompletionCache(replay_client, semantic_cache=semantic_cache)
+    system_prompt = SystemMessage(content="This is a system prompt")
+
+    response0 = await cached_client.create(
+        [system_prompt, UserMessage(content="What is the weather in Seattle today?", source="user")]
+    )
+    assert not response0.cached
+    assert len(semantic_cache) == 1
+
+    # Differs only in whitespace and punctuation.
+    similar = await cached_client.create(
+        [system_prompt, UserMessage(content="what is the   weather in seattle today", source="user")]
+    )
+    assert similar.cached
+    assert similar.content == "response 0"
+    assert not response0.cached
+
+    # Not similar enough.
+    response1 = await cached_client.create(
+        [system_prompt, UserMessage(content="What is the weather in Paris tomorrow?", source="user")]
+    )
+    assert not response1.cached
+    assert response1.content == "response 1"
+
+    # The other messages must be identical.
+    response2 = await cached_client.create(
+        [
+            SystemMessage(content="Another system prompt"),
+            UserMessage(content="What is the weather in Seattle today?", source="user"),
+        ]
+    )
+    assert not response2.cached
+    assert response2.content == "response 2"
+
+    # Exact matches do not use the semantic cache.
+    exact = await cached_client.create(
+        [system_prompt, UserMessage(content="What is the weather in Seattle today?", source="user")]
+    )
+    assert exact.cached
+    assert semantic_cache.stats.hits == 1
+    assert semantic_cache.stats.misses == 3
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_create_stream() -> None:
+    replay_client = ReplayChatCompletionClient(["response 0", "response 1"])
+    replay_client.set_cached_bool_value(False)
+    semantic_cache = SemanticCache(bag_of_words_embedding, similarity_threshold=0.9)
+    cached_client = ChatCompletionCache(replay_client, semantic_cache=semantic_cache)
+
+    original = [
+        result
+        async for result in cached_client.create_stream(
+            [UserMessage(content="What is the weather in Seattle today?", source="user")]
+        )
+    ]
+    similar = [
+        result
+        async for result in cached_client.create_stream(
+            [UserMessage(content="What is the weather in Seattle today, please?", source="user")]
+        )
+    ]
+    assert len(similar) == len(original)
+    assert isinstance(similar[-1], CreateResult) and similar[-1].cached
+    assert isinstance(original[-1], CreateResult) and similar[-1].content == original[-1].content
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_ttl_eviction_and_persistence(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    now = 1000.0
+    monkeypatch.setattr("autogen_ext.models.cache.semantic.time.time", lambda: now)
+    path = tmp_path / "semantic_cache.npz"
+    semantic_cache = SemanticCache(bag_of_words_embedding, similarity_threshold=0.9, max_entries=2, ttl=60, path=path)
+
+    seattle = await semantic_cache.embed("weather seattle")
+    paris = await semantic_cache.embed("weather paris")
+    today = await semantic_cache.embed("weather today")
+    semantic_cache.add("partition", seattle, "seattle")
+    now += 10
+    semantic_cache.add("partition", paris, "paris")
+    now += 5
+    assert semantic_cache.search("partition", seattle) == "seattle"
+    assert semantic_cache.search("other", seattle) is None
+
+    # The least recently used entry is evicted.
+    now += 5
+    semantic_cache.add("partition", today, "today")
+    assert len(semantic_cache) == 2
+    assert semantic_cache.stats.evictions == 1
+    assert semantic_cache.search("partition", paris) is None
+    assert semantic_cache.search("partition", seattle) == "seattle"
+
+    semantic_cache.save()
+    loaded = SemanticCache(bag_of_words_embedding, similarity_threshold=0.9, ttl=60, path=path)
+    assert len(loaded) == 2
+    assert loaded.search("partition", today) == "today"
+
+    # Entries expire after the time-to-live.
+    now += 45
+    assert loaded.search("partition", seattle) is None
+    assert loaded.search("partition", today) == "today"
+    assert loaded.stats.expirations == 1
+
+
+def test_semantic_cache_many_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = itertools.count()
+    monkeypatch.setattr("autogen_ext.models.cache.semantic.time.time", lambda: float(next(clock)))
+
+    async def embed(text: str) -> List[float]:
+        return []
+
+    semantic_cache = SemanticCache(embed, similarity_threshold=0.99, max_entries=50)
+    vectors = np.eye(64, dtype=np.float32)
+    for i in range(64):
+        semantic_cache.add(f"partition {i % 2}", vectors[i], f"key {i}")
+    semantic_cache.add("partition 1", vectors[63], "key 63")
+    semantic_cache.remove("key 20")
+    # The 14 least recently used entries were evicted, then one entry was removed.
+    assert len(semantic_cache) == 49
+    assert semantic_cache.stats.evictions == 14
+    for i in range(64):
+        expected = f"key {i}" if i >= 14 and i != 20 else None
+        assert semantic_cache.search(f"partition {i % 2}", vectors[i]) == expected
+        assert semantic_cache.search(f"partition {(i + 1) % 2}", vectors[i]) is None
+
+
+@pytest.mark.asyncio
+async def test_cache_create_stream_cancelled_before_reading() -> None:
+    replay_client = GatedReplayChatCompletionClient(["response 0"])
+    cached_client = ChatCompletionCache(replay_client)
+    messages: List[LLMMessage] = [UserMessage(content="prompt", source="user")]
+
+    async def consume() -> None:
+        async for _ in cached_client.create_stream(messages):
+            pass
+
+    # Cancel the only caller before the original stream has been read from.
+    task = asyncio.create_task(consume())
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert cached_client._inflight_streams == {}  # pyright: ignore[reportPrivateUsage]
+
+    replay_client.gate.set()
+    results = await _collect(cached_client.create_stream(messages))
+    assert isinstance(results[-1], CreateResult) and results[-1].content == "response 0"
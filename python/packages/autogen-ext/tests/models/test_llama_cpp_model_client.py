@@ -1,26 +1,25 @@
+import asyncio
 import contextlib
 import sys
+import threading
+import time
 from typing import TYPE_CHECKING, Any, ContextManager, Generator, List, Sequence, Union
 
 import pytest
-import torch
 
 # from autogen_agentchat.agents import AssistantAgent
 # from autogen_agentchat.messages import TextMessage
-# from autogen_core import CancellationToken
-from autogen_core.models import RequestUsage, SystemMessage, UserMessage
-from llama_cpp import ChatCompletionRequestResponseFormat
-from pydantic import BaseModel
+from autogen_core import CancellationToken
+from autogen_core.models import CreateResult, RequestUsage, SystemMessage, UserMessage
 
 # from autogen_core.tools import FunctionTool
-try:
-    from llama_cpp import ChatCompletionMessageToolCalls
+from pydantic import BaseModel
 
-    if TYPE_CHECKING:
-        from autogen_ext.models.llama_cpp._llama_cpp_completion_client import LlamaCppChatCompletionClient
-except ImportError:
-    # If llama_cpp is not installed, we can't run the tests.
-    pytest.skip("Skipping LlamaCppChatCompletionClient tests: llama-cpp-python not installed", allow_module_level=True)
+torch = pytest.importorskip("torch")
+llama_cpp = pytest.importorskip("llama_cpp", reason="llama-cpp-python not installed")
+
+if TYPE_CHECKING:
+    from autogen_ext.models.llama_cpp._llama_cpp_completion_client import LlamaCppChatCompletionClient
 
 
 class AgentResponse(BaseModel):
@@ -40,6 +39,21 @@ def __init__(
         self.model_path = model_path
         self.n_ctx = lambda: 1024
         self._structured_response = AgentResponse(thoughts="Test thoughts", content="Test content")
+        self.n_tokens = 0
+        self.cache: Any = None
+        self.running = 0
+        self.max_running = 0
+        self.threads: List[str] = []
+        self.closed = False
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        # The model must not be closed while it is generating.
+        assert self.running == 0
+        self.closed = True
+
+    def set_cache(self, cache: Any) -> None:
+        self.cache = cache
 
     # Added tokenize method for testing purposes.
     def tokenize(self, b: bytes) -> list[int]:
@@ -48,12 +62,23 @@ def tokenize(self, b: bytes) -> list[int]:
     def create_chat_completion(
         self,
         messages: Any,
-        tools: List[ChatCompletionMessageToolCalls] | None,
+        tools: List[llama_cpp.ChatCompletionMessageToolCalls] | None,
         stream: bool = False,
-        response_format: ChatCompletionRequestResponseFormat | None = None,
-    ) -> dict[str, Any]:
-        # Return fake non-streaming response.
+        response_format: llama_cpp.ChatCompletionRequestResponseFormat | None = None,
+        delay: float = 0.0,
+    ) -> Any:
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            self.threads.append(threading.current_thread().name)
+        time.sleep(delay)
+        with self._lock:
+            self.running -= 1
+
+        if stream:
+            return self._stream()
 
+        # Return fake non-streaming response.
         if response_format is not None:
             assert self._structured_response is not None
             # If response_format is provided, return a different format.
@@ -67,6 +92,14 @@ def create_chat_completion(
             "choices": [{"message": {"content": "Fake response"}}],
         }
 
+    def _stream(self) -> Generator[dict[str, Any], None, None]:
+        # Yield fake streaming chunks, one token each.
+        self.n_tokens = 5
+        yield {"choices": [{"index": 0, "delta": {"role": "assistant"}, "finish_reason": None}]}
+        yield {"choices": [{"index": 0, "delta": {"content": "Hello "}, "finish_reason": None}]}
+        yield {"choices": [{"index": 0, "delta": {"content": "World"}, "finish_reason": None}]}
+        yield {"choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}
+
     def __call__(self, prompt: str, stream: bool = True) -> Generator[dict[str, Any], None, None]:
         # Yield fake streaming tokens.
         yield {"choices": [{"text": "Hello "}]}
@@ -119,21 +152,93 @@ async def test_llama_cpp_create_structured_output(
         assert AgentResponse.model_validate_json(result.content).content == "Test content"
 
 
-# Commmented out due to raising not implemented error will leave in case streaming is supported in the future.
-# @pytest.mark.asyncio
-# async def test_llama_cpp_create_stream(
-#     get_completion_client: "ContextManager[type[LlamaCppChatCompletionClient]]",
-# ) -> None:
-#     with get_completion_client as Client:
-#         client = Client(filename="dummy")
-#         messages: Sequence[Union[SystemMessage, UserMessage]] = [
-#             SystemMessage(content="Test system"),
-#             UserMessage(content="Test user", source="user"),
-#         ]
-#         collected = ""
-#         async for token in client.create_stream(messages=messages):
-#             collected += token
-#         assert collected == "Hello World"
+@pytest.mark.asyncio
+async def test_llama_cpp_create_stream(
+    get_completion_client: "ContextManager[type[LlamaCppChatCompletionClient]]",
+) -> None:
+    with get_completion_client as Client:
+        client = Client(model_path="dummy")
+        messages: Sequence[Union[SystemMessage, UserMessage]] = [
+            SystemMessage(content="Test system"),
+            UserMessage(content="Test user", source="user"),
+        ]
+        collected = ""
+        result: CreateResult | None = None
+        async for token in client.create_stream(messages=messages):
+            if isinstance(token, CreateResult):
+                result = token
+            else:
+                collected += token
+        assert collected == "Hello World"
+        assert result is not None
+        assert result.content == "Hello World"
+        assert result.finish_reason == "stop"
+        assert result.usage == RequestUsage(prompt_tokens=3, completion_tokens=2)
+        assert client.total_usage() == RequestUsage(prompt_tokens=3, completion_tokens=2)
+
+
+@pytest.mark.asyncio
+async def test_llama_cpp_requests_are_serialized(
+    get_completion_client: "ContextManager[type[LlamaCppChatCompletionClient]]",
+) -> None:
+    with get_completion_client as Client:
+        client = Client(model_path="dummy")
+        messages = [UserMessage(content="Test user", source="user")]
+
+        async def _stream() -> None:
+            async for _ in client.create_stream(messages=messages, extra_create_args={"delay": 0.05}):
+                pass
+
+        await asyncio.gather(
+            *[client.create(messages=messages, extra_create_args={"delay": 0.05}) for _ in range(3)],
+            _stream(),
+        )
+        llm: Any = client.llm
+        assert llm.max_running == 1
+        assert all(thread.startswith("llama_cpp") for thread in llm.threads)
+
+        # A cancelled request that is still waiting in the queue is not run.
+        token = CancellationToken()
+        running = asyncio.ensure_future(client.create(messages=messages, extra_create_args={"delay": 0.05}))
+        waiting = asyncio.ensure_future(client.create(messages=messages, cancellation_token=token))
+        await asyncio.sleep(0.01)
+        token.cancel()
+        await running
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        assert len(llm.threads) == 5
+
+        # Closing waits for the running request without blocking the event loop, and drops the queued ones.
+        running = asyncio.ensure_future(client.create(messages=messages, extra_create_args={"delay": 0.2}))
+        queued = asyncio.ensure_future(client.create(messages=messages))
+        await asyncio.sleep(0.01)
+        ticks = 0
+
+        async def _tick() -> None:
+            nonlocal ticks
+            while not llm.closed:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(client.close(), _tick())
+        assert ticks > 5
+        assert llm.closed
+        await running
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        assert len(llm.threads) == 6
+
+
+@pytest.mark.asyncio
+async def test_llama_cpp_prompt_cache(
+    get_completion_client: "ContextManager[type[LlamaCppChatCompletionClient]]",
+) -> None:
+    with get_completion_client as Client:
+        cache = llama_cpp.LlamaRAMCache(capacity_bytes=1 << 20)
+        client = Client(model_path="dummy", prompt_cache=cache)
+        llm: Any = client.llm
+        assert llm.cache is cache
+        assert Client(model_path="dummy").llm.cache is None
 
 
 @pytest.mark.asyncio
@@ -2,6 +2,7 @@
 import json
 import logging
 import os
+import pickle
 from typing import Annotated, Any, AsyncGenerator, Dict, List, Literal, Tuple, TypeVar
 from unittest.mock import MagicMock
 
@@ -25,6 +26,7 @@
 from autogen_ext.models.openai._model_info import resolve_model
 from autogen_ext.models.openai._openai_client import (
     BaseOpenAIChatCompletionClient,
+    _count_message_tokens,  # pyright: ignore[reportPrivateUsage]
     calculate_vision_tokens,
     convert_tools,
     to_oai_type,
@@ -406,6 +408,66 @@ def tool2(test1: int, test2: List[int]) -> str:
     remaining_tokens = client.remaining_tokens(messages, tools=tools)
     assert remaining_tokens
 
+    # Token counts are additive over messages.
+    mockcalculate_vision_tokens.return_value = 85
+    num_tokens = client.count_tokens(messages, tools=tools)
+    base_num_tokens = client.count_tokens([], tools=tools)
+    assert num_tokens == base_num_tokens + sum(client.count_message_tokens(message) for message in messages)
+
+
+@pytest.mark.asyncio
+async def test_openai_chat_completion_client_token_count_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = OpenAIChatCompletionClient(model="gpt-4o", api_key="api_key", token_count_cache_size=2)
+    uncached_client = OpenAIChatCompletionClient(model="gpt-4o", api_key="api_key")
+    messages: List[LLMMessage] = [
+        SystemMessage(content="You are a helpful assistant."),
+        UserMessage(content="Hello", source="user"),
+        AssistantMessage(content="Hello, how can I help?", source="assistant"),
+    ]
+
+    def tool1(test: str, test2: str) -> str:
+        return test + test2
+
+    tools = [FunctionTool(tool1, description="example tool 1")]
+    expected_num_tokens = uncached_client.count_tokens(messages, tools=tools)
+    expected_message_tokens = [uncached_client.count_message_tokens(message) for message in messages]
+
+    count_message_tokens = MagicMock(wraps=_count_message_tokens)
+    monkeypatch.setattr("autogen_ext.models.openai._openai_client._count_message_tokens", count_message_tokens)
+
+    assert client.count_tokens(messages, tools=tools) == expected_num_tokens
+    assert count_message_tokens.call_count == 3
+    # The cache only holds the two most recently counted messages.
+    assert client.count_tokens(messages, tools=tools) == expected_num_tokens
+    assert count_message_tokens.call_count == 6
+    assert client.count_tokens(messages[1:], tools=tools) == expected_num_tokens - expected_message_tokens[0]
+    assert count_message_tokens.call_count == 6
+    # Equal messages share the cached count.
+    equal_message = AssistantMessage(content="Hello, how can I help?", source="assistant")
+    assert client.count_message_tokens(equal_message) == expected_message_tokens[2]
+    assert count_message_tokens.call_count == 6
+
+
+def test_openai_chat_completion_client_pickle_with_token_count_cache() -> None:
+    messages: List[LLMMessage] = [UserMessage(content="Hello", source="user")]
+    clients = [
+        OpenAIChatCompletionClient(model="gpt-4o", api_key="api_key", token_count_cache_size=2),
+        AzureOpenAIChatCompletionClient(
+            azure_deployment="gpt-4o-1",
+            model="gpt-4o",
+            api_key="api_key",
+            api_version="2020-08-04",
+            azure_endpoint="https://dummy.com",
+            token_count_cache_size=2,
+        ),
+    ]
+    for client in clients:
+        num_tokens = client.count_tokens(messages)
+        restored = pickle.loads(pickle.dumps(client))
+        # The restored client keeps the cached counts and can still count tokens.
+        assert restored.count_tokens(messages) == num_tokens
+        assert restored.count_tokens(messages + messages) > num_tokens
+
 
 @pytest.mark.parametrize(
     "mock_size, expected_num_tokens",
@@ -418,12 +480,9 @@ def tool2(test1: int, test2: List[int]) -> str:
     ],
 )
 def test_openai_count_image_tokens(mock_size: Tuple[int, int], expected_num_tokens: int) -> None:
-    # Step 1: Mock the Image class with only the 'image' attribute
-    mock_image_attr = MagicMock()
-    mock_image_attr.size = mock_size
-
+    # Step 1: Mock the Image class with only the 'size' attribute
     mock_image = MagicMock()
-    mock_image.image = mock_image_attr
+    mock_image.size = mock_size
 
     # Directly call calculate_vision_tokens and check the result
     calculated_tokens = calculate_vision_tokens(mock_image, detail="auto")
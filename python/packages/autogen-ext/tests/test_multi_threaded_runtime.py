@@ -0,0 +1,327 @@
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, List, Mapping
+
+import pytest
+from autogen_core import (
+    EVENT_LOGGER_NAME,
+    AgentId,
+    CancellationToken,
+    ClosureAgent,
+    ClosureContext,
+    DefaultTopicId,
+    MessageContext,
+    RoutedAgent,
+    SingleThreadedAgentRuntime,
+    TopicId,
+    TypeSubscription,
+    default_subscription,
+    message_handler,
+    try_get_known_serializers_for_type,
+)
+from autogen_core.logging import MessageEvent
+from autogen_ext.runtimes.multi_threaded import MultiThreadedAgentRuntime
+from autogen_test_utils import (
+    CascadingAgent,
+    CascadingMessageType,
+    LoopbackAgent,
+    LoopbackAgentWithDefaultSubscription,
+    MessageType,
+)
+
+
+@dataclass
+class Numbered:
+    value: int
+
+
+@default_subscription
+class RecordingAgent(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("Records messages and the threads that handled them.")
+        self.values: List[int] = []
+        self.threads: set[str] = set()
+
+    @message_handler
+    async def on_numbered(self, message: Numbered, ctx: MessageContext) -> int:
+        self.threads.add(threading.current_thread().name)
+        self.values.append(message.value)
+        # Yield so that out-of-order delivery would be observable.
+        await asyncio.sleep(0)
+        return message.value * 2
+
+    async def save_state(self) -> Mapping[str, Any]:
+        return {"values": list(self.values)}
+
+    async def load_state(self, state: Mapping[str, Any]) -> None:
+        self.values = list(state["values"])
+
+
+class FailingAgent(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("Always fails.")
+
+    @message_handler
+    async def on_numbered(self, message: Numbered, ctx: MessageContext) -> None:
+        raise ValueError("Test exception")
+
+
+class SlowAgent(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("Never finishes on its own.")
+        self.cancelled = asyncio.Event()
+
+    @message_handler
+    async def on_numbered(self, message: Numbered, ctx: MessageContext) -> None:
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            self.cancelled.set()
+            raise
+
+
+@pytest.mark.asyncio
+async def test_send_message_across_workers() -> None:
+    runtime = MultiThreadedAgentRuntime(num_workers=4)
+    await RecordingAgent.register(runtime, "recorder", RecordingAgent)
+    runtime.start()
+
+    results = await asyncio.gather(*[runtime.send_message(Numbered(i), AgentId("recorder", str(i))) for i in range(32)])
+    assert results == [i * 2 for i in range(32)]
+    await runtime.stop_when_idle()
+
+    threads: set[str] = set()
+    for i in range(32):
+        agent = await runtime.try_get_underlying_agent_instance(AgentId("recorder", str(i)), RecordingAgent)
+        assert agent.values == [i]
+        assert len(agent.threads) == 1
+        threads |= agent.threads
+    # Agents were spread over more than one worker thread.
+    assert len(threads) > 1
+    assert threading.current_thread().name not in threads
+
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_per_agent_ordering() -> None:
+    runtime = MultiThreadedAgentRuntime(num_workers=3)
+    await RecordingAgent.register(runtime, "recorder", RecordingAgent)
+    runtime.start()
+
+    for i in range(100):
+        await runtime.publish_message(Numbered(i), DefaultTopicId())
+    await runtime.stop_when_idle()
+
+    agent = await runtime.try_get_underlying_agent_instance(AgentId("recorder", "default"), RecordingAgent)
+    assert agent.values == list(range(100))
+
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_per_agent_ordering_across_topics_and_send() -> None:
+    runtime = MultiThreadedAgentRuntime(num_workers=4)
+    await RecordingAgent.register(runtime, "recorder", RecordingAgent)
+    for i in range(20):
+        await runtime.add_subscription(TypeSubscription(f"topic_{i}", "recorder"))
+    runtime.start()
+
+    for i in range(20):
+        await runtime.publish_message(Numbered(i), TopicId(f"topic_{i}", "default"))
+    await runtime.send_message(Numbered(100), AgentId("recorder", "default"))
+    await runtime.stop_when_idle()
+
+    agent = await runtime.try_get_underlying_agent_instance(AgentId("recorder", "default"), RecordingAgent)
+    assert agent.values == list(range(20)) + [100]
+
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_publish_cascade_stop_when_idle() -> None:
+    num_agents = 5
+    num_initial_messages = 5
+    max_rounds = 5
+    total_num_calls_expected = 0
+    for i in range(0, max_rounds):
+        total_num_calls_expected += num_initial_messages * ((num_agents - 1) ** i)
+
+    runtime = MultiThreadedAgentRuntime(num_workers=4)
+    for i in range(num_agents):
+        await CascadingAgent.register(runtime, f"name{i}", lambda: CascadingAgent(max_rounds))
+
+    runtime.start()
+    for _ in range(num_initial_messages):
+        await runtime.publish_message(CascadingMessageType(round=1), DefaultTopicId())
+    await runtime.stop_when_idle()
+
+    for i in range(num_agents):
+        agent = await runtime.try_get_underlying_agent_instance(AgentId(f"name{i}", "default"), CascadingAgent)
+        assert agent.num_calls == total_num_calls_expected
+
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_messages_before_start_are_delivered() -> None:
+    runtime = MultiThreadedAgentRuntime(num_workers=2)
+    await LoopbackAgent.register(runtime, "name", LoopbackAgent)
+    await runtime.add_subscription(TypeSubscription("default", "name"))
+
+    await runtime.publish_message(MessageType(), DefaultTopicId())
+    response = asyncio.create_task(runtime.send_message(MessageType(), AgentId("name", "other")))
+    await asyncio.sleep(0.05)
+    assert not response.done()
+
+    runtime.start()
+    assert isinstance(await response, MessageType)
+    await runtime.stop_when_idle()
+
+    default_agent = await runtime.try_get_underlying_agent_instance(AgentId("name", "default"), LoopbackAgent)
+    assert default_agent.num_calls == 1
+    other_agent = await runtime.try_get_underlying_agent_instance(AgentId("name", "other"), LoopbackAgent)
+    assert other_agent.num_calls == 1
+
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_send_message_exception_and_unknown_recipient() -> None:
+    runtime = MultiThreadedAgentRuntime(num_workers=2)
+    await FailingAgent.register(runtime, "failing", FailingAgent)
+    runtime.start()
+
+    with pytest.raises(ValueError, match="Test exception"):
+        await runtime.send_message(Numbered(1), AgentId("failing", "default"))
+    with pytest.raises(LookupError):
+        await runtime.send_message(Numbered(1), AgentId("unknown", "default"))
+
+    await runtime.stop_when_idle()
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_publish_exception_propagates() -> None:
+    runtime = MultiThreadedAgentRuntime(num_workers=2, ignore_unhandled_exceptions=False)
+    await FailingAgent.register(runtime, "failing", FailingAgent)
+    await runtime.add_subscription(TypeSubscription("default", "failing"))
+    runtime.start()
+
+    with pytest.raises(ValueError, match="Test exception"):
+        await runtime.publish_message(Numbered(1), DefaultTopicId())
+        await runtime.stop_when_idle()
+
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_stop_cancels_publish_handlers_without_error() -> None:
+    runtime = MultiThreadedAgentRuntime(num_workers=2, ignore_unhandled_exceptions=False)
+    await SlowAgent.register(runtime, "slow", SlowAgent)
+    await runtime.add_subscription(TypeSubscription("default", "slow"))
+    runtime.start()
+
+    await runtime.publish_message(Numbered(1), DefaultTopicId())
+    await asyncio.sleep(0.05)
+    # The cancellation of the in-flight handler is not an unhandled exception
+    await runtime.stop()
+
+    agent = await runtime.try_get_underlying_agent_instance(AgentId("slow", "default"), SlowAgent)
+    assert agent.cancelled.is_set()
+
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_send_message_cancellation() -> None:
+    runtime = MultiThreadedAgentRuntime(num_workers=2)
+    await SlowAgent.register(runtime, "slow", SlowAgent)
+    runtime.start()
+
+    token = CancellationToken()
+    response = asyncio.create_task(
+        runtime.send_message(Numbered(1), AgentId("slow", "default"), cancellation_token=token)
+    )
+    await asyncio.sleep(0.05)
+    token.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await response
+
+    await runtime.stop_when_idle()
+    agent = await runtime.try_get_underlying_agent_instance(AgentId("slow", "default"), SlowAgent)
+    assert agent.cancelled.is_set()
+
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_save_and_load_state() -> None:
+    runtime = MultiThreadedAgentRuntime(num_workers=3)
+    await RecordingAgent.register(runtime, "recorder", RecordingAgent)
+    runtime.start()
+    for i in range(6):
+        await runtime.send_message(Numbered(i), AgentId("recorder", str(i)))
+    state = await runtime.save_state()
+    await runtime.stop()
+    await runtime.close()
+
+    assert state == {f"recorder/{i}": {"values": [i]} for i in range(6)}
+
+    restored = MultiThreadedAgentRuntime(num_workers=2)
+    await RecordingAgent.register(restored, "recorder", RecordingAgent)
+    await restored.load_state(state)
+    assert await restored.save_state() == state
+    await restored.close()
+
+
+@pytest.mark.asyncio
+async def test_closure_agent_runs_on_registering_loop() -> None:
+    runtime = MultiThreadedAgentRuntime(num_workers=2)
+    await RecordingAgent.register(runtime, "recorder", RecordingAgent)
+    results: asyncio.Queue[int] = asyncio.Queue()
+    threads: set[str] = set()
+
+    async def collect(_agent: ClosureContext, message: Numbered, ctx: MessageContext) -> None:
+        threads.add(threading.current_thread().name)
+        await results.put(message.value)
+
+    await ClosureAgent.register_closure(
+        runtime,
+        "collector",
+        collect,
+        subscriptions=lambda: [TypeSubscription("results", "collector")],
+    )
+    runtime.start()
+    for i in range(5):
+        await runtime.publish_message(Numbered(i), TopicId("results", "default"))
+    assert [await asyncio.wait_for(results.get(), timeout=5) for _ in range(5)] == list(range(5))
+    assert threads == {threading.current_thread().name}
+
+    await runtime.stop_when_idle()
+    await runtime.close()
+
+
+async def _message_events(
+    runtime: SingleThreadedAgentRuntime | MultiThreadedAgentRuntime, caplog: pytest.LogCaptureFixture
+) -> List[str]:
+    runtime.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+    await LoopbackAgentWithDefaultSubscription.register(runtime, "name", LoopbackAgentWithDefaultSubscription)
+    caplog.clear()
+    with caplog.at_level(logging.INFO, logger=EVENT_LOGGER_NAME):
+        runtime.start()
+        await runtime.send_message(MessageType(), AgentId("name", "default"))
+        await runtime.publish_message(MessageType(), DefaultTopicId())
+        await runtime.stop_when_idle()
+    await runtime.close()
+    return [str(record.msg) for record in caplog.records if isinstance(record.msg, MessageEvent)]
+
+
+@pytest.mark.asyncio
+async def test_message_events_match_single_threaded_runtime(caplog: pytest.LogCaptureFixture) -> None:
+    expected = await _message_events(SingleThreadedAgentRuntime(), caplog)
+    assert len(expected) == 6
+    assert await _message_events(MultiThreadedAgentRuntime(num_workers=2), caplog) == expected
+    assert await _message_events(MultiThreadedAgentRuntime(num_workers=2, emit_message_events=False), caplog) == []
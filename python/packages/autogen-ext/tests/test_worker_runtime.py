@@ -17,10 +17,13 @@
     TypeSubscription,
     default_subscription,
     event,
+    rpc,
     try_get_known_serializers_for_type,
     type_subscription,
 )
 from autogen_ext.runtimes.grpc import GrpcWorkerAgentRuntime, GrpcWorkerAgentRuntimeHost
+from autogen_ext.runtimes.grpc._utils import get_message_or_batch
+from autogen_ext.runtimes.grpc.protos import agent_worker_pb2
 from autogen_test_utils import (
     CascadingAgent,
     CascadingMessageType,
@@ -406,7 +409,7 @@ async def test_disconnected_agent() -> None:
     # to some private properties. This needs to be updated once they are available publicly
 
     def get_current_subscriptions() -> List[Subscription]:
-        return host._servicer._subscription_manager._subscriptions  # type: ignore[reportPrivateUsage]
+        return list(host._servicer._subscription_manager.subscriptions)  # type: ignore[reportPrivateUsage]
 
     async def get_subscribed_recipients() -> List[AgentId]:
         return await host._servicer._subscription_manager.get_subscribed_recipients(DefaultTopicId())  # type: ignore[reportPrivateUsage]
@@ -577,6 +580,343 @@ async def test_grpc_max_message_size() -> None:
         await host.stop()
 
 
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_bounded_send_queue_and_inflight_limit() -> None:
+    host_address = "localhost:50062"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address)
+    host.start()
+
+    publisher = GrpcWorkerAgentRuntime(host_address=host_address, max_send_queue_size=2)
+    await publisher.start()
+    publisher.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+
+    subscriber = GrpcWorkerAgentRuntime(
+        host_address=host_address, max_recv_queue_size=2, max_inflight_per_agent_type={"name": 1}
+    )
+    await subscriber.start()
+    subscriber.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+    await subscriber.register_factory(
+        type=AgentType("name"), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+    )
+    await subscriber.add_subscription(TypeSubscription("default", "name"))
+
+    # With a bounded send queue the publisher waits for room in the queue.
+    for _ in range(10):
+        await publisher.publish_message(MessageType(), topic_id=TopicId("default", "default"))
+    response = await publisher.send_message(MessageType(), AgentId("name", "default"))
+    assert isinstance(response, MessageType)
+
+    await asyncio.sleep(1)
+    agent = await subscriber.try_get_underlying_agent_instance(AgentId("name", "default"), LoopbackAgent)
+    assert agent.num_calls == 11
+
+    await publisher.stop()
+    await subscriber.stop()
+    await host.stop()
+
+
+class GatedAgent(RoutedAgent):
+    def __init__(self, gate: asyncio.Event) -> None:
+        super().__init__("Waits for the gate to open before handling a message.")
+        self.gate = gate
+        self.num_calls = 0
+
+    @event
+    async def on_message(self, message: MessageType, ctx: MessageContext) -> None:
+        await self.gate.wait()
+        self.num_calls += 1
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_recv_queue_backpressure() -> None:
+    host_address = "localhost:50067"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address)
+    host.start()
+
+    publisher = GrpcWorkerAgentRuntime(host_address=host_address)
+    await publisher.start()
+    publisher.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+
+    gate = asyncio.Event()
+    subscriber = GrpcWorkerAgentRuntime(
+        host_address=host_address,
+        max_recv_queue_size=2,
+        max_concurrent_handlers=1,
+        max_inflight_per_agent_type={"gated": 1},
+    )
+    await subscriber.start()
+    subscriber.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+    await subscriber.register_factory(
+        type=AgentType("gated"), agent_factory=lambda: GatedAgent(gate), expected_class=GatedAgent
+    )
+    await subscriber.add_subscription(TypeSubscription("default", "gated"))
+
+    # Flood the slow agent: the runtime stops taking messages once as many are waiting for a handler as fit
+    # in the receive queue.
+    for _ in range(50):
+        await publisher.publish_message(MessageType(), topic_id=TopicId("default", "default"))
+    await asyncio.sleep(1)
+    assert subscriber._host_connection is not None  # type: ignore[reportPrivateUsage]
+    assert subscriber._host_connection.recv_queue_full  # type: ignore[reportPrivateUsage]
+    assert len(subscriber._background_tasks) <= 3  # type: ignore[reportPrivateUsage]
+
+    gate.set()
+    agent = await subscriber.try_get_underlying_agent_instance(AgentId("gated", "default"), GatedAgent)
+    for _ in range(50):
+        if agent.num_calls == 50:
+            break
+        await asyncio.sleep(0.1)
+    assert agent.num_calls == 50
+
+    await publisher.stop()
+    await subscriber.stop()
+    await host.stop()
+
+
+class GatedRpcAgent(RoutedAgent):
+    def __init__(self, gate: asyncio.Event) -> None:
+        super().__init__("Waits for the gate to open before responding to a request.")
+        self.gate = gate
+
+    @rpc
+    async def on_message(self, message: MessageType, ctx: MessageContext) -> MessageType:
+        await self.gate.wait()
+        return MessageType()
+
+
+class ForwardingAgent(RoutedAgent):
+    def __init__(self, recipient: AgentId) -> None:
+        super().__init__("Forwards each request to the recipient and returns its response.")
+        self.recipient = recipient
+
+    @rpc
+    async def on_message(self, message: MessageType, ctx: MessageContext) -> MessageType:
+        response: MessageType = await self.send_message(message, self.recipient)
+        return response
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_saturated_handlers_receive_remote_responses() -> None:
+    host_address = "localhost:50066"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address)
+    host.start()
+
+    gate = asyncio.Event()
+    remote = GrpcWorkerAgentRuntime(host_address=host_address)
+    await remote.start()
+    remote.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+    await remote.register_factory(
+        type=AgentType("remote"), agent_factory=lambda: GatedRpcAgent(gate), expected_class=GatedRpcAgent
+    )
+
+    # Every handler slot is held by a handler waiting for the remote worker, and more requests wait than fit in
+    # the receive queue.
+    forwarder = GrpcWorkerAgentRuntime(host_address=host_address, max_recv_queue_size=2, max_concurrent_handlers=2)
+    await forwarder.start()
+    forwarder.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+    await forwarder.register_factory(
+        type=AgentType("forwarder"),
+        agent_factory=lambda: ForwardingAgent(AgentId("remote", "default")),
+        expected_class=ForwardingAgent,
+    )
+
+    sender = GrpcWorkerAgentRuntime(host_address=host_address)
+    await sender.start()
+    sender.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+
+    requests = [
+        asyncio.create_task(sender.send_message(MessageType(), AgentId("forwarder", "default"))) for _ in range(6)
+    ]
+    await asyncio.sleep(1)
+    assert not any(request.done() for request in requests)
+
+    gate.set()
+    responses = await asyncio.wait_for(asyncio.gather(*requests), timeout=10)
+    assert all(isinstance(response, MessageType) for response in responses)
+
+    await sender.stop()
+    await forwarder.stop()
+    await remote.stop()
+    await host.stop()
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_load_balanced_agent_type() -> None:
+    host_address = "localhost:50063"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address, load_balance_agent_types=True)
+    host.start()
+
+    workers: List[GrpcWorkerAgentRuntime] = []
+    for _ in range(2):
+        worker = GrpcWorkerAgentRuntime(host_address=host_address)
+        await worker.start()
+        worker.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+        await worker.register_factory(
+            type=AgentType("name"), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+        )
+        await worker.add_subscription(TypeSubscription("default", "name"))
+        workers.append(worker)
+
+    sender = GrpcWorkerAgentRuntime(host_address=host_address)
+    await sender.start()
+    sender.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+
+    # Keys may contain the characters used in the string form of agent ids.
+    keys = [f"key{i}" for i in range(20)] + ["a,b", "c,name/d"]
+    for key in keys:
+        await sender.send_message(MessageType(), AgentId("name", key))
+        await sender.publish_message(MessageType(), topic_id=TopicId("default", key))
+    await asyncio.sleep(1)
+
+    async def calls_per_worker(key: str) -> List[int]:
+        calls: List[int] = []
+        for worker in workers:
+            if AgentId("name", key) in worker._instantiated_agents:  # type: ignore[reportPrivateUsage]
+                agent = await worker.try_get_underlying_agent_instance(AgentId("name", key), LoopbackAgent)
+                calls.append(agent.num_calls)
+            else:
+                calls.append(0)
+        return calls
+
+    # Each agent lives on exactly one worker, and both workers serve some of the agents.
+    owners: List[int] = []
+    for key in keys:
+        calls = await calls_per_worker(key)
+        assert sorted(calls) == [0, 2]
+        owners.append(calls.index(2))
+    assert set(owners) == {0, 1}
+
+    # The keys of a disconnected worker are re-routed to the remaining worker.
+    await workers[1].stop()
+    await asyncio.sleep(0.5)
+    workers = workers[:1]
+    for key in keys:
+        await sender.send_message(MessageType(), AgentId("name", key))
+        await sender.publish_message(MessageType(), topic_id=TopicId("default", key))
+    await asyncio.sleep(1)
+    for key, owner in zip(keys, owners, strict=True):
+        assert await calls_per_worker(key) == [4 if owner == 0 else 2]
+
+    await sender.stop()
+    await workers[0].stop()
+    await host.stop()
+
+
+@pytest.mark.asyncio
+async def test_get_message_or_batch() -> None:
+    queue: asyncio.Queue[agent_worker_pb2.Message] = asyncio.Queue()
+    for i in range(5):
+        queue.put_nowait(agent_worker_pb2.Message(request=agent_worker_pb2.RpcRequest(request_id=str(i))))
+
+    # Queued messages are coalesced up to the batch size.
+    batch = await get_message_or_batch(queue, max_batch_size=3)
+    assert [message.request.request_id for message in batch.batch.messages] == ["0", "1", "2"]
+    batch = await get_message_or_batch(queue, max_batch_size=3)
+    assert [message.request.request_id for message in batch.batch.messages] == ["3", "4"]
+
+    # A single message is not wrapped in a batch.
+    queue.put_nowait(agent_worker_pb2.Message(request=agent_worker_pb2.RpcRequest(request_id="5")))
+    message = await get_message_or_batch(queue, max_batch_size=3)
+    assert message.WhichOneof("message") == "request"
+
+    # Messages that arrive within the batch window join the batch.
+    queue.put_nowait(agent_worker_pb2.Message(request=agent_worker_pb2.RpcRequest(request_id="6")))
+    asyncio.get_running_loop().call_later(
+        0.01, queue.put_nowait, agent_worker_pb2.Message(request=agent_worker_pb2.RpcRequest(request_id="7"))
+    )
+    batch = await get_message_or_batch(queue, max_batch_size=3, batch_window=0.1)
+    assert [message.request.request_id for message in batch.batch.messages] == ["6", "7"]
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_batched_messages() -> None:
+    host_address = "localhost:50064"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address)
+    host.start()
+
+    worker1 = GrpcWorkerAgentRuntime(host_address=host_address, max_batch_size=16, batch_window=0.001)
+    await worker1.start()
+    worker1.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+    # This worker does not batch, so the host must send it single messages.
+    worker2 = GrpcWorkerAgentRuntime(host_address=host_address)
+    await worker2.start()
+    worker2.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+    for worker, agent_type in [(worker1, "name1"), (worker2, "name2")]:
+        await worker.register_factory(
+            type=AgentType(agent_type), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+        )
+        await worker.add_subscription(TypeSubscription("default", agent_type))
+
+    for _ in range(50):
+        await worker1.publish_message(MessageType(), topic_id=TopicId("default", "default"))
+    responses = await asyncio.gather(
+        *[worker1.send_message(MessageType(), AgentId("name2", str(i))) for i in range(20)],
+        *[worker2.send_message(MessageType(), AgentId("name1", str(i))) for i in range(20)],
+    )
+    assert all(isinstance(response, MessageType) for response in responses)
+
+    await asyncio.sleep(1)
+    worker1_agent = await worker1.try_get_underlying_agent_instance(AgentId("name1", "default"), LoopbackAgent)
+    assert worker1_agent.num_calls == 50
+    worker2_agent = await worker2.try_get_underlying_agent_instance(AgentId("name2", "default"), LoopbackAgent)
+    assert worker2_agent.num_calls == 50
+
+    await worker1.stop()
+    await worker2.stop()
+    await host.stop()
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_publish_routes_follow_registrations_and_disconnects() -> None:
+    host_address = "localhost:50065"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address)
+    host.start()
+
+    async def start_worker(agent_type: str) -> GrpcWorkerAgentRuntime:
+        worker = GrpcWorkerAgentRuntime(host_address=host_address)
+        await worker.start()
+        worker.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+        await worker.register_factory(
+            type=AgentType(agent_type), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+        )
+        await worker.add_subscription(TypeSubscription("default", agent_type))
+        return worker
+
+    async def num_calls(worker: GrpcWorkerAgentRuntime, agent_type: str) -> int:
+        agent = await worker.try_get_underlying_agent_instance(AgentId(agent_type, "default"), LoopbackAgent)
+        return agent.num_calls
+
+    publisher = GrpcWorkerAgentRuntime(host_address=host_address)
+    await publisher.start()
+    publisher.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+    workers = [await start_worker(f"name{i}") for i in range(3)]
+
+    await publisher.publish_message(MessageType(), topic_id=TopicId("default", "default"))
+    await asyncio.sleep(0.5)
+    assert [await num_calls(worker, f"name{i}") for i, worker in enumerate(workers)] == [1, 1, 1]
+
+    # A disconnected worker no longer receives events, and the others are unaffected.
+    await workers[2].stop()
+    await asyncio.sleep(0.5)
+    # A worker that joins later receives events for the same topic.
+    late_worker = await start_worker("late")
+    await publisher.publish_message(MessageType(), topic_id=TopicId("default", "default"))
+    await asyncio.sleep(0.5)
+    assert [await num_calls(worker, f"name{i}") for i, worker in enumerate(workers[:2])] == [2, 2]
+    assert await num_calls(late_worker, "late") == 1
+
+    await publisher.stop()
+    for worker in [*workers[:2], late_worker]:
+        await worker.stop()
+    await host.stop()
+
+
 if __name__ == "__main__":
     os.environ["GRPC_VERBOSITY"] = "DEBUG"
     os.environ["GRPC_TRACE"] = "all"
@@ -33,6 +33,7 @@ def ui(
     database_uri: Optional[str] = None,
     auth_config: Optional[str] = None,
     upgrade_database: bool = False,
+    async_database: bool = False,
 ):
     """
     Run the AutoGen Studio UI.
@@ -47,6 +48,8 @@ def ui(
         database_uri (str, optional): Database URI to connect to. Defaults to None.
         auth_config (str, optional): Path to authentication configuration YAML. Defaults to None.
         upgrade_database (bool, optional): Whether to upgrade the database. Defaults to False.
+        async_database (bool, optional): Whether to serve the list and get routes with an async database driver.
+            Defaults to False.
     """
     # Write configuration
     env_vars = {
@@ -66,6 +69,8 @@ def ui(
         env_vars["AUTOGENSTUDIO_AUTH_CONFIG"] = auth_config
     if upgrade_database:
         env_vars["AUTOGENSTUDIO_UPGRADE_DATABASE"] = "1"
+    if async_database:
+        env_vars["AUTOGENSTUDIO_ASYNC_DATABASE"] = "1"
 
     # Create temporary env file to share configuration with uvicorn workers
     env_file_path = get_env_file_path()
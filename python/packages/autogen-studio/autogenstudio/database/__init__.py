@@ -1,5 +1,7 @@
+from .async_db_manager import AsyncDatabaseManager
 from .db_manager import DatabaseManager
 
 __all__ = [
+    "AsyncDatabaseManager",
     "DatabaseManager",
 ]
@@ -0,0 +1,243 @@
+import json
+from datetime import datetime
+from typing import Any, Optional, Sequence
+
+from loguru import logger
+from sqlalchemy import event, exc
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlmodel import and_, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from ..datamodel import BaseDBModel, Response
+from .db_manager import CustomJSONEncoder, build_page_statement, page_response
+
+# Async drivers used for the synchronous database URIs accepted by DatabaseManager
+_ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "psycopg",
+}
+
+
+def to_async_uri(engine_uri: str) -> str:
+    """Return the URI of the async driver for a database URI, e.g. sqlite+aiosqlite:/// for sqlite:///"""
+    url = make_url(engine_uri)
+    backend = url.get_backend_name()
+    if backend not in _ASYNC_DRIVERS:
+        raise ValueError(f"No async driver known for {backend} databases, use an async URI instead")
+    # Only an explicit driver is kept, the default driver of a backend may not be async
+    if "+" in url.drivername and url.get_driver_name() in ("aiosqlite", "asyncpg", "psycopg", "psycopg_async"):
+        return engine_uri
+    return url.set(drivername=f"{backend}+{_ASYNC_DRIVERS[backend]}").render_as_string(hide_password=False)
+
+
+class AsyncDatabaseManager:
+    def __init__(
+        self,
+        engine_uri: str,
+        pool_size: int = 10,
+        max_overflow: int = 20,
+        busy_timeout: int = 5000,
+    ) -> None:
+        """
+        Async alternative to DatabaseManager for use in async request handlers.
+        Queries run on a pool of connections without blocking the event loop.
+        Does not perform any database operations.
+
+        The schema is still created and migrated with DatabaseManager.initialize_database.
+
+        Args:
+            engine_uri: Database connection URI (e.g. sqlite:///db.sqlite3 or sqlite+aiosqlite:///db.sqlite3)
+            pool_size: Number of connections kept open in the pool
+            max_overflow: Number of connections opened beyond pool_size under load
+            busy_timeout: Milliseconds a SQLite connection waits for a lock held by another connection
+        """
+        self.engine_uri = to_async_uri(engine_uri)
+        self._is_sqlite = self.engine_uri.startswith("sqlite")
+
+        pool_args: dict[str, Any] = {}
+        if ":memory:" not in self.engine_uri and make_url(self.engine_uri).database:
+            pool_args = {"pool_size": pool_size, "max_overflow": max_overflow, "pool_pre_ping": True}
+
+        self.engine: AsyncEngine = create_async_engine(
+            self.engine_uri,
+            json_serializer=lambda obj: json.dumps(obj, cls=CustomJSONEncoder),
+            **pool_args,
+        )
+        if self._is_sqlite:
+            # WAL lets readers proceed while a writer holds the lock, so pooled connections do not serialize
+            @event.listens_for(self.engine.sync_engine, "connect")
+            def _set_sqlite_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+                cursor = dbapi_connection.cursor()
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+                cursor.execute("PRAGMA foreign_keys=ON")
+                cursor.execute(f"PRAGMA busy_timeout={int(busy_timeout)}")
+                cursor.close()
+
+        self.session_factory = async_sessionmaker(self.engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def upsert(self, model: BaseDBModel, return_json: bool = True) -> Response:
+        """Create or update an entity
+
+        Args:
+            model (SQLModel): The model instance to create or update
+            return_json (bool, optional): If True, returns the model as a dictionary.
+                If False, returns the SQLModel instance. Defaults to True.
+
+        Returns:
+            Response: Contains status, message and data (either dict or SQLModel based on return_json)
+        """
+        status = True
+        model_class = type(model)
+        existing_model = None
+
+        async with self.session_factory() as session:
+            try:
+                existing_model = (await session.exec(select(model_class).where(model_class.id == model.id))).first()
+                if existing_model:
+                    model.updated_at = datetime.now()
+                    for key, value in model.model_dump().items():
+                        setattr(existing_model, key, value)
+                    model = existing_model
+                session.add(model)
+                await session.commit()
+                await session.refresh(model)
+            except Exception as e:
+                await session.rollback()
+                logger.error("Error while updating/creating " + str(model_class.__name__) + ": " + str(e))
+                status = False
+
+        return Response(
+            message=(
+                f"{model_class.__name__} Updated Successfully"
+                if existing_model
+                else f"{model_class.__name__} Created Successfully"
+            ),
+            status=status,
+            data=model.model_dump() if return_json else model,
+        )
+
+    async def insert_many(self, models: Sequence[BaseDBModel]) -> Response:
+        """Insert new entities in a single transaction
+
+        Args:
+            models (Sequence[SQLModel]): The new model instances to insert
+
+        Returns:
+            Response: Contains status and message. Either all the entities are inserted or none.
+        """
+        async with self.session_factory() as session:
+            try:
+                session.add_all(models)
+                await session.commit()
+            except Exception as e:
+                await session.rollback()
+                logger.error(f"Error while inserting {len(models)} entities: {e}")
+                return Response(message=f"Error while inserting: {e}", status=False)
+
+        return Response(message=f"{len(models)} entities inserted successfully", status=True)
+
+    def _model_to_dict(self, model_obj: BaseDBModel) -> dict[str, Any]:
+        return {col.name: getattr(model_obj, col.name) for col in model_obj.__table__.columns}  # type: ignore
+
+    async def get(
+        self,
+        model_class: type[BaseDBModel],
+        filters: dict[str, Any] | None = None,
+        return_json: bool = False,
+        order: str = "desc",
+    ) -> Response:
+        """List entities"""
+        result: list[Any] = []
+        status = True
+        status_message = ""
+
+        async with self.session_factory() as session:
+            try:
+                statement = select(model_class)
+                if filters:
+                    conditions = [getattr(model_class, col) == value for col, value in filters.items()]
+                    statement = statement.where(and_(*conditions))
+
+                if hasattr(model_class, "created_at") and order:
+                    order_by_clause = getattr(model_class.created_at, order)()  # Dynamically apply asc/desc
+                    statement = statement.order_by(order_by_clause)
+
+                items = (await session.exec(statement)).all()
+                result = [self._model_to_dict(item) if return_json else item for item in items]
+                status_message = f"{model_class.__name__} Retrieved Successfully"
+            except Exception as e:
+                await session.rollback()
+                status = False
+                status_message = f"Error while fetching {model_class.__name__}"
+                logger.error("Error while getting items: " + str(model_class.__name__) + " " + str(e))
+
+        return Response(message=status_message, status=status, data=result)
+
+    async def get_page(
+        self,
+        model_class: type[BaseDBModel],
+        filters: dict[str, Any] | None = None,
+        cursor: Optional[int] = None,
+        limit: Optional[int] = None,
+        order: str = "asc",
+        exclude_json: bool = False,
+        return_json: bool = False,
+    ) -> Response:
+        """List a page of entities, ordered by id. See DatabaseManager.get_page"""
+        async with self.session_factory() as session:
+            try:
+                statement = build_page_statement(model_class, filters, cursor, limit, order, exclude_json)
+                rows = (await session.exec(statement)).all()
+                return page_response(model_class, rows, limit, exclude_json, return_json)
+            except Exception as e:
+                await session.rollback()
+                logger.error("Error while getting items: " + str(model_class.__name__) + " " + str(e))
+                return Response(message=f"Error while fetching {model_class.__name__}", status=False, data=None)
+
+    async def delete(self, model_class: type[BaseDBModel], filters: dict[str, Any] | None = None) -> Response:
+        """Delete an entity"""
+        status_message = ""
+        status = True
+
+        async with self.session_factory() as session:
+            try:
+                statement = select(model_class)
+                if filters:
+                    conditions = [getattr(model_class, col) == value for col, value in filters.items()]
+                    statement = statement.where(and_(*conditions))
+
+                rows = (await session.exec(statement)).all()
+
+                if rows:
+                    for row in rows:
+                        await session.delete(row)
+                    await session.commit()
+                    status_message = f"{model_class.__name__} Deleted Successfully"
+                else:
+                    status_message = "Row not found"
+                    logger.info(f"Row with filters {filters} not found")
+
+            except exc.IntegrityError as e:
+                await session.rollback()
+                status = False
+                status_message = f"Integrity error: The {model_class.__name__} is linked to another entity and cannot be deleted. {e}"
+                logger.error(status_message)
+            except Exception as e:
+                await session.rollback()
+                status = False
+                status_message = f"Error while deleting: {e}"
+                logger.error(status_message)
+
+        return Response(message=status_message, status=status, data=None)
+
+    async def close(self) -> None:
+        """Close the pooled connections"""
+        logger.info("Closing async database connections...")
+        try:
+            await self.engine.dispose()
+            logger.info("Async database connections closed successfully")
+        except Exception as e:
+            logger.error(f"Error closing async database connections: {str(e)}")
+            raise
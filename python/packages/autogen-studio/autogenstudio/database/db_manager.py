@@ -2,11 +2,12 @@
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Optional, Sequence, Union
 
 from loguru import logger
-from sqlalchemy import exc, inspect, text
-from sqlmodel import Session, SQLModel, and_, create_engine, select
+from sqlalchemy import JSON, exc, inspect, text
+from sqlalchemy import select as sa_select
+from sqlmodel import Session, SQLModel, and_, col, create_engine, select
 
 from ..datamodel import BaseDBModel, Response, Team
 from ..teammanager import TeamManager
@@ -20,6 +21,61 @@ def default(self, obj):
         return super().default(obj)
 
 
+def build_page_statement(
+    model_class: type[BaseDBModel],
+    filters: dict | None = None,
+    cursor: Optional[int] = None,
+    limit: Optional[int] = None,
+    order: str = "asc",
+    exclude_json: bool = False,
+) -> Any:
+    """Build the query of a page of entities for DatabaseManager.get_page"""
+    if order not in ("asc", "desc"):
+        raise ValueError(f"Invalid order {order}, expected 'asc' or 'desc'")
+    id_column = col(model_class.id)
+    if exclude_json:
+        columns = [col for col in model_class.__table__.columns if not isinstance(col.type, JSON)]  # type: ignore
+        statement = sa_select(*columns)
+    else:
+        statement = select(model_class)
+    if filters:
+        conditions = [
+            getattr(model_class, col).in_(value)
+            if isinstance(value, (list, tuple))
+            else getattr(model_class, col) == value
+            for col, value in filters.items()
+        ]
+        statement = statement.where(and_(*conditions))
+    if cursor is not None:
+        statement = statement.where(id_column > cursor if order == "asc" else id_column < cursor)
+    statement = statement.order_by(getattr(id_column, order)())
+    if limit is not None:
+        # One more than the page, to know whether there is a next page
+        statement = statement.limit(limit + 1)
+    return statement
+
+
+def page_response(
+    model_class: type[BaseDBModel], rows: Sequence[Any], limit: Optional[int], exclude_json: bool, return_json: bool
+) -> Response:
+    """Build the Response of DatabaseManager.get_page from the rows of its query"""
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = rows[-1].id
+    if exclude_json:
+        items = [dict(row._mapping) for row in rows]
+    else:
+        items = [
+            {col.name: getattr(row, col.name) for col in row.__table__.columns} if return_json else row for row in rows
+        ]
+    return Response(
+        message=f"{model_class.__name__} Retrieved Successfully",
+        status=True,
+        data={"items": items, "next_cursor": next_cursor},
+    )
+
+
 class DatabaseManager:
     _init_lock = threading.Lock()
 
@@ -32,7 +88,9 @@ def __init__(self, engine_uri: str, base_dir: Optional[Union[str, Path]] = None)
             engine_uri: Database connection URI (e.g. sqlite:///db.sqlite3)
             base_dir: Base directory for migration files. If None, uses current directory
         """
-        connection_args = {"check_same_thread": True} if "sqlite" in engine_uri else {}
+        # Connections are checked out by one thread at a time, but not always the thread that created them,
+        # e.g., the background message writer of the WebSocketManager.
+        connection_args = {"check_same_thread": False} if "sqlite" in engine_uri else {}
 
         if base_dir is not None and isinstance(base_dir, str):
             base_dir = Path(base_dir)
@@ -194,6 +252,26 @@ def upsert(self, model: BaseDBModel, return_json: bool = True) -> Response:
             data=model.model_dump() if return_json else model,
         )
 
+    def insert_many(self, models: Sequence[BaseDBModel]) -> Response:
+        """Insert new entities in a single transaction
+
+        Args:
+            models (Sequence[SQLModel]): The new model instances to insert
+
+        Returns:
+            Response: Contains status and message. Either all the entities are inserted or none.
+        """
+        with Session(self.engine, expire_on_commit=False) as session:
+            try:
+                session.add_all(models)
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                logger.error(f"Error while inserting {len(models)} entities: {e}")
+                return Response(message=f"Error while inserting: {e}", status=False)
+
+        return Response(message=f"{len(models)} entities inserted successfully", status=True)
+
     def _model_to_dict(self, model_obj):
         return {col.name: getattr(model_obj, col.name) for col in model_obj.__table__.columns}
 
@@ -231,6 +309,42 @@ def get(
 
             return Response(message=status_message, status=status, data=result)
 
+    def get_page(
+        self,
+        model_class: type[BaseDBModel],
+        filters: dict | None = None,
+        cursor: Optional[int] = None,
+        limit: Optional[int] = None,
+        order: str = "asc",
+        exclude_json: bool = False,
+        return_json: bool = False,
+    ) -> Response:
+        """List a page of entities, ordered by id
+
+        Args:
+            model_class: The model of the entities
+            filters: Column values to match. A list or tuple value matches any of its items.
+            cursor: Id of the last entity of the previous page. Starts from the first entity if None.
+            limit: Maximum number of entities in the page. Lists all the remaining entities if None.
+            order: "asc" or "desc" order of the ids
+            exclude_json: If True, leaves out the JSON columns (e.g. message configs) and returns
+                the entities as dictionaries
+            return_json: If True, returns the entities as dictionaries
+
+        Returns:
+            Response: Data is a dictionary with the "items" of the page and the "next_cursor"
+                of the next page, None on the last page
+        """
+        with Session(self.engine) as session:
+            try:
+                statement = build_page_statement(model_class, filters, cursor, limit, order, exclude_json)
+                rows = session.exec(statement).all()
+                return page_response(model_class, rows, limit, exclude_json, return_json)
+            except Exception as e:
+                session.rollback()
+                logger.error("Error while getting items: " + str(model_class.__name__) + " " + str(e))
+                return Response(message=f"Error while fetching {model_class.__name__}", status=False, data=None)
+
     def delete(self, model_class: type[BaseDBModel], filters: dict | None = None) -> Response:
         """Delete an entity"""
         status_message = ""
@@ -59,10 +59,13 @@ class Message(BaseDBModel, table=True):
     config: Union[MessageConfig, dict] = Field(
         default_factory=lambda: MessageConfig(source="", content=""), sa_column=Column(JSON)
     )
+    # Indexed, as messages are listed per run and per session
     session_id: Optional[int] = Field(
-        default=None, sa_column=Column(Integer, ForeignKey("session.id", ondelete="NO ACTION"))
+        default=None, sa_column=Column(Integer, ForeignKey("session.id", ondelete="NO ACTION"), index=True)
+    )
+    run_id: Optional[int] = Field(
+        default=None, sa_column=Column(Integer, ForeignKey("run.id", ondelete="CASCADE"), index=True)
     )
-    run_id: Optional[int] = Field(default=None, sa_column=Column(Integer, ForeignKey("run.id", ondelete="CASCADE")))
 
     message_meta: Optional[Union[MessageMeta, dict]] = Field(default={}, sa_column=Column(JSON))
 
@@ -94,7 +97,8 @@ class Run(BaseDBModel, table=True):
     __table_args__ = {"sqlite_autoincrement": True}
 
     session_id: Optional[int] = Field(
-        default=None, sa_column=Column(Integer, ForeignKey("session.id", ondelete="CASCADE"), nullable=False)
+        default=None,
+        sa_column=Column(Integer, ForeignKey("session.id", ondelete="CASCADE"), nullable=False, index=True),
     )
     status: RunStatus = Field(default=RunStatus.CREATED)
 
@@ -196,3 +200,7 @@ class EvalRunDB(BaseDBModel, table=True):
 
     # Additional metadata
     error_message: Optional[str] = None
+
+    # Sweep of the run and its position in the sweep, to resume the sweep
+    sweep_id: Optional[str] = Field(default=None, index=True)
+    sweep_key: Optional[str] = None
@@ -2,8 +2,9 @@
 import uuid
 from datetime import datetime
 from pdb import run
-from typing import Any, Dict, List, Optional, TypedDict, Union
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, TypedDict, Union
 
+from autogen_core import ComponentModel
 from loguru import logger
 from pydantic import BaseModel
 
@@ -34,6 +35,29 @@ class TabulatedResults(TypedDict):
     runs: List[RunEntry]
 
 
+class SweepResult(TypedDict):
+    sweep_id: str
+    # Run IDs of the sweep, by task then by runner
+    run_ids: List[List[str]]
+
+
+class _RateLimiter:
+    """Spaces out calls so that at most ``calls_per_minute`` start per minute."""
+
+    def __init__(self, calls_per_minute: float):
+        if calls_per_minute <= 0:
+            raise ValueError("calls_per_minute must be positive")
+        self._interval = 60.0 / calls_per_minute
+        self._next_time = 0.0
+
+    async def wait(self) -> None:
+        now = asyncio.get_running_loop().time()
+        delay = self._next_time - now
+        self._next_time = max(now, self._next_time) + self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
 class EvalOrchestrator:
     """
     Orchestrator for evaluation runs.
@@ -77,7 +101,7 @@ async def create_task(self, task: EvalTask) -> str:
 
         if self._db_manager:
             # Store in database
-            task_db = EvalTaskDB(name=task.name, description=task.description, config=task)
+            task_db = EvalTaskDB(name=task.name, description=task.description, config=task.model_dump(mode="json"))
             response = self._db_manager.upsert(task_db)
             if not response.status:
                 logger.error(f"Failed to store task: {response.message}")
@@ -515,6 +539,239 @@ async def cancel_run(self, run_id: str) -> bool:
             logger.error(f"Failed to cancel run {run_id}: {str(e)}")
             return False
 
+    # ----- Sweeps -----
+
+    async def run_sweep(
+        self,
+        tasks: Sequence[Union[str, EvalTask]],
+        runners: Sequence[Union[BaseEvalRunner, ComponentModel, Dict[str, Any]]],
+        judge: Union[BaseEvalJudge, ComponentModel, Dict[str, Any]],
+        criteria: List[Union[str, EvalJudgeCriteria]],
+        name: str = "",
+        sweep_id: Optional[str] = None,
+        max_concurrency: int = 8,
+        rate_limits: Optional[Dict[str, float]] = None,
+    ) -> SweepResult:
+        """
+        Evaluate every task with every runner, as one run per task and runner.
+
+        The runners and the judge are loaded once and shared by all the runs, so a runner
+        evaluates several tasks concurrently, e.g. TeamEvalRunner runs each task on a team of
+        its own. Runs execute concurrently, and each run is saved as soon as it completes, so that an interrupted
+        sweep can be resumed by calling this method again with its sweep ID and the same
+        tasks and runners, in the same order. Completed runs are not executed again.
+
+        Args:
+            tasks: The tasks to evaluate (IDs or task objects)
+            runners: The runners to evaluate the tasks with (runners or component configs)
+            judge: The judge scoring all the runs (judge or component config)
+            criteria: List of criteria to use for evaluation (IDs or criteria objects)
+            name: Name for the sweep, used in the run names
+            sweep_id: ID of a previous sweep to resume. A new sweep is started if None.
+            max_concurrency: Maximum number of runs executing at the same time
+            rate_limits: Maximum number of calls per minute, by runner or judge name, e.g. to
+                stay within the rate limit of the model behind a runner
+
+        Returns:
+            The sweep ID and the run IDs, by task then by runner
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        # Load the components once, they are shared by all the runs
+        runner_objs = [r if isinstance(r, BaseEvalRunner) else BaseEvalRunner.load_component(r) for r in runners]
+        judge_obj = judge if isinstance(judge, BaseEvalJudge) else BaseEvalJudge.load_component(judge)
+        limiters = {key: _RateLimiter(calls_per_minute) for key, calls_per_minute in (rate_limits or {}).items()}
+
+        task_objs: List[EvalTask] = []
+        for task in tasks:
+            task_obj = await self.get_task(task) if isinstance(task, str) else task
+            if not task_obj:
+                raise ValueError(f"Task not found: {task}")
+            task_objs.append(task_obj)
+
+        criteria_objs: List[EvalJudgeCriteria] = []
+        for criterion in criteria:
+            criterion_obj = await self.get_criteria(criterion) if isinstance(criterion, str) else criterion
+            if not criterion_obj:
+                raise ValueError(f"Criteria not found: {criterion}")
+            criteria_objs.append(criterion_obj)
+
+        sweep_id = sweep_id or str(uuid.uuid4())
+        run_ids, pending = await self._create_sweep_runs(
+            sweep_id, name, tasks, task_objs, runner_objs, judge_obj, criteria_objs
+        )
+        logger.info(f"Sweep {sweep_id}: {len(pending)} of {len(tasks) * len(runner_objs)} runs to execute")
+
+        # A fixed number of workers share the pending runs, instead of one asyncio task per run
+        pending_iter: Iterator[Tuple[str, int, int]] = iter(pending)
+
+        async def worker() -> None:
+            for run_id, task_index, runner_index in pending_iter:
+                await self._execute_sweep_run(
+                    run_id, task_objs[task_index], runner_objs[runner_index], judge_obj, criteria_objs, limiters
+                )
+
+        await asyncio.gather(*[worker() for _ in range(min(max_concurrency, len(pending)))])
+        return {"sweep_id": sweep_id, "run_ids": run_ids}
+
+    async def _create_sweep_runs(
+        self,
+        sweep_id: str,
+        name: str,
+        tasks: Sequence[Union[str, EvalTask]],
+        task_objs: List[EvalTask],
+        runners: List[BaseEvalRunner],
+        judge: BaseEvalJudge,
+        criteria: List[EvalJudgeCriteria],
+    ) -> Tuple[List[List[str]], List[Tuple[str, int, int]]]:
+        """
+        Create the runs of a sweep that do not exist yet.
+
+        Returns:
+            The run IDs by task then by runner, and the (run ID, task index, runner index)
+            of the runs that are not completed
+        """
+        # Runs saved by a previous attempt at the sweep, by their position in the sweep
+        existing: Dict[str, Tuple[str, Any, Optional[int]]] = {}
+        if self._db_manager:
+            response = self._db_manager.get(EvalRunDB, filters={"sweep_id": sweep_id}, return_json=True)
+            if not response.status:
+                raise RuntimeError(f"Failed to load sweep {sweep_id}: {response.message}")
+            for run_data in response.data or []:
+                existing[run_data["sweep_key"]] = (str(run_data["id"]), run_data["status"], run_data["task_id"])
+        else:
+            for run_id, run_config in self._runs.items():
+                if run_config.get("sweep_id") == sweep_id:
+                    existing[run_config["sweep_key"]] = (run_id, run_config["status"], None)
+
+        runner_configs = [runner.dump_component() for runner in runners]
+        judge_config = judge.dump_component()
+        criteria_configs = [c.model_dump() for c in criteria]
+
+        run_ids: List[List[str]] = []
+        pending: List[Tuple[str, int, int]] = []
+        new_runs: List[Tuple[EvalRunDB, int, int]] = []
+        for task_index, task in enumerate(tasks):
+            task_obj = task_objs[task_index]
+            run_ids.append([])
+            # The task row of the runs is stored once per task
+            task_id: Optional[int] = int(task) if isinstance(task, str) and task.isdigit() else None
+            for runner_index, runner in enumerate(runners):
+                sweep_key = f"{task_index}:{runner_index}"
+                if sweep_key in existing:
+                    run_id, status, existing_task_id = existing[sweep_key]
+                    task_id = task_id or existing_task_id
+                    run_ids[task_index].append(run_id)
+                    if status != EvalRunStatus.COMPLETED:
+                        pending.append((run_id, task_index, runner_index))
+                    continue
+
+                run_name = f"{name or 'Sweep'} - {task_obj.name or task_index} - {runner.name}"
+                if self._db_manager:
+                    if task_id is None:
+                        task_id = int(await self.create_task(task_obj))
+                    run_db = EvalRunDB(
+                        name=run_name,
+                        task_id=task_id,
+                        runner_config=runner_configs[runner_index].model_dump(),
+                        judge_config=judge_config.model_dump(),
+                        criteria_configs=criteria_configs,
+                        status=EvalRunStatus.PENDING,
+                        sweep_id=sweep_id,
+                        sweep_key=sweep_key,
+                    )
+                    new_runs.append((run_db, task_index, runner_index))
+                    run_ids[task_index].append("")
+                else:
+                    run_id = str(uuid.uuid4())
+                    self._runs[run_id] = {
+                        "task": task_obj,
+                        "runner_config": runner_configs[runner_index],
+                        "judge_config": judge_config,
+                        "criteria_configs": criteria_configs,
+                        "status": EvalRunStatus.PENDING,
+                        "created_at": datetime.now(),
+                        "run_result": None,
+                        "score_result": None,
+                        "name": run_name,
+                        "description": "",
+                        "sweep_id": sweep_id,
+                        "sweep_key": sweep_key,
+                    }
+                    run_ids[task_index].append(run_id)
+                    pending.append((run_id, task_index, runner_index))
+
+        if self._db_manager and new_runs:
+            # All the new runs are stored in one transaction
+            response = self._db_manager.insert_many([run_db for run_db, _, _ in new_runs])
+            if not response.status:
+                raise RuntimeError(f"Failed to store sweep runs: {response.message}")
+            for run_db, task_index, runner_index in new_runs:
+                run_ids[task_index][runner_index] = str(run_db.id)
+                pending.append((str(run_db.id), task_index, runner_index))
+
+        return run_ids, pending
+
+    async def _execute_sweep_run(
+        self,
+        run_id: str,
+        task: EvalTask,
+        runner: BaseEvalRunner,
+        judge: BaseEvalJudge,
+        criteria: List[EvalJudgeCriteria],
+        limiters: Dict[str, _RateLimiter],
+    ) -> None:
+        """
+        Execute a run of a sweep with loaded components, and save its outcome in one update.
+
+        Args:
+            run_id: The ID of the run
+            task: The task to evaluate
+            runner: The runner to use for evaluation
+            judge: The judge to use for evaluation
+            criteria: The criteria to use for evaluation
+            limiters: Rate limiters by runner or judge name
+        """
+        start_time = datetime.now()
+        try:
+            await self._update_run_fields(run_id, {"status": EvalRunStatus.RUNNING, "start_time": start_time})
+
+            if runner.name in limiters:
+                await limiters[runner.name].wait()
+            run_result = await runner.run(task)
+            if not run_result.status:
+                logger.error(f"Runner failed for run {run_id}: {run_result.error}")
+                await self._update_run_fields(
+                    run_id,
+                    {
+                        "status": EvalRunStatus.FAILED,
+                        "run_result": run_result,
+                        "error_message": run_result.error,
+                        "end_time": datetime.now(),
+                    },
+                )
+                return
+
+            if judge.name in limiters:
+                await limiters[judge.name].wait()
+            score_result = await judge.judge(task, run_result, criteria)
+
+            await self._update_run_fields(
+                run_id,
+                {
+                    "status": EvalRunStatus.COMPLETED,
+                    "run_result": run_result,
+                    "score_result": score_result,
+                    "end_time": datetime.now(),
+                },
+            )
+        except Exception as e:
+            logger.exception(f"Error executing run {run_id}: {str(e)}")
+            await self._update_run_fields(
+                run_id, {"status": EvalRunStatus.FAILED, "error_message": str(e), "end_time": datetime.now()}
+            )
+
     # ----- Helper Methods -----
 
     async def _get_run_config(self, run_id: str) -> Optional[Dict[str, Any]]:
@@ -529,7 +786,9 @@ async def _get_run_config(self, run_id: str) -> Optional[Dict[str, Any]]:
         """
         if self._db_manager:
             # Retrieve from database
-            response = self._db_manager.get(EvalRunDB, filters={"id": int(run_id) if run_id.isdigit() else run_id})
+            response = self._db_manager.get(
+                EvalRunDB, filters={"id": int(run_id) if run_id.isdigit() else run_id}, return_json=True
+            )
 
             if response.status and response.data and len(response.data) > 0:
                 run_data = response.data[0]
@@ -537,7 +796,9 @@ async def _get_run_config(self, run_id: str) -> Optional[Dict[str, Any]]:
                 # Get task
                 task = None
                 if run_data.get("task_id"):
-                    task_response = self._db_manager.get(EvalTaskDB, filters={"id": run_data.get("task_id")})
+                    task_response = self._db_manager.get(
+                        EvalTaskDB, filters={"id": run_data.get("task_id")}, return_json=True
+                    )
                     if task_response.status and task_response.data and len(task_response.data) > 0:
                         task_data = task_response.data[0]
                         task = (
@@ -589,6 +850,30 @@ async def _update_run_status(self, run_id: str, status: EvalRunStatus) -> None:
                 self._runs[run_id]["status"] = status
                 self._runs[run_id]["updated_at"] = datetime.now()
 
+    async def _update_run_fields(self, run_id: str, updates: Dict[str, Any]) -> None:
+        """
+        Update several fields of an evaluation run at once.
+
+        Args:
+            run_id: The ID of the run
+            updates: The new values, by field name
+        """
+        if self._db_manager:
+            # Update in database
+            response = self._db_manager.get(EvalRunDB, filters={"id": int(run_id) if run_id.isdigit() else run_id})
+
+            if response.status and response.data and len(response.data) > 0:
+                run_db = response.data[0]
+                for key, value in updates.items():
+                    setattr(run_db, key, value.model_dump(mode="json") if isinstance(value, BaseModel) else value)
+                run_db.updated_at = datetime.now()
+                self._db_manager.upsert(run_db)
+        else:
+            # Update in memory
+            if run_id in self._runs:
+                self._runs[run_id].update(updates)
+                self._runs[run_id]["updated_at"] = datetime.now()
+
     async def _update_run_result(self, run_id: str, run_result: EvalRunResult) -> None:
         """
         Update the result of an evaluation run.
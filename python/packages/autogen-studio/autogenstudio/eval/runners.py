@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, Optional, Sequence, Type, Union
+from typing import Any, Dict, List, Optional, Sequence, Type, Union
 
 from autogen_agentchat.base import TaskResult, Team
 from autogen_agentchat.messages import ChatMessage, MultiModalMessage, TextMessage
@@ -138,6 +138,8 @@ class TeamEvalRunner(BaseEvalRunner, Component[TeamEvalRunnerConfig]):
     """Evaluation runner that uses a team of agents to process tasks.
 
     This runner creates and runs a team based on a team configuration.
+    Each task runs on a team of its own, reset after the task, so the runner can
+    evaluate several tasks concurrently. The teams are reused across tasks.
     """
 
     component_config_schema = TeamEvalRunnerConfig
@@ -153,12 +155,28 @@ def __init__(
     ):
         super().__init__(name, description, metadata)
         self._team = team if isinstance(team, Team) else Team.load_component(team)
+        # Teams that are not running a task, more are loaded from the config when they are all busy
+        self._idle_teams: List[Team] = [self._team]
+
+    def _acquire_team(self) -> Team:
+        if self._idle_teams:
+            return self._idle_teams.pop()
+        return Team.load_component(self._team.dump_component())
+
+    async def _release_team(self, team: Team) -> None:
+        try:
+            await team.reset()
+        except Exception:
+            # A team that cannot be reset is not reused
+            return
+        self._idle_teams.append(team)
 
     async def run(self, task: EvalTask, cancellation_token: Optional[CancellationToken] = None) -> EvalRunResult:
         """Run the task with the team and return the result."""
         # Create initial result object
         result = EvalRunResult()
 
+        team = self._acquire_team()
         try:
             team_task: Sequence[ChatMessage] = []
             if isinstance(task.input, str):
@@ -171,12 +189,14 @@ async def run(self, task: EvalTask, cancellation_token: Optional[CancellationTok
                         team_task.append(MultiModalMessage(source="user", content=[message]))
 
             # Run task with team
-            team_result = await self._team.run(task=team_task, cancellation_token=cancellation_token)
+            team_result = await team.run(task=team_task, cancellation_token=cancellation_token)
 
             result = EvalRunResult(result=team_result, status=True, start_time=datetime.now(), end_time=datetime.now())
 
         except Exception as e:
             result = EvalRunResult(status=False, error=str(e), end_time=datetime.now())
+        finally:
+            await self._release_team(team)
 
         return result
 
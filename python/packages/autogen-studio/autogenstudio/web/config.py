@@ -11,6 +11,7 @@ class Settings(BaseSettings):
     CONFIG_DIR: str = "configs"  # Default config directory relative to app_root
     DEFAULT_USER_ID: str = "guestuser@gmail.com"
     UPGRADE_DATABASE: bool = False
+    ASYNC_DATABASE: bool = False  # Serve the list and get routes with AsyncDatabaseManager
 
     model_config = {"env_prefix": "AUTOGENSTUDIO_"}
 
@@ -3,11 +3,13 @@
 import os
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional, Union
 
 from fastapi import Depends, FastAPI, HTTPException, Request, WebSocket, status
 
-from ..database import DatabaseManager
+from ..database import AsyncDatabaseManager, DatabaseManager
+from ..datamodel import Response
+from ..datamodel.db import BaseDBModel
 from ..teammanager import TeamManager
 from .auth import AuthConfig, AuthManager, AuthMiddleware
 from .auth.dependencies import get_auth_manager
@@ -18,6 +20,7 @@
 
 # Global manager instances
 _db_manager: Optional[DatabaseManager] = None
+_async_db_manager: Optional[AsyncDatabaseManager] = None
 _websocket_manager: Optional[WebSocketManager] = None
 _team_manager: Optional[TeamManager] = None
 _auth_manager: Optional[AuthManager] = None
@@ -49,6 +52,36 @@ async def get_db() -> DatabaseManager:
     return _db_manager
 
 
+class SyncReadDatabase:
+    """Awaitable get and get_page of a DatabaseManager, used by the read routes when the async database is disabled"""
+
+    def __init__(self, db_manager: DatabaseManager) -> None:
+        self._db_manager = db_manager
+
+    async def get(
+        self,
+        model_class: type[BaseDBModel],
+        filters: dict[str, Any] | None = None,
+        return_json: bool = False,
+        order: str = "desc",
+    ) -> Response:
+        response: Response = self._db_manager.get(model_class, filters=filters, return_json=return_json, order=order)
+        return response
+
+    async def get_page(self, model_class: type[BaseDBModel], **kwargs: Any) -> Response:
+        return self._db_manager.get_page(model_class, **kwargs)
+
+
+async def get_read_db() -> Union[AsyncDatabaseManager, SyncReadDatabase]:
+    """Dependency provider for the database of the list and get routes.
+
+    The async database manager when AUTOGENSTUDIO_ASYNC_DATABASE is set, so that queries do not block the event loop.
+    """
+    if _async_db_manager:
+        return _async_db_manager
+    return SyncReadDatabase(await get_db())
+
+
 async def get_websocket_manager() -> WebSocketManager:
     """Dependency provider for connection manager"""
     if not _websocket_manager:
@@ -118,7 +151,7 @@ async def register_auth_dependencies(app: FastAPI, auth_manager: AuthManager) ->
 
 async def init_managers(database_uri: str, config_dir: str | Path, app_root: str | Path) -> None:
     """Initialize all manager instances"""
-    global _db_manager, _websocket_manager, _team_manager
+    global _db_manager, _async_db_manager, _websocket_manager, _team_manager
 
     logger.info("Initializing managers...")
 
@@ -127,6 +160,11 @@ async def init_managers(database_uri: str, config_dir: str | Path, app_root: str
         _db_manager = DatabaseManager(engine_uri=database_uri, base_dir=app_root)
         _db_manager.initialize_database(auto_upgrade=settings.UPGRADE_DATABASE)
 
+        if settings.ASYNC_DATABASE:
+            # Uses the schema created by the sync manager
+            _async_db_manager = AsyncDatabaseManager(engine_uri=database_uri)
+            logger.info("Async database manager initialized")
+
         # init default team config
         await _db_manager.import_teams_from_directory(config_dir, settings.DEFAULT_USER_ID, check_exists=True)
 
@@ -146,7 +184,7 @@ async def init_managers(database_uri: str, config_dir: str | Path, app_root: str
 
 async def cleanup_managers() -> None:
     """Cleanup and shutdown all manager instances"""
-    global _db_manager, _websocket_manager, _team_manager, _auth_manager
+    global _db_manager, _async_db_manager, _websocket_manager, _team_manager, _auth_manager
 
     logger.info("Cleaning up managers...")
 
@@ -164,7 +202,15 @@ async def cleanup_managers() -> None:
 
     _auth_manager = None
 
-    # Cleanup database manager last
+    # Cleanup database managers last
+    if _async_db_manager:
+        try:
+            await _async_db_manager.close()
+        except Exception as e:
+            logger.error(f"Error cleaning up async database manager: {str(e)}")
+        finally:
+            _async_db_manager = None
+
     if _db_manager:
         try:
             await _db_manager.close()
@@ -183,6 +229,7 @@ def get_manager_status() -> dict:
     """Get the initialization status of all managers"""
     return {
         "database_manager": _db_manager is not None,
+        "async_database_manager": _async_db_manager is not None,
         "websocket_manager": _websocket_manager is not None,
         "team_manager": _team_manager is not None,
         "auth_manager": _auth_manager is not None,
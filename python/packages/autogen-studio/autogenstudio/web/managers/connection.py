@@ -33,6 +33,7 @@
     TeamResult,
 )
 from ...teammanager import TeamManager
+from .message_writer import MessageWriter
 from .run_context import RunContext
 
 logger = logging.getLogger(__name__)
@@ -48,6 +49,10 @@ def __init__(self, db_manager: DatabaseManager):
         # Track explicitly closed connections
         self._closed_connections: set[int] = set()
         self._input_responses: Dict[int, asyncio.Queue] = {}
+        # Run rows of the active runs, read once per run
+        self._runs: Dict[int, Run] = {}
+        # Streamed messages are persisted in batches in the background
+        self._message_writer = MessageWriter(db_manager)
 
         self._cancel_message = TeamResult(
             task_result=TaskResult(
@@ -97,6 +102,8 @@ async def start_stream(
             try:
                 # Update run with task and status
                 run = await self._get_run(run_id)
+                if run is not None:
+                    self._runs[run_id] = run
 
                 if run is not None and run.user_id:
                     # get user Settings
@@ -140,6 +147,8 @@ async def start_stream(
                         # Capture final result if it's a TeamResult
                         elif isinstance(message, TeamResult):
                             final_result = message.model_dump()
+                # Persist the streamed messages before the run is marked as finished
+                await self._message_writer.flush()
                 if not cancellation_token.is_cancelled() and run_id not in self._closed_connections:
                     if final_result:
                         await self._update_run(run_id, RunStatus.COMPLETE, team_result=final_result)
@@ -162,16 +171,18 @@ async def start_stream(
             except Exception as e:
                 logger.error(f"Stream error for run {run_id}: {e}")
                 traceback.print_exc()
+                await self._message_writer.flush()
                 await self._handle_stream_error(run_id, e)
             finally:
                 self._cancellation_tokens.pop(run_id, None)
+                self._runs.pop(run_id, None)
 
     async def _save_message(
         self, run_id: int, message: Union[BaseAgentEvent | BaseChatMessage, BaseChatMessage]
     ) -> None:
-        """Save a message to the database"""
+        """Queue a message to be saved to the database by the background message writer"""
 
-        run = await self._get_run(run_id)
+        run = self._runs.get(run_id) or await self._get_run(run_id)
         if run:
             db_message = Message(
                 session_id=run.session_id,
@@ -179,7 +190,7 @@ async def _save_message(
                 config=self._convert_images_in_dict(message.model_dump()),
                 user_id=None,  # You might want to pass this from somewhere
             )
-            self.db_manager.upsert(db_message)
+            self._message_writer.enqueue(db_message)
 
     async def _update_run(
         self, run_id: int, status: RunStatus, team_result: Optional[dict] = None, error: Optional[str] = None
@@ -283,7 +294,7 @@ def _convert_images_in_dict(self, obj: Any) -> Any:
             return [self._convert_images_in_dict(item) for item in obj]
         elif isinstance(obj, AGImage):  # Assuming you've imported AGImage
             # Convert the Image object to a serializable format
-            return {"type": "image", "url": f"data:image/png;base64,{obj.to_base64()}", "alt": "Image"}
+            return {"type": "image", "url": obj.data_uri, "alt": "Image"}
         else:
             return obj
 
@@ -471,7 +482,13 @@ async def cleanup(self) -> None:
         except Exception as e:
             logger.error(f"Error during WebSocketManager cleanup: {e}")
         finally:
+            # Write the messages still queued before shutting down
+            try:
+                await self._message_writer.close()
+            except Exception as e:
+                logger.error(f"Error closing message writer: {e}")
             # Always clear internal state, even if cleanup had errors
+            self._runs.clear()
             self._connections.clear()
             self._cancellation_tokens.clear()
             self._closed_connections.clear()
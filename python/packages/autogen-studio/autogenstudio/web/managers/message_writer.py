@@ -0,0 +1,113 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Union
+
+from ...database import DatabaseManager
+from ...datamodel import Message
+
+logger = logging.getLogger(__name__)
+
+
+class _FlushRequest:
+    """A marker in the write queue that is resolved once everything queued before it is written"""
+
+    def __init__(self, future: "asyncio.Future[None]"):
+        self.future = future
+
+
+class MessageWriter:
+    """Write-behind queue that persists streamed messages without blocking the event loop.
+
+    Messages are queued by :meth:`enqueue` and written by a background task in batches on a
+    dedicated database thread, with the messages of each run in a single transaction. If a
+    transaction fails, the messages of that run are written one at a time, so that a bad
+    message does not lose the others. Messages of a run are written in the order they were queued.
+
+    Args:
+        db_manager: Database manager used to insert the messages
+        max_batch_size: Maximum number of messages written in one batch
+        flush_interval: Seconds to wait for more messages before writing a batch that is not full
+    """
+
+    def __init__(self, db_manager: DatabaseManager, max_batch_size: int = 200, flush_interval: float = 0.05):
+        self.db_manager = db_manager
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self._queue: Optional[asyncio.Queue[Union[Message, _FlushRequest]]] = None
+        self._worker: Optional[asyncio.Task[None]] = None
+        # A single thread keeps the writes serialized and off the event loop
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="studio-message-writer")
+
+    def enqueue(self, message: Message) -> None:
+        """Queue a message to be written, without waiting for the write"""
+        self._ensure_worker().put_nowait(message)
+
+    async def flush(self) -> None:
+        """Wait until all the messages queued so far are written"""
+        if self._worker is None or self._worker.done():
+            return
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._ensure_worker().put_nowait(_FlushRequest(future))
+        await future
+
+    async def close(self) -> None:
+        """Write the queued messages and stop the background task"""
+        await self.flush()
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+            self._queue = None
+        self._executor.shutdown(wait=True)
+
+    def _ensure_worker(self) -> "asyncio.Queue[Union[Message, _FlushRequest]]":
+        if self._queue is None or self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run(self._queue))
+        return self._queue
+
+    async def _run(self, queue: "asyncio.Queue[Union[Message, _FlushRequest]]") -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[Message] = []
+            flush_requests: List[_FlushRequest] = []
+            item = await queue.get()
+            deadline = loop.time() + self.flush_interval
+            while True:
+                if isinstance(item, _FlushRequest):
+                    # Write what is queued right away
+                    flush_requests.append(item)
+                    break
+                batch.append(item)
+                if len(batch) >= self.max_batch_size:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=max(deadline - loop.time(), 0))
+                except asyncio.TimeoutError:
+                    break
+
+            if batch:
+                try:
+                    await loop.run_in_executor(self._executor, self._write_batch, batch)
+                except Exception as e:
+                    logger.error(f"Failed to save {len(batch)} messages: {e}")
+            for request in flush_requests:
+                if not request.future.done():
+                    request.future.set_result(None)
+
+    def _write_batch(self, batch: List[Message]) -> None:
+        """Write a batch, in one transaction per run, falling back to one message at a time for a failed run"""
+        runs: Dict[Optional[int], List[Message]] = {}
+        for message in batch:
+            runs.setdefault(message.run_id, []).append(message)
+        for run_id, messages in runs.items():
+            response = self.db_manager.insert_many(messages)
+            if response.status:
+                continue
+            failed = sum(not self.db_manager.insert_many([message]).status for message in messages)
+            if failed:
+                logger.error(f"Failed to save {failed} of {len(messages)} messages of run {run_id}")
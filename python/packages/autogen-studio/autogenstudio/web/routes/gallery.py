@@ -4,7 +4,7 @@
 from ...database import DatabaseManager
 from ...datamodel import Gallery, Response
 from ...gallery.builder import create_default_gallery
-from ..deps import get_db
+from ..deps import get_db, get_read_db
 
 router = APIRouter()
 
@@ -51,8 +51,8 @@ async def list_gallery_entries(user_id: str, db: DatabaseManager = Depends(get_d
 
 
 @router.get("/{gallery_id}")
-async def get_gallery_entry(gallery_id: int, user_id: str, db: DatabaseManager = Depends(get_db)) -> Response:
-    result = db.get(Gallery, filters={"id": gallery_id, "user_id": user_id})
+async def get_gallery_entry(gallery_id: int, user_id: str, db=Depends(get_read_db)) -> Response:
+    result = await db.get(Gallery, filters={"id": gallery_id, "user_id": user_id})
     if not result.status or not result.data:
         raise HTTPException(status_code=404, detail="Gallery entry not found")
 
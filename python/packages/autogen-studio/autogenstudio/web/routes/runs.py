@@ -1,11 +1,11 @@
 # /api/runs routes
-from typing import Dict
+from typing import Dict, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
 from ...datamodel import Message, Run, RunStatus, Session
-from ..deps import get_db
+from ..deps import get_db, get_read_db
 
 router = APIRouter()
 
@@ -48,9 +48,9 @@ async def create_run(
 
 
 @router.get("/{run_id}")
-async def get_run(run_id: int, db=Depends(get_db)) -> Dict:
+async def get_run(run_id: int, db=Depends(get_read_db)) -> Dict:
     """Get run details including task and result"""
-    run = db.get(Run, filters={"id": run_id}, return_json=False)
+    run = await db.get(Run, filters={"id": run_id}, return_json=False)
     if not run.status or not run.data:
         raise HTTPException(status_code=404, detail="Run not found")
 
@@ -58,8 +58,19 @@ async def get_run(run_id: int, db=Depends(get_db)) -> Dict:
 
 
 @router.get("/{run_id}/messages")
-async def get_run_messages(run_id: int, db=Depends(get_db)) -> Dict:
-    """Get all messages for a run"""
-    messages = db.get(Message, filters={"run_id": run_id}, order="created_at asc", return_json=False)
+async def get_run_messages(
+    run_id: int,
+    cursor: Optional[int] = None,
+    limit: Optional[int] = Query(default=None, ge=1, le=1000),
+    summary: bool = False,
+    db=Depends(get_read_db),
+) -> Dict:
+    """Get the messages of a run, all of them or a page after cursor.
+
+    With summary, the message configs are left out.
+    """
+    messages = await db.get_page(Message, filters={"run_id": run_id}, cursor=cursor, limit=limit, exclude_json=summary)
+    if not messages.status:
+        raise HTTPException(status_code=500, detail="Database error while fetching messages")
 
-    return {"status": True, "data": messages.data}
+    return {"status": True, "data": messages.data["items"], "next_cursor": messages.data["next_cursor"]}
@@ -1,27 +1,27 @@
 # api/routes/sessions.py
 import re
-from typing import Dict
+from typing import Dict, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from loguru import logger
 
 from ...datamodel import Message, Response, Run, Session
-from ..deps import get_db
+from ..deps import get_db, get_read_db
 
 router = APIRouter()
 
 
 @router.get("/")
-async def list_sessions(user_id: str, db=Depends(get_db)) -> Dict:
+async def list_sessions(user_id: str, db=Depends(get_read_db)) -> Dict:
     """List all sessions for a user"""
-    response = db.get(Session, filters={"user_id": user_id})
+    response = await db.get(Session, filters={"user_id": user_id})
     return {"status": True, "data": response.data}
 
 
 @router.get("/{session_id}")
-async def get_session(session_id: int, user_id: str, db=Depends(get_db)) -> Dict:
+async def get_session(session_id: int, user_id: str, db=Depends(get_read_db)) -> Dict:
     """Get a specific session"""
-    response = db.get(Session, filters={"id": session_id, "user_id": user_id})
+    response = await db.get(Session, filters={"id": session_id, "user_id": user_id})
     if not response.status or not response.data:
         raise HTTPException(status_code=404, detail="Session not found")
     return {"status": True, "data": response.data[0]}
@@ -64,60 +64,65 @@ async def delete_session(session_id: int, user_id: str, db=Depends(get_db)) -> D
 
 
 @router.get("/{session_id}/runs")
-async def list_session_runs(session_id: int, user_id: str, db=Depends(get_db)) -> Dict:
-    """Get complete session history organized by runs"""
+async def list_session_runs(
+    session_id: int,
+    user_id: str,
+    cursor: Optional[int] = None,
+    limit: Optional[int] = Query(default=None, ge=1, le=1000),
+    summary: bool = False,
+    db=Depends(get_read_db),
+) -> Dict:
+    """Get session history organized by runs, all of them or a page after cursor.
+
+    With summary, the runs are listed without their task, result and messages.
+    """
 
     try:
         # 1. Verify session exists and belongs to user
-        session = db.get(Session, filters={"id": session_id, "user_id": user_id}, return_json=False)
+        session = await db.get(Session, filters={"id": session_id, "user_id": user_id}, return_json=False)
         if not session.status:
             raise HTTPException(status_code=500, detail="Database error while fetching session")
         if not session.data:
             raise HTTPException(status_code=404, detail="Session not found or access denied")
 
         # 2. Get ordered runs for session
-        runs = db.get(Run, filters={"session_id": session_id}, order="asc", return_json=False)
+        runs = await db.get_page(
+            Run, filters={"session_id": session_id}, cursor=cursor, limit=limit, exclude_json=summary
+        )
         if not runs.status:
             raise HTTPException(status_code=500, detail="Database error while fetching runs")
-
-        # 3. Build response with messages per run
-        run_data = []
-        if runs.data:  # It's ok to have no runs
-            for run in runs.data:
-                try:
-                    # Get messages for this specific run
-                    messages = db.get(Message, filters={"run_id": run.id}, order="asc", return_json=False)
-                    if not messages.status:
-                        logger.error(f"Failed to fetch messages for run {run.id}")
-                        # Continue processing other runs even if one fails
-                        messages.data = []
-
-                    run_data.append(
-                        {
-                            "id": str(run.id),
-                            "created_at": run.created_at,
-                            "status": run.status,
-                            "task": run.task,
-                            "team_result": run.team_result,
-                            "messages": messages.data or [],
-                        }
-                    )
-                except Exception as e:
-                    logger.error(f"Error processing run {run.id}: {str(e)}")
-                    # Include run with error state instead of failing entirely
-                    run_data.append(
-                        {
-                            "id": str(run.id),
-                            "created_at": run.created_at,
-                            "status": "ERROR",
-                            "task": run.task,
-                            "team_result": None,
-                            "messages": [],
-                            "error": f"Failed to process run: {str(e)}",
-                        }
-                    )
-
-        return {"status": True, "data": {"runs": run_data}}
+        runs_page = runs.data["items"]
+
+        if summary:
+            run_data = [
+                {"id": str(run["id"]), "created_at": run["created_at"], "status": run["status"]} for run in runs_page
+            ]
+            return {"status": True, "data": {"runs": run_data}, "next_cursor": runs.data["next_cursor"]}
+
+        # 3. Get the messages of all the runs in the page at once
+        messages_by_run: Dict[int, list] = {run.id: [] for run in runs_page}
+        if runs_page:
+            messages = await db.get_page(Message, filters={"run_id": list(messages_by_run)})
+            if messages.status:
+                for message in messages.data["items"]:
+                    messages_by_run[message.run_id].append(message)
+            else:
+                logger.error(f"Failed to fetch messages for the runs of session {session_id}")
+
+        # 4. Build response with messages per run
+        run_data = [
+            {
+                "id": str(run.id),
+                "created_at": run.created_at,
+                "status": run.status,
+                "task": run.task,
+                "team_result": run.team_result,
+                "messages": messages_by_run[run.id],
+            }
+            for run in runs_page
+        ]
+
+        return {"status": True, "data": {"runs": run_data}, "next_cursor": runs.data["next_cursor"]}
 
     except HTTPException:
         raise  # Re-raise HTTP exceptions
@@ -5,7 +5,7 @@
 
 from ...datamodel import Team
 from ...gallery.builder import create_default_gallery
-from ..deps import get_db
+from ..deps import get_db, get_read_db
 
 router = APIRouter()
 
@@ -26,9 +26,9 @@ async def list_teams(user_id: str, db=Depends(get_db)) -> Dict:
 
 
 @router.get("/{team_id}")
-async def get_team(team_id: int, user_id: str, db=Depends(get_db)) -> Dict:
+async def get_team(team_id: int, user_id: str, db=Depends(get_read_db)) -> Dict:
     """Get a specific team"""
-    response = db.get(Team, filters={"id": team_id, "user_id": user_id})
+    response = await db.get(Team, filters={"id": team_id, "user_id": user_id})
     if not response.status or not response.data:
         raise HTTPException(status_code=404, detail="Team not found")
     return {"status": True, "data": response.data[0]}
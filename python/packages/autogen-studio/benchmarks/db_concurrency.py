@@ -0,0 +1,121 @@
+"""Concurrent load benchmark for the Studio database managers.
+
+Serves the session and run routes of Studio from a FastAPI app, with the list and get
+routes backed either by the synchronous :class:`~autogenstudio.database.DatabaseManager`
+(the default) or by :class:`~autogenstudio.database.AsyncDatabaseManager` (as with
+``AUTOGENSTUDIO_ASYNC_DATABASE=true``), and sends them concurrent requests. It reports the requests per second and how long the event loop was blocked
+during the load, which delays every other request and websocket of the server.
+
+Usage:
+
+.. code-block:: bash
+
+    python benchmarks/db_concurrency.py --requests 2000 --concurrency 50 --sessions 500
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+import httpx
+from fastapi import FastAPI
+
+from autogenstudio.database import AsyncDatabaseManager, DatabaseManager
+from autogenstudio.datamodel import Run, RunStatus, Session
+from autogenstudio.web.deps import SyncReadDatabase, get_db, get_read_db
+from autogenstudio.web.routes import runs, sessions
+
+
+def create_app(db: DatabaseManager, read_db: AsyncDatabaseManager | SyncReadDatabase) -> FastAPI:
+    app = FastAPI()
+    app.include_router(sessions.router, prefix="/sessions")
+    app.include_router(runs.router, prefix="/runs")
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_read_db] = lambda: read_db
+
+    return app
+
+
+async def run_load(
+    app: FastAPI, num_requests: int, concurrency: int, session_ids: List[int]
+) -> tuple[float, List[float]]:
+    transport = httpx.ASGITransport(app=app)
+    loop_lags: List[float] = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://studio") as client:
+        queue: asyncio.Queue[int] = asyncio.Queue()
+        for i in range(num_requests):
+            queue.put_nowait(i)
+
+        async def worker() -> None:
+            while not queue.empty():
+                i = queue.get_nowait()
+                # Cycle through the list and get routes
+                session_id = session_ids[i % len(session_ids)]
+                if i % 3 == 0:
+                    url = "/sessions/"
+                elif i % 3 == 1:
+                    url = f"/sessions/{session_id}"
+                else:
+                    url = f"/sessions/{session_id}/runs"
+                response = await client.get(url, params={"user_id": "benchmark"})
+                assert response.status_code == 200
+
+        async def probe(done: asyncio.Event) -> None:
+            # How late a short sleep wakes up is how long the event loop was blocked
+            while not done.is_set():
+                start = time.perf_counter()
+                await asyncio.sleep(0.005)
+                loop_lags.append(time.perf_counter() - start - 0.005)
+
+        done = asyncio.Event()
+        probe_task = asyncio.create_task(probe(done))
+        start = time.perf_counter()
+        await asyncio.gather(*[worker() for _ in range(concurrency)])
+        elapsed = time.perf_counter() - start
+        done.set()
+        await probe_task
+    return num_requests / elapsed, loop_lags
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--sessions", type=int, default=500, help="Sessions stored in the database.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine_uri = f"sqlite:///{Path(tmp_dir) / 'studio.db'}"
+        sync_db = DatabaseManager(engine_uri, base_dir=tmp_dir)
+        sync_db.initialize_database()
+        session_ids = [
+            sync_db.upsert(Session(user_id="benchmark", name=f"session {i}"), return_json=False).data.id
+            for i in range(args.sessions)
+        ]
+        sync_db.insert_many(
+            [
+                Run(session_id=session_id, user_id="benchmark", status=RunStatus.COMPLETE, task={}, team_result={})
+                for session_id in session_ids
+            ]
+        )
+        async_db = AsyncDatabaseManager(engine_uri, pool_size=args.concurrency // 5 or 1)
+
+        for label, app in [
+            ("sync", create_app(sync_db, SyncReadDatabase(sync_db))),
+            ("async", create_app(sync_db, async_db)),
+        ]:
+            rate, loop_lags = await run_load(app, args.requests, args.concurrency, session_ids)
+            p50 = statistics.median(loop_lags) * 1e3
+            p_max = max(loop_lags) * 1e3
+            print(f"{label:<6} {rate:>8.0f} requests/s   event loop lag p50={p50:>7.2f} ms max={p_max:>7.2f} ms")
+
+        await async_db.close()
+        await sync_db.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
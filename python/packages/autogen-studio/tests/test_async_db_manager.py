@@ -0,0 +1,128 @@
+import asyncio
+from typing import AsyncGenerator
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from sqlalchemy import text
+
+from autogenstudio.database import AsyncDatabaseManager, DatabaseManager
+from autogenstudio.database.async_db_manager import to_async_uri
+from autogenstudio.datamodel.db import Message, Run, RunStatus
+from autogenstudio.datamodel.db import Session as SessionModel
+from autogenstudio.web.deps import SyncReadDatabase, get_db, get_read_db
+from autogenstudio.web.routes import runs, sessions
+
+
+@pytest_asyncio.fixture
+async def async_db(tmp_path) -> AsyncGenerator[AsyncDatabaseManager, None]:
+    """Async manager on a database whose schema is created by DatabaseManager"""
+    engine_uri = f"sqlite:///{tmp_path / 'test.db'}"
+    db = DatabaseManager(engine_uri, base_dir=tmp_path)
+    db.reset_db()
+    db.initialize_database(auto_upgrade=False)
+    await db.close()
+
+    async_db = AsyncDatabaseManager(engine_uri, pool_size=5, max_overflow=5)
+    yield async_db
+    await async_db.close()
+
+
+def test_to_async_uri() -> None:
+    assert to_async_uri("sqlite:///studio.db") == "sqlite+aiosqlite:///studio.db"
+    assert to_async_uri("sqlite+aiosqlite:///studio.db") == "sqlite+aiosqlite:///studio.db"
+    assert to_async_uri("postgresql://user:pw@host/studio") == "postgresql+psycopg://user:pw@host/studio"
+    with pytest.raises(ValueError):
+        to_async_uri("mssql://host/studio")
+
+
+@pytest.mark.asyncio
+async def test_crud_operations(async_db: AsyncDatabaseManager) -> None:
+    response = await async_db.upsert(SessionModel(user_id="test_user", name="first"), return_json=False)
+    assert response.status is True
+    assert "Created Successfully" in response.message
+    session = response.data
+
+    session.name = "renamed"
+    response = await async_db.upsert(session)
+    assert response.status is True
+    assert "Updated Successfully" in response.message
+
+    response = await async_db.get(SessionModel, filters={"user_id": "test_user"}, return_json=True)
+    assert response.status is True
+    assert [item["name"] for item in response.data] == ["renamed"]
+
+    response = await async_db.delete(SessionModel, filters={"id": session.id})
+    assert response.status is True
+    assert (await async_db.get(SessionModel, filters={"user_id": "test_user"})).data == []
+
+
+@pytest.mark.asyncio
+async def test_sqlite_wal_mode(async_db: AsyncDatabaseManager) -> None:
+    async with async_db.engine.connect() as conn:
+        assert (await conn.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+        assert (await conn.execute(text("PRAGMA foreign_keys"))).scalar() == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reads_and_writes(async_db: AsyncDatabaseManager) -> None:
+    """More concurrent operations than pooled connections, mixing reads and writes"""
+
+    async def create_and_read(i: int) -> None:
+        created = await async_db.upsert(SessionModel(user_id=f"user_{i % 4}", name=f"session {i}"))
+        assert created.status is True
+        fetched = await async_db.get(SessionModel, filters={"id": created.data["id"]})
+        assert fetched.status is True
+        assert fetched.data[0].name == f"session {i}"
+
+    await asyncio.gather(*[create_and_read(i) for i in range(50)])
+    response = await async_db.get(SessionModel)
+    assert len(response.data) == 50
+
+
+@pytest.mark.asyncio
+async def test_read_routes(async_db: AsyncDatabaseManager, tmp_path) -> None:
+    """The list and get routes respond the same with the sync and the async database manager"""
+    db = DatabaseManager(f"sqlite:///{tmp_path / 'test.db'}", base_dir=tmp_path)
+    session = db.upsert(SessionModel(user_id="test_user", name="session"), return_json=False).data
+    run = db.upsert(
+        Run(session_id=session.id, user_id="test_user", status=RunStatus.COMPLETE, task={}, team_result={}),
+        return_json=False,
+    ).data
+    db.insert_many(
+        [
+            Message(session_id=session.id, run_id=run.id, user_id="test_user", config={"source": source})
+            for source in ["user", "agent"]
+        ]
+    )
+
+    urls = [
+        "/sessions/?user_id=test_user",
+        f"/sessions/{session.id}?user_id=test_user",
+        f"/sessions/{session.id}/runs?user_id=test_user",
+        f"/runs/{run.id}",
+        f"/runs/{run.id}/messages?limit=1",
+    ]
+
+    def create_app(read_db: AsyncDatabaseManager | SyncReadDatabase) -> FastAPI:
+        app = FastAPI()
+        app.include_router(sessions.router, prefix="/sessions")
+        app.include_router(runs.router, prefix="/runs")
+        app.dependency_overrides[get_db] = lambda: db
+        app.dependency_overrides[get_read_db] = lambda: read_db
+        return app
+
+    responses = []
+    for app in [create_app(SyncReadDatabase(db)), create_app(async_db)]:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://studio") as client:
+            results = [await client.get(url) for url in urls]
+        assert all(result.status_code == 200 for result in results)
+        responses.append([result.json() for result in results])
+    await db.close()
+
+    assert responses[0] == responses[1]
+    sync_responses = responses[0]
+    assert sync_responses[1]["data"]["name"] == "session"
+    assert len(sync_responses[2]["data"]["runs"][0]["messages"]) == 2
+    assert sync_responses[4]["next_cursor"] is not None
@@ -1,5 +1,6 @@
 import asyncio 
 import pytest
+from sqlalchemy import inspect
 from sqlmodel import Session, text, select
 from typing import Generator
 
@@ -187,4 +188,69 @@ def test_initialize_database_scenarios(self, tmp_path, monkeypatch):
 
         finally:
             asyncio.run(db.close())
-            db.reset_db() 
\ No newline at end of file
+            db.reset_db()
+
+    def test_get_page(self, test_db: DatabaseManager, test_user: str):
+        """Test cursor pagination and the projection without JSON columns"""
+        session = test_db.upsert(SessionModel(user_id=test_user, name="Session"), return_json=False).data
+        run_ids = [
+            test_db.upsert(
+                Run(user_id=test_user, session_id=session.id, task=MessageConfig(content="Task", source="user").model_dump()),
+                return_json=False,
+            ).data.id
+            for _ in range(2)
+        ]
+        test_db.insert_many([
+            Message(
+                user_id=test_user,
+                session_id=session.id,
+                run_id=run_ids[i % 2],
+                config=MessageConfig(content=f"Message{i}", source="assistant").model_dump(),
+            )
+            for i in range(25)
+        ])
+
+        # Follow the cursors through the pages of the first run
+        contents, cursor, num_pages = [], None, 0
+        while True:
+            page = test_db.get_page(Message, {"run_id": run_ids[0]}, cursor=cursor, limit=5)
+            assert page.status is True
+            contents += [message.config["content"] for message in page.data["items"]]
+            num_pages += 1
+            cursor = page.data["next_cursor"]
+            if cursor is None:
+                break
+        assert contents == [f"Message{i}" for i in range(0, 25, 2)]
+        assert num_pages == 3
+
+        # Newest first
+        page = test_db.get_page(Message, {"run_id": run_ids[0]}, limit=2, order="desc", return_json=True)
+        assert [message["config"]["content"] for message in page.data["items"]] == ["Message24", "Message22"]
+
+        # Several runs at once, without the message configs
+        page = test_db.get_page(Message, {"run_id": run_ids}, exclude_json=True)
+        assert len(page.data["items"]) == 25
+        assert page.data["next_cursor"] is None
+        assert "config" not in page.data["items"][0]
+        assert page.data["items"][0]["run_id"] == run_ids[0]
+
+    def test_indexes_are_migrated(self, tmp_path):
+        """Test that the indexes are added to a database created without them"""
+        db_path = tmp_path / "test_indexes.db"
+        db = DatabaseManager(f"sqlite:///{db_path}", base_dir=tmp_path)
+        expected = {("message", "ix_message_run_id"), ("message", "ix_message_session_id"), ("run", "ix_run_session_id")}
+
+        try:
+            db.initialize_database()
+            with db.engine.connect() as conn:
+                for _, index in expected:
+                    conn.execute(text(f"DROP INDEX {index}"))
+                conn.commit()
+
+            response = db.initialize_database()
+            assert response.status is True
+            inspector = inspect(db.engine)
+            indexes = {(table, index["name"]) for table in ("message", "run") for index in inspector.get_indexes(table)}
+            assert expected <= indexes
+        finally:
+            asyncio.run(db.close())
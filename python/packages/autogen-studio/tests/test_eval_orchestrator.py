@@ -0,0 +1,193 @@
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Set
+
+import pytest
+from autogen_agentchat.agents import AssistantAgent
+from autogen_agentchat.conditions import MaxMessageTermination
+from autogen_agentchat.teams import RoundRobinGroupChat
+from autogen_core import CancellationToken, Component
+from autogen_ext.models.replay import ReplayChatCompletionClient
+from typing_extensions import Self
+
+from autogenstudio.database import DatabaseManager
+from autogenstudio.datamodel.db import EvalRunDB
+from autogenstudio.datamodel.eval import EvalJudgeCriteria, EvalRunResult, EvalRunStatus, EvalScore, EvalTask
+from autogenstudio.eval.judges import BaseEvalJudge, BaseEvalJudgeConfig
+from autogenstudio.eval.orchestrator import EvalOrchestrator
+from autogenstudio.eval.runners import BaseEvalRunner, BaseEvalRunnerConfig, TeamEvalRunner
+
+
+class ConcurrencyTracker:
+    def __init__(self) -> None:
+        self.active = 0
+        self.max_active = 0
+
+
+class FakeRunner(BaseEvalRunner, Component[BaseEvalRunnerConfig]):
+    """Runner that tracks the concurrent runs and fails the tasks named in failing_tasks"""
+
+    component_config_schema = BaseEvalRunnerConfig
+
+    def __init__(
+        self,
+        name: str = "Fake Runner",
+        failing_tasks: Optional[Set[str]] = None,
+        delay: float = 0.01,
+        tracker: Optional[ConcurrencyTracker] = None,
+    ):
+        super().__init__(name)
+        self.failing_tasks = failing_tasks or set()
+        self.delay = delay
+        self.tracker = tracker or ConcurrencyTracker()
+        self.calls: List[str] = []
+
+    async def run(self, task: EvalTask, cancellation_token: Optional[CancellationToken] = None) -> EvalRunResult:
+        self.calls.append(task.name)
+        self.tracker.active += 1
+        self.tracker.max_active = max(self.tracker.max_active, self.tracker.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.tracker.active -= 1
+        if task.name in self.failing_tasks:
+            return EvalRunResult(status=False, error="failed")
+        return EvalRunResult(status=True)
+
+    @classmethod
+    def _from_config(cls, config: BaseEvalRunnerConfig) -> Self:
+        return cls(name=config.name)
+
+
+class FakeJudge(BaseEvalJudge, Component[BaseEvalJudgeConfig]):
+    component_config_schema = BaseEvalJudgeConfig
+
+    def __init__(self, name: str = "Fake Judge"):
+        super().__init__(name)
+        self.calls = 0
+
+    async def judge(
+        self,
+        task: EvalTask,
+        result: EvalRunResult,
+        criteria: List[EvalJudgeCriteria],
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> EvalScore:
+        self.calls += 1
+        return EvalScore(overall_score=float(len(task.name)))
+
+    @classmethod
+    def _from_config(cls, config: BaseEvalJudgeConfig) -> Self:
+        return cls(name=config.name)
+
+
+def make_tasks(count: int) -> List[EvalTask]:
+    return [EvalTask(name=f"task {i}", input=f"input {i}") for i in range(count)]
+
+
+@pytest.fixture
+def criteria() -> List[EvalJudgeCriteria]:
+    return [EvalJudgeCriteria(dimension="quality", prompt="Rate the quality")]
+
+
+@pytest.mark.asyncio
+async def test_sweep_bounded_concurrency(criteria: List[EvalJudgeCriteria]) -> None:
+    orchestrator = EvalOrchestrator()
+    tracker = ConcurrencyTracker()
+    runners = [FakeRunner("runner a", tracker=tracker), FakeRunner("runner b", tracker=tracker)]
+    judge = FakeJudge()
+
+    result = await orchestrator.run_sweep(make_tasks(10), runners, judge, criteria, max_concurrency=3)
+
+    assert len(result["run_ids"]) == 10
+    assert all(len(task_run_ids) == 2 for task_run_ids in result["run_ids"])
+    # The same component instances are used for all the runs
+    assert all(len(runner.calls) == 10 for runner in runners)
+    assert judge.calls == 20
+    assert tracker.max_active == 3
+    for task_run_ids in result["run_ids"]:
+        for run_id in task_run_ids:
+            assert await orchestrator.get_run_status(run_id) == EvalRunStatus.COMPLETED
+    score = await orchestrator.get_run_score(result["run_ids"][3][1])
+    assert score is not None and score.overall_score == len("task 3")
+
+
+def make_team_runner(num_tasks: int) -> tuple[TeamEvalRunner, ReplayChatCompletionClient]:
+    model_client = ReplayChatCompletionClient(["done"] * num_tasks)
+    agent = AssistantAgent("assistant", model_client=model_client)
+    team = RoundRobinGroupChat([agent], termination_condition=MaxMessageTermination(2))
+    return TeamEvalRunner(team=team, name="team"), model_client
+
+
+@pytest.mark.asyncio
+async def test_sweep_team_runner_concurrent_tasks(criteria: List[EvalJudgeCriteria]) -> None:
+    """A team runs one task at a time, concurrent tasks of a sweep must each get a team"""
+    orchestrator = EvalOrchestrator()
+    runner, _ = make_team_runner(3)
+
+    result = await orchestrator.run_sweep(make_tasks(3), [runner], FakeJudge(), criteria, max_concurrency=3)
+
+    for (run_id,) in result["run_ids"]:
+        assert await orchestrator.get_run_status(run_id) == EvalRunStatus.COMPLETED
+
+
+@pytest.mark.asyncio
+async def test_sweep_team_runner_resets_between_tasks(criteria: List[EvalJudgeCriteria]) -> None:
+    orchestrator = EvalOrchestrator()
+    runner, model_client = make_team_runner(3)
+
+    await orchestrator.run_sweep(make_tasks(3), [runner], FakeJudge(), criteria, max_concurrency=1)
+
+    # Each task starts a new conversation: the model only sees the system message and the task
+    assert len(model_client.create_calls) == 3
+    for i, call in enumerate(model_client.create_calls):
+        assert len(call["messages"]) == 2
+        assert call["messages"][1].content == f"input {i}"
+
+
+@pytest.mark.asyncio
+async def test_sweep_rate_limits(criteria: List[EvalJudgeCriteria]) -> None:
+    orchestrator = EvalOrchestrator()
+    runner = FakeRunner("limited", delay=0)
+
+    start = time.perf_counter()
+    # 1200 calls per minute, so that the 4 runs start at least 50 ms apart
+    await orchestrator.run_sweep(make_tasks(4), [runner], FakeJudge(), criteria, rate_limits={"limited": 1200})
+    assert time.perf_counter() - start >= 0.15
+    assert len(runner.calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_sweep_resume_from_database(tmp_path, criteria: List[EvalJudgeCriteria]) -> None:
+    db = DatabaseManager(f"sqlite:///{tmp_path / 'test.db'}", base_dir=tmp_path)
+    db.reset_db()
+    db.initialize_database(auto_upgrade=False)
+    try:
+        orchestrator = EvalOrchestrator(db)
+        tasks = make_tasks(5)
+        runner = FakeRunner("runner", failing_tasks={"task 1", "task 3"})
+        result = await orchestrator.run_sweep(tasks, [runner], FakeJudge(), criteria, name="sweep")
+
+        runs: List[Dict[str, Any]] = db.get(EvalRunDB, filters={"sweep_id": result["sweep_id"]}, return_json=True).data
+        statuses = {run["sweep_key"]: run["status"] for run in runs}
+        assert statuses["1:0"] == EvalRunStatus.FAILED
+        assert statuses["0:0"] == EvalRunStatus.COMPLETED
+        # Results are stored with the run
+        assert all(run["score_result"] is not None for run in runs if run["status"] == EvalRunStatus.COMPLETED)
+
+        # Resuming only executes the runs that did not complete
+        resumed_runner = FakeRunner("runner")
+        resumed = await orchestrator.run_sweep(
+            tasks, [resumed_runner], FakeJudge(), criteria, sweep_id=result["sweep_id"]
+        )
+        assert resumed["run_ids"] == result["run_ids"]
+        assert sorted(resumed_runner.calls) == ["task 1", "task 3"]
+
+        runs = db.get(EvalRunDB, filters={"sweep_id": result["sweep_id"]}, return_json=True).data
+        assert len(runs) == 5
+        assert all(run["status"] == EvalRunStatus.COMPLETED for run in runs)
+
+        table = await orchestrator.tabulate_results([run_id for (run_id,) in result["run_ids"]])
+        assert [run["task_name"] for run in table["runs"]] == [task.name for task in tasks]
+    finally:
+        await db.close()
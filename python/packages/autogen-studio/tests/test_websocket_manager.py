@@ -0,0 +1,148 @@
+import asyncio
+import json
+import threading
+import time
+from typing import AsyncGenerator, Generator
+
+import pytest
+from autogen_agentchat.base import TaskResult
+from autogen_agentchat.messages import TextMessage
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from autogenstudio.database import DatabaseManager
+from autogenstudio.datamodel.db import Message, Run, RunStatus
+from autogenstudio.datamodel.db import Session as SessionModel
+from autogenstudio.datamodel.types import MessageConfig, TeamResult
+from autogenstudio.web.deps import get_db, get_websocket_manager
+from autogenstudio.web.managers.connection import WebSocketManager
+from autogenstudio.web.managers.message_writer import MessageWriter
+from autogenstudio.web.routes import ws
+
+NUM_RUNS = 50
+MESSAGES_PER_RUN = 40
+
+
+class FakeTeamManager:
+    """Streams a fixed number of messages, as fast as the websocket manager consumes them"""
+
+    async def run_stream(
+        self, task, team_config, input_func=None, cancellation_token=None, env_vars=None
+    ) -> AsyncGenerator:
+        for i in range(MESSAGES_PER_RUN):
+            yield TextMessage(source="agent", content=f"message {i}")
+            await asyncio.sleep(0)
+        yield TeamResult(task_result=TaskResult(messages=[], stop_reason="done"), usage="", duration=0)
+
+
+@pytest.fixture
+def test_db(tmp_path) -> Generator[DatabaseManager, None, None]:
+    db = DatabaseManager(f"sqlite:///{tmp_path / 'test.db'}", base_dir=tmp_path)
+    db.reset_db()
+    db.initialize_database(auto_upgrade=False)
+    yield db
+    asyncio.run(db.close())
+
+
+@pytest.fixture
+def ws_client(test_db: DatabaseManager, monkeypatch: pytest.MonkeyPatch) -> Generator[tuple, None, None]:
+    monkeypatch.setattr("autogenstudio.web.managers.connection.TeamManager", FakeTeamManager)
+    manager = WebSocketManager(test_db)
+    app = FastAPI()
+    app.include_router(ws.router, prefix="/ws")
+    app.state.auth_manager = None
+    app.dependency_overrides[get_websocket_manager] = lambda: manager
+    app.dependency_overrides[get_db] = lambda: test_db
+    with TestClient(app) as client:
+        yield client, manager
+
+
+def test_concurrent_runs_stream_and_persist_messages(test_db: DatabaseManager, ws_client: tuple) -> None:
+    """Load test: concurrent runs streaming through the websocket route"""
+    client, manager = ws_client
+    session = test_db.upsert(SessionModel(user_id="test_user", name="load test"), return_json=False).data
+    run_ids = [
+        test_db.upsert(
+            Run(session_id=session.id, user_id="test_user", task=MessageConfig(content="", source="user").model_dump()),
+            return_json=False,
+        ).data.id
+        for _ in range(NUM_RUNS)
+    ]
+
+    received = {run_id: 0 for run_id in run_ids}
+    errors = []
+
+    def stream_run(run_id: int) -> None:
+        try:
+            with client.websocket_connect(f"/ws/runs/{run_id}") as websocket:
+                assert websocket.receive_json()["status"] == "connected"
+                websocket.send_text(json.dumps({"type": "start", "task": "task", "team_config": {"provider": "fake"}}))
+                while True:
+                    message = websocket.receive_json()
+                    if message["type"] == "message":
+                        received[run_id] += 1
+                    elif message["type"] == "result":
+                        break
+                # Stay connected until the run is finished, so that closing does not stop it
+                while run_id in manager.active_runs:
+                    time.sleep(0.01)
+        except Exception as e:
+            errors.append(e)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=stream_run, args=(run_id,)) for run_id in run_ids]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=120)
+    elapsed = time.perf_counter() - start
+    # Persisting messages must not serialize the streams behind the database
+    assert elapsed < 60, f"{NUM_RUNS} runs x {MESSAGES_PER_RUN} messages streamed in {elapsed:.2f}s"
+
+    assert not errors
+    assert all(count == MESSAGES_PER_RUN for count in received.values())
+    for run_id in run_ids:
+        run = test_db.get(Run, filters={"id": run_id}).data[0]
+        assert run.status == RunStatus.COMPLETE
+        messages = test_db.get(Message, filters={"run_id": run_id}, order="asc").data
+        # All messages are persisted once the run is complete, in the order they were streamed
+        assert [message.config["content"] for message in sorted(messages, key=lambda m: m.id)] == [
+            f"message {i}" for i in range(MESSAGES_PER_RUN)
+        ]
+        assert all(message.session_id == session.id for message in messages)
+
+
+def test_message_writer_failure_is_isolated_to_the_message(test_db: DatabaseManager) -> None:
+    """A message that cannot be written does not lose the messages of the other runs in its batch"""
+    session = test_db.upsert(SessionModel(user_id="test_user", name="writer test"), return_json=False).data
+    run_ids = [
+        test_db.upsert(
+            Run(session_id=session.id, user_id="test_user", task=MessageConfig(content="", source="user").model_dump()),
+            return_json=False,
+        ).data.id
+        for _ in range(3)
+    ]
+    bad_run_id = run_ids[1]
+
+    async def write() -> None:
+        writer = MessageWriter(test_db, flush_interval=1)
+        for i in range(5):
+            for run_id in run_ids:
+                # The config of this message cannot be serialized to JSON
+                content = object() if run_id == bad_run_id and i == 2 else f"message {i}"
+                writer.enqueue(
+                    Message(
+                        user_id="test_user",
+                        session_id=session.id,
+                        run_id=run_id,
+                        config={"source": "agent", "content": content},
+                    )
+                )
+        await writer.close()
+
+    asyncio.run(write())
+
+    for run_id in run_ids:
+        messages = test_db.get(Message, filters={"run_id": run_id}, order="asc").data
+        expected = [f"message {i}" for i in range(5) if run_id != bad_run_id or i != 2]
+        assert [message.config["content"] for message in sorted(messages, key=lambda m: m.id)] == expected